@@ -1,6 +1,10 @@
 #!/usr/bin/env python
 import numpy as np
-from hal_arm_kinematics import hal_arm_kinematics
+try:
+    # Compiled kernels, if libhal_arm_kinematics.so has been built
+    from hal_arm_kinematics_c import hal_arm_kinematics
+except ImportError:
+    from hal_arm_kinematics import hal_arm_kinematics
 import tf
 import time
 import sys
@@ -17,6 +21,9 @@ class HalKinematics(hal_arm_kinematics):
         self.q4 = 0
         self.q5 = 0
         self.jangles = [self.q0,self.q1,self.q2,self.q3,self.q4,self.q5]
+        # Filled in place by fk_and_jacobian_into on every IK iteration
+        self.poses = np.empty((6,4,4))
+        self.Jac = np.empty((6,6))
         
         #rospy.init_node('Hal_FK')
 
@@ -49,9 +56,11 @@ class HalKinematics(hal_arm_kinematics):
                 big_diff = np.sqrt(np.square(diff))
         return big_diff
 
-    def analytical_jacobian(self,jangles):
-        pose = self.FK[5](jangles)
-        Jac = self.J[5](jangles)
+    def analytical_jacobian(self,jangles,pose=None,Jac=None):
+        # pose and Jac, if given, are the end effector pose and Jacobian at jangles
+        if pose is None or Jac is None:
+            poses, Jac = self.fk_and_jacobian(jangles)
+            pose = poses[5]
         epsilon = []
         pose = tf.transformations.quaternion_from_matrix(pose)
         print pose
@@ -87,11 +96,12 @@ class HalKinematics(hal_arm_kinematics):
     def solve_local_ik(self, goal_pose):
 
         goal = goal_pose
-        deltas = self.delta_x_and_e(goal, self.FK[5](self.jangles))
         count = 0
         ik_start = time.time()
         q_next = np.matrix([])
         q_curr = self.jangles
+        # All link poses and the end effector Jacobian, from one fused evaluation
+        poses, Jac = self.fk_and_jacobian_into(q_curr, self.poses, self.Jac)
         diff = 10
         a1 = .25
         b1 = .125
@@ -99,9 +109,9 @@ class HalKinematics(hal_arm_kinematics):
             a = np.hstack((a1*(np.eye(3,3)), np.zeros((3,3))))
             b = np.hstack((np.zeros((3,3)), b1*(np.eye(3,3))))
             constants = np.vstack((a,b))
-            deltas = np.array(self.delta_x_and_e(goal, self.FK[5](q_curr)))
+            deltas = np.array(self.delta_x_and_e(goal, poses[5]))
             deltas = deltas.dot(constants)
-            J_t = self.analytical_jacobian(q_curr)
+            J_t = self.analytical_jacobian(q_curr, poses[5], Jac)
             rank = np.linalg.matrix_rank(np.linalg.pinv(J_t.T))
             delta_q = (.1)*np.dot(J_t.T, deltas)
 
@@ -173,12 +183,12 @@ class HalKinematics(hal_arm_kinematics):
             #print q_next
             time.sleep(.001)
 
-            deltas = self.delta_x_and_e(goal,self.FK[5](q_next))
+            poses, Jac = self.fk_and_jacobian_into(q_next, poses, Jac)
             diff = self.greatest_diff(q_next, q_curr)
             #print deltas
             #print self.FK[5](q_next)[:,3]
             #print q_next
-            self.publish_to_tf(q_next)
+            self.publish_to_tf(q_next, poses)
             q_curr = q_next
             count = count + 1
             if count>5000:
@@ -186,7 +196,7 @@ class HalKinematics(hal_arm_kinematics):
         ik_end = time.time()
         #print "Total solve time: ", ik_end - ik_start
         print "Iterations: ", count
-        print "Solution Pose: \n", self.FK[5](q_next)
+        print "Solution Pose: \n", poses[5]
         #print "Goal Pose: \n", goal
         #print "J_t\n",J_t.T
         #print "Error Measure: \n", np.sum(self.FK[5](q_next)-goal)
@@ -196,7 +206,10 @@ class HalKinematics(hal_arm_kinematics):
         
         return q_next
 
-    def publish_to_tf(self,q):
+    def publish_to_tf(self,q,poses=None):
+        # poses, if given, are the link poses at q from fk_and_jacobian
+        if poses is None:
+            poses, Jac = self.fk_and_jacobian(q)
         br0 = tf.TransformBroadcaster()
         br1 = tf.TransformBroadcaster()
         br2 = tf.TransformBroadcaster()
@@ -204,12 +217,7 @@ class HalKinematics(hal_arm_kinematics):
         br4 = tf.TransformBroadcaster()
         br5 = tf.TransformBroadcaster()
 
-        Tb0 = self.FK[0](q)
-        Tb1 = self.FK[1](q)
-        Tb2 = self.FK[2](q)
-        Tb3 = self.FK[3](q)
-        Tb4 = self.FK[4](q)
-        Tbee = self.FK[5](q)
+        Tb0, Tb1, Tb2, Tb3, Tb4, Tbee = poses
         br0.sendTransform((Tb0[0:3,3]),
                           tf.transformations.quaternion_from_matrix(Tb0),
                           rospy.Time.now(),
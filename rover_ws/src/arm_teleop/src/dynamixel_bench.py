@@ -0,0 +1,181 @@
+#!/usr/bin/python
+
+# Throughput and latency benchmark for lib_dynamixel bus operations.
+#
+# Times read_angle, read_angs_angvels, move_angle and move_angles_sync and
+# writes the results as JSON, either against real servos:
+#     python dynamixel_bench.py -d /dev/ttyUSB0 --baud 1000000 --ids 1,2,3 --counts 1,3
+# or against simulated MX-64s at several baudrates (no -d):
+#     python dynamixel_bench.py --bauds 57600,1000000 --counts 1,2,4,8 -o bench.json
+#
+# Move commands re-send each servo's current angle, so nothing moves.
+# move_angles_sync gets no status packet and returns once its packet is queued
+# on the port, so its rate measures the host-side cost rather than the bus.
+
+import sys
+import time
+import json
+import optparse
+import numpy as np
+import serial
+
+import lib_dynamixel as ld
+import dynamixel_sim as ds
+
+OPERATIONS = ['read_angle', 'read_angs_angvels', 'move_angle', 'move_angles_sync']
+
+
+class Counting_Serial():
+
+    ''' Wraps a serial port and counts the bytes and packets passing through it.
+    '''
+
+    def __init__(self, port):
+        self.port = port
+        self._parser = ld.Dynamixel_Packet_Parser()
+        self.reset_counts()
+
+    def reset_counts(self):
+        self.tx_bytes = self.rx_bytes = 0
+        self.tx_packets = self.rx_packets = 0
+
+    def write(self, data):
+        data = bytearray(data)
+        self.tx_bytes += len(data)
+        i = 0
+        while i + 3 < len(data):  # Instruction packets are whole within one write
+            self.tx_packets += 1
+            i += data[i + 3] + 4
+        return self.port.write(data)
+
+    def read(self, nBytes=1):
+        data = self.port.read(nBytes)
+        self.rx_bytes += len(data)
+        self._parser.feed(data)
+        try:
+            while self._parser.next_packet() is not None:
+                self.rx_packets += 1
+        except RuntimeError:
+            pass  # Garbled reply; the library reports it
+        return data
+
+    def flushInput(self):
+        self._parser.reset()
+        self.port.flushInput()
+
+    def __getattr__(self, name):
+        return getattr(self.port, name)
+
+
+def _latency_stats(samples):
+    ms = np.array(samples) * 1000.
+    return {'mean': float(np.mean(ms)),
+            'p50': float(np.percentile(ms, 50)),
+            'p90': float(np.percentile(ms, 90)),
+            'p99': float(np.percentile(ms, 99)),
+            'max': float(np.max(ms))}
+
+
+def bench_operation(dyn, port, op, ids, iterations=200):
+    ''' Call op on ids iterations times and return a result dict.
+    '''
+    angs, _ = dyn.read_angles(ids)
+    angvels = [0.5] * len(ids)
+    calls = {'read_angle': lambda: dyn.read_angle(ids[0]),
+             'read_angs_angvels': lambda: dyn.read_angs_angvels(ids),
+             'move_angle': lambda: dyn.move_angle(ids[0], angs[0], angvels[0]),
+             'move_angles_sync': lambda: dyn.move_angles_sync(ids, angs, angvels)}
+    call = calls[op]
+    samples = []
+    errors = 0
+    port.reset_counts()
+    start = time.time()
+    for i in range(iterations):
+        t = time.time()
+        try:
+            call()
+        except RuntimeError:
+            errors += 1
+        samples.append(time.time() - t)
+    elapsed = time.time() - start
+    return {'op': op,
+            'baudrate': dyn.baudrate,
+            'servos': len(ids),
+            'iterations': iterations,
+            'errors': errors,
+            'latency_ms': _latency_stats(samples),
+            'calls_per_sec': iterations / elapsed,
+            'packets_per_sec': (port.tx_packets + port.rx_packets) / elapsed,
+            'bytes_per_sec': (port.tx_bytes + port.rx_bytes) / elapsed,
+            'tx_bytes': port.tx_bytes,
+            'rx_bytes': port.rx_bytes}
+
+
+def run(dev=None, baudrates=None, ids=None, counts=None, ops=None, iterations=200, model=310):
+    ''' Benchmark ops for the first n of ids, for n in counts, at each baudrate.
+        Without dev, a simulated bus of model servos is created for each baudrate;
+        with dev, baudrates must be the single rate the servos are set to.
+        returns a dict ready for json.dump
+    '''
+    if ops is None:
+        ops = OPERATIONS
+    if counts is None:
+        counts = [1]
+    if ids is None:
+        ids = range(1, max(counts) + 1)
+    results = []
+    for baudrate in baudrates:
+        if dev is None:
+            bus = ds.Simulated_Bus([ds.Simulated_Servo(id, model, baudrate=baudrate) for id in ids],
+                                   baudrate)
+        else:
+            bus = serial.Serial(dev, baudrate, timeout=1.0)
+        port = Counting_Serial(bus)
+        dyn = ld.Dynamixel_Chain(dev or 'sim', baudrate, ids=ids, serial_dev=port,
+                                 cache_file=dev and ld.TOPOLOGY_CACHE)
+        for count in counts:
+            for op in ops:
+                results.append(bench_operation(dyn, port, op, ids[:count], iterations))
+        bus.close()
+    return {'time': time.time(),
+            'bus': dev or 'simulated',
+            'results': results}
+
+
+if __name__ == '__main__':
+    p = optparse.OptionParser(usage="Benchmark Dynamixel bus operations, with JSON output")
+    p.add_option('-d', action='store', type='string', dest='dev_name',
+                 help='Device string for USB2Dynamixel [default: simulated servos]')
+    p.add_option('--baud', action='store', type='int', dest='baud', default=57600,
+                 help='baudrate of the servos on -d [default = 57600]')
+    p.add_option('--bauds', action='store', type='string', dest='bauds', default='57600,1000000',
+                 help='comma separated baudrates to simulate [default = 57600,1000000]')
+    p.add_option('--ids', action='store', type='string', dest='ids',
+                 help='comma separated servo ids [default = 1..max(counts)]')
+    p.add_option('--counts', action='store', type='string', dest='counts', default='1',
+                 help='comma separated numbers of servos to address per call [default = 1]')
+    p.add_option('--ops', action='store', type='string', dest='ops', default=','.join(OPERATIONS),
+                 help='comma separated operations [default = all]')
+    p.add_option('-n', action='store', type='int', dest='iterations', default=200,
+                 help='calls per operation [default = 200]')
+    p.add_option('--model', action='store', type='int', dest='model', default=310,
+                 help='model number of simulated servos [default = 310 (MX-64)]')
+    p.add_option('-o', action='store', type='string', dest='output',
+                 help='file to write JSON results to [default: stdout]')
+    opt, args = p.parse_args()
+
+    if opt.dev_name is None:
+        baudrates = [int(b) for b in opt.bauds.split(',')]
+    else:
+        baudrates = [opt.baud]
+    ids = [int(id) for id in opt.ids.split(',')] if opt.ids else None
+    counts = [int(n) for n in opt.counts.split(',')]
+    stdout, sys.stdout = sys.stdout, sys.stderr  # Keep library messages out of the JSON
+    report = run(opt.dev_name, baudrates, ids, counts, opt.ops.split(','), opt.iterations, opt.model)
+    sys.stdout = stdout
+    if opt.output:
+        with open(opt.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print
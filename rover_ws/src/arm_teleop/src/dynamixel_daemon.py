@@ -0,0 +1,327 @@
+#!/usr/bin/python
+
+# Share one USB2Dynamixel between processes.
+#
+# A Dynamixel_Bus_Server owns the serial port and serves clients over a Unix
+# socket.  Each client is a Dynamixel_Chain whose bus transactions are
+# forwarded to the server, so the whole Dynamixel_Chain API works unchanged:
+#     python dynamixel_daemon.py -d /dev/ttyUSB0 --baud 1000000
+# and, in any number of other processes:
+#     import dynamixel_daemon as dd
+#     dyn = dd.Dynamixel_Client('/dev/ttyUSB0')
+#     dyn.move_angle(1, 0.5)
+#
+# Instructions from all clients go through one Dynamixel_IO_Thread, so requests
+# that arrive together share the bus: reads from MX-series servos are merged into
+# BULK_READs and, with --no-ack, writes of the same block into SYNC_WRITEs.
+# Clients read through the control table mirror of the server's chain: every
+# write passes through it, so no client sees another's stale values.
+#
+# Messages are JSON objects, one per line.  A request is
+#     {"op": ..., "args": [...]}
+# and the reply {"result": ...} or {"error": "message"}.
+
+import os
+import sys
+import json
+import socket
+import threading
+import optparse
+
+import lib_dynamixel as ld
+
+
+def socket_path(dev):
+    ''' The default socket for the daemon serving dev.
+    '''
+    return '/tmp/dynamixel_%s.sock' % os.path.basename(str(dev))
+
+
+def _json_default(obj):
+    if hasattr(obj, 'tolist'):  # numpy arrays and scalars
+        return obj.tolist()
+    raise TypeError('%r is not JSON serializable' % (obj,))
+
+
+class Dynamixel_Bus_Server():
+
+    ''' Serves a Dynamixel_Chain to clients on a Unix socket, one thread per client.
+        Call serve_forever(), or start() to serve from a background thread.
+    '''
+
+    def __init__(self, chain, path=None):
+        self.chain = chain
+        self.path = path or socket_path(chain.dev_name)
+        self.io = ld.Dynamixel_IO_Thread(chain)
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # Left by a daemon that did not shut down
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.path)
+        self.sock.listen(16)
+        self.should_run = True
+        self.clients = []
+        self.ops = {'info': self.info,
+                    'transact': self.transact,
+                    'read': self.read,
+                    'packet': self.packet,
+                    'bulk_read': self.bulk_read,
+                    'set_status_return_level': self.set_status_return_level,
+                    'call': self.call}
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def serve_forever(self):
+        while self.should_run:
+            try:
+                conn, addr = self.sock.accept()
+            except socket.error:
+                break  # Closed by stop()
+            self.clients.append(conn)
+            thread = threading.Thread(target=self._serve_client, args=(conn,))
+            thread.daemon = True
+            thread.start()
+
+    def stop(self):
+        self.should_run = False
+        for sock in [self.sock] + self.clients:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)  # Wakes the threads blocked on them
+            except socket.error:
+                pass
+        self.sock.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.io.stop()
+
+    def _serve_client(self, conn):
+        f = conn.makefile('rb')
+        try:
+            for line in f:
+                try:
+                    request = json.loads(line)
+                    reply = {'result': self.ops[request['op']](*request.get('args', []))}
+                except Exception as e:
+                    reply = {'error': str(e)}
+                conn.sendall(json.dumps(reply, default=_json_default) + '\n')
+        except socket.error:
+            pass  # Client went away
+        finally:
+            f.close()
+            conn.close()
+            self.clients.remove(conn)
+
+    def info(self):
+        ''' What a client needs to set itself up without touching the bus.
+        '''
+        chain = self.chain
+        servos = dict((id, {'model': chain.read_model_number(id),
+                            'firmware': chain.read_firmware_version(id)})
+                      for id in chain.servos.keys())
+        return {'dev': chain.dev_name,
+                'baudrate': chain.baudrate,
+                'servos': servos,
+                'status_return_levels': chain.status_return_levels}
+
+    def transact(self, instruction, id, status_return=None, priority=None, deadline=None):
+        request = self.io.submit(instruction, id, status_return, priority=priority, deadline=deadline)
+        return request.result(self.chain.max_timeout * (self.chain.max_retries + 2))
+
+    def read(self, id, address, nBytes, max_age=None):
+        ''' Serve a read from the chain's control table mirror if it has the data
+            (see Dynamixel_Chain.read_address), otherwise from the servo.
+        '''
+        mirror = self.chain.mirrors.get(id)
+        if mirror is not None:
+            data = mirror.get(address, nBytes, max_age)
+            if data is not None:
+                return data
+        return self.transact([0x02, address, nBytes], id)
+
+    def packet(self, packet, priority=None, deadline=None):
+        ''' Split a buffer of prebuilt instruction packets (e.g. a SYNC_WRITE) into
+            instructions and queue them without waiting for status packets.
+        '''
+        requests = []
+        i = 0
+        while i + 4 < len(packet):
+            length = packet[i + 3]
+            requests.append(self.io.submit(packet[i + 4:i + length + 3], packet[i + 2], False,
+                                           priority=priority, deadline=deadline))
+            i += length + 4
+        for request in requests:
+            request.result(self.chain.max_timeout)
+
+    def bulk_read(self, reads, priority=None, deadline=None):
+        ''' Queue the reads together, so the I/O thread can merge them into a BULK_READ.
+            returns [id, data, 0] or {'error': message} for each read
+        '''
+        requests = [self.io.submit([0x02, address, nBytes], id, True,
+                                   priority=priority, deadline=deadline)
+                    for id, address, nBytes in reads]
+        replies = []
+        for (id, address, nBytes), request in zip(reads, requests):
+            try:
+                replies.append([id, request.result(self.chain.max_timeout * (self.chain.max_retries + 2)), 0])
+            except Exception as e:
+                replies.append({'error': str(e)})
+        return replies
+
+    def set_status_return_level(self, id, level):
+        self.chain.set_status_return_level(id, level)
+        return self.chain.status_return_levels
+
+    # Diagnostics clients may run on the server with call().  Anything that
+    # talks to the servos must go through the I/O thread instead.
+    CALLS = ('recovery_counts', 'reply_margin', 'stats')
+
+    def call(self, name, *args):
+        ''' Run one of CALLS: a Dynamixel_Chain method, or stats() below.
+        '''
+        if name not in self.CALLS:
+            raise RuntimeError('lib_dynamixel: %s is not available to Dynamixel bus clients' % name)
+        if name == 'stats':
+            return self.stats(*args)
+        return getattr(self.chain, name)(*args)
+
+    def stats(self, key='instruction'):
+        ''' The chain's Bus_Statistics summary (see Bus_Statistics.summary), or None
+            if statistics are not enabled.
+        '''
+        if self.chain.stats is None:
+            return None
+        return self.chain.stats.summary(key)
+
+
+class Dynamixel_Client(ld.Dynamixel_Chain):
+
+    ''' A Dynamixel_Chain on a port owned by a Dynamixel_Bus_Server.  Each thread
+        gets its own connection, so requests from different threads are
+        arbitrated (and batched) by the server rather than queued here.
+    '''
+
+    def __init__(self, dev='/dev/ttyUSB0', ids=None, path=None):
+        ''' dev - the port the server was started on
+            ids - servos to use (by default all those the server found)
+            path - the server's socket, if not the default for dev
+        '''
+        self.path = path or socket_path(dev)
+        self._local = threading.local()
+        self._info = self._call('info')
+        ld.Dynamixel_Chain.__init__(self, dev, self._info['baudrate'], ids, cache_file=None)
+
+    def _open_serial(self, baudrate):
+        return None  # The server has the port
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                conn.connect(self.path)
+            except socket.error:
+                raise RuntimeError('lib_dynamixel: No Dynamixel bus server at %s\n' % self.path)
+            self._local.conn = conn
+            self._local.f = conn.makefile('rb')
+        return conn, self._local.f
+
+    def _call(self, op, *args):
+        conn, f = self._connection()
+        conn.sendall(json.dumps({'op': op, 'args': args}) + '\n')
+        line = f.readline()
+        if not line:
+            self._local.conn = None
+            raise RuntimeError('lib_dynamixel: Lost connection to Dynamixel bus server\n')
+        reply = json.loads(line)
+        if 'error' in reply:
+            raise RuntimeError(reply['error'])
+        return reply['result']
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.f.close()
+            conn.close()
+            self._local.conn = None
+
+    def _cached_topology(self, ids=None):
+        servos = dict((int(id), info) for id, info in self._info['servos'].items())
+        if ids is None:
+            return servos
+        missing = [id for id in ids if id not in servos]
+        if missing:
+            raise RuntimeError('lib_dynamixel: Server at %s has no servo(s) %s' % (self.path, missing))
+        return dict((id, servos[id]) for id in ids)
+
+    def _save_topology(self):
+        pass
+
+    def _read_status_return_levels(self, ids):
+        levels = self._info['status_return_levels']
+        self.status_return_levels = dict((int(id), level) for id, level in levels.items()
+                                         if int(id) in ids)
+
+    def read_address(self, id, address, nBytes=1, max_age=None):
+        # Other clients' writes only invalidate the server's mirror, so read
+        # through it rather than the one in this process
+        if id in self._thread_batch().pending:
+            self.flush_writes()
+        return self._call('read', id, address, nBytes, max_age)
+
+    def _transact(self, instruction, id, status_return=None, priority=None, deadline=None):
+        # Servo errors are raised by the server, so any reply here is error free
+        return id, self._call('transact', instruction, id, status_return, priority, deadline), 0
+
+    def send_packet(self, packet, priority=ld.Bus_Arbiter.COMMAND, deadline=None):
+        self._call('packet', list(bytearray(packet)), priority, deadline)
+
+    def _bulk_read(self, reads, priority=ld.Bus_Arbiter.TELEMETRY, deadline=None):
+        replies = self._call('bulk_read', reads, priority, deadline)
+        return [RuntimeError(reply['error']) if isinstance(reply, dict) else tuple(reply)
+                for reply in replies]
+
+    def set_status_return_level(self, id, level=2):
+        if self._thread_batch().pending:
+            self.flush_writes()
+        self._invalidate_mirror(id, 0x10, 1)
+        levels = self._call('set_status_return_level', id, level)
+        self.status_return_levels = dict((int(i), l) for i, l in levels.items()
+                                         if int(i) in self.servos)
+        return []
+
+    def server_call(self, name, *args):
+        ''' Run a diagnostic on the server, e.g. server_call('recovery_counts').
+            name is one of Dynamixel_Bus_Server.CALLS.
+        '''
+        return self._call('call', name, *args)
+
+
+if __name__ == '__main__':
+    p = optparse.OptionParser(usage="Serve a USB2Dynamixel to other processes on a Unix socket")
+    p.add_option('-d', action='store', type='string', dest='dev_name', default='/dev/ttyUSB0',
+                 help='Device string for USB2Dynamixel [default = /dev/ttyUSB0]')
+    p.add_option('--baud', action='store', type='int', dest='baud', default=57600,
+                 help='baudrate of the servos [default = 57600]')
+    p.add_option('--ids', action='store', type='string', dest='ids',
+                 help='comma separated servo ids [default: scan]')
+    p.add_option('-s', action='store', type='string', dest='path',
+                 help='socket to serve on [default: /tmp/dynamixel_<device>.sock]')
+    p.add_option('--no-ack', action='store_true', dest='no_ack', default=False,
+                 help='set the servos not to acknowledge writes, so writes can be merged')
+    opt, args = p.parse_args()
+
+    ids = [int(id) for id in opt.ids.split(',')] if opt.ids else None
+    chain = ld.Dynamixel_Chain(opt.dev_name, opt.baud, ids)
+    if opt.no_ack:
+        chain.set_write_acknowledgement(False)
+    server = Dynamixel_Bus_Server(chain, opt.path)
+    print 'Serving %s on %s' % (opt.dev_name, server.path)
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.stop()
@@ -0,0 +1,445 @@
+#!/usr/bin/python
+
+# Simulated Robotis Dynamixel servos on a simulated USB2Dynamixel, for running
+# lib_dynamixel, lib_robotis and robotis_servo without hardware.
+#
+# In-process, pass a Simulated_Bus as the serial device:
+#     import lib_dynamixel as ld, dynamixel_sim as ds
+#     bus = ds.Simulated_Bus([ds.Simulated_Servo(1), ds.Simulated_Servo(2, model=28)])
+#     dyn = ld.Dynamixel_Chain('sim', 57600, serial_dev=bus, cache_file=None)
+#
+# Or expose the bus on a pseudo-terminal and open it by name:
+#     python dynamixel_sim.py --ids 1,2 --model 310
+#     (prints e.g. /dev/pts/5, usable as the dev_name of any of the libraries)
+
+import os
+import select
+import threading
+import time
+import random
+import termios
+import tty
+import optparse
+
+# model number: (name, control table size, encoder ticks per revolution)
+MODELS = {29: ('MX-28', 0x4A, 4096),
+          310: ('MX-64', 0x4A, 4096),
+          320: ('MX-106', 0x4A, 4096),
+          24: ('RX-24', 0x32, 1228.8),  # 1024 ticks over 300 degrees
+          28: ('RX-28', 0x32, 1228.8),
+          64: ('RX-64', 0x32, 1228.8)}
+
+# Addresses that reject writes (model, firmware, present values, moving)
+READ_ONLY = set([0, 1, 2] + range(36, 44) + [46] + range(0x44, 0x46))
+
+
+def _baud_register(baudrate):
+    return max(0, min(254, int(round(2000000. / baudrate)) - 1))
+
+
+def _checksum(body):
+    return (~sum(body)) % 256
+
+
+class Simulated_Servo():
+
+    ''' Protocol 1.0 control table and a simple motion model for one servo.
+        Goal position is approached at the moving speed (0 = full speed)
+        while torque is enabled.  Set error to report alarm flags in every
+        status packet, e.g. servo.error = 32 for an overload.
+    '''
+
+    def __init__(self, id=1, model=310, firmware=36, baudrate=57600):
+        if model not in MODELS:
+            raise RuntimeError('dynamixel_sim: Unsupported model number: %d' % model)
+        self.model = model
+        self.name, size, self.ticks_per_rev = MODELS[model]
+        self.mx = size == 0x4A
+        self.table = bytearray(size)
+        self.error = 0
+        self._factory_defaults(firmware)
+        self.table[3] = id
+        self.table[4] = _baud_register(baudrate)
+        self._position = float(self._word(36))
+        self._stamp = time.time()
+
+    def _factory_defaults(self, firmware):
+        t = self.table
+        max_enc = 4095 if self.mx else 1023
+        t[0], t[1], t[2], t[3] = self.model % 256, self.model / 256, firmware, 1
+        t[4] = _baud_register(57600)
+        t[5] = 250  # Return delay, 2 us units
+        self._set_word(6, 0)  # CW angle limit
+        self._set_word(8, max_enc)  # CCW angle limit
+        t[11], t[12], t[13] = 80, 60, 160  # Temperature and voltage limits
+        self._set_word(14, 0x3FF)  # Max torque
+        t[16], t[17], t[18] = 2, 36, 36  # Status return level, alarm LED, alarm shutdown
+        if self.mx:
+            t[26], t[27], t[28] = 0, 0, 32  # D, I, P gains
+        else:
+            t[26], t[27], t[28], t[29] = 1, 1, 32, 32  # Compliance margins and slopes
+        center = (max_enc + 1) / 2
+        self._set_word(30, center)
+        self._set_word(34, 0x3FF)  # Torque limit
+        self._set_word(36, center)
+        t[42], t[43] = 120, 40  # 12.0 V, 40 C
+        self._set_word(48, 32)  # Punch
+
+    def _word(self, address):
+        return self.table[address] + self.table[address + 1] * 256
+
+    def _set_word(self, address, value):
+        self.table[address] = value % 256
+        self.table[address + 1] = value / 256
+
+    @property
+    def id(self):
+        return self.table[3]
+
+    @property
+    def baudrate(self):
+        return 2000000. / (self.table[4] + 1)
+
+    @property
+    def return_delay(self):
+        return self.table[5] * 2e-6
+
+    @property
+    def status_return_level(self):
+        return self.table[16]
+
+    def update(self, now=None):
+        ''' Advance the motion model to now.
+        '''
+        if now is None:
+            now = time.time()
+        dt, self._stamp = now - self._stamp, now
+        goal = self._word(30)
+        speed_reg = self._word(32) % 1024 or 1023
+        rate = speed_reg * 0.114 / 60. * self.ticks_per_rev  # ticks/sec
+        error = goal - self._position
+        if not self.table[24] or error == 0:
+            self._set_word(38, 0)
+            self.table[46] = 0
+            return
+        step = min(abs(error), rate * dt)
+        self._position += step if error > 0 else -step
+        self._set_word(36, int(round(self._position)))
+        self._set_word(38, speed_reg if error > 0 else speed_reg + 1024)
+        self.table[46] = int(self._position != goal)
+
+    def read(self, address, nBytes):
+        ''' returns (err, data); reads past the control table set the Range Error flag.
+        '''
+        if address + nBytes > len(self.table):
+            return self.error | 8, []
+        self.update()
+        return self.error, list(self.table[address:address + nBytes])
+
+    def write(self, address, data):
+        ''' returns err; writes past the control table set the Range Error flag.
+        '''
+        if address + len(data) > len(self.table):
+            return self.error | 8
+        self.update()
+        if self.table[47] and address < 0x18:
+            return self.error | 8  # EEPROM locked
+        for i, byte in enumerate(data):
+            if address + i not in READ_ONLY:
+                self.table[address + i] = byte
+        if address <= 31 and address + len(data) > 30:
+            self._position = float(self._word(36))  # Start a new move from here
+        return self.error
+
+    def reset(self):
+        ''' RESET instruction: factory defaults (ID 1, 57600 baud).
+        '''
+        self._factory_defaults(self.table[2])
+        self._position = float(self._word(36))
+
+
+class Simulated_Bus():
+
+    ''' Serial-port-like object with Simulated_Servos on the other end.
+        Implements the parts of the pyserial Serial interface the servo
+        libraries use.  Instruction and status packets take their real time on
+        the wire at the port baudrate (10 bits per byte), each servo waits its
+        return delay before answering, and only servos whose baudrate matches
+        the port see anything.  With realtime=False, replies are available
+        immediately and nothing sleeps.
+
+        Fault injection (probabilities per status packet):
+            drop - the reply is lost
+            corrupt - one byte of the reply is flipped
+            noise - a few random bytes arrive before the reply
+    '''
+
+    def __init__(self, servos=None, baudrate=57600, timeout=1.0, realtime=True,
+                 drop=0., corrupt=0., noise=0., seed=None):
+        self.servos = {}
+        for servo in (servos or []):
+            self.add_servo(servo)
+        self.port = 'sim'
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.realtime = realtime
+        self.drop = drop
+        self.corrupt = corrupt
+        self.noise = noise
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.tx_bytes = 0
+        self.rx_bytes = 0
+        self._incoming = bytearray()  # Instruction bytes not yet forming a packet
+        self._replies = []  # [start time, bytearray] in arrival order
+        self._busy_until = 0.  # When the bus is next idle
+        self._open = True
+
+    def add_servo(self, servo):
+        self.servos[servo.id] = servo
+
+    # pyserial interface
+
+    def isOpen(self):
+        return self._open
+
+    def open(self):
+        self._open = True
+
+    def close(self):
+        self._open = False
+
+    def setTimeout(self, timeout):
+        self.timeout = timeout
+
+    def setBaudrate(self, baudrate):
+        self.baudrate = baudrate
+
+    def setParity(self, parity):
+        pass
+
+    def setStopbits(self, stopbits):
+        pass
+
+    def flushOutput(self):
+        pass
+
+    def flush(self):
+        pass
+
+    def flushInput(self):
+        with self.lock:
+            now = time.time()
+            self._replies = [r for r in self._replies if r[0] > now] if self.realtime else []
+
+    def inWaiting(self):
+        with self.lock:
+            return self._available(time.time())
+
+    def write(self, data):
+        data = bytearray(data)
+        with self.lock:
+            now = time.time()
+            start = max(now, self._busy_until)
+            self._busy_until = start + self._wire_time(len(data))
+            self.tx_bytes += len(data)
+            self._incoming.extend(data)
+            self._process_incoming()
+        return len(data)
+
+    def read(self, nBytes=1):
+        deadline = time.time() + (self.timeout if self.timeout is not None else 1e9)
+        while True:
+            with self.lock:
+                now = time.time()
+                available = self._available(now)
+                if available >= nBytes or now >= deadline:
+                    out = self._take(min(available, nBytes), now)
+                    self.rx_bytes += len(out)
+                    return str(out)
+                wake = self._time_of_byte(nBytes)
+            time.sleep(max(0., min(wake, deadline) - time.time()))
+
+    # Bus timing
+
+    def _wire_time(self, nBytes):
+        return nBytes * 10. / self.baudrate
+
+    def _available(self, now):
+        count = 0
+        for start, data in self._replies:
+            if not self.realtime:
+                count += len(data)
+            else:
+                arrived = max(0, min(len(data), int((now - start) / self._wire_time(1))))
+                count += arrived
+                if arrived < len(data):
+                    break
+        return count
+
+    def _time_of_byte(self, n):
+        ''' Time at which the n-th pending byte will have arrived.
+        '''
+        for start, data in self._replies:
+            if n <= len(data):
+                return start + self._wire_time(n)
+            n -= len(data)
+        return time.time() + 1e9
+
+    def _take(self, n, now):
+        out = bytearray()
+        while n > 0:
+            start, data = self._replies[0]
+            part = data[:n]
+            out.extend(part)
+            n -= len(part)
+            if len(part) == len(data):
+                self._replies.pop(0)
+            else:
+                # The rest of this packet keeps arriving from where it left off
+                self._replies[0] = [start + self._wire_time(len(part)), data[len(part):]]
+        return out
+
+    # Protocol
+
+    def _process_incoming(self):
+        buf = self._incoming
+        while len(buf) >= 4:
+            if buf[0] != 0xFF or buf[1] != 0xFF:
+                del buf[0]  # Line noise; servos hunt for the next header
+                continue
+            end = buf[3] + 4
+            if len(buf) < end:
+                return
+            packet = buf[:end]
+            del buf[:end]
+            self._handle(packet)
+
+    def _reply(self, servo, err, params, ready):
+        ''' Queue a status packet from servo that starts after the bus is free at time ready.
+            returns the time the packet finishes.
+        '''
+        body = [servo.id, len(params) + 2, err] + params
+        data = bytearray([0xFF, 0xFF] + body + [_checksum(body)])
+        rand = self.random.random
+        if self.drop and rand() < self.drop:
+            return ready
+        if self.corrupt and rand() < self.corrupt:
+            data[self.random.randrange(2, len(data))] ^= 1 << self.random.randrange(8)
+        if self.noise and rand() < self.noise:
+            data[0:0] = bytearray(self.random.randrange(256) for i in range(self.random.randint(1, 4)))
+        start = ready + servo.return_delay
+        self._replies.append([start, data])
+        self._busy_until = start + self._wire_time(len(data))
+        return self._busy_until
+
+    def _handle(self, packet):
+        id, instruction = packet[2], packet[4]
+        params = list(packet[5:-1])
+        servos = [s for s in self.servos.values() if abs(s.baudrate - self.baudrate) < 0.03 * self.baudrate]
+        ready = self._busy_until
+        if _checksum(packet[2:-1]) != packet[-1]:
+            for servo in servos:
+                if servo.id == id:
+                    self._reply(servo, servo.error | 16, [], ready)
+            return
+        if instruction == 0x83:  # SYNC_WRITE, no replies
+            address, nBytes = params[0], params[1]
+            for k in range(2, len(params) - nBytes, nBytes + 1):
+                for servo in servos:
+                    if servo.id == params[k]:
+                        servo.write(address, params[k + 1:k + 1 + nBytes])
+            return
+        if instruction == 0x92:  # BULK_READ, replies in the order requested
+            for k in range(1, len(params) - 2, 3):
+                nBytes, sid, address = params[k:k + 3]
+                for servo in servos:
+                    if servo.id == sid and servo.mx:
+                        err, data = servo.read(address, nBytes)
+                        ready = self._reply(servo, err, data, ready)
+            return
+        for servo in servos:
+            if servo.id != id and id != 0xFE:
+                continue
+            level = servo.status_return_level
+            if instruction == 0x01:
+                err, data, needs = servo.error, [], 0
+            elif instruction == 0x02:
+                err, data = servo.read(params[0], params[1])
+                needs = 1
+            elif instruction == 0x03:
+                err, data, needs = servo.write(params[0], params[1:]), [], 2
+            elif instruction == 0x06:
+                servo.reset()
+                err, data, needs = servo.error, [], 2
+            else:
+                err, data, needs = servo.error | 64, [], 0  # Instruction Error
+            if id != 0xFE and level >= needs:
+                self._reply(servo, err, data, ready)
+        # Servos may have changed id (e.g. WRITE to address 3) or been reset
+        self.servos = dict((s.id, s) for s in self.servos.values())
+
+
+class Pty_Bridge():
+
+    ''' Serves a Simulated_Bus on a pseudo-terminal, for code that opens its
+        serial device by name.  The bus follows the baudrate the client sets
+        on the terminal when it is a standard termios rate.
+    '''
+
+    def __init__(self, bus):
+        self.bus = bus
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.dev_name = os.ttyname(self.slave)
+        self._speeds = dict((getattr(termios, 'B%d' % b), b)
+                            for b in [9600, 19200, 57600, 115200, 230400, 460800, 500000,
+                                      1000000, 2000000, 2500000, 3000000]
+                            if hasattr(termios, 'B%d' % b))
+        self.bus.setTimeout(0.)
+        self._running = True
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            readable, _, _ = select.select([self.master], [], [], 0.0005)
+            if readable:
+                speed = termios.tcgetattr(self.slave)[5]
+                if speed in self._speeds:
+                    self.bus.setBaudrate(self._speeds[speed])
+                self.bus.write(os.read(self.master, 4096))
+            out = self.bus.read(self.bus.inWaiting())
+            if out:
+                os.write(self.master, out)
+
+    def close(self):
+        self._running = False
+        self._thread.join()
+        os.close(self.master)
+        os.close(self.slave)
+
+
+if __name__ == '__main__':
+    p = optparse.OptionParser(usage="Serve simulated Dynamixel servos on a pseudo-terminal")
+    p.add_option('--ids', action='store', type='string', dest='ids', default='1',
+                 help='comma separated servo ids [default = 1]')
+    p.add_option('--model', action='store', type='int', dest='model', default=310,
+                 help='model number: 29, 310, 320 (MX) or 24, 28, 64 (RX) [default = 310]')
+    p.add_option('--baud', action='store', type='int', dest='baud', default=57600,
+                 help='baudrate of the servos [default = 57600]')
+    p.add_option('--drop', action='store', type='float', dest='drop', default=0.,
+                 help='probability of dropping each status packet')
+    p.add_option('--corrupt', action='store', type='float', dest='corrupt', default=0.,
+                 help='probability of corrupting each status packet')
+    opt, args = p.parse_args()
+
+    servos = [Simulated_Servo(int(id), opt.model, baudrate=opt.baud) for id in opt.ids.split(',')]
+    bridge = Pty_Bridge(Simulated_Bus(servos, opt.baud, drop=opt.drop, corrupt=opt.corrupt))
+    print bridge.dev_name
+    try:
+        while True:
+            time.sleep(1.)
+    except KeyboardInterrupt:
+        bridge.close()
@@ -0,0 +1,812 @@
+from math import sin, cos
+import numpy as np
+pi = np.pi
+
+class hal_arm_dynamics(): 
+    def __init__(self):
+        pass
+
+    # The parms argument, per link: inertia tensor L and first moment of mass l
+    # (mass times centre of mass) about the link frame, mass m, then the
+    # coefficients of the friction model
+    dynparms = ['L_1xx', 'L_1xy', 'L_1xz', 'L_1yy', 'L_1yz', 'L_1zz', 'l_1x', 'l_1y', 'l_1z', 'm_1', 'fv_1',
+                'L_2xx', 'L_2xy', 'L_2xz', 'L_2yy', 'L_2yz', 'L_2zz', 'l_2x', 'l_2y', 'l_2z', 'm_2', 'fv_2',
+                'L_3xx', 'L_3xy', 'L_3xz', 'L_3yy', 'L_3yz', 'L_3zz', 'l_3x', 'l_3y', 'l_3z', 'm_3', 'fv_3',
+                'L_4xx', 'L_4xy', 'L_4xz', 'L_4yy', 'L_4yz', 'L_4zz', 'l_4x', 'l_4y', 'l_4z', 'm_4', 'fv_4',
+                'L_5xx', 'L_5xy', 'L_5xz', 'L_5yy', 'L_5yz', 'L_5zz', 'l_5x', 'l_5y', 'l_5z', 'm_5', 'fv_5',
+                'L_6xx', 'L_6xy', 'L_6xz', 'L_6yy', 'L_6yz', 'L_6zz', 'l_6x', 'l_6y', 'l_6z', 'm_6', 'fv_6']
+
+
+
+    @staticmethod
+    def invdyn(parms, q, dq, ddq):
+    #
+        tau = [0]*6
+    #
+        x0 = ddq[0]*parms[6]
+        x1 = 0.10795*sin(q[0])**2 + 0.10795*cos(q[0])**2
+        x2 = dq[0]**2
+        x3 = parms[8]*x2
+        x4 = ddq[0]*x1
+        x5 = sin(q[1])
+        x6 = cos(q[1])
+        x7 = dq[0]*x6
+        x8 = ddq[0]*x5 + dq[1]*x7
+        x9 = dq[0]*x5
+        x10 = dq[1]*x9
+        x11 = ddq[0]*x6 - x10
+        x12 = -dq[1]*parms[18] + parms[19]*x7
+        x13 = x6**2
+        x14 = 0.381*x13 + 0.381*x5**2
+        x15 = x10*x14 - x11*x14 - x4
+        x16 = cos(q[2])
+        x17 = x16*x9
+        x18 = sin(q[2])
+        x19 = x18*x7
+        x20 = x17 + x19
+        x21 = dq[1] + dq[2]
+        x22 = -parms[29]*x20 + parms[30]*x21
+        x23 = x16*x7 - x18*x9
+        x24 = -parms[28]*x21 + parms[29]*x23
+        x25 = dq[2]*x7 + x8
+        x26 = x16*x25
+        x27 = -dq[2]*x9 + x11
+        x28 = x18*x27
+        x29 = x26 + x28
+        x30 = x16*x27 - x18*x25
+        x31 = 0.06985*x16**2 + 0.06985*x18**2
+        x32 = x23*x31
+        x33 = x15 + x21*x32 + x29*x31
+        x34 = cos(q[3])
+        x35 = -ddq[3] - x26 - x28
+        x36 = parms[39]*x35
+        x37 = -dq[3] - x17 - x19
+        x38 = x21*x34
+        x39 = sin(q[3])
+        x40 = x23*x39
+        x41 = x38 - x40
+        x42 = -parms[40]*x41 + parms[41]*x37
+        x43 = x37*x42
+        x44 = ddq[1] + ddq[2]
+        x45 = -dq[3]*x23 + x44
+        x46 = x39*x45
+        x47 = dq[3]*x21 + x30
+        x48 = x34*x47
+        x49 = x46 + x48
+        x50 = parms[40]*x49
+        x51 = x21*x39
+        x52 = x23*x34
+        x53 = x51 + x52
+        x54 = parms[39]*x41 - parms[41]*x53
+        x55 = x53*x54
+        x56 = sin(q[4])
+        x57 = cos(q[4])
+        x58 = x37*x56 + x53*x57
+        x59 = dq[4] + x41
+        x60 = -parms[50]*x59 + parms[51]*x58
+        x61 = x58*x60
+        x62 = -x37*x57 + x53*x56
+        x63 = -parms[51]*x62 + parms[52]*x59
+        x64 = x62*x63
+        x65 = -dq[4]*x53 + x35
+        x66 = dq[4]*x37 + x49
+        x67 = x56*x66 - x57*x65
+        x68 = parms[50]*x67
+        x69 = x56*x65 + x57*x66
+        x70 = parms[52]*x69
+        x71 = 0.3556*x38 - 0.3556*x40
+        x72 = x1*x2
+        x73 = x14*x2
+        x74 = ddq[1]*x14 + x5*x6*x73 + x5*x72 + 9.81*x6
+        x75 = -dq[1]**2*x14 - x13*x73 + 9.81*x5 - x6*x72
+        x76 = x16*x74 - x18*x75 - x20**2*x31 - x21**2*x31
+        x77 = x33*x34 - x37*x71 - x39*x76 - 0.3556*x46 - 0.3556*x48
+        x78 = parms[42]*x77
+        x79 = parms[53]*x77
+        x80 = cos(q[5])
+        x81 = ddq[5] + x67
+        x82 = parms[61]*x81
+        x83 = dq[5] + x62
+        x84 = x59*x80
+        x85 = sin(q[5])
+        x86 = x58*x85
+        x87 = x84 - x86
+        x88 = -parms[62]*x83 + parms[63]*x87
+        x89 = x83*x88
+        x90 = x59*x85
+        x91 = x58*x80
+        x92 = x90 + x91
+        x93 = -parms[61]*x87 + parms[62]*x92
+        x94 = x92*x93
+        x95 = x34*x45
+        x96 = x39*x47
+        x97 = x95 - x96
+        x98 = ddq[4] + x97
+        x99 = -dq[5]*x58 + x98
+        x100 = x85*x99
+        x101 = dq[5]*x59 + x69
+        x102 = x101*x80
+        x103 = x100 + x102
+        x104 = parms[63]*x103
+        x105 = 0.2413*x84 - 0.2413*x86
+        x106 = x31*x44
+        x107 = x20*x32
+        x108 = -0.3556*x51 - 0.3556*x52
+        x109 = x18*x74
+        x110 = x16*x75
+        x111 = x106 - x107 - x108*x53 - x109 - x110 + x41*x71
+        x112 = x108*x37 + x33*x39 + x34*x76 + 0.3556*x95 - 0.3556*x96
+        x113 = x111*x56 + x112*x57
+        x114 = -0.2413*x100 - 0.2413*x102 + x105*x83 - x113*x85 + x77*x80
+        x115 = parms[64]*x114
+        x116 = -x104 + x115 + x82 + x89 - x94
+        x117 = x116*x80
+        x118 = parms[62]*x81
+        x119 = parms[61]*x83 - parms[63]*x92
+        x120 = x119*x83
+        x121 = x87*x93
+        x122 = x80*x99
+        x123 = x101*x85
+        x124 = x122 - x123
+        x125 = parms[63]*x124
+        x126 = -0.2413*x90 - 0.2413*x91
+        x127 = x113*x80 + 0.2413*x122 - 0.2413*x123 - x126*x83 + x77*x85
+        x128 = parms[64]*x127
+        x129 = -x118 - x120 + x121 + x125 + x128
+        x130 = x129*x85
+        x131 = x117 + x130 - x36 - x43 + x50 + x55 - x61 + x64 + x68 - x70 + x78 + x79
+        x132 = parms[41]*x35
+        x133 = -parms[39]*x37 + parms[40]*x53
+        x134 = x133*x37
+        x135 = parms[40]*x97
+        x136 = x41*x54
+        x137 = parms[42]*x112
+        x138 = parms[50]*x62 - parms[52]*x58
+        x139 = -x111*x57 + x112*x56
+        x140 = -x105*x87 + x126*x92 + x139
+        x141 = -parms[50]*x98 + parms[51]*x69 + parms[53]*x139 - parms[61]*x124 + parms[62]*x103 + parms[64]*x140 + x119*x92 + x138*x58 - x59*x63 - x87*x88
+        x142 = x141*x56
+        x143 = -parms[51]*x67 + parms[52]*x98 + parms[53]*x113 - x116*x85 + x129*x80 - x138*x62 + x59*x60
+        x144 = x143*x57
+        x145 = x132 + x134 - x135 - x136 + x137 + x142 + x144
+        x146 = parms[28]*x29 - parms[30]*x30 + parms[31]*x33 + x131*x34 + x145*x39 + x20*x22 - x23*x24
+        x147 = -parms[17]*x11 + parms[18]*x8 + parms[20]*x15 - x12*x7 + x146 + x9*(dq[1]*parms[17] - parms[19]*x9)
+        x148 = dq[1]*parms[15] + parms[12]*x9 + parms[14]*x7
+        x149 = dq[1]*parms[16] + parms[13]*x9 + parms[15]*x7
+        x150 = parms[22]*x23 + parms[23]*x21 + parms[24]*x20
+        x151 = parms[23]*x23 + parms[25]*x21 + parms[26]*x20
+        x152 = parms[35]*x53 + parms[37]*x37 + parms[38]*x41
+        x153 = parms[33]*x53 + parms[34]*x37 + parms[35]*x41
+        x154 = parms[44]*x58 + parms[45]*x59 + parms[46]*x62
+        x155 = parms[45]*x58 + parms[47]*x59 + parms[48]*x62
+        x156 = parms[56]*x92 + parms[58]*x87 + parms[59]*x83
+        x157 = parms[55]*x92 + parms[56]*x87 + parms[57]*x83
+        x158 = parms[57]*x103 + parms[59]*x124 + parms[60]*x81 + parms[61]*x114 - parms[62]*x127 + x156*x92 - x157*x87
+        x159 = parms[46]*x69 + parms[48]*x98 + parms[49]*x67 + parms[50]*x77 - parms[51]*x113 - x154*x59 + x155*x58 + x158
+        x160 = parms[46]*x58 + parms[48]*x59 + parms[49]*x62
+        x161 = parms[57]*x92 + parms[59]*x87 + parms[60]*x83
+        x162 = parms[55]*x103 + parms[56]*x124 + parms[57]*x81 + parms[62]*x140 - parms[63]*x114 + 0.2413*x104 - 0.2413*x115 - x156*x83 + x161*x87 - 0.2413*x82 - 0.2413*x89 + 0.2413*x94
+        x163 = parms[56]*x103 + parms[58]*x124 + parms[59]*x81 - parms[61]*x140 + parms[63]*x127 - 0.2413*x118 - 0.2413*x120 + 0.2413*x121 + 0.2413*x125 + 0.2413*x128 + x157*x83 - x161*x92
+        x164 = parms[44]*x69 + parms[45]*x98 + parms[46]*x67 + parms[51]*x139 - parms[52]*x77 - x155*x62 + x160*x59 + x162*x80 - x163*x85
+        x165 = -parms[34]*x49 - parms[36]*x35 - parms[37]*x97 + parms[39]*x77 - parms[41]*x112 + x152*x53 - x153*x41 + x159*x57 - x164*x56
+        x166 = parms[24]*x30 + parms[26]*x44 + parms[27]*x29 + parms[28]*x33 - parms[29]*x76 + x146*x31 - x150*x21 + x151*x23 + x165
+        x167 = parms[24]*x23 + parms[26]*x21 + parms[27]*x20
+        x168 = -x106 + x107 + x109 + x110
+        x169 = parms[34]*x53 + parms[36]*x37 + parms[37]*x41
+        x170 = parms[45]*x69 + parms[47]*x98 + parms[48]*x67 - parms[50]*x139 + parms[52]*x113 + x154*x62 - x160*x58 + x162*x85 + x163*x80
+        x171 = parms[35]*x49 + parms[37]*x35 + parms[38]*x97 + parms[39]*x111 - parms[40]*x112 + 0.3556*x132 + 0.3556*x134 - 0.3556*x135 - 0.3556*x136 + 0.3556*x137 + 0.3556*x142 + 0.3556*x144 - x153*x37 + x169*x53 + x170
+        x172 = parms[33]*x49 + parms[34]*x35 + parms[35]*x97 + parms[40]*x77 - parms[41]*x111 - 0.3556*x117 - 0.3556*x130 + x152*x37 + x159*x56 + x164*x57 - x169*x41 + 0.3556*x36 + 0.3556*x43 - 0.3556*x50 - 0.3556*x55 + 0.3556*x61 - 0.3556*x64 - 0.3556*x68 + 0.3556*x70 - 0.3556*x78 - 0.3556*x79
+        x173 = parms[22]*x30 + parms[23]*x44 + parms[24]*x29 + parms[29]*x168 - parms[30]*x33 - x151*x20 + x167*x21 - x171*x39 + x172*x34
+        x174 = dq[1]*parms[13] + parms[11]*x9 + parms[12]*x7
+        x175 = parms[28]*x20 - parms[30]*x23
+        x176 = -parms[28]*x44 + parms[29]*x30 + parms[31]*x168 - parms[39]*x97 + parms[41]*x49 - parms[42]*x111 + x133*x53 + x141*x57 - x143*x56 + x175*x23 - x21*x22 - x41*x42
+        x177 = parms[23]*x30 + parms[25]*x44 + parms[26]*x29 - parms[28]*x168 + parms[30]*x76 + x150*x20 - x167*x23 + x171*x34 + x172*x39 - x176*x31
+    #
+        tau[0] = ddq[0]*parms[3] + dq[0]*parms[10] + x0*x1 - x1*x3 - x1*(-parms[9]*x4 - x0 + x147 - x3) + x5*(ddq[1]*parms[13] - dq[1]*x148 + parms[11]*x8 + parms[12]*x11 + parms[18]*x15 - parms[19]*x74 + x149*x7 + x16*x166 - x173*x18) + x6*(ddq[1]*parms[15] + dq[1]*x174 + parms[12]*x8 + parms[14]*x11 - parms[17]*x15 + parms[19]*x75 - x14*x147 - x149*x9 + x16*x173 + x166*x18)
+        tau[1] = ddq[1]*parms[16] + dq[1]*parms[21] + parms[13]*x8 + parms[15]*x11 + parms[17]*x74 - parms[18]*x75 + x14*(ddq[1]*parms[17] + dq[1]*x12 - parms[19]*x8 + parms[20]*x74 + x16*(-parms[29]*x29 + parms[30]*x44 + parms[31]*x76 - x131*x39 + x145*x34 - x175*x20 + x21*x24) + x176*x18 - x9*(-parms[17]*x7 + parms[18]*x9)) + x148*x9 - x174*x7 + x177
+        tau[2] = dq[2]*parms[32] + x177
+        tau[3] = dq[3]*parms[43] + x165
+        tau[4] = dq[4]*parms[54] + x170
+        tau[5] = dq[5]*parms[65] + x158
+    #
+        tau = np.array(tau).reshape(6)
+        return tau
+
+
+
+    @staticmethod
+    def gravity(parms, q):
+    #
+        tau = [0]*6
+    #
+        x0 = cos(q[3])
+        x1 = sin(q[3])
+        x2 = sin(q[2])
+        x3 = sin(q[1])
+        x4 = 9.81*x3
+        x5 = cos(q[2])
+        x6 = cos(q[1])
+        x7 = 9.81*x6
+        x8 = -x2*x4 + x5*x7
+        x9 = x1*x8
+        x10 = parms[42]*x9
+        x11 = parms[53]*x9
+        x12 = sin(q[5])
+        x13 = cos(q[5])
+        x14 = sin(q[4])
+        x15 = x4*x5
+        x16 = x2*x7
+        x17 = -x15 - x16
+        x18 = cos(q[4])
+        x19 = x0*x8
+        x20 = x14*x17 + x18*x19
+        x21 = -x12*x9 + x13*x20
+        x22 = parms[64]*x21
+        x23 = x12*x22
+        x24 = -x12*x20 - x13*x9
+        x25 = parms[64]*x24
+        x26 = x13*x25
+        x27 = -x10 - x11 + x23 + x26
+        x28 = parms[42]*x19
+        x29 = x14*x19 - x17*x18
+        x30 = parms[53]*x29 + parms[64]*x29
+        x31 = x14*x30
+        x32 = parms[53]*x20 - x12*x25 + x13*x22
+        x33 = x18*x32
+        x34 = x28 + x31 + x33
+        x35 = x0*x27 + x1*x34
+        x36 = 0.06985*x2**2 + 0.06985*x5**2
+        x37 = parms[61]*x24 - parms[62]*x21
+        x38 = -parms[50]*x9 - parms[51]*x20 + x37
+        x39 = 0.2413*parms[64]
+        x40 = -parms[61]*x29 + parms[63]*x21 + x21*x39
+        x41 = parms[62]*x29 - parms[63]*x24 - x24*x39
+        x42 = parms[51]*x29 + parms[52]*x9 - x12*x40 + x13*x41
+        x43 = -parms[39]*x9 - parms[41]*x19 - x14*x42 + x18*x38
+        x44 = -parms[29]*x8 + x35*x36 + x43
+        x45 = x15 + x16
+        x46 = -parms[50]*x29 + parms[52]*x20 + x12*x41 + x13*x40
+        x47 = parms[39]*x17 - parms[40]*x19 + 0.3556*x28 + 0.3556*x31 + 0.3556*x33 + x46
+        x48 = -parms[40]*x9 - parms[41]*x17 + 0.3556*x10 + 0.3556*x11 + x14*x38 + x18*x42 - 0.3556*x23 - 0.3556*x26
+        x49 = parms[29]*x45 + x0*x48 - x1*x47
+        x50 = 0.381*x3**2 + 0.381*x6**2
+        x51 = parms[31]*x45 - parms[42]*x17 - x14*x32 + x18*x30
+        x52 = -parms[28]*x45 + parms[30]*x8 + x0*x47 + x1*x48 - x36*x51
+    #
+        tau[0] = x3*(-parms[19]*x7 - x2*x49 + x44*x5) - x35*(0.10795*sin(q[0])**2 + 0.10795*cos(q[0])**2) + x6*(parms[19]*x4 + x2*x44 - x35*x50 + x49*x5)
+        tau[1] = parms[17]*x7 - parms[18]*x4 + x50*(parms[20]*x7 + x2*x51 + x5*(parms[31]*x8 + x0*x34 - x1*x27)) + x52
+        tau[2] = x52
+        tau[3] = x43
+        tau[4] = x46
+        tau[5] = x37
+    #
+        tau = np.array(tau).reshape(6)
+        return tau
+
+
+
+    @staticmethod
+    def mass_matrix(parms, q):
+    #
+        M = [0]*36
+    #
+        x0 = 0.10795*sin(q[0])**2
+        x1 = 0.10795*cos(q[0])**2
+        x2 = -x0 - x1
+        x3 = x0 + x1
+        x4 = sin(q[1])
+        x5 = cos(q[1])
+        x6 = 0.381*x4**2 + 0.381*x5**2
+        x7 = x2 - x5*x6
+        x8 = cos(q[2])
+        x9 = x4*x8
+        x10 = sin(q[2])
+        x11 = x10*x5
+        x12 = x11 + x9
+        x13 = -x10*x4 + x5*x8
+        x14 = 0.06985*x10**2
+        x15 = 0.06985*x8**2
+        x16 = x14 + x15
+        x17 = x12*x16 + x7
+        x18 = cos(q[3])
+        x19 = -x11 - x9
+        x20 = parms[40]*x18
+        x21 = cos(q[4])
+        x22 = sin(q[4])
+        x23 = x13*x18
+        x24 = -x19*x21 + x22*x23
+        x25 = parms[50]*x24
+        x26 = x19*x22 + x21*x23
+        x27 = parms[52]*x26
+        x28 = 0.3556*x18
+        x29 = -x13*x28 + x17*x18
+        x30 = parms[42]*x29
+        x31 = parms[53]*x29
+        x32 = cos(q[5])
+        x33 = sin(q[5])
+        x34 = sin(q[3])
+        x35 = x13*x34
+        x36 = x33*x35
+        x37 = x26*x32
+        x38 = -x36 + x37
+        x39 = parms[63]*x38
+        x40 = 0.3556*x34
+        x41 = -x13*x40 + x17*x34
+        x42 = x21*x41
+        x43 = x29*x32 - x33*x42 + 0.2413*x36 - 0.2413*x37
+        x44 = parms[64]*x43
+        x45 = parms[61]*x24 - x39 + x44
+        x46 = x32*x45
+        x47 = x32*x35
+        x48 = x26*x33
+        x49 = -x47 - x48
+        x50 = parms[63]*x49
+        x51 = x29*x33 + x32*x42 - 0.2413*x47 - 0.2413*x48
+        x52 = parms[64]*x51
+        x53 = -parms[62]*x24 + x50 + x52
+        x54 = x33*x53
+        x55 = parms[40]*x34
+        x56 = parms[42]*x41
+        x57 = x22*x41
+        x58 = x22*(parms[50]*x35 + parms[51]*x26 + parms[53]*x57 - parms[61]*x49 + parms[62]*x38 + parms[64]*x57)
+        x59 = x21*(-parms[51]*x24 - parms[52]*x35 + parms[53]*x42 + x32*x53 - x33*x45)
+        x60 = parms[28]*x12 - parms[30]*x13 + parms[31]*x17 + x18*(-parms[39]*x19 + x13*x20 + x25 - x27 + x30 + x31 + x46 + x54) + x34*(parms[41]*x19 + x13*x55 + x56 + x58 + x59)
+        x61 = -parms[17]*x5 + parms[18]*x4 + parms[20]*x7 + x60
+        x62 = parms[51]*x21
+        x63 = parms[46]*x26 - parms[48]*x35 + parms[49]*x24 + parms[50]*x29 + parms[57]*x38 + parms[59]*x49 + parms[60]*x24 + parms[61]*x43 - parms[62]*x51 - x41*x62
+        x64 = parms[51]*x22
+        x65 = 0.2413*parms[61]
+        x66 = parms[55]*x38 + parms[56]*x49 + parms[57]*x24 + parms[62]*x57 - parms[63]*x43 - x24*x65 + 0.2413*x39 - 0.2413*x44
+        x67 = 0.2413*parms[62]
+        x68 = parms[56]*x38 + parms[58]*x49 + parms[59]*x24 - parms[61]*x57 + parms[63]*x51 - x24*x67 + 0.2413*x50 + 0.2413*x52
+        x69 = parms[44]*x26 - parms[45]*x35 + parms[46]*x24 - parms[52]*x29 + x32*x66 - x33*x68 + x41*x64
+        x70 = parms[24]*x13 + parms[27]*x12 + parms[28]*x17 - parms[34]*x23 - parms[36]*x19 + parms[37]*x35 + parms[39]*x29 - parms[41]*x41 + x16*x60 + x21*x63 - x22*x69
+        x71 = 0.3556*parms[41]
+        x72 = parms[35]*x18
+        x73 = 0.3556*x55
+        x74 = 0.3556*parms[39]
+        x75 = parms[35]*x34
+        x76 = 0.3556*x20
+        x77 = parms[22]*x13 + parms[24]*x12 - parms[30]*x17 + x18*(parms[33]*x23 + parms[34]*x19 + parms[40]*x29 - x13*x75 - x13*x76 + x19*x74 + x21*x69 + x22*x63 - 0.3556*x25 + 0.3556*x27 - 0.3556*x30 - 0.3556*x31 - 0.3556*x46 - 0.3556*x54) - x34*(parms[37]*x19 - parms[38]*x35 - parms[40]*x41 + parms[45]*x26 - parms[47]*x35 + parms[48]*x24 - parms[50]*x57 + parms[52]*x42 + x13*x72 + x13*x73 + x19*x71 + x32*x68 + x33*x66 + 0.3556*x56 + 0.3556*x58 + 0.3556*x59)
+        x78 = x22*x34
+        x79 = x21*x34
+        x80 = parms[50]*x78 - parms[52]*x79 + x55
+        x81 = x6*x8
+        x82 = -x34*x81 - x40
+        x83 = parms[42]*x82
+        x84 = parms[53]*x82
+        x85 = x18*x33
+        x86 = x32*x79
+        x87 = x85 + x86
+        x88 = parms[63]*x87
+        x89 = parms[61]*x78 - x88
+        x90 = -0.2413*x85 - 0.2413*x86
+        x91 = x18*x81 + x28
+        x92 = x10*x6
+        x93 = x16 - x92
+        x94 = x21*x91 + x22*x93
+        x95 = x32*x82 - x33*x94 + x90
+        x96 = parms[64]*x95
+        x97 = x89 + x96
+        x98 = x32*x97
+        x99 = x18*x32
+        x100 = x33*x79
+        x101 = -x100 + x99
+        x102 = parms[63]*x101
+        x103 = -parms[62]*x78 + x102
+        x104 = -0.2413*x100 + 0.2413*x99
+        x105 = x104 + x32*x94 + x33*x82
+        x106 = parms[64]*x105
+        x107 = x103 + x106
+        x108 = x107*x33
+        x109 = x108 + x80 + x83 + x84 + x98
+        x110 = -x20
+        x111 = parms[42]*x91
+        x112 = -parms[50]*x18 - parms[61]*x101 + parms[62]*x87 + x34*x62
+        x113 = -x21*x93 + x22*x91
+        x114 = parms[53]*x113 + parms[64]*x113 + x112
+        x115 = x114*x22
+        x116 = parms[52]*x18 - x34*x64
+        x117 = parms[53]*x94 + x107*x32 + x116 - x33*x97
+        x118 = x117*x21
+        x119 = x110 + x111 + x115 + x118
+        x120 = x109*x18 + x119*x34
+        x121 = parms[26] - parms[34]*x34 - parms[37]*x18
+        x122 = parms[46]*x21
+        x123 = parms[60]*x22
+        x124 = parms[48]*x18 + parms[49]*x78 + parms[57]*x87 + parms[59]*x101 + x122*x34 + x123*x34
+        x125 = parms[50]*x82 - parms[51]*x94 + parms[61]*x95 - parms[62]*x105 + x124
+        x126 = parms[46]*x22
+        x127 = parms[44]*x79 + parms[45]*x18 + x126*x34
+        x128 = parms[55]*x87 + parms[56]*x101 + parms[57]*x78 - x65*x78 + 0.2413*x88
+        x129 = parms[62]*x113 - parms[63]*x95 + x128 - 0.2413*x96
+        x130 = parms[56]*x87 + parms[58]*x101 + parms[59]*x78 + 0.2413*x102 - x67*x78
+        x131 = -parms[61]*x113 + parms[63]*x105 + 0.2413*x106 + x130
+        x132 = parms[51]*x113 - parms[52]*x82 + x127 + x129*x32 - x131*x33
+        x133 = -parms[29]*x81 + parms[39]*x82 - parms[41]*x91 + x120*x16 + x121 + x125*x21 - x132*x22
+        x134 = -x14 - x15
+        x135 = x134 + x92
+        x136 = parms[38]*x18 + parms[45]*x79 + parms[47]*x18 + parms[48]*x78 + x75
+        x137 = parms[39]*x93 - parms[40]*x91 - parms[50]*x113 + parms[52]*x94 + 0.3556*x111 + 0.3556*x115 + 0.3556*x118 + x129*x33 + x131*x32 + x136 - x76
+        x138 = parms[50]*x40
+        x139 = parms[52]*x40
+        x140 = parms[33]*x34 - x138*x22 + x139*x21 + x72
+        x141 = parms[40]*x82 - parms[41]*x93 - 0.3556*x108 + x125*x22 + x132*x21 + x140 - x73 - 0.3556*x83 - 0.3556*x84 - 0.3556*x98
+        x142 = parms[23] + parms[29]*x135 - x137*x34 + x141*x18
+        x143 = -x120*x3 + x4*(parms[13] - parms[19]*x6 - x10*x142 + x133*x8) + x5*(parms[15] + x10*x133 - x120*x6 + x142*x8)
+        x144 = x16*x22
+        x145 = x144 + x21*x28
+        x146 = -x145*x33 - x32*x40 + x90
+        x147 = parms[64]*x146
+        x148 = x147 + x89
+        x149 = x148*x32
+        x150 = x104 + x145*x32 - x33*x40
+        x151 = parms[64]*x150
+        x152 = x103 + x151
+        x153 = x152*x33
+        x154 = -parms[42]*x40 - parms[53]*x40 + x149 + x153 + x80
+        x155 = -x16*x21 + x22*x28
+        x156 = parms[53]*x155 + parms[64]*x155 + x112
+        x157 = x156*x22
+        x158 = parms[53]*x145 + x116 - x148*x33 + x152*x32
+        x159 = x158*x21
+        x160 = parms[42]*x28 + x110 + x157 + x159
+        x161 = x154*x18 + x160*x34
+        x162 = -parms[51]*x145 + parms[61]*x146 - parms[62]*x150 + x124 - x138
+        x163 = parms[62]*x155 - parms[63]*x146 + x128 - 0.2413*x147
+        x164 = -parms[61]*x155 + parms[63]*x150 + x130 + 0.2413*x151
+        x165 = parms[51]*x155 + x127 + x139 + x163*x32 - x164*x33
+        x166 = x121 + x16*x161 + x162*x21 - x165*x22 - x18*x71 - x34*x74
+        x167 = 0.12645136*parms[42]
+        x168 = parms[39]*x16 - parms[50]*x155 + parms[52]*x145 + x136 + 0.3556*x157 + 0.3556*x159 + x163*x33 + x164*x32 + x167*x18 - 0.7112*x20
+        x169 = -parms[41]*x16 + 0.12645136*parms[53]*x34 + x140 - 0.3556*x149 - 0.3556*x153 + x162*x22 + x165*x21 + x167*x34 - 0.7112*x55
+        x170 = parms[23] + parms[29]*x134 - x168*x34 + x169*x18
+        x171 = -x161*x3 + x4*(-x10*x170 + x166*x8) + x5*(x10*x166 - x161*x6 + x170*x8)
+        x172 = parms[50]*x21
+        x173 = parms[52]*x22
+        x174 = parms[63]*x32
+        x175 = parms[64]*x32
+        x176 = 0.2413*x175
+        x177 = parms[61]*x21 + x174*x22 + x176*x22
+        x178 = x177*x32
+        x179 = parms[63]*x33
+        x180 = parms[64]*x33
+        x181 = 0.2413*x180
+        x182 = -parms[62]*x21 + x179*x22 + x181*x22
+        x183 = x182*x33
+        x184 = parms[39] + x172 + x173 + x178 + x183
+        x185 = parms[61]*x33
+        x186 = parms[62]*x32
+        x187 = -x185*x22 - x186*x22 - x64
+        x188 = x187*x22
+        x189 = -x177*x33 + x182*x32 - x62
+        x190 = x189*x21
+        x191 = -parms[41] + x188 + x190
+        x192 = x18*x184 + x191*x34
+        x193 = parms[60]*x21
+        x194 = x22*x33
+        x195 = x22*x32
+        x196 = parms[49]*x21 - parms[57]*x195 + parms[59]*x194 - x126 + x193 - x194*x67 + x195*x65
+        x197 = parms[56]*x33
+        x198 = 0.4826*x174
+        x199 = 0.05822569*x175
+        x200 = -parms[55]*x195 + parms[57]*x21 + x197*x22 - x198*x22 - x199*x22 - x21*x65
+        x201 = parms[56]*x32
+        x202 = 0.4826*x179
+        x203 = 0.05822569*x180
+        x204 = parms[58]*x194 + parms[59]*x21 - x201*x22 + x202*x22 + x203*x22 - x21*x67
+        x205 = -parms[44]*x22 + x122 + x200*x32 - x204*x33
+        x206 = parms[36] + x196*x21 - x205*x22
+        x207 = x16*x192 + x206
+        x208 = -parms[37] - parms[45]*x22 + parms[48]*x21 + 0.3556*x188 + 0.3556*x190 + x200*x33 + x204*x32 - x71
+        x209 = -parms[34] - 0.3556*x172 - 0.3556*x173 - 0.3556*x178 - 0.3556*x183 + x196*x22 + x205*x21 - x74
+        x210 = x18*x209 - x208*x34
+        x211 = -x192*x3 + x4*(-x10*x210 + x207*x8) + x5*(x10*x207 - x192*x6 + x210*x8)
+        x212 = x174 + x176
+        x213 = x212*x33
+        x214 = -x179 - x181
+        x215 = x214*x32
+        x216 = x213 + x215
+        x217 = parms[62]*x33
+        x218 = parms[61]*x32
+        x219 = -parms[50] + x217 - x218
+        x220 = x219*x22
+        x221 = parms[52] + x212*x32 - x214*x33
+        x222 = x21*x221
+        x223 = x220 + x222
+        x224 = x18*x216 + x223*x34
+        x225 = parms[48] + parms[57]*x33 + parms[59]*x32 - x32*x67 - x33*x65
+        x226 = parms[55]*x33 + x201 + x202 + x203
+        x227 = parms[58]*x32 + x197 + x198 + x199
+        x228 = parms[45] + x226*x32 - x227*x33
+        x229 = x21*x225 - x22*x228
+        x230 = x16*x224 + x229
+        x231 = parms[47] + x226*x33 + x227*x32
+        x232 = 0.3556*x220 + 0.3556*x222 + x231
+        x233 = x21*x228 - 0.3556*x213 - 0.3556*x215 + x22*x225
+        x234 = x18*x233 - x232*x34
+        x235 = -x224*x3 + x4*(-x10*x234 + x230*x8) + x5*(x10*x230 - x224*x6 + x234*x8)
+        x236 = -x217 + x218
+        x237 = -x185 - x186
+        x238 = x18*x236 + x237*x79
+        x239 = parms[57] - x65
+        x240 = parms[59] - x67
+        x241 = x239*x32 - x240*x33
+        x242 = x193 - x22*x241
+        x243 = x16*x238 + x242
+        x244 = x21*x237
+        x245 = x239*x33 + x240*x32
+        x246 = 0.3556*x244 + x245
+        x247 = x123 + x21*x241 + 0.3556*x217 - 0.3556*x218
+        x248 = x18*x247 - x246*x34
+        x249 = -x238*x3 + x4*(-x10*x248 + x243*x8) + x5*(x10*x243 - x238*x6 + x248*x8)
+        x250 = -parms[28] - parms[39]*x18 + parms[41]*x34
+        x251 = parms[31]*x135 - parms[42]*x93 + x114*x21 - x117*x22 + x250
+        x252 = parms[31]*x134 - parms[42]*x16 + x156*x21 - x158*x22 + x250
+        x253 = parms[25] - parms[28]*x134 - x16*x252 + x168*x18 + x169*x34
+        x254 = x253 + x6*(x10*x252 + x8*(parms[30] - x154*x34 + x160*x18))
+        x255 = x187*x21 - x189*x22
+        x256 = -x16*x255 + x18*x208 + x209*x34
+        x257 = x256 + x6*(x10*x255 + x8*(x18*x191 - x184*x34))
+        x258 = x21*x219 - x22*x221
+        x259 = -x16*x258 + x18*x232 + x233*x34
+        x260 = x259 + x6*(x10*x258 + x8*(x18*x223 - x216*x34))
+        x261 = x144*x237 + x18*x246 + x247*x34
+        x262 = x261 + x6*(-x10*x22*x237 + x8*(x18*x244 - x236*x34))
+    #
+        M[0] = parms[3] - parms[6]*x2 - x3*(-parms[6] + parms[9]*x2 + x61) + x4*(parms[11]*x4 + parms[12]*x5 + parms[18]*x7 - x10*x77 + x70*x8) + x5*(parms[12]*x4 + parms[14]*x5 - parms[17]*x7 + x10*x70 - x6*x61 + x77*x8)
+        M[1] = x143
+        M[2] = x171
+        M[3] = x211
+        M[4] = x235
+        M[5] = x249
+        M[6] = x143
+        M[7] = parms[16] + parms[17]*x6 + parms[25] - parms[28]*x135 + parms[30]*x81 + x137*x18 + x141*x34 - x16*x251 + x6*(parms[17] + parms[20]*x6 + x10*x251 + x8*(parms[30] + parms[31]*x81 - x109*x34 + x119*x18))
+        M[8] = x254
+        M[9] = x257
+        M[10] = x260
+        M[11] = x262
+        M[12] = x171
+        M[13] = x254
+        M[14] = x253
+        M[15] = x256
+        M[16] = x259
+        M[17] = x261
+        M[18] = x211
+        M[19] = x257
+        M[20] = x256
+        M[21] = x206
+        M[22] = x229
+        M[23] = x242
+        M[24] = x235
+        M[25] = x260
+        M[26] = x259
+        M[27] = x229
+        M[28] = x231
+        M[29] = x245
+        M[30] = x249
+        M[31] = x262
+        M[32] = x261
+        M[33] = x242
+        M[34] = x245
+        M[35] = parms[60]
+    #
+        M = np.array(M).reshape(6, 6)
+        return M
+
+
+
+    @staticmethod
+    def coriolis(parms, q, dq):
+    #
+        tau = [0]*6
+    #
+        x0 = dq[0]**2
+        x1 = parms[8]*x0
+        x2 = 0.10795*sin(q[0])**2 + 0.10795*cos(q[0])**2
+        x3 = dq[1]*parms[17]
+        x4 = sin(q[1])
+        x5 = dq[0]*x4
+        x6 = x3*x5
+        x7 = dq[1]*parms[18]
+        x8 = cos(q[1])
+        x9 = dq[0]*x8
+        x10 = parms[19]*x9 - x7
+        x11 = x4**2
+        x12 = x8**2
+        x13 = 0.762*x11 + 0.762*x12
+        x14 = cos(q[2])
+        x15 = dq[1]*x9
+        x16 = dq[2]*x9 + x15
+        x17 = x14*x16
+        x18 = sin(q[2])
+        x19 = dq[1]*x5
+        x20 = -dq[2]*x5 - x19
+        x21 = x18*x20
+        x22 = x17 + x21
+        x23 = x14*x20 - x16*x18
+        x24 = x14*x5
+        x25 = x18*x9
+        x26 = x24 + x25
+        x27 = dq[1] + dq[2]
+        x28 = -parms[29]*x26 + parms[30]*x27
+        x29 = x14*x9 - x18*x5
+        x30 = -parms[28]*x27 + parms[29]*x29
+        x31 = 0.06985*x14**2 + 0.06985*x18**2
+        x32 = x29*x31
+        x33 = x13*x19 + x22*x31 + x27*x32
+        x34 = cos(q[3])
+        x35 = -x17 - x21
+        x36 = parms[39]*x35
+        x37 = sin(q[3])
+        x38 = x29*x37
+        x39 = dq[3]*x27 + x23
+        x40 = x34*x39
+        x41 = -dq[3]*x38 + x40
+        x42 = parms[40]*x41
+        x43 = -dq[3] - x24 - x25
+        x44 = x27*x34
+        x45 = -x38 + x44
+        x46 = -parms[40]*x45 + parms[41]*x43
+        x47 = x43*x46
+        x48 = x27*x37
+        x49 = x29*x34
+        x50 = x48 + x49
+        x51 = parms[39]*x45 - parms[41]*x50
+        x52 = x50*x51
+        x53 = sin(q[4])
+        x54 = cos(q[4])
+        x55 = x43*x53 + x50*x54
+        x56 = dq[4] + x45
+        x57 = -parms[50]*x56 + parms[51]*x55
+        x58 = x55*x57
+        x59 = -x43*x54 + x50*x53
+        x60 = -parms[51]*x59 + parms[52]*x56
+        x61 = x59*x60
+        x62 = -dq[4]*x50 + x35
+        x63 = dq[4]*x43 + x41
+        x64 = x53*x63 - x54*x62
+        x65 = parms[50]*x64
+        x66 = x53*x62 + x54*x63
+        x67 = parms[52]*x66
+        x68 = 0.3556*x38
+        x69 = 0.3556*x44 - x68
+        x70 = x0*x2
+        x71 = 0.381*x11 + 0.381*x12
+        x72 = x0*x71
+        x73 = x4*x70 + x4*x72*x8
+        x74 = -dq[1]**2*x71 - x12*x72 - x70*x8
+        x75 = x14*x73 - x18*x74 - x26**2*x31 - x27**2*x31
+        x76 = dq[3]*x68 + x33*x34 - x37*x75 - 0.3556*x40 - x43*x69
+        x77 = parms[42]*x76
+        x78 = parms[53]*x76
+        x79 = cos(q[5])
+        x80 = parms[61]*x64
+        x81 = dq[5] + x59
+        x82 = x56*x79
+        x83 = sin(q[5])
+        x84 = x55*x83
+        x85 = x82 - x84
+        x86 = -parms[62]*x81 + parms[63]*x85
+        x87 = x81*x86
+        x88 = x56*x83
+        x89 = x55*x79
+        x90 = x88 + x89
+        x91 = -parms[61]*x85 + parms[62]*x90
+        x92 = x90*x91
+        x93 = x37*x39
+        x94 = -dq[3]*x49 - x93
+        x95 = -dq[5]*x55 + x94
+        x96 = x83*x95
+        x97 = dq[5]*x56 + x66
+        x98 = x79*x97
+        x99 = x96 + x98
+        x100 = parms[63]*x99
+        x101 = 0.2413*x82 - 0.2413*x84
+        x102 = x26*x32
+        x103 = x18*x73
+        x104 = 0.3556*x49
+        x105 = -x104 - 0.3556*x48
+        x106 = x14*x74
+        x107 = -x102 - x103 - x105*x50 - x106 + x45*x69
+        x108 = -dq[3]*x104 + x105*x43 + x33*x37 + x34*x75 - 0.3556*x93
+        x109 = x107*x53 + x108*x54
+        x110 = x101*x81 - x109*x83 + x76*x79 - 0.2413*x96 - 0.2413*x98
+        x111 = parms[64]*x110
+        x112 = -x100 + x111 + x80 + x87 - x92
+        x113 = x112*x79
+        x114 = parms[62]*x64
+        x115 = parms[61]*x81 - parms[63]*x90
+        x116 = x115*x81
+        x117 = x85*x91
+        x118 = x79*x95
+        x119 = x83*x97
+        x120 = x118 - x119
+        x121 = parms[63]*x120
+        x122 = -0.2413*x88 - 0.2413*x89
+        x123 = x109*x79 + 0.2413*x118 - 0.2413*x119 - x122*x81 + x76*x83
+        x124 = parms[64]*x123
+        x125 = -x114 - x116 + x117 + x121 + x124
+        x126 = x125*x83
+        x127 = x113 + x126 - x36 + x42 - x47 + x52 - x58 + x61 + x65 - x67 + x77 + x78
+        x128 = parms[41]*x35
+        x129 = parms[40]*x94
+        x130 = -parms[39]*x43 + parms[40]*x50
+        x131 = x130*x43
+        x132 = x45*x51
+        x133 = parms[42]*x108
+        x134 = parms[50]*x59 - parms[52]*x55
+        x135 = -x107*x54 + x108*x53
+        x136 = -x101*x85 + x122*x90 + x135
+        x137 = -parms[50]*x94 + parms[51]*x66 + parms[53]*x135 - parms[61]*x120 + parms[62]*x99 + parms[64]*x136 + x115*x90 + x134*x55 - x56*x60 - x85*x86
+        x138 = x137*x53
+        x139 = -parms[51]*x64 + parms[52]*x94 + parms[53]*x109 - x112*x83 + x125*x79 - x134*x59 + x56*x57
+        x140 = x139*x54
+        x141 = x128 - x129 + x131 - x132 + x133 + x138 + x140
+        x142 = parms[28]*x22 - parms[30]*x23 + parms[31]*x33 + x127*x34 + x141*x37 + x26*x28 - x29*x30
+        x143 = dq[0]*dq[1]*parms[20]*x13*x4 - x10*x9 + x142 + x5*(-parms[19]*x5 + x3) + x6 + x7*x9
+        x144 = parms[12]*x5
+        x145 = dq[1]*parms[15]
+        x146 = parms[14]*x9 + x144 + x145
+        x147 = dq[1]*parms[16] + parms[13]*x5 + parms[15]*x9
+        x148 = parms[22]*x29 + parms[23]*x27 + parms[24]*x26
+        x149 = parms[23]*x29 + parms[25]*x27 + parms[26]*x26
+        x150 = parms[35]*x50 + parms[37]*x43 + parms[38]*x45
+        x151 = parms[33]*x50 + parms[34]*x43 + parms[35]*x45
+        x152 = parms[44]*x55 + parms[45]*x56 + parms[46]*x59
+        x153 = parms[45]*x55 + parms[47]*x56 + parms[48]*x59
+        x154 = parms[56]*x90 + parms[58]*x85 + parms[59]*x81
+        x155 = parms[55]*x90 + parms[56]*x85 + parms[57]*x81
+        x156 = parms[57]*x99 + parms[59]*x120 + parms[60]*x64 + parms[61]*x110 - parms[62]*x123 + x154*x90 - x155*x85
+        x157 = parms[46]*x66 + parms[48]*x94 + parms[49]*x64 + parms[50]*x76 - parms[51]*x109 - x152*x56 + x153*x55 + x156
+        x158 = parms[46]*x55 + parms[48]*x56 + parms[49]*x59
+        x159 = parms[57]*x90 + parms[59]*x85 + parms[60]*x81
+        x160 = parms[55]*x99 + parms[56]*x120 + parms[57]*x64 + parms[62]*x136 - parms[63]*x110 + 0.2413*x100 - 0.2413*x111 - x154*x81 + x159*x85 - 0.2413*x80 - 0.2413*x87 + 0.2413*x92
+        x161 = parms[56]*x99 + parms[58]*x120 + parms[59]*x64 - parms[61]*x136 + parms[63]*x123 - 0.2413*x114 - 0.2413*x116 + 0.2413*x117 + 0.2413*x121 + 0.2413*x124 + x155*x81 - x159*x90
+        x162 = parms[44]*x66 + parms[45]*x94 + parms[46]*x64 + parms[51]*x135 - parms[52]*x76 - x153*x59 + x158*x56 + x160*x79 - x161*x83
+        x163 = -parms[34]*x41 - parms[36]*x35 - parms[37]*x94 + parms[39]*x76 - parms[41]*x108 + x150*x50 - x151*x45 + x157*x54 - x162*x53
+        x164 = parms[24]*x23 + parms[27]*x22 + parms[28]*x33 - parms[29]*x75 + x142*x31 - x148*x27 + x149*x29 + x163
+        x165 = parms[24]*x29 + parms[26]*x27 + parms[27]*x26
+        x166 = x102 + x103 + x106
+        x167 = parms[34]*x50 + parms[36]*x43 + parms[37]*x45
+        x168 = parms[45]*x66 + parms[47]*x94 + parms[48]*x64 - parms[50]*x135 + parms[52]*x109 + x152*x59 - x158*x55 + x160*x83 + x161*x79
+        x169 = parms[35]*x41 + parms[37]*x35 + parms[38]*x94 + parms[39]*x107 - parms[40]*x108 + 0.3556*x128 - 0.3556*x129 + 0.3556*x131 - 0.3556*x132 + 0.3556*x133 + 0.3556*x138 + 0.3556*x140 - x151*x43 + x167*x50 + x168
+        x170 = parms[33]*x41 + parms[34]*x35 + parms[35]*x94 + parms[40]*x76 - parms[41]*x107 - 0.3556*x113 - 0.3556*x126 + x150*x43 + x157*x53 + x162*x54 - x167*x45 + 0.3556*x36 - 0.3556*x42 + 0.3556*x47 - 0.3556*x52 + 0.3556*x58 - 0.3556*x61 - 0.3556*x65 + 0.3556*x67 - 0.3556*x77 - 0.3556*x78
+        x171 = parms[22]*x23 + parms[24]*x22 + parms[29]*x166 - parms[30]*x33 - x149*x26 + x165*x27 - x169*x37 + x170*x34
+        x172 = parms[12]*x9
+        x173 = dq[1]*parms[13]
+        x174 = parms[11]*x5 + x172 + x173
+        x175 = parms[28]*x26 - parms[30]*x29
+        x176 = parms[29]*x23 + parms[31]*x166 - parms[39]*x94 + parms[41]*x41 - parms[42]*x107 + x130*x50 + x137*x54 - x139*x53 + x175*x29 - x27*x28 - x45*x46
+        x177 = parms[23]*x23 + parms[26]*x22 - parms[28]*x166 + parms[30]*x75 + x148*x26 - x165*x29 + x169*x34 + x170*x37 - x176*x31
+    #
+        tau[0] = -x1*x2 - x2*(-x1 + x143) + x4*(dq[0]*dq[1]*parms[18]*x13*x4 - dq[1]*x144 - dq[1]*x146 + parms[11]*x15 - parms[19]*x73 + x14*x164 + x147*x9 - x171*x18) + x8*(dq[1]*x172 + dq[1]*x174 - parms[14]*x19 + parms[19]*x74 - x13*x6 + x14*x171 - x143*x71 - x147*x5 + x164*x18)
+        tau[1] = parms[17]*x73 - parms[18]*x74 - x145*x5 + x146*x5 + x173*x9 - x174*x9 + x177 + x71*(dq[1]*x10 - parms[19]*x15 + parms[20]*x73 + x14*(-parms[29]*x22 + parms[31]*x75 - x127*x37 + x141*x34 - x175*x26 + x27*x30) + x176*x18 - x5*(-parms[17]*x9 + parms[18]*x5))
+        tau[2] = x177
+        tau[3] = x163
+        tau[4] = x168
+        tau[5] = x156
+    #
+        tau = np.array(tau).reshape(6)
+        return tau
+
+
+
+    @staticmethod
+    def friction(parms, dq):
+    #
+        tau = [0]*6
+    #
+    #
+        tau[0] = dq[0]*parms[10]
+        tau[1] = dq[1]*parms[21]
+        tau[2] = dq[2]*parms[32]
+        tau[3] = dq[3]*parms[43]
+        tau[4] = dq[4]*parms[54]
+        tau[5] = dq[5]*parms[65]
+    #
+        tau = np.array(tau).reshape(6)
+        return tau
+
+
+
@@ -0,0 +1,1058 @@
+/* Generated by hal_gen_eqns.py; loaded by hal_arm_kinematics_c.py */
+#include <math.h>
+
+void joint_fk00(const double *q, double *pose)
+{
+    const double x0 = sin(q[0]);
+    const double x1 = cos(q[0]);
+    pose[0] = -x0;
+    pose[1] = 0;
+    pose[2] = x1;
+    pose[3] = -0.10795*x0;
+    pose[4] = x1;
+    pose[5] = 0;
+    pose[6] = x0;
+    pose[7] = 0.10795*x1;
+    pose[8] = 0;
+    pose[9] = 1;
+    pose[10] = 0;
+    pose[11] = 0.0889000000000000;
+    pose[12] = 0;
+    pose[13] = 0;
+    pose[14] = 0;
+    pose[15] = 1;
+}
+
+void joint_fk00_batch(const double *q, double *pose, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        joint_fk00(q + 6*i, pose + 16*i);
+}
+
+void jacobian00(const double *q, double *jacobian)
+{
+    jacobian[0] = -0.10795*cos(q[0]);
+    jacobian[1] = 0;
+    jacobian[2] = 0;
+    jacobian[3] = 0;
+    jacobian[4] = 0;
+    jacobian[5] = 0;
+    jacobian[6] = -0.10795*sin(q[0]);
+    jacobian[7] = 0;
+    jacobian[8] = 0;
+    jacobian[9] = 0;
+    jacobian[10] = 0;
+    jacobian[11] = 0;
+    jacobian[12] = 0;
+    jacobian[13] = 0;
+    jacobian[14] = 0;
+    jacobian[15] = 0;
+    jacobian[16] = 0;
+    jacobian[17] = 0;
+    jacobian[18] = 0;
+    jacobian[19] = 0;
+    jacobian[20] = 0;
+    jacobian[21] = 0;
+    jacobian[22] = 0;
+    jacobian[23] = 0;
+    jacobian[24] = 0;
+    jacobian[25] = 0;
+    jacobian[26] = 0;
+    jacobian[27] = 0;
+    jacobian[28] = 0;
+    jacobian[29] = 0;
+    jacobian[30] = 1;
+    jacobian[31] = 0;
+    jacobian[32] = 0;
+    jacobian[33] = 0;
+    jacobian[34] = 0;
+    jacobian[35] = 0;
+}
+
+void jacobian00_batch(const double *q, double *jacobian, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        jacobian00(q + 6*i, jacobian + 36*i);
+}
+
+void joint_fk01(const double *q, double *pose)
+{
+    const double x0 = sin(q[0]);
+    const double x1 = cos(q[1]);
+    const double x2 = x0*x1;
+    const double x3 = sin(q[1]);
+    const double x4 = cos(q[0]);
+    const double x5 = x1*x4;
+    pose[0] = -x2;
+    pose[1] = x0*x3;
+    pose[2] = x4;
+    pose[3] = -0.10795*x0 - 0.381*x2;
+    pose[4] = x5;
+    pose[5] = -x3*x4;
+    pose[6] = x0;
+    pose[7] = 0.10795*x4 + 0.381*x5;
+    pose[8] = x3;
+    pose[9] = x1;
+    pose[10] = 0;
+    pose[11] = 0.381*x3 + 0.0889;
+    pose[12] = 0;
+    pose[13] = 0;
+    pose[14] = 0;
+    pose[15] = 1;
+}
+
+void joint_fk01_batch(const double *q, double *pose, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        joint_fk01(q + 6*i, pose + 16*i);
+}
+
+void jacobian01(const double *q, double *jacobian)
+{
+    const double x0 = cos(q[0]);
+    const double x1 = cos(q[1]);
+    const double x2 = 0.381*x0;
+    const double x3 = sin(q[1]);
+    const double x4 = sin(q[0]);
+    const double x5 = 0.381*x4;
+    const double x6 = 0.381*x1;
+    jacobian[0] = -0.10795*x0 - x1*x2;
+    jacobian[1] = x3*x5;
+    jacobian[2] = 0;
+    jacobian[3] = 0;
+    jacobian[4] = 0;
+    jacobian[5] = 0;
+    jacobian[6] = -x1*x5 - 0.10795*x4;
+    jacobian[7] = -x2*x3;
+    jacobian[8] = 0;
+    jacobian[9] = 0;
+    jacobian[10] = 0;
+    jacobian[11] = 0;
+    jacobian[12] = 0;
+    jacobian[13] = (x0*x0)*x6 + (x4*x4)*x6;
+    jacobian[14] = 0;
+    jacobian[15] = 0;
+    jacobian[16] = 0;
+    jacobian[17] = 0;
+    jacobian[18] = 0;
+    jacobian[19] = x0;
+    jacobian[20] = 0;
+    jacobian[21] = 0;
+    jacobian[22] = 0;
+    jacobian[23] = 0;
+    jacobian[24] = 0;
+    jacobian[25] = x4;
+    jacobian[26] = 0;
+    jacobian[27] = 0;
+    jacobian[28] = 0;
+    jacobian[29] = 0;
+    jacobian[30] = 1;
+    jacobian[31] = 0;
+    jacobian[32] = 0;
+    jacobian[33] = 0;
+    jacobian[34] = 0;
+    jacobian[35] = 0;
+}
+
+void jacobian01_batch(const double *q, double *jacobian, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        jacobian01(q + 6*i, jacobian + 36*i);
+}
+
+void joint_fk02(const double *q, double *pose)
+{
+    const double x0 = sin(q[0]);
+    const double x1 = sin(q[1]);
+    const double x2 = cos(q[2]);
+    const double x3 = x1*x2;
+    const double x4 = x0*x3;
+    const double x5 = sin(q[2]);
+    const double x6 = cos(q[1]);
+    const double x7 = x5*x6;
+    const double x8 = x0*x7;
+    const double x9 = cos(q[0]);
+    const double x10 = x1*x5;
+    const double x11 = x2*x6;
+    const double x12 = 0.381*x6;
+    const double x13 = x3*x9;
+    const double x14 = x7*x9;
+    pose[0] = x4 + x8;
+    pose[1] = x9;
+    pose[2] = x0*x10 - x0*x11;
+    pose[3] = -x0*x12 - 0.10795*x0 + 0.06985*x4 + 0.06985*x8;
+    pose[4] = -x13 - x14;
+    pose[5] = x0;
+    pose[6] = -x10*x9 + x11*x9;
+    pose[7] = x12*x9 - 0.06985*x13 - 0.06985*x14 + 0.10795*x9;
+    pose[8] = -x10 + x11;
+    pose[9] = 0;
+    pose[10] = x3 + x7;
+    pose[11] = 0.381*x1 - 0.06985*x10 + 0.06985*x11 + 0.0889;
+    pose[12] = 0;
+    pose[13] = 0;
+    pose[14] = 0;
+    pose[15] = 1;
+}
+
+void joint_fk02_batch(const double *q, double *pose, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        joint_fk02(q + 6*i, pose + 16*i);
+}
+
+void jacobian02(const double *q, double *jacobian)
+{
+    const double x0 = cos(q[0]);
+    const double x1 = cos(q[1]);
+    const double x2 = 0.381*x0;
+    const double x3 = cos(q[2]);
+    const double x4 = sin(q[1]);
+    const double x5 = 0.06985*x0*x4;
+    const double x6 = sin(q[2]);
+    const double x7 = 0.06985*x0*x1;
+    const double x8 = sin(q[0]);
+    const double x9 = 0.381*x8;
+    const double x10 = 0.06985*x4*x8;
+    const double x11 = 0.06985*x1*x8;
+    const double x12 = -x10*x6 + x11*x3;
+    const double x13 = -x3*x7 + x5*x6;
+    const double x14 = (x8*x8);
+    const double x15 = 0.381*x1;
+    const double x16 = (x0*x0);
+    const double x17 = x3*x4;
+    const double x18 = 0.06985*x14;
+    const double x19 = x1*x6;
+    const double x20 = 0.06985*x16;
+    const double x21 = -x17*x18 - x17*x20 - x18*x19 - x19*x20;
+    jacobian[0] = -0.10795*x0 - x1*x2 + x3*x5 + x6*x7;
+    jacobian[1] = x12 + x4*x9;
+    jacobian[2] = x12;
+    jacobian[3] = 0;
+    jacobian[4] = 0;
+    jacobian[5] = 0;
+    jacobian[6] = -x1*x9 + x10*x3 + x11*x6 - 0.10795*x8;
+    jacobian[7] = x13 - x2*x4;
+    jacobian[8] = x13;
+    jacobian[9] = 0;
+    jacobian[10] = 0;
+    jacobian[11] = 0;
+    jacobian[12] = 0;
+    jacobian[13] = x14*x15 + x15*x16 + x21;
+    jacobian[14] = x21;
+    jacobian[15] = 0;
+    jacobian[16] = 0;
+    jacobian[17] = 0;
+    jacobian[18] = 0;
+    jacobian[19] = x0;
+    jacobian[20] = x0;
+    jacobian[21] = 0;
+    jacobian[22] = 0;
+    jacobian[23] = 0;
+    jacobian[24] = 0;
+    jacobian[25] = x8;
+    jacobian[26] = x8;
+    jacobian[27] = 0;
+    jacobian[28] = 0;
+    jacobian[29] = 0;
+    jacobian[30] = 1;
+    jacobian[31] = 0;
+    jacobian[32] = 0;
+    jacobian[33] = 0;
+    jacobian[34] = 0;
+    jacobian[35] = 0;
+}
+
+void jacobian02_batch(const double *q, double *jacobian, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        jacobian02(q + 6*i, jacobian + 36*i);
+}
+
+void joint_fk03(const double *q, double *pose)
+{
+    const double x0 = sin(q[3]);
+    const double x1 = cos(q[0]);
+    const double x2 = x0*x1;
+    const double x3 = sin(q[0]);
+    const double x4 = cos(q[3]);
+    const double x5 = x3*x4;
+    const double x6 = sin(q[1]);
+    const double x7 = cos(q[2]);
+    const double x8 = x6*x7;
+    const double x9 = sin(q[2]);
+    const double x10 = cos(q[1]);
+    const double x11 = x10*x9;
+    const double x12 = x10*x7;
+    const double x13 = x12*x3;
+    const double x14 = x6*x9;
+    const double x15 = x14*x3;
+    const double x16 = x1*x4;
+    const double x17 = x0*x3;
+    const double x18 = 0.381*x10;
+    const double x19 = 0.06985*x3;
+    const double x20 = x1*x14;
+    const double x21 = x1*x12;
+    const double x22 = 0.06985*x1;
+    pose[0] = x11*x5 + x2 + x5*x8;
+    pose[1] = x13 - x15;
+    pose[2] = -x11*x17 + x16 - x17*x8;
+    pose[3] = x11*x19 - 0.3556*x13 + 0.3556*x15 - x18*x3 + x19*x8 - 0.10795*x3;
+    pose[4] = -x11*x16 - x16*x8 + x17;
+    pose[5] = x20 - x21;
+    pose[6] = x11*x2 + x2*x8 + x5;
+    pose[7] = x1*x18 + 0.10795*x1 - x11*x22 - 0.3556*x20 + 0.3556*x21 - x22*x8;
+    pose[8] = x12*x4 - x14*x4;
+    pose[9] = -x11 - x8;
+    pose[10] = -x0*x12 + x0*x14;
+    pose[11] = 0.3556*x11 + 0.06985*x12 - 0.06985*x14 + 0.381*x6 + 0.3556*x8 + 0.0889;
+    pose[12] = 0;
+    pose[13] = 0;
+    pose[14] = 0;
+    pose[15] = 1;
+}
+
+void joint_fk03_batch(const double *q, double *pose, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        joint_fk03(q + 6*i, pose + 16*i);
+}
+
+void jacobian03(const double *q, double *jacobian)
+{
+    const double x0 = cos(q[0]);
+    const double x1 = cos(q[1]);
+    const double x2 = 0.381*x0;
+    const double x3 = sin(q[1]);
+    const double x4 = sin(q[2]);
+    const double x5 = x3*x4;
+    const double x6 = x0*x5;
+    const double x7 = cos(q[2]);
+    const double x8 = x0*x3*x7;
+    const double x9 = x0*x1*x4;
+    const double x10 = x1*x7;
+    const double x11 = x0*x10;
+    const double x12 = sin(q[0]);
+    const double x13 = 0.381*x12;
+    const double x14 = x12*x5;
+    const double x15 = x12*x3*x7;
+    const double x16 = x1*x12*x4;
+    const double x17 = x10*x12;
+    const double x18 = -0.06985*x14 + 0.3556*x15 + 0.3556*x16 + 0.06985*x17;
+    const double x19 = -0.06985*x11 + 0.06985*x6 - 0.3556*x8 - 0.3556*x9;
+    const double x20 = (x12*x12);
+    const double x21 = 0.381*x1;
+    const double x22 = (x0*x0);
+    const double x23 = 0.3556*x20;
+    const double x24 = x3*x7;
+    const double x25 = 0.06985*x20;
+    const double x26 = x1*x4;
+    const double x27 = 0.3556*x22;
+    const double x28 = 0.06985*x22;
+    const double x29 = x10*x23 + x10*x27 - x23*x5 - x24*x25 - x24*x28 - x25*x26 - x26*x28 - x27*x5;
+    jacobian[0] = -0.10795*x0 - x1*x2 - 0.3556*x11 + 0.3556*x6 + 0.06985*x8 + 0.06985*x9;
+    jacobian[1] = x13*x3 + x18;
+    jacobian[2] = x18;
+    jacobian[3] = 0;
+    jacobian[4] = 0;
+    jacobian[5] = 0;
+    jacobian[6] = -x1*x13 - 0.10795*x12 + 0.3556*x14 + 0.06985*x15 + 0.06985*x16 - 0.3556*x17;
+    jacobian[7] = x19 - x2*x3;
+    jacobian[8] = x19;
+    jacobian[9] = 0;
+    jacobian[10] = 0;
+    jacobian[11] = 0;
+    jacobian[12] = 0;
+    jacobian[13] = x20*x21 + x21*x22 + x29;
+    jacobian[14] = x29;
+    jacobian[15] = 0;
+    jacobian[16] = 0;
+    jacobian[17] = 0;
+    jacobian[18] = 0;
+    jacobian[19] = x0;
+    jacobian[20] = x0;
+    jacobian[21] = x14 - x17;
+    jacobian[22] = 0;
+    jacobian[23] = 0;
+    jacobian[24] = 0;
+    jacobian[25] = x12;
+    jacobian[26] = x12;
+    jacobian[27] = x11 - x6;
+    jacobian[28] = 0;
+    jacobian[29] = 0;
+    jacobian[30] = 1;
+    jacobian[31] = 0;
+    jacobian[32] = 0;
+    jacobian[33] = x24 + x26;
+    jacobian[34] = 0;
+    jacobian[35] = 0;
+}
+
+void jacobian03_batch(const double *q, double *jacobian, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        jacobian03(q + 6*i, jacobian + 36*i);
+}
+
+void joint_fk04(const double *q, double *pose)
+{
+    const double x0 = cos(q[4]);
+    const double x1 = sin(q[3]);
+    const double x2 = cos(q[0]);
+    const double x3 = x1*x2;
+    const double x4 = sin(q[4]);
+    const double x5 = sin(q[0]);
+    const double x6 = cos(q[1]);
+    const double x7 = cos(q[2]);
+    const double x8 = x5*x6*x7;
+    const double x9 = sin(q[1]);
+    const double x10 = sin(q[2]);
+    const double x11 = x10*x5*x9;
+    const double x12 = cos(q[3]);
+    const double x13 = x12*x5;
+    const double x14 = x7*x9;
+    const double x15 = x0*x14;
+    const double x16 = x10*x6;
+    const double x17 = x0*x16;
+    const double x18 = x12*x2;
+    const double x19 = x1*x5;
+    const double x20 = x14*x4;
+    const double x21 = x16*x4;
+    const double x22 = 0.381*x6;
+    const double x23 = 0.3556*x5;
+    const double x24 = x10*x9;
+    const double x25 = 0.06985*x5;
+    const double x26 = x6*x7;
+    const double x27 = x10*x4*x9;
+    const double x28 = x4*x6*x7;
+    const double x29 = x0*x6*x7;
+    const double x30 = x0*x10*x9;
+    const double x31 = 0.3556*x2;
+    const double x32 = 0.06985*x2;
+    pose[0] = x0*x3 - x11*x4 + x13*x15 + x13*x17 + x4*x8;
+    pose[1] = -x14*x19 - x16*x19 + x18;
+    pose[2] = x0*x11 - x0*x8 + x13*x20 + x13*x21 + x3*x4;
+    pose[3] = x14*x25 + x16*x25 - x22*x5 + x23*x24 - x23*x26 - 0.10795*x5;
+    pose[4] = x0*x19 - x15*x18 - x17*x18 + x2*x27 - x2*x28;
+    pose[5] = x13 + x14*x3 + x16*x3;
+    pose[6] = -x18*x20 - x18*x21 + x19*x4 + x2*x29 - x2*x30;
+    pose[7] = -x14*x32 - x16*x32 + x2*x22 + 0.10795*x2 - x24*x31 + x26*x31;
+    pose[8] = x12*x29 - x12*x30 - x20 - x21;
+    pose[9] = x1*x24 - x1*x26;
+    pose[10] = -x12*x27 + x12*x28 + x15 + x17;
+    pose[11] = 0.3556*x14 + 0.3556*x16 - 0.06985*x24 + 0.06985*x26 + 0.381*x9 + 0.0889;
+    pose[12] = 0;
+    pose[13] = 0;
+    pose[14] = 0;
+    pose[15] = 1;
+}
+
+void joint_fk04_batch(const double *q, double *pose, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        joint_fk04(q + 6*i, pose + 16*i);
+}
+
+void jacobian04(const double *q, double *jacobian)
+{
+    const double x0 = cos(q[0]);
+    const double x1 = cos(q[1]);
+    const double x2 = 0.381*x0;
+    const double x3 = sin(q[1]);
+    const double x4 = sin(q[2]);
+    const double x5 = x3*x4;
+    const double x6 = x0*x5;
+    const double x7 = cos(q[2]);
+    const double x8 = x0*x3*x7;
+    const double x9 = x0*x1*x4;
+    const double x10 = x1*x7;
+    const double x11 = x0*x10;
+    const double x12 = sin(q[0]);
+    const double x13 = 0.381*x12;
+    const double x14 = x12*x5;
+    const double x15 = x12*x3*x7;
+    const double x16 = x1*x12*x4;
+    const double x17 = x10*x12;
+    const double x18 = -0.06985*x14 + 0.3556*x15 + 0.3556*x16 + 0.06985*x17;
+    const double x19 = -0.06985*x11 + 0.06985*x6 - 0.3556*x8 - 0.3556*x9;
+    const double x20 = (x12*x12);
+    const double x21 = 0.381*x1;
+    const double x22 = (x0*x0);
+    const double x23 = 0.3556*x20;
+    const double x24 = x3*x7;
+    const double x25 = 0.06985*x20;
+    const double x26 = x1*x4;
+    const double x27 = 0.3556*x22;
+    const double x28 = 0.06985*x22;
+    const double x29 = x10*x23 + x10*x27 - x23*x5 - x24*x25 - x24*x28 - x25*x26 - x26*x28 - x27*x5;
+    const double x30 = cos(q[3]);
+    const double x31 = sin(q[3]);
+    jacobian[0] = -0.10795*x0 - x1*x2 - 0.3556*x11 + 0.3556*x6 + 0.06985*x8 + 0.06985*x9;
+    jacobian[1] = x13*x3 + x18;
+    jacobian[2] = x18;
+    jacobian[3] = 0;
+    jacobian[4] = 0;
+    jacobian[5] = 0;
+    jacobian[6] = -x1*x13 - 0.10795*x12 + 0.3556*x14 + 0.06985*x15 + 0.06985*x16 - 0.3556*x17;
+    jacobian[7] = x19 - x2*x3;
+    jacobian[8] = x19;
+    jacobian[9] = 0;
+    jacobian[10] = 0;
+    jacobian[11] = 0;
+    jacobian[12] = 0;
+    jacobian[13] = x20*x21 + x21*x22 + x29;
+    jacobian[14] = x29;
+    jacobian[15] = 0;
+    jacobian[16] = 0;
+    jacobian[17] = 0;
+    jacobian[18] = 0;
+    jacobian[19] = x0;
+    jacobian[20] = x0;
+    jacobian[21] = x14 - x17;
+    jacobian[22] = x0*x30 - x15*x31 - x16*x31;
+    jacobian[23] = 0;
+    jacobian[24] = 0;
+    jacobian[25] = x12;
+    jacobian[26] = x12;
+    jacobian[27] = x11 - x6;
+    jacobian[28] = x12*x30 + x31*x8 + x31*x9;
+    jacobian[29] = 0;
+    jacobian[30] = 1;
+    jacobian[31] = 0;
+    jacobian[32] = 0;
+    jacobian[33] = x24 + x26;
+    jacobian[34] = -x10*x31 + x31*x5;
+    jacobian[35] = 0;
+}
+
+void jacobian04_batch(const double *q, double *jacobian, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        jacobian04(q + 6*i, jacobian + 36*i);
+}
+
+void joint_fk05(const double *q, double *pose)
+{
+    const double x0 = sin(q[5]);
+    const double x1 = cos(q[0]);
+    const double x2 = cos(q[3]);
+    const double x3 = x1*x2;
+    const double x4 = x0*x3;
+    const double x5 = sin(q[3]);
+    const double x6 = cos(q[5]);
+    const double x7 = x5*x6;
+    const double x8 = cos(q[4]);
+    const double x9 = x1*x8;
+    const double x10 = sin(q[0]);
+    const double x11 = sin(q[4]);
+    const double x12 = cos(q[1]);
+    const double x13 = cos(q[2]);
+    const double x14 = x10*x11*x12*x13;
+    const double x15 = sin(q[1]);
+    const double x16 = sin(q[2]);
+    const double x17 = x10*x11*x15*x16;
+    const double x18 = x0*x5;
+    const double x19 = x10*x13*x15;
+    const double x20 = x10*x12*x16;
+    const double x21 = x10*x2;
+    const double x22 = x21*x6;
+    const double x23 = x13*x15;
+    const double x24 = x23*x8;
+    const double x25 = x12*x16;
+    const double x26 = x25*x8;
+    const double x27 = x3*x6;
+    const double x28 = x0*x21;
+    const double x29 = x11*x5;
+    const double x30 = x1*x29;
+    const double x31 = x10*x8;
+    const double x32 = x15*x16;
+    const double x33 = x31*x32;
+    const double x34 = x12*x13;
+    const double x35 = x31*x34;
+    const double x36 = x11*x13*x15;
+    const double x37 = x21*x36;
+    const double x38 = x11*x12*x16;
+    const double x39 = x21*x38;
+    const double x40 = 0.381*x12;
+    const double x41 = 0.3556*x10;
+    const double x42 = 0.06985*x10;
+    const double x43 = x10*x5*x8;
+    const double x44 = x1*x11*x15*x16;
+    const double x45 = x1*x13*x15;
+    const double x46 = x1*x12*x16;
+    const double x47 = x1*x11*x12*x13;
+    const double x48 = x10*x29;
+    const double x49 = x34*x9;
+    const double x50 = x32*x9;
+    const double x51 = x3*x36;
+    const double x52 = x3*x38;
+    const double x53 = 0.3556*x1;
+    const double x54 = 0.06985*x1;
+    const double x55 = x15*x16*x5;
+    const double x56 = x12*x13*x2*x8;
+    const double x57 = x15*x16*x2*x8;
+    const double x58 = x11*x2;
+    const double x59 = x34*x58;
+    const double x60 = x32*x58;
+    pose[0] = x14*x6 - x17*x6 - x18*x19 - x18*x20 + x22*x24 + x22*x26 + x4 + x7*x9;
+    pose[1] = -x0*x14 + x0*x17 - x18*x9 - x19*x7 - x20*x7 - x24*x28 - x26*x28 + x27;
+    pose[2] = x30 + x33 - x35 + x37 + x39;
+    pose[3] = -x10*x40 - 0.10795*x10 + x23*x42 + x25*x42 + 0.2413*x30 + x32*x41 + 0.2413*x33 - x34*x41 - 0.2413*x35 + 0.2413*x37 + 0.2413*x39;
+    pose[4] = x18*x45 + x18*x46 - x24*x27 - x26*x27 + x28 + x43*x6 + x44*x6 - x47*x6;
+    pose[5] = -x0*x43 - x0*x44 + x0*x47 + x22 + x24*x4 + x26*x4 + x45*x7 + x46*x7;
+    pose[6] = x48 + x49 - x50 - x51 - x52;
+    pose[7] = x1*x40 + 0.10795*x1 - x23*x54 - x25*x54 - x32*x53 + x34*x53 + 0.2413*x48 + 0.2413*x49 - 0.2413*x50 - 0.2413*x51 - 0.2413*x52;
+    pose[8] = x0*x55 - x18*x34 - x36*x6 - x38*x6 + x56*x6 - x57*x6;
+    pose[9] = x0*x36 + x0*x38 - x0*x56 + x0*x57 - x34*x7 + x55*x6;
+    pose[10] = x24 + x26 + x59 - x60;
+    pose[11] = 0.381*x15 + 0.3556*x23 + 0.2413*x24 + 0.3556*x25 + 0.2413*x26 - 0.06985*x32 + 0.06985*x34 + 0.2413*x59 - 0.2413*x60 + 0.0889;
+    pose[12] = 0;
+    pose[13] = 0;
+    pose[14] = 0;
+    pose[15] = 1;
+}
+
+void joint_fk05_batch(const double *q, double *pose, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        joint_fk05(q + 6*i, pose + 16*i);
+}
+
+void jacobian05(const double *q, double *jacobian)
+{
+    const double x0 = cos(q[0]);
+    const double x1 = cos(q[1]);
+    const double x2 = 0.381*x0;
+    const double x3 = sin(q[0]);
+    const double x4 = sin(q[3]);
+    const double x5 = sin(q[4]);
+    const double x6 = x4*x5;
+    const double x7 = x3*x6;
+    const double x8 = 0.2413*x7;
+    const double x9 = sin(q[1]);
+    const double x10 = sin(q[2]);
+    const double x11 = x10*x9;
+    const double x12 = x0*x11;
+    const double x13 = cos(q[2]);
+    const double x14 = x0*x13*x9;
+    const double x15 = x0*x1*x10;
+    const double x16 = x1*x13;
+    const double x17 = x0*x16;
+    const double x18 = cos(q[4]);
+    const double x19 = x12*x18;
+    const double x20 = x17*x18;
+    const double x21 = x13*x9;
+    const double x22 = cos(q[3]);
+    const double x23 = x0*x22*x5;
+    const double x24 = x21*x23;
+    const double x25 = x1*x10;
+    const double x26 = x23*x25;
+    const double x27 = 0.381*x3;
+    const double x28 = x11*x3;
+    const double x29 = x13*x3*x9;
+    const double x30 = x1*x10*x3;
+    const double x31 = x16*x3;
+    const double x32 = 0.2413*x3;
+    const double x33 = x18*x21;
+    const double x34 = x18*x25;
+    const double x35 = 0.2413*x22*x3*x5;
+    const double x36 = -x11*x35 + x16*x35 - 0.06985*x28 + 0.3556*x29 + 0.3556*x30 + 0.06985*x31 + x32*x33 + x32*x34;
+    const double x37 = 0.2413*x0*x22*x5;
+    const double x38 = (x9*x9);
+    const double x39 = (x10*x10);
+    const double x40 = x38*x39;
+    const double x41 = (x13*x13);
+    const double x42 = x38*x41;
+    const double x43 = (x1*x1);
+    const double x44 = x39*x43;
+    const double x45 = x41*x43;
+    const double x46 = 0.2413*x22*x3;
+    const double x47 = (x4*x4);
+    const double x48 = 0.2413*x10*x3*x5*x9;
+    const double x49 = (x22*x22);
+    const double x50 = 0.2413*x1*x13*x3*x5;
+    const double x51 = 0.2413*x0*x18*x4;
+    const double x52 = x0*x6;
+    const double x53 = 0.2413*x52;
+    const double x54 = x18*x28;
+    const double x55 = x18*x31;
+    const double x56 = x22*x3*x5;
+    const double x57 = x21*x56;
+    const double x58 = x25*x56;
+    const double x59 = 0.2413*x0;
+    const double x60 = x11*x37 + 0.06985*x12 - 0.3556*x14 - 0.3556*x15 - x16*x37 - 0.06985*x17 - x33*x59 - x34*x59;
+    const double x61 = 0.2413*x0*x22;
+    const double x62 = 0.2413*x0*x10*x5*x9;
+    const double x63 = 0.2413*x0*x1*x13*x5;
+    const double x64 = 0.2413*x18*x3*x4;
+    const double x65 = (x3*x3);
+    const double x66 = 0.381*x1;
+    const double x67 = (x0*x0);
+    const double x68 = 0.3556*x65;
+    const double x69 = 0.06985*x65;
+    const double x70 = 0.3556*x67;
+    const double x71 = 0.06985*x67;
+    const double x72 = 0.2413*x18*x65;
+    const double x73 = x11*x72;
+    const double x74 = x16*x72;
+    const double x75 = 0.2413*x18*x67;
+    const double x76 = x11*x75;
+    const double x77 = x16*x75;
+    const double x78 = 0.2413*x22*x5*x65;
+    const double x79 = 0.2413*x22*x5*x67;
+    const double x80 = -x11*x68 - x11*x70 + x16*x68 + x16*x70 - x21*x69 - x21*x71 - x21*x78 - x21*x79 - x25*x69 - x25*x71 - x25*x78 - x25*x79 - x73 + x74 - x76 + x77;
+    const double x81 = 0.2413*x4*x5*x65;
+    const double x82 = 0.2413*x4*x5*x67;
+    const double x83 = 0.2413*x13*x5*x65*x9;
+    const double x84 = 0.2413*x1*x10*x5*x65;
+    const double x85 = 0.2413*x13*x5*x67*x9;
+    const double x86 = 0.2413*x1*x10*x5*x67;
+    const double x87 = x22*x5;
+    jacobian[0] = -0.10795*x0 - x1*x2 + 0.3556*x12 + 0.06985*x14 + 0.06985*x15 - 0.3556*x17 + 0.2413*x19 - 0.2413*x20 + 0.2413*x24 + 0.2413*x26 - x8;
+    jacobian[1] = x27*x9 + x36;
+    jacobian[2] = x36;
+    jacobian[3] = -x21*x8 - x25*x8 + x37*x40 + x37*x42 + x37*x44 + x37*x45;
+    jacobian[4] = x33*x46 + x34*x46 + x40*x51 + x42*x51 + x44*x51 + x45*x51 - x47*x48 + x47*x50 - x48*x49 + x49*x50;
+    jacobian[5] = 0;
+    jacobian[6] = -x1*x27 + 0.3556*x28 + 0.06985*x29 - 0.10795*x3 + 0.06985*x30 - 0.3556*x31 + x53 + 0.2413*x54 - 0.2413*x55 + 0.2413*x57 + 0.2413*x58;
+    jacobian[7] = -x2*x9 + x60;
+    jacobian[8] = x60;
+    jacobian[9] = x21*x53 + x25*x53 + x35*x40 + x35*x42 + x35*x44 + x35*x45;
+    jacobian[10] = -x33*x61 - x34*x61 + x40*x64 + x42*x64 + x44*x64 + x45*x64 + x47*x62 - x47*x63 + x49*x62 - x49*x63;
+    jacobian[11] = 0;
+    jacobian[12] = 0;
+    jacobian[13] = x65*x66 + x66*x67 + x80;
+    jacobian[14] = x80;
+    jacobian[15] = x11*x81 + x11*x82 - x16*x81 - x16*x82;
+    jacobian[16] = -x22*x73 + x22*x74 - x22*x76 + x22*x77 - x47*x83 - x47*x84 - x47*x85 - x47*x86 - x49*x83 - x49*x84 - x49*x85 - x49*x86;
+    jacobian[17] = 0;
+    jacobian[18] = 0;
+    jacobian[19] = x0;
+    jacobian[20] = x0;
+    jacobian[21] = x28 - x31;
+    jacobian[22] = x0*x22 - x29*x4 - x30*x4;
+    jacobian[23] = x52 + x54 - x55 + x57 + x58;
+    jacobian[24] = 0;
+    jacobian[25] = x3;
+    jacobian[26] = x3;
+    jacobian[27] = -x12 + x17;
+    jacobian[28] = x14*x4 + x15*x4 + x22*x3;
+    jacobian[29] = -x19 + x20 - x24 - x26 + x7;
+    jacobian[30] = 1;
+    jacobian[31] = 0;
+    jacobian[32] = 0;
+    jacobian[33] = x21 + x25;
+    jacobian[34] = x11*x4 - x16*x4;
+    jacobian[35] = -x11*x87 + x16*x87 + x33 + x34;
+}
+
+void jacobian05_batch(const double *q, double *jacobian, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        jacobian05(q + 6*i, jacobian + 36*i);
+}
+
+void fk_and_jacobian(const double *q, double *poses, double *jacobian)
+{
+    const double x0 = sin(q[0]);
+    const double x1 = cos(q[0]);
+    const double x2 = -0.10795*x0;
+    const double x3 = 0.10795*x1;
+    const double x4 = cos(q[1]);
+    const double x5 = x0*x4;
+    const double x6 = sin(q[1]);
+    const double x7 = x0*x6;
+    const double x8 = x2 - 0.381*x5;
+    const double x9 = x1*x4;
+    const double x10 = x1*x6;
+    const double x11 = 0.381*x9;
+    const double x12 = x11 + x3;
+    const double x13 = 0.381*x6;
+    const double x14 = x13 + 0.0889;
+    const double x15 = cos(q[2]);
+    const double x16 = x15*x7;
+    const double x17 = sin(q[2]);
+    const double x18 = x17*x5;
+    const double x19 = x17*x7;
+    const double x20 = x15*x5;
+    const double x21 = x19 - x20;
+    const double x22 = 0.06985*x16 + 0.06985*x18 + x8;
+    const double x23 = x10*x15;
+    const double x24 = x17*x4;
+    const double x25 = x1*x24;
+    const double x26 = x15*x9;
+    const double x27 = x17*x6;
+    const double x28 = x1*x27;
+    const double x29 = x26 - x28;
+    const double x30 = 0.06985*x23;
+    const double x31 = 0.06985*x25;
+    const double x32 = x12 - x30 - x31;
+    const double x33 = x15*x4;
+    const double x34 = x15*x6;
+    const double x35 = x24 + x34;
+    const double x36 = 0.06985*x27;
+    const double x37 = x14 + 0.06985*x33 - x36;
+    const double x38 = sin(q[3]);
+    const double x39 = x1*x38;
+    const double x40 = cos(q[3]);
+    const double x41 = x16*x40;
+    const double x42 = x18*x40;
+    const double x43 = x1*x40;
+    const double x44 = x16*x38;
+    const double x45 = x0*x38;
+    const double x46 = x24*x45;
+    const double x47 = x43 - x44 - x46;
+    const double x48 = 0.3556*x19 - 0.3556*x20 + x22;
+    const double x49 = x23*x40;
+    const double x50 = x0*x40;
+    const double x51 = x23*x38;
+    const double x52 = x24*x39;
+    const double x53 = x50 + x51 + x52;
+    const double x54 = 0.3556*x28;
+    const double x55 = 0.3556*x26;
+    const double x56 = x32 - x54 + x55;
+    const double x57 = x33*x40;
+    const double x58 = x27*x40;
+    const double x59 = x27*x38;
+    const double x60 = x33*x38;
+    const double x61 = x59 - x60;
+    const double x62 = 0.3556*x24;
+    const double x63 = 0.3556*x34 + x37 + x62;
+    const double x64 = cos(q[4]);
+    const double x65 = x39*x64;
+    const double x66 = sin(q[4]);
+    const double x67 = x20*x66;
+    const double x68 = x19*x66;
+    const double x69 = x41*x64;
+    const double x70 = x42*x64;
+    const double x71 = x39*x66;
+    const double x72 = x19*x64;
+    const double x73 = x20*x64;
+    const double x74 = x41*x66;
+    const double x75 = x42*x66;
+    const double x76 = x71 + x72 - x73 + x74 + x75;
+    const double x77 = x45*x64;
+    const double x78 = x28*x66;
+    const double x79 = x26*x66;
+    const double x80 = x49*x64;
+    const double x81 = x24*x64;
+    const double x82 = x45*x66;
+    const double x83 = x26*x64;
+    const double x84 = x28*x64;
+    const double x85 = x49*x66;
+    const double x86 = x24*x66;
+    const double x87 = x43*x86;
+    const double x88 = x82 + x83 - x84 - x85 - x87;
+    const double x89 = x34*x66;
+    const double x90 = x57*x64;
+    const double x91 = x58*x64;
+    const double x92 = x34*x64;
+    const double x93 = x57*x66;
+    const double x94 = x58*x66;
+    const double x95 = x81 + x92 + x93 - x94;
+    const double x96 = sin(q[5]);
+    const double x97 = x43*x96;
+    const double x98 = cos(q[5]);
+    const double x99 = x43*x98;
+    const double x100 = x48 + 0.2413*x71 + 0.2413*x72 - 0.2413*x73 + 0.2413*x74 + 0.2413*x75;
+    const double x101 = 0.2413*x82;
+    const double x102 = 0.2413*x84;
+    const double x103 = 0.2413*x83;
+    const double x104 = 0.2413*x85;
+    const double x105 = 0.2413*x87;
+    const double x106 = 0.2413*x81;
+    const double x107 = 0.2413*x64;
+    const double x108 = 0.2413*x40;
+    const double x109 = x107*x16 + x107*x18 + x108*x67 - x108*x68 + 0.3556*x16 + 0.3556*x18 - 0.06985*x19 + 0.06985*x20;
+    const double x110 = 0.2413*x66;
+    const double x111 = 0.2413*x1*x40*x66;
+    const double x112 = (x6*x6);
+    const double x113 = (x17*x17);
+    const double x114 = x112*x113;
+    const double x115 = (x15*x15);
+    const double x116 = x112*x115;
+    const double x117 = (x4*x4);
+    const double x118 = x113*x117;
+    const double x119 = x115*x117;
+    const double x120 = (x38*x38);
+    const double x121 = 0.2413*x0*x17*x6*x66;
+    const double x122 = (x40*x40);
+    const double x123 = 0.2413*x0*x15*x4*x66;
+    const double x124 = 0.2413*x1*x38*x64;
+    const double x125 = x1*x36 - x1*x62 - x107*x23 - x107*x25 - x108*x79 + x111*x27 - 0.3556*x23 - 0.06985*x26;
+    const double x126 = 0.2413*x0*x40*x66;
+    const double x127 = 0.2413*x1*x17*x6*x66;
+    const double x128 = 0.2413*x1*x15*x4*x66;
+    const double x129 = 0.2413*x0*x38*x64;
+    const double x130 = (x0*x0);
+    const double x131 = 0.381*x4;
+    const double x132 = (x1*x1);
+    const double x133 = 0.3556*x130;
+    const double x134 = 0.06985*x130;
+    const double x135 = 0.3556*x132;
+    const double x136 = 0.06985*x132;
+    const double x137 = 0.2413*x130*x64;
+    const double x138 = 0.2413*x132*x64;
+    const double x139 = 0.2413*x130*x40;
+    const double x140 = 0.2413*x132*x40;
+    const double x141 = -x133*x27 + x133*x33 - x134*x24 - x134*x34 - x135*x27 + x135*x33 - x136*x24 - x136*x34 - x137*x27 + x137*x33 - x138*x27 + x138*x33 - x139*x86 - x139*x89 - x140*x86 - x140*x89;
+    const double x142 = 0.2413*x130*x66;
+    const double x143 = 0.2413*x132*x66;
+    const double x144 = 0.2413*x130;
+    const double x145 = 0.2413*x132;
+    const double x146 = 0.2413*x130*x15*x6*x66;
+    const double x147 = 0.2413*x130*x17*x4*x66;
+    const double x148 = 0.2413*x132*x15*x6*x66;
+    const double x149 = 0.2413*x132*x17*x4*x66;
+    poses[0] = -x0;
+    poses[1] = 0;
+    poses[2] = x1;
+    poses[3] = x2;
+    poses[4] = x1;
+    poses[5] = 0;
+    poses[6] = x0;
+    poses[7] = x3;
+    poses[8] = 0;
+    poses[9] = 1;
+    poses[10] = 0;
+    poses[11] = 0.0889000000000000;
+    poses[12] = 0;
+    poses[13] = 0;
+    poses[14] = 0;
+    poses[15] = 1;
+    poses[16] = -x5;
+    poses[17] = x7;
+    poses[18] = x1;
+    poses[19] = x8;
+    poses[20] = x9;
+    poses[21] = -x10;
+    poses[22] = x0;
+    poses[23] = x12;
+    poses[24] = x6;
+    poses[25] = x4;
+    poses[26] = 0;
+    poses[27] = x14;
+    poses[28] = 0;
+    poses[29] = 0;
+    poses[30] = 0;
+    poses[31] = 1;
+    poses[32] = x16 + x18;
+    poses[33] = x1;
+    poses[34] = x21;
+    poses[35] = x22;
+    poses[36] = -x23 - x25;
+    poses[37] = x0;
+    poses[38] = x29;
+    poses[39] = x32;
+    poses[40] = -x27 + x33;
+    poses[41] = 0;
+    poses[42] = x35;
+    poses[43] = x37;
+    poses[44] = 0;
+    poses[45] = 0;
+    poses[46] = 0;
+    poses[47] = 1;
+    poses[48] = x39 + x41 + x42;
+    poses[49] = -x19 + x20;
+    poses[50] = x47;
+    poses[51] = x48;
+    poses[52] = -x24*x43 + x45 - x49;
+    poses[53] = -x26 + x28;
+    poses[54] = x53;
+    poses[55] = x56;
+    poses[56] = x57 - x58;
+    poses[57] = -x24 - x34;
+    poses[58] = x61;
+    poses[59] = x63;
+    poses[60] = 0;
+    poses[61] = 0;
+    poses[62] = 0;
+    poses[63] = 1;
+    poses[64] = x65 + x67 - x68 + x69 + x70;
+    poses[65] = x47;
+    poses[66] = x76;
+    poses[67] = x48;
+    poses[68] = -x43*x81 + x77 + x78 - x79 - x80;
+    poses[69] = x53;
+    poses[70] = x88;
+    poses[71] = x56;
+    poses[72] = -x86 - x89 + x90 - x91;
+    poses[73] = x61;
+    poses[74] = x95;
+    poses[75] = x63;
+    poses[76] = 0;
+    poses[77] = 0;
+    poses[78] = 0;
+    poses[79] = 1;
+    poses[80] = -x44*x96 - x46*x96 + x65*x98 + x67*x98 - x68*x98 + x69*x98 + x70*x98 + x97;
+    poses[81] = -x44*x98 - x46*x98 - x65*x96 - x67*x96 + x68*x96 - x69*x96 - x70*x96 + x99;
+    poses[82] = x76;
+    poses[83] = x100;
+    poses[84] = x50*x96 + x51*x96 + x52*x96 + x77*x98 + x78*x98 - x79*x98 - x80*x98 - x81*x99;
+    poses[85] = x50*x98 + x51*x98 + x52*x98 - x77*x96 - x78*x96 + x79*x96 + x80*x96 + x81*x97;
+    poses[86] = x88;
+    poses[87] = x101 - x102 + x103 - x104 - x105 + x56;
+    poses[88] = x59*x96 - x60*x96 - x86*x98 - x89*x98 + x90*x98 - x91*x98;
+    poses[89] = x59*x98 - x60*x98 + x86*x96 + x89*x96 - x90*x96 + x91*x96;
+    poses[90] = x95;
+    poses[91] = x106 + x63 + 0.2413*x92 + 0.2413*x93 - 0.2413*x94;
+    poses[92] = 0;
+    poses[93] = 0;
+    poses[94] = 0;
+    poses[95] = 1;
+    jacobian[0] = -x101 + x102 - x103 + x104 + x105 - x11 - x3 + x30 + x31 + x54 - x55;
+    jacobian[1] = x0*x13 + x109;
+    jacobian[2] = x109;
+    jacobian[3] = -x101*x24 - x110*x44 + x111*x114 + x111*x116 + x111*x118 + x111*x119;
+    jacobian[4] = x107*x41 + x107*x42 + x114*x124 + x116*x124 + x118*x124 + x119*x124 - x120*x121 + x120*x123 - x121*x122 + x122*x123;
+    jacobian[5] = 0;
+    jacobian[6] = x100;
+    jacobian[7] = -x1*x13 + x125;
+    jacobian[8] = x125;
+    jacobian[9] = x110*x51 + x114*x126 + x116*x126 + x118*x126 + x119*x126 + 0.2413*x17*x39*x4*x66;
+    jacobian[10] = -x106*x43 - x107*x49 + x114*x129 + x116*x129 + x118*x129 + x119*x129 + x120*x127 - x120*x128 + x122*x127 - x122*x128;
+    jacobian[11] = 0;
+    jacobian[12] = 0;
+    jacobian[13] = x130*x131 + x131*x132 + x141;
+    jacobian[14] = x141;
+    jacobian[15] = x142*x59 - x142*x60 + x143*x59 - x143*x60;
+    jacobian[16] = -x120*x146 - x120*x147 - x120*x148 - x120*x149 - x122*x146 - x122*x147 - x122*x148 - x122*x149 + x144*x90 - x144*x91 + x145*x90 - x145*x91;
+    jacobian[17] = 0;
+    jacobian[18] = 0;
+    jacobian[19] = x1;
+    jacobian[20] = x1;
+    jacobian[21] = x21;
+    jacobian[22] = x47;
+    jacobian[23] = x76;
+    jacobian[24] = 0;
+    jacobian[25] = x0;
+    jacobian[26] = x0;
+    jacobian[27] = x29;
+    jacobian[28] = x53;
+    jacobian[29] = x88;
+    jacobian[30] = 1;
+    jacobian[31] = 0;
+    jacobian[32] = 0;
+    jacobian[33] = x35;
+    jacobian[34] = x61;
+    jacobian[35] = x95;
+}
+
+void fk_and_jacobian_batch(const double *q, double *poses, double *jacobian, long n)
+{
+    long i;
+    for (i = 0; i < n; i++)
+        fk_and_jacobian(q + 6*i, poses + 96*i, jacobian + 36*i);
+}
@@ -29,9 +29,8 @@ class hal_arm_kinematics():
         pose[13] = 0
         pose[14] = 0
         pose[15] = 1
-
-        pose = np.array(pose).reshape(4,4)
     #
+        pose = np.array(pose).reshape(4,4)
         return pose
 
 
@@ -63,9 +62,8 @@ class hal_arm_kinematics():
         pose[13] = 0
         pose[14] = 0
         pose[15] = 1
-
-        pose = np.array(pose).reshape(4,4)
     #
+        pose = np.array(pose).reshape(4,4)
         return pose
 
 
@@ -106,9 +104,8 @@ class hal_arm_kinematics():
         pose[13] = 0
         pose[14] = 0
         pose[15] = 1
-
-        pose = np.array(pose).reshape(4,4)
     #
+        pose = np.array(pose).reshape(4,4)
         return pose
 
 
@@ -119,48 +116,46 @@ class hal_arm_kinematics():
     #
         x0 = sin(q[3])
         x1 = cos(q[0])
-        x2 = cos(q[3])
+        x2 = x0*x1
         x3 = sin(q[0])
-        x4 = sin(q[1])
-        x5 = cos(q[2])
-        x6 = x4*x5
-        x7 = x3*x6
-        x8 = sin(q[2])
-        x9 = cos(q[1])
-        x10 = x8*x9
-        x11 = x10*x3
-        x12 = x11 + x7
-        x13 = x5*x9
-        x14 = x13*x3
-        x15 = x4*x8
-        x16 = x15*x3
-        x17 = 0.381*x9
-        x18 = x1*x6
-        x19 = x1*x10
-        x20 = -x18 - x19
-        x21 = x1*x15
-        x22 = x1*x13
-        x23 = x13 - x15
-    #
-        pose[0] = x0*x1 + x12*x2
-        pose[1] = x14 - x16
-        pose[2] = -x0*x12 + x1*x2
-        pose[3] = 0.06985*x11 - 0.3556*x14 + 0.3556*x16 - x17*x3 - 0.10795*x3 + 0.06985*x7
-        pose[4] = x0*x3 + x2*x20
-        pose[5] = x21 - x22
-        pose[6] = -x0*x20 + x2*x3
-        pose[7] = x1*x17 + 0.10795*x1 - 0.06985*x18 - 0.06985*x19 - 0.3556*x21 + 0.3556*x22
-        pose[8] = x2*x23
-        pose[9] = -x10 - x6
-        pose[10] = -x0*x23
-        pose[11] = 0.3556*x10 + 0.06985*x13 - 0.06985*x15 + 0.381*x4 + 0.3556*x6 + 0.0889
+        x4 = cos(q[3])
+        x5 = x3*x4
+        x6 = sin(q[1])
+        x7 = cos(q[2])
+        x8 = x6*x7
+        x9 = sin(q[2])
+        x10 = cos(q[1])
+        x11 = x10*x9
+        x12 = x10*x7
+        x13 = x12*x3
+        x14 = x6*x9
+        x15 = x14*x3
+        x16 = x1*x4
+        x17 = x0*x3
+        x18 = 0.381*x10
+        x19 = 0.06985*x3
+        x20 = x1*x14
+        x21 = x1*x12
+        x22 = 0.06985*x1
+    #
+        pose[0] = x11*x5 + x2 + x5*x8
+        pose[1] = x13 - x15
+        pose[2] = -x11*x17 + x16 - x17*x8
+        pose[3] = x11*x19 - 0.3556*x13 + 0.3556*x15 - x18*x3 + x19*x8 - 0.10795*x3
+        pose[4] = -x11*x16 - x16*x8 + x17
+        pose[5] = x20 - x21
+        pose[6] = x11*x2 + x2*x8 + x5
+        pose[7] = x1*x18 + 0.10795*x1 - x11*x22 - 0.3556*x20 + 0.3556*x21 - x22*x8
+        pose[8] = x12*x4 - x14*x4
+        pose[9] = -x11 - x8
+        pose[10] = -x0*x12 + x0*x14
+        pose[11] = 0.3556*x11 + 0.06985*x12 - 0.06985*x14 + 0.381*x6 + 0.3556*x8 + 0.0889
         pose[12] = 0
         pose[13] = 0
         pose[14] = 0
         pose[15] = 1
-
-        pose = np.array(pose).reshape(4,4)
     #
+        pose = np.array(pose).reshape(4,4)
         return pose
 
 
@@ -169,58 +164,58 @@ class hal_arm_kinematics():
     #
         pose = [0]*16
     #
-        x0 = sin(q[4])
-        x1 = sin(q[0])
-        x2 = cos(q[1])
-        x3 = cos(q[2])
-        x4 = x2*x3
-        x5 = x1*x4
-        x6 = sin(q[1])
-        x7 = sin(q[2])
-        x8 = x6*x7
-        x9 = x1*x8
-        x10 = x5 - x9
-        x11 = cos(q[4])
-        x12 = sin(q[3])
-        x13 = cos(q[0])
-        x14 = cos(q[3])
-        x15 = x3*x6
-        x16 = x1*x15
-        x17 = x2*x7
-        x18 = x1*x17
-        x19 = x16 + x18
-        x20 = x12*x13 + x14*x19
-        x21 = 0.381*x2
-        x22 = x13*x8
-        x23 = x13*x4
-        x24 = x22 - x23
-        x25 = x13*x15
-        x26 = x13*x17
-        x27 = -x25 - x26
-        x28 = x1*x12 + x14*x27
-        x29 = -x15 - x17
-        x30 = x4 - x8
-        x31 = x14*x30
-    #
-        pose[0] = x0*x10 + x11*x20
-        pose[1] = -x12*x19 + x13*x14
-        pose[2] = x0*x20 - x10*x11
-        pose[3] = -x1*x21 - 0.10795*x1 + 0.06985*x16 + 0.06985*x18 - 0.3556*x5 + 0.3556*x9
-        pose[4] = x0*x24 + x11*x28
-        pose[5] = x1*x14 - x12*x27
-        pose[6] = x0*x28 - x11*x24
-        pose[7] = x13*x21 + 0.10795*x13 - 0.3556*x22 + 0.3556*x23 - 0.06985*x25 - 0.06985*x26
-        pose[8] = x0*x29 + x11*x31
-        pose[9] = -x12*x30
-        pose[10] = x0*x31 - x11*x29
-        pose[11] = 0.3556*x15 + 0.3556*x17 + 0.06985*x4 + 0.381*x6 - 0.06985*x8 + 0.0889
+        x0 = cos(q[4])
+        x1 = sin(q[3])
+        x2 = cos(q[0])
+        x3 = x1*x2
+        x4 = sin(q[4])
+        x5 = sin(q[0])
+        x6 = cos(q[1])
+        x7 = cos(q[2])
+        x8 = x5*x6*x7
+        x9 = sin(q[1])
+        x10 = sin(q[2])
+        x11 = x10*x5*x9
+        x12 = cos(q[3])
+        x13 = x12*x5
+        x14 = x7*x9
+        x15 = x0*x14
+        x16 = x10*x6
+        x17 = x0*x16
+        x18 = x12*x2
+        x19 = x1*x5
+        x20 = x14*x4
+        x21 = x16*x4
+        x22 = 0.381*x6
+        x23 = 0.3556*x5
+        x24 = x10*x9
+        x25 = 0.06985*x5
+        x26 = x6*x7
+        x27 = x10*x4*x9
+        x28 = x4*x6*x7
+        x29 = x0*x6*x7
+        x30 = x0*x10*x9
+        x31 = 0.3556*x2
+        x32 = 0.06985*x2
+    #
+        pose[0] = x0*x3 - x11*x4 + x13*x15 + x13*x17 + x4*x8
+        pose[1] = -x14*x19 - x16*x19 + x18
+        pose[2] = x0*x11 - x0*x8 + x13*x20 + x13*x21 + x3*x4
+        pose[3] = x14*x25 + x16*x25 - x22*x5 + x23*x24 - x23*x26 - 0.10795*x5
+        pose[4] = x0*x19 - x15*x18 - x17*x18 + x2*x27 - x2*x28
+        pose[5] = x13 + x14*x3 + x16*x3
+        pose[6] = -x18*x20 - x18*x21 + x19*x4 + x2*x29 - x2*x30
+        pose[7] = -x14*x32 - x16*x32 + x2*x22 + 0.10795*x2 - x24*x31 + x26*x31
+        pose[8] = x12*x29 - x12*x30 - x20 - x21
+        pose[9] = x1*x24 - x1*x26
+        pose[10] = -x12*x27 + x12*x28 + x15 + x17
+        pose[11] = 0.3556*x14 + 0.3556*x16 - 0.06985*x24 + 0.06985*x26 + 0.381*x9 + 0.0889
         pose[12] = 0
         pose[13] = 0
         pose[14] = 0
         pose[15] = 1
-
-        pose = np.array(pose).reshape(4,4)
     #
+        pose = np.array(pose).reshape(4,4)
         return pose
 
 
@@ -232,69 +227,83 @@ class hal_arm_kinematics():
         x0 = sin(q[5])
         x1 = cos(q[0])
         x2 = cos(q[3])
-        x3 = sin(q[3])
-        x4 = sin(q[0])
-        x5 = sin(q[1])
-        x6 = cos(q[2])
+        x3 = x1*x2
+        x4 = x0*x3
+        x5 = sin(q[3])
+        x6 = cos(q[5])
         x7 = x5*x6
-        x8 = x4*x7
-        x9 = sin(q[2])
-        x10 = cos(q[1])
-        x11 = x10*x9
-        x12 = x11*x4
-        x13 = x12 + x8
-        x14 = x1*x2 - x13*x3
-        x15 = cos(q[5])
-        x16 = sin(q[4])
-        x17 = x10*x6
-        x18 = x17*x4
-        x19 = x5*x9
-        x20 = x19*x4
-        x21 = x18 - x20
-        x22 = cos(q[4])
-        x23 = x1*x3 + x13*x2
-        x24 = x16*x21 + x22*x23
-        x25 = x21*x22
-        x26 = x16*x23
-        x27 = 0.381*x10
-        x28 = x1*x7
-        x29 = x1*x11
-        x30 = -x28 - x29
-        x31 = x2*x4 - x3*x30
-        x32 = x1*x19
-        x33 = x1*x17
-        x34 = x32 - x33
-        x35 = x2*x30 + x3*x4
-        x36 = x16*x34 + x22*x35
-        x37 = x22*x34
-        x38 = x16*x35
-        x39 = x17 - x19
-        x40 = x3*x39
-        x41 = -x11 - x7
-        x42 = x2*x39
-        x43 = x16*x41 + x22*x42
-        x44 = x22*x41
-        x45 = x16*x42
-    #
-        pose[0] = x0*x14 + x15*x24
-        pose[1] = -x0*x24 + x14*x15
-        pose[2] = -x25 + x26
-        pose[3] = 0.06985*x12 - 0.3556*x18 + 0.3556*x20 - 0.2413*x25 + 0.2413*x26 - x27*x4 - 0.10795*x4 + 0.06985*x8
-        pose[4] = x0*x31 + x15*x36
-        pose[5] = -x0*x36 + x15*x31
-        pose[6] = -x37 + x38
-        pose[7] = x1*x27 + 0.10795*x1 - 0.06985*x28 - 0.06985*x29 - 0.3556*x32 + 0.3556*x33 - 0.2413*x37 + 0.2413*x38
-        pose[8] = -x0*x40 + x15*x43
-        pose[9] = -x0*x43 - x15*x40
-        pose[10] = -x44 + x45
-        pose[11] = 0.3556*x11 + 0.06985*x17 - 0.06985*x19 - 0.2413*x44 + 0.2413*x45 + 0.381*x5 + 0.3556*x7 + 0.0889
+        x8 = cos(q[4])
+        x9 = x1*x8
+        x10 = sin(q[0])
+        x11 = sin(q[4])
+        x12 = cos(q[1])
+        x13 = cos(q[2])
+        x14 = x10*x11*x12*x13
+        x15 = sin(q[1])
+        x16 = sin(q[2])
+        x17 = x10*x11*x15*x16
+        x18 = x0*x5
+        x19 = x10*x13*x15
+        x20 = x10*x12*x16
+        x21 = x10*x2
+        x22 = x21*x6
+        x23 = x13*x15
+        x24 = x23*x8
+        x25 = x12*x16
+        x26 = x25*x8
+        x27 = x3*x6
+        x28 = x0*x21
+        x29 = x11*x5
+        x30 = x1*x29
+        x31 = x10*x8
+        x32 = x15*x16
+        x33 = x31*x32
+        x34 = x12*x13
+        x35 = x31*x34
+        x36 = x11*x13*x15
+        x37 = x21*x36
+        x38 = x11*x12*x16
+        x39 = x21*x38
+        x40 = 0.381*x12
+        x41 = 0.3556*x10
+        x42 = 0.06985*x10
+        x43 = x10*x5*x8
+        x44 = x1*x11*x15*x16
+        x45 = x1*x13*x15
+        x46 = x1*x12*x16
+        x47 = x1*x11*x12*x13
+        x48 = x10*x29
+        x49 = x34*x9
+        x50 = x32*x9
+        x51 = x3*x36
+        x52 = x3*x38
+        x53 = 0.3556*x1
+        x54 = 0.06985*x1
+        x55 = x15*x16*x5
+        x56 = x12*x13*x2*x8
+        x57 = x15*x16*x2*x8
+        x58 = x11*x2
+        x59 = x34*x58
+        x60 = x32*x58
+    #
+        pose[0] = x14*x6 - x17*x6 - x18*x19 - x18*x20 + x22*x24 + x22*x26 + x4 + x7*x9
+        pose[1] = -x0*x14 + x0*x17 - x18*x9 - x19*x7 - x20*x7 - x24*x28 - x26*x28 + x27
+        pose[2] = x30 + x33 - x35 + x37 + x39
+        pose[3] = -x10*x40 - 0.10795*x10 + x23*x42 + x25*x42 + 0.2413*x30 + x32*x41 + 0.2413*x33 - x34*x41 - 0.2413*x35 + 0.2413*x37 + 0.2413*x39
+        pose[4] = x18*x45 + x18*x46 - x24*x27 - x26*x27 + x28 + x43*x6 + x44*x6 - x47*x6
+        pose[5] = -x0*x43 - x0*x44 + x0*x47 + x22 + x24*x4 + x26*x4 + x45*x7 + x46*x7
+        pose[6] = x48 + x49 - x50 - x51 - x52
+        pose[7] = x1*x40 + 0.10795*x1 - x23*x54 - x25*x54 - x32*x53 + x34*x53 + 0.2413*x48 + 0.2413*x49 - 0.2413*x50 - 0.2413*x51 - 0.2413*x52
+        pose[8] = x0*x55 - x18*x34 - x36*x6 - x38*x6 + x56*x6 - x57*x6
+        pose[9] = x0*x36 + x0*x38 - x0*x56 + x0*x57 - x34*x7 + x55*x6
+        pose[10] = x24 + x26 + x59 - x60
+        pose[11] = 0.381*x15 + 0.3556*x23 + 0.2413*x24 + 0.3556*x25 + 0.2413*x26 - 0.06985*x32 + 0.06985*x34 + 0.2413*x59 - 0.2413*x60 + 0.0889
         pose[12] = 0
         pose[13] = 0
         pose[14] = 0
         pose[15] = 1
-
-        pose = np.array(pose).reshape(4,4)
     #
+        pose = np.array(pose).reshape(4,4)
         return pose
 
 
@@ -307,7 +316,7 @@ class hal_arm_kinematics():
     #
         jacobian = [0]*36
     #
-
+    #
         jacobian[0] = -0.10795*cos(q[0])
         jacobian[1] = 0
         jacobian[2] = 0
@@ -410,37 +419,42 @@ class hal_arm_kinematics():
     #
         x0 = cos(q[0])
         x1 = cos(q[1])
-        x2 = 0.381*x1
-        x3 = x0*x2
+        x2 = 0.381*x0
+        x3 = cos(q[2])
         x4 = sin(q[1])
-        x5 = cos(q[2])
-        x6 = 0.06985*x4*x5
-        x7 = x0*x6
-        x8 = sin(q[2])
-        x9 = 0.06985*x1*x8
-        x10 = x0*x9
-        x11 = sin(q[0])
-        x12 = 0.06985*x1*x5 - 0.06985*x4*x8
-        x13 = x12 + 0.381*x4
-        x14 = x11*x6 + x11*x9
-        x15 = -x11*x2 + x14
-        x16 = -x10 - x7
-    #
-        jacobian[0] = -0.10795*x0 + x10 - x3 + x7
-        jacobian[1] = x11*x13
-        jacobian[2] = x11*x12
+        x5 = 0.06985*x0*x4
+        x6 = sin(q[2])
+        x7 = 0.06985*x0*x1
+        x8 = sin(q[0])
+        x9 = 0.381*x8
+        x10 = 0.06985*x4*x8
+        x11 = 0.06985*x1*x8
+        x12 = -x10*x6 + x11*x3
+        x13 = -x3*x7 + x5*x6
+        x14 = x8**2
+        x15 = 0.381*x1
+        x16 = x0**2
+        x17 = x3*x4
+        x18 = 0.06985*x14
+        x19 = x1*x6
+        x20 = 0.06985*x16
+        x21 = -x17*x18 - x17*x20 - x18*x19 - x19*x20
+    #
+        jacobian[0] = -0.10795*x0 - x1*x2 + x3*x5 + x6*x7
+        jacobian[1] = x12 + x4*x9
+        jacobian[2] = x12
         jacobian[3] = 0
         jacobian[4] = 0
         jacobian[5] = 0
-        jacobian[6] = -0.10795*x11 + x15
-        jacobian[7] = -x0*x13
-        jacobian[8] = -x0*x12
+        jacobian[6] = -x1*x9 + x10*x3 + x11*x6 - 0.10795*x8
+        jacobian[7] = x13 - x2*x4
+        jacobian[8] = x13
         jacobian[9] = 0
         jacobian[10] = 0
         jacobian[11] = 0
         jacobian[12] = 0
-        jacobian[13] = x0*(x16 + x3) - x11*x15
-        jacobian[14] = x0*x16 - x11*x14
+        jacobian[13] = x14*x15 + x15*x16 + x21
+        jacobian[14] = x21
         jacobian[15] = 0
         jacobian[16] = 0
         jacobian[17] = 0
@@ -451,8 +465,8 @@ class hal_arm_kinematics():
         jacobian[22] = 0
         jacobian[23] = 0
         jacobian[24] = 0
-        jacobian[25] = x11
-        jacobian[26] = x11
+        jacobian[25] = x8
+        jacobian[26] = x8
         jacobian[27] = 0
         jacobian[28] = 0
         jacobian[29] = 0
@@ -474,72 +488,69 @@ class hal_arm_kinematics():
     #
         x0 = cos(q[0])
         x1 = cos(q[1])
-        x2 = 0.381*x1
-        x3 = x0*x2
-        x4 = sin(q[1])
-        x5 = sin(q[2])
-        x6 = x4*x5
-        x7 = x0*x6
-        x8 = 0.3556*x7
-        x9 = 0.06985*x0
-        x10 = cos(q[2])
-        x11 = x10*x4
-        x12 = x11*x9
-        x13 = x1*x5
-        x14 = x13*x9
-        x15 = x1*x10
-        x16 = x0*x15
-        x17 = 0.3556*x16
-        x18 = sin(q[0])
-        x19 = 0.3556*x11 + 0.3556*x13
-        x20 = 0.06985*x15 + x19 - 0.06985*x6
-        x21 = x20 + 0.381*x4
-        x22 = x16 - x7
-        x23 = x11 + x13
-        x24 = x17 - x8
-        x25 = x18*x6
-        x26 = x15*x18
-        x27 = 0.3556*x25 - 0.3556*x26
-        x28 = 0.06985*x18
-        x29 = x11*x28 + x13*x28 + x27
-        x30 = -x18*x2 + x29
-        x31 = x25 - x26
-        x32 = -x12 - x14 + x24
-    #
-        jacobian[0] = -0.10795*x0 + x12 + x14 - x17 - x3 + x8
-        jacobian[1] = x18*x21
-        jacobian[2] = x18*x20
-        jacobian[3] = x19*x22 - x23*x24
+        x2 = 0.381*x0
+        x3 = sin(q[1])
+        x4 = sin(q[2])
+        x5 = x3*x4
+        x6 = x0*x5
+        x7 = cos(q[2])
+        x8 = x0*x3*x7
+        x9 = x0*x1*x4
+        x10 = x1*x7
+        x11 = x0*x10
+        x12 = sin(q[0])
+        x13 = 0.381*x12
+        x14 = x12*x5
+        x15 = x12*x3*x7
+        x16 = x1*x12*x4
+        x17 = x10*x12
+        x18 = -0.06985*x14 + 0.3556*x15 + 0.3556*x16 + 0.06985*x17
+        x19 = -0.06985*x11 + 0.06985*x6 - 0.3556*x8 - 0.3556*x9
+        x20 = x12**2
+        x21 = 0.381*x1
+        x22 = x0**2
+        x23 = 0.3556*x20
+        x24 = x3*x7
+        x25 = 0.06985*x20
+        x26 = x1*x4
+        x27 = 0.3556*x22
+        x28 = 0.06985*x22
+        x29 = x10*x23 + x10*x27 - x23*x5 - x24*x25 - x24*x28 - x25*x26 - x26*x28 - x27*x5
+    #
+        jacobian[0] = -0.10795*x0 - x1*x2 - 0.3556*x11 + 0.3556*x6 + 0.06985*x8 + 0.06985*x9
+        jacobian[1] = x13*x3 + x18
+        jacobian[2] = x18
+        jacobian[3] = 0
         jacobian[4] = 0
         jacobian[5] = 0
-        jacobian[6] = -0.10795*x18 + x30
-        jacobian[7] = -x0*x21
-        jacobian[8] = -x0*x20
-        jacobian[9] = -x19*x31 + x23*x27
+        jacobian[6] = -x1*x13 - 0.10795*x12 + 0.3556*x14 + 0.06985*x15 + 0.06985*x16 - 0.3556*x17
+        jacobian[7] = x19 - x2*x3
+        jacobian[8] = x19
+        jacobian[9] = 0
         jacobian[10] = 0
         jacobian[11] = 0
         jacobian[12] = 0
-        jacobian[13] = x0*(x3 + x32) - x18*x30
-        jacobian[14] = x0*x32 - x18*x29
-        jacobian[15] = -x22*x27 + x24*x31
+        jacobian[13] = x20*x21 + x21*x22 + x29
+        jacobian[14] = x29
+        jacobian[15] = 0
         jacobian[16] = 0
         jacobian[17] = 0
         jacobian[18] = 0
         jacobian[19] = x0
         jacobian[20] = x0
-        jacobian[21] = x31
+        jacobian[21] = x14 - x17
         jacobian[22] = 0
         jacobian[23] = 0
         jacobian[24] = 0
-        jacobian[25] = x18
-        jacobian[26] = x18
-        jacobian[27] = x22
+        jacobian[25] = x12
+        jacobian[26] = x12
+        jacobian[27] = x11 - x6
         jacobian[28] = 0
         jacobian[29] = 0
         jacobian[30] = 1
         jacobian[31] = 0
         jacobian[32] = 0
-        jacobian[33] = x23
+        jacobian[33] = x24 + x26
         jacobian[34] = 0
         jacobian[35] = 0
     #
@@ -554,77 +565,72 @@ class hal_arm_kinematics():
     #
         x0 = cos(q[0])
         x1 = cos(q[1])
-        x2 = 0.381*x1
-        x3 = x0*x2
-        x4 = sin(q[1])
-        x5 = sin(q[2])
-        x6 = x4*x5
-        x7 = x0*x6
-        x8 = 0.3556*x7
-        x9 = cos(q[2])
-        x10 = x4*x9
+        x2 = 0.381*x0
+        x3 = sin(q[1])
+        x4 = sin(q[2])
+        x5 = x3*x4
+        x6 = x0*x5
+        x7 = cos(q[2])
+        x8 = x0*x3*x7
+        x9 = x0*x1*x4
+        x10 = x1*x7
         x11 = x0*x10
-        x12 = 0.06985*x11
-        x13 = x1*x5
-        x14 = x0*x13
-        x15 = 0.06985*x14
-        x16 = x1*x9
-        x17 = x0*x16
-        x18 = 0.3556*x17
-        x19 = sin(q[0])
-        x20 = 0.3556*x10 + 0.3556*x13
-        x21 = 0.06985*x16 + x20 - 0.06985*x6
-        x22 = x21 + 0.381*x4
-        x23 = x17 - x7
-        x24 = x10 + x13
-        x25 = x18 - x8
-        x26 = x19*x6
-        x27 = x16*x19
-        x28 = 0.3556*x26 - 0.3556*x27
-        x29 = x10*x19
-        x30 = x13*x19
-        x31 = x28 + 0.06985*x29 + 0.06985*x30
-        x32 = -x19*x2 + x31
-        x33 = x26 - x27
-        x34 = -x12 - x15 + x25
-        x35 = cos(q[3])
-        x36 = sin(q[3])
-    #
-        jacobian[0] = -0.10795*x0 + x12 + x15 - x18 - x3 + x8
-        jacobian[1] = x19*x22
-        jacobian[2] = x19*x21
-        jacobian[3] = x20*x23 - x24*x25
+        x12 = sin(q[0])
+        x13 = 0.381*x12
+        x14 = x12*x5
+        x15 = x12*x3*x7
+        x16 = x1*x12*x4
+        x17 = x10*x12
+        x18 = -0.06985*x14 + 0.3556*x15 + 0.3556*x16 + 0.06985*x17
+        x19 = -0.06985*x11 + 0.06985*x6 - 0.3556*x8 - 0.3556*x9
+        x20 = x12**2
+        x21 = 0.381*x1
+        x22 = x0**2
+        x23 = 0.3556*x20
+        x24 = x3*x7
+        x25 = 0.06985*x20
+        x26 = x1*x4
+        x27 = 0.3556*x22
+        x28 = 0.06985*x22
+        x29 = x10*x23 + x10*x27 - x23*x5 - x24*x25 - x24*x28 - x25*x26 - x26*x28 - x27*x5
+        x30 = cos(q[3])
+        x31 = sin(q[3])
+    #
+        jacobian[0] = -0.10795*x0 - x1*x2 - 0.3556*x11 + 0.3556*x6 + 0.06985*x8 + 0.06985*x9
+        jacobian[1] = x13*x3 + x18
+        jacobian[2] = x18
+        jacobian[3] = 0
         jacobian[4] = 0
         jacobian[5] = 0
-        jacobian[6] = -0.10795*x19 + x32
-        jacobian[7] = -x0*x22
-        jacobian[8] = -x0*x21
-        jacobian[9] = -x20*x33 + x24*x28
+        jacobian[6] = -x1*x13 - 0.10795*x12 + 0.3556*x14 + 0.06985*x15 + 0.06985*x16 - 0.3556*x17
+        jacobian[7] = x19 - x2*x3
+        jacobian[8] = x19
+        jacobian[9] = 0
         jacobian[10] = 0
         jacobian[11] = 0
         jacobian[12] = 0
-        jacobian[13] = x0*(x3 + x34) - x19*x32
-        jacobian[14] = x0*x34 - x19*x31
-        jacobian[15] = -x23*x28 + x25*x33
+        jacobian[13] = x20*x21 + x21*x22 + x29
+        jacobian[14] = x29
+        jacobian[15] = 0
         jacobian[16] = 0
         jacobian[17] = 0
         jacobian[18] = 0
         jacobian[19] = x0
         jacobian[20] = x0
-        jacobian[21] = x33
-        jacobian[22] = x0*x35 - x36*(x29 + x30)
+        jacobian[21] = x14 - x17
+        jacobian[22] = x0*x30 - x15*x31 - x16*x31
         jacobian[23] = 0
         jacobian[24] = 0
-        jacobian[25] = x19
-        jacobian[26] = x19
-        jacobian[27] = x23
-        jacobian[28] = x19*x35 - x36*(-x11 - x14)
+        jacobian[25] = x12
+        jacobian[26] = x12
+        jacobian[27] = x11 - x6
+        jacobian[28] = x12*x30 + x31*x8 + x31*x9
         jacobian[29] = 0
         jacobian[30] = 1
         jacobian[31] = 0
         jacobian[32] = 0
-        jacobian[33] = x24
-        jacobian[34] = -x36*(x16 - x6)
+        jacobian[33] = x24 + x26
+        jacobian[34] = -x10*x31 + x31*x5
         jacobian[35] = 0
     #
         jacobian = np.array(jacobian).reshape(6,6)
@@ -638,100 +644,129 @@ class hal_arm_kinematics():
     #
         x0 = cos(q[0])
         x1 = cos(q[1])
-        x2 = 0.381*x1
-        x3 = x0*x2
-        x4 = sin(q[1])
-        x5 = sin(q[2])
+        x2 = 0.381*x0
+        x3 = sin(q[0])
+        x4 = sin(q[3])
+        x5 = sin(q[4])
         x6 = x4*x5
-        x7 = x0*x6
-        x8 = 0.3556*x7
-        x9 = cos(q[2])
-        x10 = x4*x9
-        x11 = x0*x10
-        x12 = 0.06985*x11
-        x13 = x1*x5
-        x14 = x0*x13
-        x15 = 0.06985*x14
-        x16 = x1*x9
+        x7 = x3*x6
+        x8 = 0.2413*x7
+        x9 = sin(q[1])
+        x10 = sin(q[2])
+        x11 = x10*x9
+        x12 = x0*x11
+        x13 = cos(q[2])
+        x14 = x0*x13*x9
+        x15 = x0*x1*x10
+        x16 = x1*x13
         x17 = x0*x16
-        x18 = 0.3556*x17
-        x19 = cos(q[4])
-        x20 = x19*(-x17 + x7)
-        x21 = 0.2413*x20
-        x22 = sin(q[4])
-        x23 = sin(q[0])
-        x24 = sin(q[3])
-        x25 = cos(q[3])
-        x26 = -x11 - x14
-        x27 = x22*(x23*x24 + x25*x26)
-        x28 = 0.2413*x27
-        x29 = x19*(-x10 - x13)
-        x30 = x16 - x6
-        x31 = x22*x25*x30
-        x32 = -0.2413*x29 + 0.2413*x31
-        x33 = 0.3556*x10 + 0.3556*x13 + x32
-        x34 = 0.06985*x16 + x33 - 0.06985*x6
-        x35 = x34 + 0.381*x4
-        x36 = x17 - x7
-        x37 = x10 + x13
-        x38 = -x21 + x28
-        x39 = x18 + x38 - x8
-        x40 = x23*x25 - x24*x26
-        x41 = x24*x30
-        x42 = -x20 + x27
-        x43 = -x29 + x31
-        x44 = x10*x23
-        x45 = x13*x23
-        x46 = x23*x6
-        x47 = x16*x23
-        x48 = x19*(-x46 + x47)
-        x49 = x44 + x45
-        x50 = x22*(x0*x24 + x25*x49)
-        x51 = -0.2413*x48 + 0.2413*x50
-        x52 = 0.3556*x46 - 0.3556*x47 + x51
-        x53 = 0.06985*x44 + 0.06985*x45 + x52
-        x54 = -x2*x23 + x53
-        x55 = x46 - x47
-        x56 = x0*x25 - x24*x49
-        x57 = -x48 + x50
-        x58 = -x12 - x15 + x39
-    #
-        jacobian[0] = -0.10795*x0 + x12 + x15 - x18 + x21 - x28 - x3 + x8
-        jacobian[1] = x23*x35
-        jacobian[2] = x23*x34
-        jacobian[3] = x33*x36 - x37*x39
-        jacobian[4] = x32*x40 + x38*x41
-        jacobian[5] = x32*x42 - x38*x43
-        jacobian[6] = -0.10795*x23 + x54
-        jacobian[7] = -x0*x35
-        jacobian[8] = -x0*x34
-        jacobian[9] = -x33*x55 + x37*x52
-        jacobian[10] = -x32*x56 - x41*x51
-        jacobian[11] = -x32*x57 + x43*x51
+        x18 = cos(q[4])
+        x19 = x12*x18
+        x20 = x17*x18
+        x21 = x13*x9
+        x22 = cos(q[3])
+        x23 = x0*x22*x5
+        x24 = x21*x23
+        x25 = x1*x10
+        x26 = x23*x25
+        x27 = 0.381*x3
+        x28 = x11*x3
+        x29 = x13*x3*x9
+        x30 = x1*x10*x3
+        x31 = x16*x3
+        x32 = 0.2413*x3
+        x33 = x18*x21
+        x34 = x18*x25
+        x35 = 0.2413*x22*x3*x5
+        x36 = -x11*x35 + x16*x35 - 0.06985*x28 + 0.3556*x29 + 0.3556*x30 + 0.06985*x31 + x32*x33 + x32*x34
+        x37 = 0.2413*x0*x22*x5
+        x38 = x9**2
+        x39 = x10**2
+        x40 = x38*x39
+        x41 = x13**2
+        x42 = x38*x41
+        x43 = x1**2
+        x44 = x39*x43
+        x45 = x41*x43
+        x46 = 0.2413*x22*x3
+        x47 = x4**2
+        x48 = 0.2413*x10*x3*x5*x9
+        x49 = x22**2
+        x50 = 0.2413*x1*x13*x3*x5
+        x51 = 0.2413*x0*x18*x4
+        x52 = x0*x6
+        x53 = 0.2413*x52
+        x54 = x18*x28
+        x55 = x18*x31
+        x56 = x22*x3*x5
+        x57 = x21*x56
+        x58 = x25*x56
+        x59 = 0.2413*x0
+        x60 = x11*x37 + 0.06985*x12 - 0.3556*x14 - 0.3556*x15 - x16*x37 - 0.06985*x17 - x33*x59 - x34*x59
+        x61 = 0.2413*x0*x22
+        x62 = 0.2413*x0*x10*x5*x9
+        x63 = 0.2413*x0*x1*x13*x5
+        x64 = 0.2413*x18*x3*x4
+        x65 = x3**2
+        x66 = 0.381*x1
+        x67 = x0**2
+        x68 = 0.3556*x65
+        x69 = 0.06985*x65
+        x70 = 0.3556*x67
+        x71 = 0.06985*x67
+        x72 = 0.2413*x18*x65
+        x73 = x11*x72
+        x74 = x16*x72
+        x75 = 0.2413*x18*x67
+        x76 = x11*x75
+        x77 = x16*x75
+        x78 = 0.2413*x22*x5*x65
+        x79 = 0.2413*x22*x5*x67
+        x80 = -x11*x68 - x11*x70 + x16*x68 + x16*x70 - x21*x69 - x21*x71 - x21*x78 - x21*x79 - x25*x69 - x25*x71 - x25*x78 - x25*x79 - x73 + x74 - x76 + x77
+        x81 = 0.2413*x4*x5*x65
+        x82 = 0.2413*x4*x5*x67
+        x83 = 0.2413*x13*x5*x65*x9
+        x84 = 0.2413*x1*x10*x5*x65
+        x85 = 0.2413*x13*x5*x67*x9
+        x86 = 0.2413*x1*x10*x5*x67
+        x87 = x22*x5
+    #
+        jacobian[0] = -0.10795*x0 - x1*x2 + 0.3556*x12 + 0.06985*x14 + 0.06985*x15 - 0.3556*x17 + 0.2413*x19 - 0.2413*x20 + 0.2413*x24 + 0.2413*x26 - x8
+        jacobian[1] = x27*x9 + x36
+        jacobian[2] = x36
+        jacobian[3] = -x21*x8 - x25*x8 + x37*x40 + x37*x42 + x37*x44 + x37*x45
+        jacobian[4] = x33*x46 + x34*x46 + x40*x51 + x42*x51 + x44*x51 + x45*x51 - x47*x48 + x47*x50 - x48*x49 + x49*x50
+        jacobian[5] = 0
+        jacobian[6] = -x1*x27 + 0.3556*x28 + 0.06985*x29 - 0.10795*x3 + 0.06985*x30 - 0.3556*x31 + x53 + 0.2413*x54 - 0.2413*x55 + 0.2413*x57 + 0.2413*x58
+        jacobian[7] = -x2*x9 + x60
+        jacobian[8] = x60
+        jacobian[9] = x21*x53 + x25*x53 + x35*x40 + x35*x42 + x35*x44 + x35*x45
+        jacobian[10] = -x33*x61 - x34*x61 + x40*x64 + x42*x64 + x44*x64 + x45*x64 + x47*x62 - x47*x63 + x49*x62 - x49*x63
+        jacobian[11] = 0
         jacobian[12] = 0
-        jacobian[13] = x0*(x3 + x58) - x23*x54
-        jacobian[14] = x0*x58 - x23*x53
-        jacobian[15] = -x36*x52 + x39*x55
-        jacobian[16] = x38*x56 - x40*x51
-        jacobian[17] = x38*x57 - x42*x51
+        jacobian[13] = x65*x66 + x66*x67 + x80
+        jacobian[14] = x80
+        jacobian[15] = x11*x81 + x11*x82 - x16*x81 - x16*x82
+        jacobian[16] = -x22*x73 + x22*x74 - x22*x76 + x22*x77 - x47*x83 - x47*x84 - x47*x85 - x47*x86 - x49*x83 - x49*x84 - x49*x85 - x49*x86
+        jacobian[17] = 0
         jacobian[18] = 0
         jacobian[19] = x0
         jacobian[20] = x0
-        jacobian[21] = x55
-        jacobian[22] = x56
-        jacobian[23] = x57
+        jacobian[21] = x28 - x31
+        jacobian[22] = x0*x22 - x29*x4 - x30*x4
+        jacobian[23] = x52 + x54 - x55 + x57 + x58
         jacobian[24] = 0
-        jacobian[25] = x23
-        jacobian[26] = x23
-        jacobian[27] = x36
-        jacobian[28] = x40
-        jacobian[29] = x42
+        jacobian[25] = x3
+        jacobian[26] = x3
+        jacobian[27] = -x12 + x17
+        jacobian[28] = x14*x4 + x15*x4 + x22*x3
+        jacobian[29] = -x19 + x20 - x24 - x26 + x7
         jacobian[30] = 1
         jacobian[31] = 0
         jacobian[32] = 0
-        jacobian[33] = x37
-        jacobian[34] = -x41
-        jacobian[35] = x43
+        jacobian[33] = x21 + x25
+        jacobian[34] = x11*x4 - x16*x4
+        jacobian[35] = -x11*x87 + x16*x87 + x33 + x34
     #
         jacobian = np.array(jacobian).reshape(6,6)
         return jacobian
@@ -739,3 +774,2309 @@ class hal_arm_kinematics():
 
 
     J = {0:jacobian00, 1:jacobian01, 2:jacobian02, 3:jacobian03, 4:jacobian04, 5:jacobian05, }
+
+
+
+    def joint_fk00_batch(q):
+    #
+        q = np.asarray(q, dtype=float).reshape(-1, 6)
+        pose = np.empty((q.shape[0], 16))
+    #
+        x0 = np.sin(q[:, 0])
+        x1 = np.cos(q[:, 0])
+    #
+        pose[:, 0] = -x0
+        pose[:, 1] = 0
+        pose[:, 2] = x1
+        pose[:, 3] = -0.10795*x0
+        pose[:, 4] = x1
+        pose[:, 5] = 0
+        pose[:, 6] = x0
+        pose[:, 7] = 0.10795*x1
+        pose[:, 8] = 0
+        pose[:, 9] = 1
+        pose[:, 10] = 0
+        pose[:, 11] = 0.0889000000000000
+        pose[:, 12] = 0
+        pose[:, 13] = 0
+        pose[:, 14] = 0
+        pose[:, 15] = 1
+    #
+        return pose.reshape(-1, 4, 4)
+
+
+
+    def joint_fk01_batch(q):
+    #
+        q = np.asarray(q, dtype=float).reshape(-1, 6)
+        pose = np.empty((q.shape[0], 16))
+    #
+        x0 = np.sin(q[:, 0])
+        x1 = np.cos(q[:, 1])
+        x2 = x0*x1
+        x3 = np.sin(q[:, 1])
+        x4 = np.cos(q[:, 0])
+        x5 = x1*x4
+    #
+        pose[:, 0] = -x2
+        pose[:, 1] = x0*x3
+        pose[:, 2] = x4
+        pose[:, 3] = -0.10795*x0 - 0.381*x2
+        pose[:, 4] = x5
+        pose[:, 5] = -x3*x4
+        pose[:, 6] = x0
+        pose[:, 7] = 0.10795*x4 + 0.381*x5
+        pose[:, 8] = x3
+        pose[:, 9] = x1
+        pose[:, 10] = 0
+        pose[:, 11] = 0.381*x3 + 0.0889
+        pose[:, 12] = 0
+        pose[:, 13] = 0
+        pose[:, 14] = 0
+        pose[:, 15] = 1
+    #
+        return pose.reshape(-1, 4, 4)
+
+
+
+    def joint_fk02_batch(q):
+    #
+        q = np.asarray(q, dtype=float).reshape(-1, 6)
+        pose = np.empty((q.shape[0], 16))
+    #
+        x0 = np.sin(q[:, 0])
+        x1 = np.sin(q[:, 1])
+        x2 = np.cos(q[:, 2])
+        x3 = x1*x2
+        x4 = x0*x3
+        x5 = np.sin(q[:, 2])
+        x6 = np.cos(q[:, 1])
+        x7 = x5*x6
+        x8 = x0*x7
+        x9 = np.cos(q[:, 0])
+        x10 = x1*x5
+        x11 = x2*x6
+        x12 = 0.381*x6
+        x13 = x3*x9
+        x14 = x7*x9
+    #
+        pose[:, 0] = x4 + x8
+        pose[:, 1] = x9
+        pose[:, 2] = x0*x10 - x0*x11
+        pose[:, 3] = -x0*x12 - 0.10795*x0 + 0.06985*x4 + 0.06985*x8
+        pose[:, 4] = -x13 - x14
+        pose[:, 5] = x0
+        pose[:, 6] = -x10*x9 + x11*x9
+        pose[:, 7] = x12*x9 - 0.06985*x13 - 0.06985*x14 + 0.10795*x9
+        pose[:, 8] = -x10 + x11
+        pose[:, 9] = 0
+        pose[:, 10] = x3 + x7
+        pose[:, 11] = 0.381*x1 - 0.06985*x10 + 0.06985*x11 + 0.0889
+        pose[:, 12] = 0
+        pose[:, 13] = 0
+        pose[:, 14] = 0
+        pose[:, 15] = 1
+    #
+        return pose.reshape(-1, 4, 4)
+
+
+
+    def joint_fk03_batch(q):
+    #
+        q = np.asarray(q, dtype=float).reshape(-1, 6)
+        pose = np.empty((q.shape[0], 16))
+    #
+        x0 = np.sin(q[:, 3])
+        x1 = np.cos(q[:, 0])
+        x2 = x0*x1
+        x3 = np.sin(q[:, 0])
+        x4 = np.cos(q[:, 3])
+        x5 = x3*x4
+        x6 = np.sin(q[:, 1])
+        x7 = np.cos(q[:, 2])
+        x8 = x6*x7
+        x9 = np.sin(q[:, 2])
+        x10 = np.cos(q[:, 1])
+        x11 = x10*x9
+        x12 = x10*x7
+        x13 = x12*x3
+        x14 = x6*x9
+        x15 = x14*x3
+        x16 = x1*x4
+        x17 = x0*x3
+        x18 = 0.381*x10
+        x19 = 0.06985*x3
+        x20 = x1*x14
+        x21 = x1*x12
+        x22 = 0.06985*x1
+    #
+        pose[:, 0] = x11*x5 + x2 + x5*x8
+        pose[:, 1] = x13 - x15
+        pose[:, 2] = -x11*x17 + x16 - x17*x8
+        pose[:, 3] = x11*x19 - 0.3556*x13 + 0.3556*x15 - x18*x3 + x19*x8 - 0.10795*x3
+        pose[:, 4] = -x11*x16 - x16*x8 + x17
+        pose[:, 5] = x20 - x21
+        pose[:, 6] = x11*x2 + x2*x8 + x5
+        pose[:, 7] = x1*x18 + 0.10795*x1 - x11*x22 - 0.3556*x20 + 0.3556*x21 - x22*x8
+        pose[:, 8] = x12*x4 - x14*x4
+        pose[:, 9] = -x11 - x8
+        pose[:, 10] = -x0*x12 + x0*x14
+        pose[:, 11] = 0.3556*x11 + 0.06985*x12 - 0.06985*x14 + 0.381*x6 + 0.3556*x8 + 0.0889
+        pose[:, 12] = 0
+        pose[:, 13] = 0
+        pose[:, 14] = 0
+        pose[:, 15] = 1
+    #
+        return pose.reshape(-1, 4, 4)
+
+
+
+    def joint_fk04_batch(q):
+    #
+        q = np.asarray(q, dtype=float).reshape(-1, 6)
+        pose = np.empty((q.shape[0], 16))
+    #
+        x0 = np.cos(q[:, 4])
+        x1 = np.sin(q[:, 3])
+        x2 = np.cos(q[:, 0])
+        x3 = x1*x2
+        x4 = np.sin(q[:, 4])
+        x5 = np.sin(q[:, 0])
+        x6 = np.cos(q[:, 1])
+        x7 = np.cos(q[:, 2])
+        x8 = x5*x6*x7
+        x9 = np.sin(q[:, 1])
+        x10 = np.sin(q[:, 2])
+        x11 = x10*x5*x9
+        x12 = np.cos(q[:, 3])
+        x13 = x12*x5
+        x14 = x7*x9
+        x15 = x0*x14
+        x16 = x10*x6
+        x17 = x0*x16
+        x18 = x12*x2
+        x19 = x1*x5
+        x20 = x14*x4
+        x21 = x16*x4
+        x22 = 0.381*x6
+        x23 = 0.3556*x5
+        x24 = x10*x9
+        x25 = 0.06985*x5
+        x26 = x6*x7
+        x27 = x10*x4*x9
+        x28 = x4*x6*x7
+        x29 = x0*x6*x7
+        x30 = x0*x10*x9
+        x31 = 0.3556*x2
+        x32 = 0.06985*x2
+    #
+        pose[:, 0] = x0*x3 - x11*x4 + x13*x15 + x13*x17 + x4*x8
+        pose[:, 1] = -x14*x19 - x16*x19 + x18
+        pose[:, 2] = x0*x11 - x0*x8 + x13*x20 + x13*x21 + x3*x4
+        pose[:, 3] = x14*x25 + x16*x25 - x22*x5 + x23*x24 - x23*x26 - 0.10795*x5
+        pose[:, 4] = x0*x19 - x15*x18 - x17*x18 + x2*x27 - x2*x28
+        pose[:, 5] = x13 + x14*x3 + x16*x3
+        pose[:, 6] = -x18*x20 - x18*x21 + x19*x4 + x2*x29 - x2*x30
+        pose[:, 7] = -x14*x32 - x16*x32 + x2*x22 + 0.10795*x2 - x24*x31 + x26*x31
+        pose[:, 8] = x12*x29 - x12*x30 - x20 - x21
+        pose[:, 9] = x1*x24 - x1*x26
+        pose[:, 10] = -x12*x27 + x12*x28 + x15 + x17
+        pose[:, 11] = 0.3556*x14 + 0.3556*x16 - 0.06985*x24 + 0.06985*x26 + 0.381*x9 + 0.0889
+        pose[:, 12] = 0
+        pose[:, 13] = 0
+        pose[:, 14] = 0
+        pose[:, 15] = 1
+    #
+        return pose.reshape(-1, 4, 4)
+
+
+
+    def joint_fk05_batch(q):
+    #
+        q = np.asarray(q, dtype=float).reshape(-1, 6)
+        pose = np.empty((q.shape[0], 16))
+    #
+        x0 = np.sin(q[:, 5])
+        x1 = np.cos(q[:, 0])
+        x2 = np.cos(q[:, 3])
+        x3 = x1*x2
+        x4 = x0*x3
+        x5 = np.sin(q[:, 3])
+        x6 = np.cos(q[:, 5])
+        x7 = x5*x6
+        x8 = np.cos(q[:, 4])
+        x9 = x1*x8
+        x10 = np.sin(q[:, 0])
+        x11 = np.sin(q[:, 4])
+        x12 = np.cos(q[:, 1])
+        x13 = np.cos(q[:, 2])
+        x14 = x10*x11*x12*x13
+        x15 = np.sin(q[:, 1])
+        x16 = np.sin(q[:, 2])
+        x17 = x10*x11*x15*x16
+        x18 = x0*x5
+        x19 = x10*x13*x15
+        x20 = x10*x12*x16
+        x21 = x10*x2
+        x22 = x21*x6
+        x23 = x13*x15
+        x24 = x23*x8
+        x25 = x12*x16
+        x26 = x25*x8
+        x27 = x3*x6
+        x28 = x0*x21
+        x29 = x11*x5
+        x30 = x1*x29
+        x31 = x10*x8
+        x32 = x15*x16
+        x33 = x31*x32
+        x34 = x12*x13
+        x35 = x31*x34
+        x36 = x11*x13*x15
+        x37 = x21*x36
+        x38 = x11*x12*x16
+        x39 = x21*x38
+        x40 = 0.381*x12
+        x41 = 0.3556*x10
+        x42 = 0.06985*x10
+        x43 = x10*x5*x8
+        x44 = x1*x11*x15*x16
+        x45 = x1*x13*x15
+        x46 = x1*x12*x16
+        x47 = x1*x11*x12*x13
+        x48 = x10*x29
+        x49 = x34*x9
+        x50 = x32*x9
+        x51 = x3*x36
+        x52 = x3*x38
+        x53 = 0.3556*x1
+        x54 = 0.06985*x1
+        x55 = x15*x16*x5
+        x56 = x12*x13*x2*x8
+        x57 = x15*x16*x2*x8
+        x58 = x11*x2
+        x59 = x34*x58
+        x60 = x32*x58
+    #
+        pose[:, 0] = x14*x6 - x17*x6 - x18*x19 - x18*x20 + x22*x24 + x22*x26 + x4 + x7*x9
+        pose[:, 1] = -x0*x14 + x0*x17 - x18*x9 - x19*x7 - x20*x7 - x24*x28 - x26*x28 + x27
+        pose[:, 2] = x30 + x33 - x35 + x37 + x39
+        pose[:, 3] = -x10*x40 - 0.10795*x10 + x23*x42 + x25*x42 + 0.2413*x30 + x32*x41 + 0.2413*x33 - x34*x41 - 0.2413*x35 + 0.2413*x37 + 0.2413*x39
+        pose[:, 4] = x18*x45 + x18*x46 - x24*x27 - x26*x27 + x28 + x43*x6 + x44*x6 - x47*x6
+        pose[:, 5] = -x0*x43 - x0*x44 + x0*x47 + x22 + x24*x4 + x26*x4 + x45*x7 + x46*x7
+        pose[:, 6] = x48 + x49 - x50 - x51 - x52
+        pose[:, 7] = x1*x40 + 0.10795*x1 - x23*x54 - x25*x54 - x32*x53 + x34*x53 + 0.2413*x48 + 0.2413*x49 - 0.2413*x50 - 0.2413*x51 - 0.2413*x52
+        pose[:, 8] = x0*x55 - x18*x34 - x36*x6 - x38*x6 + x56*x6 - x57*x6
+        pose[:, 9] = x0*x36 + x0*x38 - x0*x56 + x0*x57 - x34*x7 + x55*x6
+        pose[:, 10] = x24 + x26 + x59 - x60
+        pose[:, 11] = 0.381*x15 + 0.3556*x23 + 0.2413*x24 + 0.3556*x25 + 0.2413*x26 - 0.06985*x32 + 0.06985*x34 + 0.2413*x59 - 0.2413*x60 + 0.0889
+        pose[:, 12] = 0
+        pose[:, 13] = 0
+        pose[:, 14] = 0
+        pose[:, 15] = 1
+    #
+        return pose.reshape(-1, 4, 4)
+
+
+
+    FK_batch = {0:joint_fk00_batch, 1:joint_fk01_batch, 2:joint_fk02_batch, 3:joint_fk03_batch, 4:joint_fk04_batch, 5:joint_fk05_batch, }
+
+
+
+    @staticmethod
+    def fk_and_jacobian(q):
+    #
+        out = [0]*132
+    #
+        x0 = sin(q[0])
+        x1 = cos(q[0])
+        x2 = -0.10795*x0
+        x3 = 0.10795*x1
+        x4 = cos(q[1])
+        x5 = x0*x4
+        x6 = sin(q[1])
+        x7 = x0*x6
+        x8 = x2 - 0.381*x5
+        x9 = x1*x4
+        x10 = x1*x6
+        x11 = 0.381*x9
+        x12 = x11 + x3
+        x13 = 0.381*x6
+        x14 = x13 + 0.0889
+        x15 = cos(q[2])
+        x16 = x15*x7
+        x17 = sin(q[2])
+        x18 = x17*x5
+        x19 = x17*x7
+        x20 = x15*x5
+        x21 = x19 - x20
+        x22 = 0.06985*x16 + 0.06985*x18 + x8
+        x23 = x10*x15
+        x24 = x17*x4
+        x25 = x1*x24
+        x26 = x15*x9
+        x27 = x17*x6
+        x28 = x1*x27
+        x29 = x26 - x28
+        x30 = 0.06985*x23
+        x31 = 0.06985*x25
+        x32 = x12 - x30 - x31
+        x33 = x15*x4
+        x34 = x15*x6
+        x35 = x24 + x34
+        x36 = 0.06985*x27
+        x37 = x14 + 0.06985*x33 - x36
+        x38 = sin(q[3])
+        x39 = x1*x38
+        x40 = cos(q[3])
+        x41 = x16*x40
+        x42 = x18*x40
+        x43 = x1*x40
+        x44 = x16*x38
+        x45 = x0*x38
+        x46 = x24*x45
+        x47 = x43 - x44 - x46
+        x48 = 0.3556*x19 - 0.3556*x20 + x22
+        x49 = x23*x40
+        x50 = x0*x40
+        x51 = x23*x38
+        x52 = x24*x39
+        x53 = x50 + x51 + x52
+        x54 = 0.3556*x28
+        x55 = 0.3556*x26
+        x56 = x32 - x54 + x55
+        x57 = x33*x40
+        x58 = x27*x40
+        x59 = x27*x38
+        x60 = x33*x38
+        x61 = x59 - x60
+        x62 = 0.3556*x24
+        x63 = 0.3556*x34 + x37 + x62
+        x64 = cos(q[4])
+        x65 = x39*x64
+        x66 = sin(q[4])
+        x67 = x20*x66
+        x68 = x19*x66
+        x69 = x41*x64
+        x70 = x42*x64
+        x71 = x39*x66
+        x72 = x19*x64
+        x73 = x20*x64
+        x74 = x41*x66
+        x75 = x42*x66
+        x76 = x71 + x72 - x73 + x74 + x75
+        x77 = x45*x64
+        x78 = x28*x66
+        x79 = x26*x66
+        x80 = x49*x64
+        x81 = x24*x64
+        x82 = x45*x66
+        x83 = x26*x64
+        x84 = x28*x64
+        x85 = x49*x66
+        x86 = x24*x66
+        x87 = x43*x86
+        x88 = x82 + x83 - x84 - x85 - x87
+        x89 = x34*x66
+        x90 = x57*x64
+        x91 = x58*x64
+        x92 = x34*x64
+        x93 = x57*x66
+        x94 = x58*x66
+        x95 = x81 + x92 + x93 - x94
+        x96 = sin(q[5])
+        x97 = x43*x96
+        x98 = cos(q[5])
+        x99 = x43*x98
+        x100 = x48 + 0.2413*x71 + 0.2413*x72 - 0.2413*x73 + 0.2413*x74 + 0.2413*x75
+        x101 = 0.2413*x82
+        x102 = 0.2413*x84
+        x103 = 0.2413*x83
+        x104 = 0.2413*x85
+        x105 = 0.2413*x87
+        x106 = 0.2413*x81
+        x107 = 0.2413*x64
+        x108 = 0.2413*x40
+        x109 = x107*x16 + x107*x18 + x108*x67 - x108*x68 + 0.3556*x16 + 0.3556*x18 - 0.06985*x19 + 0.06985*x20
+        x110 = 0.2413*x66
+        x111 = 0.2413*x1*x40*x66
+        x112 = x6**2
+        x113 = x17**2
+        x114 = x112*x113
+        x115 = x15**2
+        x116 = x112*x115
+        x117 = x4**2
+        x118 = x113*x117
+        x119 = x115*x117
+        x120 = x38**2
+        x121 = 0.2413*x0*x17*x6*x66
+        x122 = x40**2
+        x123 = 0.2413*x0*x15*x4*x66
+        x124 = 0.2413*x1*x38*x64
+        x125 = x1*x36 - x1*x62 - x107*x23 - x107*x25 - x108*x79 + x111*x27 - 0.3556*x23 - 0.06985*x26
+        x126 = 0.2413*x0*x40*x66
+        x127 = 0.2413*x1*x17*x6*x66
+        x128 = 0.2413*x1*x15*x4*x66
+        x129 = 0.2413*x0*x38*x64
+        x130 = x0**2
+        x131 = 0.381*x4
+        x132 = x1**2
+        x133 = 0.3556*x130
+        x134 = 0.06985*x130
+        x135 = 0.3556*x132
+        x136 = 0.06985*x132
+        x137 = 0.2413*x130*x64
+        x138 = 0.2413*x132*x64
+        x139 = 0.2413*x130*x40
+        x140 = 0.2413*x132*x40
+        x141 = -x133*x27 + x133*x33 - x134*x24 - x134*x34 - x135*x27 + x135*x33 - x136*x24 - x136*x34 - x137*x27 + x137*x33 - x138*x27 + x138*x33 - x139*x86 - x139*x89 - x140*x86 - x140*x89
+        x142 = 0.2413*x130*x66
+        x143 = 0.2413*x132*x66
+        x144 = 0.2413*x130
+        x145 = 0.2413*x132
+        x146 = 0.2413*x130*x15*x6*x66
+        x147 = 0.2413*x130*x17*x4*x66
+        x148 = 0.2413*x132*x15*x6*x66
+        x149 = 0.2413*x132*x17*x4*x66
+    #
+        out[0] = -x0
+        out[1] = 0
+        out[2] = x1
+        out[3] = x2
+        out[4] = x1
+        out[5] = 0
+        out[6] = x0
+        out[7] = x3
+        out[8] = 0
+        out[9] = 1
+        out[10] = 0
+        out[11] = 0.0889000000000000
+        out[12] = 0
+        out[13] = 0
+        out[14] = 0
+        out[15] = 1
+        out[16] = -x5
+        out[17] = x7
+        out[18] = x1
+        out[19] = x8
+        out[20] = x9
+        out[21] = -x10
+        out[22] = x0
+        out[23] = x12
+        out[24] = x6
+        out[25] = x4
+        out[26] = 0
+        out[27] = x14
+        out[28] = 0
+        out[29] = 0
+        out[30] = 0
+        out[31] = 1
+        out[32] = x16 + x18
+        out[33] = x1
+        out[34] = x21
+        out[35] = x22
+        out[36] = -x23 - x25
+        out[37] = x0
+        out[38] = x29
+        out[39] = x32
+        out[40] = -x27 + x33
+        out[41] = 0
+        out[42] = x35
+        out[43] = x37
+        out[44] = 0
+        out[45] = 0
+        out[46] = 0
+        out[47] = 1
+        out[48] = x39 + x41 + x42
+        out[49] = -x19 + x20
+        out[50] = x47
+        out[51] = x48
+        out[52] = -x24*x43 + x45 - x49
+        out[53] = -x26 + x28
+        out[54] = x53
+        out[55] = x56
+        out[56] = x57 - x58
+        out[57] = -x24 - x34
+        out[58] = x61
+        out[59] = x63
+        out[60] = 0
+        out[61] = 0
+        out[62] = 0
+        out[63] = 1
+        out[64] = x65 + x67 - x68 + x69 + x70
+        out[65] = x47
+        out[66] = x76
+        out[67] = x48
+        out[68] = -x43*x81 + x77 + x78 - x79 - x80
+        out[69] = x53
+        out[70] = x88
+        out[71] = x56
+        out[72] = -x86 - x89 + x90 - x91
+        out[73] = x61
+        out[74] = x95
+        out[75] = x63
+        out[76] = 0
+        out[77] = 0
+        out[78] = 0
+        out[79] = 1
+        out[80] = -x44*x96 - x46*x96 + x65*x98 + x67*x98 - x68*x98 + x69*x98 + x70*x98 + x97
+        out[81] = -x44*x98 - x46*x98 - x65*x96 - x67*x96 + x68*x96 - x69*x96 - x70*x96 + x99
+        out[82] = x76
+        out[83] = x100
+        out[84] = x50*x96 + x51*x96 + x52*x96 + x77*x98 + x78*x98 - x79*x98 - x80*x98 - x81*x99
+        out[85] = x50*x98 + x51*x98 + x52*x98 - x77*x96 - x78*x96 + x79*x96 + x80*x96 + x81*x97
+        out[86] = x88
+        out[87] = x101 - x102 + x103 - x104 - x105 + x56
+        out[88] = x59*x96 - x60*x96 - x86*x98 - x89*x98 + x90*x98 - x91*x98
+        out[89] = x59*x98 - x60*x98 + x86*x96 + x89*x96 - x90*x96 + x91*x96
+        out[90] = x95
+        out[91] = x106 + x63 + 0.2413*x92 + 0.2413*x93 - 0.2413*x94
+        out[92] = 0
+        out[93] = 0
+        out[94] = 0
+        out[95] = 1
+        out[96] = -x101 + x102 - x103 + x104 + x105 - x11 - x3 + x30 + x31 + x54 - x55
+        out[97] = x0*x13 + x109
+        out[98] = x109
+        out[99] = -x101*x24 - x110*x44 + x111*x114 + x111*x116 + x111*x118 + x111*x119
+        out[100] = x107*x41 + x107*x42 + x114*x124 + x116*x124 + x118*x124 + x119*x124 - x120*x121 + x120*x123 - x121*x122 + x122*x123
+        out[101] = 0
+        out[102] = x100
+        out[103] = -x1*x13 + x125
+        out[104] = x125
+        out[105] = x110*x51 + x114*x126 + x116*x126 + x118*x126 + x119*x126 + 0.2413*x17*x39*x4*x66
+        out[106] = -x106*x43 - x107*x49 + x114*x129 + x116*x129 + x118*x129 + x119*x129 + x120*x127 - x120*x128 + x122*x127 - x122*x128
+        out[107] = 0
+        out[108] = 0
+        out[109] = x130*x131 + x131*x132 + x141
+        out[110] = x141
+        out[111] = x142*x59 - x142*x60 + x143*x59 - x143*x60
+        out[112] = -x120*x146 - x120*x147 - x120*x148 - x120*x149 - x122*x146 - x122*x147 - x122*x148 - x122*x149 + x144*x90 - x144*x91 + x145*x90 - x145*x91
+        out[113] = 0
+        out[114] = 0
+        out[115] = x1
+        out[116] = x1
+        out[117] = x21
+        out[118] = x47
+        out[119] = x76
+        out[120] = 0
+        out[121] = x0
+        out[122] = x0
+        out[123] = x29
+        out[124] = x53
+        out[125] = x88
+        out[126] = 1
+        out[127] = 0
+        out[128] = 0
+        out[129] = x35
+        out[130] = x61
+        out[131] = x95
+    #
+        poses = np.array(out[:96]).reshape(6,4,4)
+        jacobian = np.array(out[96:]).reshape(6,6)
+        return poses, jacobian
+
+
+
+    def joint_fk00_into(q, pose):
+    #
+        x0 = sin(q[0])
+        x1 = cos(q[0])
+    #
+        pose[0, 0] = -x0
+        pose[0, 1] = 0
+        pose[0, 2] = x1
+        pose[0, 3] = -0.10795*x0
+        pose[1, 0] = x1
+        pose[1, 1] = 0
+        pose[1, 2] = x0
+        pose[1, 3] = 0.10795*x1
+        pose[2, 0] = 0
+        pose[2, 1] = 1
+        pose[2, 2] = 0
+        pose[2, 3] = 0.0889000000000000
+        pose[3, 0] = 0
+        pose[3, 1] = 0
+        pose[3, 2] = 0
+        pose[3, 3] = 1
+    #
+        return pose
+
+
+
+    def jacobian00_into(q, jacobian):
+    #
+    #
+        jacobian[0, 0] = -0.10795*cos(q[0])
+        jacobian[0, 1] = 0
+        jacobian[0, 2] = 0
+        jacobian[0, 3] = 0
+        jacobian[0, 4] = 0
+        jacobian[0, 5] = 0
+        jacobian[1, 0] = -0.10795*sin(q[0])
+        jacobian[1, 1] = 0
+        jacobian[1, 2] = 0
+        jacobian[1, 3] = 0
+        jacobian[1, 4] = 0
+        jacobian[1, 5] = 0
+        jacobian[2, 0] = 0
+        jacobian[2, 1] = 0
+        jacobian[2, 2] = 0
+        jacobian[2, 3] = 0
+        jacobian[2, 4] = 0
+        jacobian[2, 5] = 0
+        jacobian[3, 0] = 0
+        jacobian[3, 1] = 0
+        jacobian[3, 2] = 0
+        jacobian[3, 3] = 0
+        jacobian[3, 4] = 0
+        jacobian[3, 5] = 0
+        jacobian[4, 0] = 0
+        jacobian[4, 1] = 0
+        jacobian[4, 2] = 0
+        jacobian[4, 3] = 0
+        jacobian[4, 4] = 0
+        jacobian[4, 5] = 0
+        jacobian[5, 0] = 1
+        jacobian[5, 1] = 0
+        jacobian[5, 2] = 0
+        jacobian[5, 3] = 0
+        jacobian[5, 4] = 0
+        jacobian[5, 5] = 0
+    #
+        return jacobian
+
+
+
+    def joint_fk01_into(q, pose):
+    #
+        x0 = sin(q[0])
+        x1 = cos(q[1])
+        x2 = x0*x1
+        x3 = sin(q[1])
+        x4 = cos(q[0])
+        x5 = x1*x4
+    #
+        pose[0, 0] = -x2
+        pose[0, 1] = x0*x3
+        pose[0, 2] = x4
+        pose[0, 3] = -0.10795*x0 - 0.381*x2
+        pose[1, 0] = x5
+        pose[1, 1] = -x3*x4
+        pose[1, 2] = x0
+        pose[1, 3] = 0.10795*x4 + 0.381*x5
+        pose[2, 0] = x3
+        pose[2, 1] = x1
+        pose[2, 2] = 0
+        pose[2, 3] = 0.381*x3 + 0.0889
+        pose[3, 0] = 0
+        pose[3, 1] = 0
+        pose[3, 2] = 0
+        pose[3, 3] = 1
+    #
+        return pose
+
+
+
+    def jacobian01_into(q, jacobian):
+    #
+        x0 = cos(q[0])
+        x1 = cos(q[1])
+        x2 = 0.381*x0
+        x3 = sin(q[1])
+        x4 = sin(q[0])
+        x5 = 0.381*x4
+        x6 = 0.381*x1
+    #
+        jacobian[0, 0] = -0.10795*x0 - x1*x2
+        jacobian[0, 1] = x3*x5
+        jacobian[0, 2] = 0
+        jacobian[0, 3] = 0
+        jacobian[0, 4] = 0
+        jacobian[0, 5] = 0
+        jacobian[1, 0] = -x1*x5 - 0.10795*x4
+        jacobian[1, 1] = -x2*x3
+        jacobian[1, 2] = 0
+        jacobian[1, 3] = 0
+        jacobian[1, 4] = 0
+        jacobian[1, 5] = 0
+        jacobian[2, 0] = 0
+        jacobian[2, 1] = x0**2*x6 + x4**2*x6
+        jacobian[2, 2] = 0
+        jacobian[2, 3] = 0
+        jacobian[2, 4] = 0
+        jacobian[2, 5] = 0
+        jacobian[3, 0] = 0
+        jacobian[3, 1] = x0
+        jacobian[3, 2] = 0
+        jacobian[3, 3] = 0
+        jacobian[3, 4] = 0
+        jacobian[3, 5] = 0
+        jacobian[4, 0] = 0
+        jacobian[4, 1] = x4
+        jacobian[4, 2] = 0
+        jacobian[4, 3] = 0
+        jacobian[4, 4] = 0
+        jacobian[4, 5] = 0
+        jacobian[5, 0] = 1
+        jacobian[5, 1] = 0
+        jacobian[5, 2] = 0
+        jacobian[5, 3] = 0
+        jacobian[5, 4] = 0
+        jacobian[5, 5] = 0
+    #
+        return jacobian
+
+
+
+    def joint_fk02_into(q, pose):
+    #
+        x0 = sin(q[0])
+        x1 = sin(q[1])
+        x2 = cos(q[2])
+        x3 = x1*x2
+        x4 = x0*x3
+        x5 = sin(q[2])
+        x6 = cos(q[1])
+        x7 = x5*x6
+        x8 = x0*x7
+        x9 = cos(q[0])
+        x10 = x1*x5
+        x11 = x2*x6
+        x12 = 0.381*x6
+        x13 = x3*x9
+        x14 = x7*x9
+    #
+        pose[0, 0] = x4 + x8
+        pose[0, 1] = x9
+        pose[0, 2] = x0*x10 - x0*x11
+        pose[0, 3] = -x0*x12 - 0.10795*x0 + 0.06985*x4 + 0.06985*x8
+        pose[1, 0] = -x13 - x14
+        pose[1, 1] = x0
+        pose[1, 2] = -x10*x9 + x11*x9
+        pose[1, 3] = x12*x9 - 0.06985*x13 - 0.06985*x14 + 0.10795*x9
+        pose[2, 0] = -x10 + x11
+        pose[2, 1] = 0
+        pose[2, 2] = x3 + x7
+        pose[2, 3] = 0.381*x1 - 0.06985*x10 + 0.06985*x11 + 0.0889
+        pose[3, 0] = 0
+        pose[3, 1] = 0
+        pose[3, 2] = 0
+        pose[3, 3] = 1
+    #
+        return pose
+
+
+
+    def jacobian02_into(q, jacobian):
+    #
+        x0 = cos(q[0])
+        x1 = cos(q[1])
+        x2 = 0.381*x0
+        x3 = cos(q[2])
+        x4 = sin(q[1])
+        x5 = 0.06985*x0*x4
+        x6 = sin(q[2])
+        x7 = 0.06985*x0*x1
+        x8 = sin(q[0])
+        x9 = 0.381*x8
+        x10 = 0.06985*x4*x8
+        x11 = 0.06985*x1*x8
+        x12 = -x10*x6 + x11*x3
+        x13 = -x3*x7 + x5*x6
+        x14 = x8**2
+        x15 = 0.381*x1
+        x16 = x0**2
+        x17 = x3*x4
+        x18 = 0.06985*x14
+        x19 = x1*x6
+        x20 = 0.06985*x16
+        x21 = -x17*x18 - x17*x20 - x18*x19 - x19*x20
+    #
+        jacobian[0, 0] = -0.10795*x0 - x1*x2 + x3*x5 + x6*x7
+        jacobian[0, 1] = x12 + x4*x9
+        jacobian[0, 2] = x12
+        jacobian[0, 3] = 0
+        jacobian[0, 4] = 0
+        jacobian[0, 5] = 0
+        jacobian[1, 0] = -x1*x9 + x10*x3 + x11*x6 - 0.10795*x8
+        jacobian[1, 1] = x13 - x2*x4
+        jacobian[1, 2] = x13
+        jacobian[1, 3] = 0
+        jacobian[1, 4] = 0
+        jacobian[1, 5] = 0
+        jacobian[2, 0] = 0
+        jacobian[2, 1] = x14*x15 + x15*x16 + x21
+        jacobian[2, 2] = x21
+        jacobian[2, 3] = 0
+        jacobian[2, 4] = 0
+        jacobian[2, 5] = 0
+        jacobian[3, 0] = 0
+        jacobian[3, 1] = x0
+        jacobian[3, 2] = x0
+        jacobian[3, 3] = 0
+        jacobian[3, 4] = 0
+        jacobian[3, 5] = 0
+        jacobian[4, 0] = 0
+        jacobian[4, 1] = x8
+        jacobian[4, 2] = x8
+        jacobian[4, 3] = 0
+        jacobian[4, 4] = 0
+        jacobian[4, 5] = 0
+        jacobian[5, 0] = 1
+        jacobian[5, 1] = 0
+        jacobian[5, 2] = 0
+        jacobian[5, 3] = 0
+        jacobian[5, 4] = 0
+        jacobian[5, 5] = 0
+    #
+        return jacobian
+
+
+
+    def joint_fk03_into(q, pose):
+    #
+        x0 = sin(q[3])
+        x1 = cos(q[0])
+        x2 = x0*x1
+        x3 = sin(q[0])
+        x4 = cos(q[3])
+        x5 = x3*x4
+        x6 = sin(q[1])
+        x7 = cos(q[2])
+        x8 = x6*x7
+        x9 = sin(q[2])
+        x10 = cos(q[1])
+        x11 = x10*x9
+        x12 = x10*x7
+        x13 = x12*x3
+        x14 = x6*x9
+        x15 = x14*x3
+        x16 = x1*x4
+        x17 = x0*x3
+        x18 = 0.381*x10
+        x19 = 0.06985*x3
+        x20 = x1*x14
+        x21 = x1*x12
+        x22 = 0.06985*x1
+    #
+        pose[0, 0] = x11*x5 + x2 + x5*x8
+        pose[0, 1] = x13 - x15
+        pose[0, 2] = -x11*x17 + x16 - x17*x8
+        pose[0, 3] = x11*x19 - 0.3556*x13 + 0.3556*x15 - x18*x3 + x19*x8 - 0.10795*x3
+        pose[1, 0] = -x11*x16 - x16*x8 + x17
+        pose[1, 1] = x20 - x21
+        pose[1, 2] = x11*x2 + x2*x8 + x5
+        pose[1, 3] = x1*x18 + 0.10795*x1 - x11*x22 - 0.3556*x20 + 0.3556*x21 - x22*x8
+        pose[2, 0] = x12*x4 - x14*x4
+        pose[2, 1] = -x11 - x8
+        pose[2, 2] = -x0*x12 + x0*x14
+        pose[2, 3] = 0.3556*x11 + 0.06985*x12 - 0.06985*x14 + 0.381*x6 + 0.3556*x8 + 0.0889
+        pose[3, 0] = 0
+        pose[3, 1] = 0
+        pose[3, 2] = 0
+        pose[3, 3] = 1
+    #
+        return pose
+
+
+
+    def jacobian03_into(q, jacobian):
+    #
+        x0 = cos(q[0])
+        x1 = cos(q[1])
+        x2 = 0.381*x0
+        x3 = sin(q[1])
+        x4 = sin(q[2])
+        x5 = x3*x4
+        x6 = x0*x5
+        x7 = cos(q[2])
+        x8 = x0*x3*x7
+        x9 = x0*x1*x4
+        x10 = x1*x7
+        x11 = x0*x10
+        x12 = sin(q[0])
+        x13 = 0.381*x12
+        x14 = x12*x5
+        x15 = x12*x3*x7
+        x16 = x1*x12*x4
+        x17 = x10*x12
+        x18 = -0.06985*x14 + 0.3556*x15 + 0.3556*x16 + 0.06985*x17
+        x19 = -0.06985*x11 + 0.06985*x6 - 0.3556*x8 - 0.3556*x9
+        x20 = x12**2
+        x21 = 0.381*x1
+        x22 = x0**2
+        x23 = 0.3556*x20
+        x24 = x3*x7
+        x25 = 0.06985*x20
+        x26 = x1*x4
+        x27 = 0.3556*x22
+        x28 = 0.06985*x22
+        x29 = x10*x23 + x10*x27 - x23*x5 - x24*x25 - x24*x28 - x25*x26 - x26*x28 - x27*x5
+    #
+        jacobian[0, 0] = -0.10795*x0 - x1*x2 - 0.3556*x11 + 0.3556*x6 + 0.06985*x8 + 0.06985*x9
+        jacobian[0, 1] = x13*x3 + x18
+        jacobian[0, 2] = x18
+        jacobian[0, 3] = 0
+        jacobian[0, 4] = 0
+        jacobian[0, 5] = 0
+        jacobian[1, 0] = -x1*x13 - 0.10795*x12 + 0.3556*x14 + 0.06985*x15 + 0.06985*x16 - 0.3556*x17
+        jacobian[1, 1] = x19 - x2*x3
+        jacobian[1, 2] = x19
+        jacobian[1, 3] = 0
+        jacobian[1, 4] = 0
+        jacobian[1, 5] = 0
+        jacobian[2, 0] = 0
+        jacobian[2, 1] = x20*x21 + x21*x22 + x29
+        jacobian[2, 2] = x29
+        jacobian[2, 3] = 0
+        jacobian[2, 4] = 0
+        jacobian[2, 5] = 0
+        jacobian[3, 0] = 0
+        jacobian[3, 1] = x0
+        jacobian[3, 2] = x0
+        jacobian[3, 3] = x14 - x17
+        jacobian[3, 4] = 0
+        jacobian[3, 5] = 0
+        jacobian[4, 0] = 0
+        jacobian[4, 1] = x12
+        jacobian[4, 2] = x12
+        jacobian[4, 3] = x11 - x6
+        jacobian[4, 4] = 0
+        jacobian[4, 5] = 0
+        jacobian[5, 0] = 1
+        jacobian[5, 1] = 0
+        jacobian[5, 2] = 0
+        jacobian[5, 3] = x24 + x26
+        jacobian[5, 4] = 0
+        jacobian[5, 5] = 0
+    #
+        return jacobian
+
+
+
+    def joint_fk04_into(q, pose):
+    #
+        x0 = cos(q[4])
+        x1 = sin(q[3])
+        x2 = cos(q[0])
+        x3 = x1*x2
+        x4 = sin(q[4])
+        x5 = sin(q[0])
+        x6 = cos(q[1])
+        x7 = cos(q[2])
+        x8 = x5*x6*x7
+        x9 = sin(q[1])
+        x10 = sin(q[2])
+        x11 = x10*x5*x9
+        x12 = cos(q[3])
+        x13 = x12*x5
+        x14 = x7*x9
+        x15 = x0*x14
+        x16 = x10*x6
+        x17 = x0*x16
+        x18 = x12*x2
+        x19 = x1*x5
+        x20 = x14*x4
+        x21 = x16*x4
+        x22 = 0.381*x6
+        x23 = 0.3556*x5
+        x24 = x10*x9
+        x25 = 0.06985*x5
+        x26 = x6*x7
+        x27 = x10*x4*x9
+        x28 = x4*x6*x7
+        x29 = x0*x6*x7
+        x30 = x0*x10*x9
+        x31 = 0.3556*x2
+        x32 = 0.06985*x2
+    #
+        pose[0, 0] = x0*x3 - x11*x4 + x13*x15 + x13*x17 + x4*x8
+        pose[0, 1] = -x14*x19 - x16*x19 + x18
+        pose[0, 2] = x0*x11 - x0*x8 + x13*x20 + x13*x21 + x3*x4
+        pose[0, 3] = x14*x25 + x16*x25 - x22*x5 + x23*x24 - x23*x26 - 0.10795*x5
+        pose[1, 0] = x0*x19 - x15*x18 - x17*x18 + x2*x27 - x2*x28
+        pose[1, 1] = x13 + x14*x3 + x16*x3
+        pose[1, 2] = -x18*x20 - x18*x21 + x19*x4 + x2*x29 - x2*x30
+        pose[1, 3] = -x14*x32 - x16*x32 + x2*x22 + 0.10795*x2 - x24*x31 + x26*x31
+        pose[2, 0] = x12*x29 - x12*x30 - x20 - x21
+        pose[2, 1] = x1*x24 - x1*x26
+        pose[2, 2] = -x12*x27 + x12*x28 + x15 + x17
+        pose[2, 3] = 0.3556*x14 + 0.3556*x16 - 0.06985*x24 + 0.06985*x26 + 0.381*x9 + 0.0889
+        pose[3, 0] = 0
+        pose[3, 1] = 0
+        pose[3, 2] = 0
+        pose[3, 3] = 1
+    #
+        return pose
+
+
+
+    def jacobian04_into(q, jacobian):
+    #
+        x0 = cos(q[0])
+        x1 = cos(q[1])
+        x2 = 0.381*x0
+        x3 = sin(q[1])
+        x4 = sin(q[2])
+        x5 = x3*x4
+        x6 = x0*x5
+        x7 = cos(q[2])
+        x8 = x0*x3*x7
+        x9 = x0*x1*x4
+        x10 = x1*x7
+        x11 = x0*x10
+        x12 = sin(q[0])
+        x13 = 0.381*x12
+        x14 = x12*x5
+        x15 = x12*x3*x7
+        x16 = x1*x12*x4
+        x17 = x10*x12
+        x18 = -0.06985*x14 + 0.3556*x15 + 0.3556*x16 + 0.06985*x17
+        x19 = -0.06985*x11 + 0.06985*x6 - 0.3556*x8 - 0.3556*x9
+        x20 = x12**2
+        x21 = 0.381*x1
+        x22 = x0**2
+        x23 = 0.3556*x20
+        x24 = x3*x7
+        x25 = 0.06985*x20
+        x26 = x1*x4
+        x27 = 0.3556*x22
+        x28 = 0.06985*x22
+        x29 = x10*x23 + x10*x27 - x23*x5 - x24*x25 - x24*x28 - x25*x26 - x26*x28 - x27*x5
+        x30 = cos(q[3])
+        x31 = sin(q[3])
+    #
+        jacobian[0, 0] = -0.10795*x0 - x1*x2 - 0.3556*x11 + 0.3556*x6 + 0.06985*x8 + 0.06985*x9
+        jacobian[0, 1] = x13*x3 + x18
+        jacobian[0, 2] = x18
+        jacobian[0, 3] = 0
+        jacobian[0, 4] = 0
+        jacobian[0, 5] = 0
+        jacobian[1, 0] = -x1*x13 - 0.10795*x12 + 0.3556*x14 + 0.06985*x15 + 0.06985*x16 - 0.3556*x17
+        jacobian[1, 1] = x19 - x2*x3
+        jacobian[1, 2] = x19
+        jacobian[1, 3] = 0
+        jacobian[1, 4] = 0
+        jacobian[1, 5] = 0
+        jacobian[2, 0] = 0
+        jacobian[2, 1] = x20*x21 + x21*x22 + x29
+        jacobian[2, 2] = x29
+        jacobian[2, 3] = 0
+        jacobian[2, 4] = 0
+        jacobian[2, 5] = 0
+        jacobian[3, 0] = 0
+        jacobian[3, 1] = x0
+        jacobian[3, 2] = x0
+        jacobian[3, 3] = x14 - x17
+        jacobian[3, 4] = x0*x30 - x15*x31 - x16*x31
+        jacobian[3, 5] = 0
+        jacobian[4, 0] = 0
+        jacobian[4, 1] = x12
+        jacobian[4, 2] = x12
+        jacobian[4, 3] = x11 - x6
+        jacobian[4, 4] = x12*x30 + x31*x8 + x31*x9
+        jacobian[4, 5] = 0
+        jacobian[5, 0] = 1
+        jacobian[5, 1] = 0
+        jacobian[5, 2] = 0
+        jacobian[5, 3] = x24 + x26
+        jacobian[5, 4] = -x10*x31 + x31*x5
+        jacobian[5, 5] = 0
+    #
+        return jacobian
+
+
+
+    def joint_fk05_into(q, pose):
+    #
+        x0 = sin(q[5])
+        x1 = cos(q[0])
+        x2 = cos(q[3])
+        x3 = x1*x2
+        x4 = x0*x3
+        x5 = sin(q[3])
+        x6 = cos(q[5])
+        x7 = x5*x6
+        x8 = cos(q[4])
+        x9 = x1*x8
+        x10 = sin(q[0])
+        x11 = sin(q[4])
+        x12 = cos(q[1])
+        x13 = cos(q[2])
+        x14 = x10*x11*x12*x13
+        x15 = sin(q[1])
+        x16 = sin(q[2])
+        x17 = x10*x11*x15*x16
+        x18 = x0*x5
+        x19 = x10*x13*x15
+        x20 = x10*x12*x16
+        x21 = x10*x2
+        x22 = x21*x6
+        x23 = x13*x15
+        x24 = x23*x8
+        x25 = x12*x16
+        x26 = x25*x8
+        x27 = x3*x6
+        x28 = x0*x21
+        x29 = x11*x5
+        x30 = x1*x29
+        x31 = x10*x8
+        x32 = x15*x16
+        x33 = x31*x32
+        x34 = x12*x13
+        x35 = x31*x34
+        x36 = x11*x13*x15
+        x37 = x21*x36
+        x38 = x11*x12*x16
+        x39 = x21*x38
+        x40 = 0.381*x12
+        x41 = 0.3556*x10
+        x42 = 0.06985*x10
+        x43 = x10*x5*x8
+        x44 = x1*x11*x15*x16
+        x45 = x1*x13*x15
+        x46 = x1*x12*x16
+        x47 = x1*x11*x12*x13
+        x48 = x10*x29
+        x49 = x34*x9
+        x50 = x32*x9
+        x51 = x3*x36
+        x52 = x3*x38
+        x53 = 0.3556*x1
+        x54 = 0.06985*x1
+        x55 = x15*x16*x5
+        x56 = x12*x13*x2*x8
+        x57 = x15*x16*x2*x8
+        x58 = x11*x2
+        x59 = x34*x58
+        x60 = x32*x58
+    #
+        pose[0, 0] = x14*x6 - x17*x6 - x18*x19 - x18*x20 + x22*x24 + x22*x26 + x4 + x7*x9
+        pose[0, 1] = -x0*x14 + x0*x17 - x18*x9 - x19*x7 - x20*x7 - x24*x28 - x26*x28 + x27
+        pose[0, 2] = x30 + x33 - x35 + x37 + x39
+        pose[0, 3] = -x10*x40 - 0.10795*x10 + x23*x42 + x25*x42 + 0.2413*x30 + x32*x41 + 0.2413*x33 - x34*x41 - 0.2413*x35 + 0.2413*x37 + 0.2413*x39
+        pose[1, 0] = x18*x45 + x18*x46 - x24*x27 - x26*x27 + x28 + x43*x6 + x44*x6 - x47*x6
+        pose[1, 1] = -x0*x43 - x0*x44 + x0*x47 + x22 + x24*x4 + x26*x4 + x45*x7 + x46*x7
+        pose[1, 2] = x48 + x49 - x50 - x51 - x52
+        pose[1, 3] = x1*x40 + 0.10795*x1 - x23*x54 - x25*x54 - x32*x53 + x34*x53 + 0.2413*x48 + 0.2413*x49 - 0.2413*x50 - 0.2413*x51 - 0.2413*x52
+        pose[2, 0] = x0*x55 - x18*x34 - x36*x6 - x38*x6 + x56*x6 - x57*x6
+        pose[2, 1] = x0*x36 + x0*x38 - x0*x56 + x0*x57 - x34*x7 + x55*x6
+        pose[2, 2] = x24 + x26 + x59 - x60
+        pose[2, 3] = 0.381*x15 + 0.3556*x23 + 0.2413*x24 + 0.3556*x25 + 0.2413*x26 - 0.06985*x32 + 0.06985*x34 + 0.2413*x59 - 0.2413*x60 + 0.0889
+        pose[3, 0] = 0
+        pose[3, 1] = 0
+        pose[3, 2] = 0
+        pose[3, 3] = 1
+    #
+        return pose
+
+
+
+    def jacobian05_into(q, jacobian):
+    #
+        x0 = cos(q[0])
+        x1 = cos(q[1])
+        x2 = 0.381*x0
+        x3 = sin(q[0])
+        x4 = sin(q[3])
+        x5 = sin(q[4])
+        x6 = x4*x5
+        x7 = x3*x6
+        x8 = 0.2413*x7
+        x9 = sin(q[1])
+        x10 = sin(q[2])
+        x11 = x10*x9
+        x12 = x0*x11
+        x13 = cos(q[2])
+        x14 = x0*x13*x9
+        x15 = x0*x1*x10
+        x16 = x1*x13
+        x17 = x0*x16
+        x18 = cos(q[4])
+        x19 = x12*x18
+        x20 = x17*x18
+        x21 = x13*x9
+        x22 = cos(q[3])
+        x23 = x0*x22*x5
+        x24 = x21*x23
+        x25 = x1*x10
+        x26 = x23*x25
+        x27 = 0.381*x3
+        x28 = x11*x3
+        x29 = x13*x3*x9
+        x30 = x1*x10*x3
+        x31 = x16*x3
+        x32 = 0.2413*x3
+        x33 = x18*x21
+        x34 = x18*x25
+        x35 = 0.2413*x22*x3*x5
+        x36 = -x11*x35 + x16*x35 - 0.06985*x28 + 0.3556*x29 + 0.3556*x30 + 0.06985*x31 + x32*x33 + x32*x34
+        x37 = 0.2413*x0*x22*x5
+        x38 = x9**2
+        x39 = x10**2
+        x40 = x38*x39
+        x41 = x13**2
+        x42 = x38*x41
+        x43 = x1**2
+        x44 = x39*x43
+        x45 = x41*x43
+        x46 = 0.2413*x22*x3
+        x47 = x4**2
+        x48 = 0.2413*x10*x3*x5*x9
+        x49 = x22**2
+        x50 = 0.2413*x1*x13*x3*x5
+        x51 = 0.2413*x0*x18*x4
+        x52 = x0*x6
+        x53 = 0.2413*x52
+        x54 = x18*x28
+        x55 = x18*x31
+        x56 = x22*x3*x5
+        x57 = x21*x56
+        x58 = x25*x56
+        x59 = 0.2413*x0
+        x60 = x11*x37 + 0.06985*x12 - 0.3556*x14 - 0.3556*x15 - x16*x37 - 0.06985*x17 - x33*x59 - x34*x59
+        x61 = 0.2413*x0*x22
+        x62 = 0.2413*x0*x10*x5*x9
+        x63 = 0.2413*x0*x1*x13*x5
+        x64 = 0.2413*x18*x3*x4
+        x65 = x3**2
+        x66 = 0.381*x1
+        x67 = x0**2
+        x68 = 0.3556*x65
+        x69 = 0.06985*x65
+        x70 = 0.3556*x67
+        x71 = 0.06985*x67
+        x72 = 0.2413*x18*x65
+        x73 = x11*x72
+        x74 = x16*x72
+        x75 = 0.2413*x18*x67
+        x76 = x11*x75
+        x77 = x16*x75
+        x78 = 0.2413*x22*x5*x65
+        x79 = 0.2413*x22*x5*x67
+        x80 = -x11*x68 - x11*x70 + x16*x68 + x16*x70 - x21*x69 - x21*x71 - x21*x78 - x21*x79 - x25*x69 - x25*x71 - x25*x78 - x25*x79 - x73 + x74 - x76 + x77
+        x81 = 0.2413*x4*x5*x65
+        x82 = 0.2413*x4*x5*x67
+        x83 = 0.2413*x13*x5*x65*x9
+        x84 = 0.2413*x1*x10*x5*x65
+        x85 = 0.2413*x13*x5*x67*x9
+        x86 = 0.2413*x1*x10*x5*x67
+        x87 = x22*x5
+    #
+        jacobian[0, 0] = -0.10795*x0 - x1*x2 + 0.3556*x12 + 0.06985*x14 + 0.06985*x15 - 0.3556*x17 + 0.2413*x19 - 0.2413*x20 + 0.2413*x24 + 0.2413*x26 - x8
+        jacobian[0, 1] = x27*x9 + x36
+        jacobian[0, 2] = x36
+        jacobian[0, 3] = -x21*x8 - x25*x8 + x37*x40 + x37*x42 + x37*x44 + x37*x45
+        jacobian[0, 4] = x33*x46 + x34*x46 + x40*x51 + x42*x51 + x44*x51 + x45*x51 - x47*x48 + x47*x50 - x48*x49 + x49*x50
+        jacobian[0, 5] = 0
+        jacobian[1, 0] = -x1*x27 + 0.3556*x28 + 0.06985*x29 - 0.10795*x3 + 0.06985*x30 - 0.3556*x31 + x53 + 0.2413*x54 - 0.2413*x55 + 0.2413*x57 + 0.2413*x58
+        jacobian[1, 1] = -x2*x9 + x60
+        jacobian[1, 2] = x60
+        jacobian[1, 3] = x21*x53 + x25*x53 + x35*x40 + x35*x42 + x35*x44 + x35*x45
+        jacobian[1, 4] = -x33*x61 - x34*x61 + x40*x64 + x42*x64 + x44*x64 + x45*x64 + x47*x62 - x47*x63 + x49*x62 - x49*x63
+        jacobian[1, 5] = 0
+        jacobian[2, 0] = 0
+        jacobian[2, 1] = x65*x66 + x66*x67 + x80
+        jacobian[2, 2] = x80
+        jacobian[2, 3] = x11*x81 + x11*x82 - x16*x81 - x16*x82
+        jacobian[2, 4] = -x22*x73 + x22*x74 - x22*x76 + x22*x77 - x47*x83 - x47*x84 - x47*x85 - x47*x86 - x49*x83 - x49*x84 - x49*x85 - x49*x86
+        jacobian[2, 5] = 0
+        jacobian[3, 0] = 0
+        jacobian[3, 1] = x0
+        jacobian[3, 2] = x0
+        jacobian[3, 3] = x28 - x31
+        jacobian[3, 4] = x0*x22 - x29*x4 - x30*x4
+        jacobian[3, 5] = x52 + x54 - x55 + x57 + x58
+        jacobian[4, 0] = 0
+        jacobian[4, 1] = x3
+        jacobian[4, 2] = x3
+        jacobian[4, 3] = -x12 + x17
+        jacobian[4, 4] = x14*x4 + x15*x4 + x22*x3
+        jacobian[4, 5] = -x19 + x20 - x24 - x26 + x7
+        jacobian[5, 0] = 1
+        jacobian[5, 1] = 0
+        jacobian[5, 2] = 0
+        jacobian[5, 3] = x21 + x25
+        jacobian[5, 4] = x11*x4 - x16*x4
+        jacobian[5, 5] = -x11*x87 + x16*x87 + x33 + x34
+    #
+        return jacobian
+
+
+
+    FK_into = {0:joint_fk00_into, 1:joint_fk01_into, 2:joint_fk02_into, 3:joint_fk03_into, 4:joint_fk04_into, 5:joint_fk05_into, }
+    J_into = {0:jacobian00_into, 1:jacobian01_into, 2:jacobian02_into, 3:jacobian03_into, 4:jacobian04_into, 5:jacobian05_into, }
+
+
+
+    @staticmethod
+    def fk_and_jacobian_into(q, poses, jacobian):
+    #
+        x0 = sin(q[0])
+        x1 = cos(q[0])
+        x2 = -0.10795*x0
+        x3 = 0.10795*x1
+        x4 = cos(q[1])
+        x5 = x0*x4
+        x6 = sin(q[1])
+        x7 = x0*x6
+        x8 = x2 - 0.381*x5
+        x9 = x1*x4
+        x10 = x1*x6
+        x11 = 0.381*x9
+        x12 = x11 + x3
+        x13 = 0.381*x6
+        x14 = x13 + 0.0889
+        x15 = cos(q[2])
+        x16 = x15*x7
+        x17 = sin(q[2])
+        x18 = x17*x5
+        x19 = x17*x7
+        x20 = x15*x5
+        x21 = x19 - x20
+        x22 = 0.06985*x16 + 0.06985*x18 + x8
+        x23 = x10*x15
+        x24 = x17*x4
+        x25 = x1*x24
+        x26 = x15*x9
+        x27 = x17*x6
+        x28 = x1*x27
+        x29 = x26 - x28
+        x30 = 0.06985*x23
+        x31 = 0.06985*x25
+        x32 = x12 - x30 - x31
+        x33 = x15*x4
+        x34 = x15*x6
+        x35 = x24 + x34
+        x36 = 0.06985*x27
+        x37 = x14 + 0.06985*x33 - x36
+        x38 = sin(q[3])
+        x39 = x1*x38
+        x40 = cos(q[3])
+        x41 = x16*x40
+        x42 = x18*x40
+        x43 = x1*x40
+        x44 = x16*x38
+        x45 = x0*x38
+        x46 = x24*x45
+        x47 = x43 - x44 - x46
+        x48 = 0.3556*x19 - 0.3556*x20 + x22
+        x49 = x23*x40
+        x50 = x0*x40
+        x51 = x23*x38
+        x52 = x24*x39
+        x53 = x50 + x51 + x52
+        x54 = 0.3556*x28
+        x55 = 0.3556*x26
+        x56 = x32 - x54 + x55
+        x57 = x33*x40
+        x58 = x27*x40
+        x59 = x27*x38
+        x60 = x33*x38
+        x61 = x59 - x60
+        x62 = 0.3556*x24
+        x63 = 0.3556*x34 + x37 + x62
+        x64 = cos(q[4])
+        x65 = x39*x64
+        x66 = sin(q[4])
+        x67 = x20*x66
+        x68 = x19*x66
+        x69 = x41*x64
+        x70 = x42*x64
+        x71 = x39*x66
+        x72 = x19*x64
+        x73 = x20*x64
+        x74 = x41*x66
+        x75 = x42*x66
+        x76 = x71 + x72 - x73 + x74 + x75
+        x77 = x45*x64
+        x78 = x28*x66
+        x79 = x26*x66
+        x80 = x49*x64
+        x81 = x24*x64
+        x82 = x45*x66
+        x83 = x26*x64
+        x84 = x28*x64
+        x85 = x49*x66
+        x86 = x24*x66
+        x87 = x43*x86
+        x88 = x82 + x83 - x84 - x85 - x87
+        x89 = x34*x66
+        x90 = x57*x64
+        x91 = x58*x64
+        x92 = x34*x64
+        x93 = x57*x66
+        x94 = x58*x66
+        x95 = x81 + x92 + x93 - x94
+        x96 = sin(q[5])
+        x97 = x43*x96
+        x98 = cos(q[5])
+        x99 = x43*x98
+        x100 = x48 + 0.2413*x71 + 0.2413*x72 - 0.2413*x73 + 0.2413*x74 + 0.2413*x75
+        x101 = 0.2413*x82
+        x102 = 0.2413*x84
+        x103 = 0.2413*x83
+        x104 = 0.2413*x85
+        x105 = 0.2413*x87
+        x106 = 0.2413*x81
+        x107 = 0.2413*x64
+        x108 = 0.2413*x40
+        x109 = x107*x16 + x107*x18 + x108*x67 - x108*x68 + 0.3556*x16 + 0.3556*x18 - 0.06985*x19 + 0.06985*x20
+        x110 = 0.2413*x66
+        x111 = 0.2413*x1*x40*x66
+        x112 = x6**2
+        x113 = x17**2
+        x114 = x112*x113
+        x115 = x15**2
+        x116 = x112*x115
+        x117 = x4**2
+        x118 = x113*x117
+        x119 = x115*x117
+        x120 = x38**2
+        x121 = 0.2413*x0*x17*x6*x66
+        x122 = x40**2
+        x123 = 0.2413*x0*x15*x4*x66
+        x124 = 0.2413*x1*x38*x64
+        x125 = x1*x36 - x1*x62 - x107*x23 - x107*x25 - x108*x79 + x111*x27 - 0.3556*x23 - 0.06985*x26
+        x126 = 0.2413*x0*x40*x66
+        x127 = 0.2413*x1*x17*x6*x66
+        x128 = 0.2413*x1*x15*x4*x66
+        x129 = 0.2413*x0*x38*x64
+        x130 = x0**2
+        x131 = 0.381*x4
+        x132 = x1**2
+        x133 = 0.3556*x130
+        x134 = 0.06985*x130
+        x135 = 0.3556*x132
+        x136 = 0.06985*x132
+        x137 = 0.2413*x130*x64
+        x138 = 0.2413*x132*x64
+        x139 = 0.2413*x130*x40
+        x140 = 0.2413*x132*x40
+        x141 = -x133*x27 + x133*x33 - x134*x24 - x134*x34 - x135*x27 + x135*x33 - x136*x24 - x136*x34 - x137*x27 + x137*x33 - x138*x27 + x138*x33 - x139*x86 - x139*x89 - x140*x86 - x140*x89
+        x142 = 0.2413*x130*x66
+        x143 = 0.2413*x132*x66
+        x144 = 0.2413*x130
+        x145 = 0.2413*x132
+        x146 = 0.2413*x130*x15*x6*x66
+        x147 = 0.2413*x130*x17*x4*x66
+        x148 = 0.2413*x132*x15*x6*x66
+        x149 = 0.2413*x132*x17*x4*x66
+    #
+        poses[0, 0, 0] = -x0
+        poses[0, 0, 1] = 0
+        poses[0, 0, 2] = x1
+        poses[0, 0, 3] = x2
+        poses[0, 1, 0] = x1
+        poses[0, 1, 1] = 0
+        poses[0, 1, 2] = x0
+        poses[0, 1, 3] = x3
+        poses[0, 2, 0] = 0
+        poses[0, 2, 1] = 1
+        poses[0, 2, 2] = 0
+        poses[0, 2, 3] = 0.0889000000000000
+        poses[0, 3, 0] = 0
+        poses[0, 3, 1] = 0
+        poses[0, 3, 2] = 0
+        poses[0, 3, 3] = 1
+        poses[1, 0, 0] = -x5
+        poses[1, 0, 1] = x7
+        poses[1, 0, 2] = x1
+        poses[1, 0, 3] = x8
+        poses[1, 1, 0] = x9
+        poses[1, 1, 1] = -x10
+        poses[1, 1, 2] = x0
+        poses[1, 1, 3] = x12
+        poses[1, 2, 0] = x6
+        poses[1, 2, 1] = x4
+        poses[1, 2, 2] = 0
+        poses[1, 2, 3] = x14
+        poses[1, 3, 0] = 0
+        poses[1, 3, 1] = 0
+        poses[1, 3, 2] = 0
+        poses[1, 3, 3] = 1
+        poses[2, 0, 0] = x16 + x18
+        poses[2, 0, 1] = x1
+        poses[2, 0, 2] = x21
+        poses[2, 0, 3] = x22
+        poses[2, 1, 0] = -x23 - x25
+        poses[2, 1, 1] = x0
+        poses[2, 1, 2] = x29
+        poses[2, 1, 3] = x32
+        poses[2, 2, 0] = -x27 + x33
+        poses[2, 2, 1] = 0
+        poses[2, 2, 2] = x35
+        poses[2, 2, 3] = x37
+        poses[2, 3, 0] = 0
+        poses[2, 3, 1] = 0
+        poses[2, 3, 2] = 0
+        poses[2, 3, 3] = 1
+        poses[3, 0, 0] = x39 + x41 + x42
+        poses[3, 0, 1] = -x19 + x20
+        poses[3, 0, 2] = x47
+        poses[3, 0, 3] = x48
+        poses[3, 1, 0] = -x24*x43 + x45 - x49
+        poses[3, 1, 1] = -x26 + x28
+        poses[3, 1, 2] = x53
+        poses[3, 1, 3] = x56
+        poses[3, 2, 0] = x57 - x58
+        poses[3, 2, 1] = -x24 - x34
+        poses[3, 2, 2] = x61
+        poses[3, 2, 3] = x63
+        poses[3, 3, 0] = 0
+        poses[3, 3, 1] = 0
+        poses[3, 3, 2] = 0
+        poses[3, 3, 3] = 1
+        poses[4, 0, 0] = x65 + x67 - x68 + x69 + x70
+        poses[4, 0, 1] = x47
+        poses[4, 0, 2] = x76
+        poses[4, 0, 3] = x48
+        poses[4, 1, 0] = -x43*x81 + x77 + x78 - x79 - x80
+        poses[4, 1, 1] = x53
+        poses[4, 1, 2] = x88
+        poses[4, 1, 3] = x56
+        poses[4, 2, 0] = -x86 - x89 + x90 - x91
+        poses[4, 2, 1] = x61
+        poses[4, 2, 2] = x95
+        poses[4, 2, 3] = x63
+        poses[4, 3, 0] = 0
+        poses[4, 3, 1] = 0
+        poses[4, 3, 2] = 0
+        poses[4, 3, 3] = 1
+        poses[5, 0, 0] = -x44*x96 - x46*x96 + x65*x98 + x67*x98 - x68*x98 + x69*x98 + x70*x98 + x97
+        poses[5, 0, 1] = -x44*x98 - x46*x98 - x65*x96 - x67*x96 + x68*x96 - x69*x96 - x70*x96 + x99
+        poses[5, 0, 2] = x76
+        poses[5, 0, 3] = x100
+        poses[5, 1, 0] = x50*x96 + x51*x96 + x52*x96 + x77*x98 + x78*x98 - x79*x98 - x80*x98 - x81*x99
+        poses[5, 1, 1] = x50*x98 + x51*x98 + x52*x98 - x77*x96 - x78*x96 + x79*x96 + x80*x96 + x81*x97
+        poses[5, 1, 2] = x88
+        poses[5, 1, 3] = x101 - x102 + x103 - x104 - x105 + x56
+        poses[5, 2, 0] = x59*x96 - x60*x96 - x86*x98 - x89*x98 + x90*x98 - x91*x98
+        poses[5, 2, 1] = x59*x98 - x60*x98 + x86*x96 + x89*x96 - x90*x96 + x91*x96
+        poses[5, 2, 2] = x95
+        poses[5, 2, 3] = x106 + x63 + 0.2413*x92 + 0.2413*x93 - 0.2413*x94
+        poses[5, 3, 0] = 0
+        poses[5, 3, 1] = 0
+        poses[5, 3, 2] = 0
+        poses[5, 3, 3] = 1
+        jacobian[0, 0] = -x101 + x102 - x103 + x104 + x105 - x11 - x3 + x30 + x31 + x54 - x55
+        jacobian[0, 1] = x0*x13 + x109
+        jacobian[0, 2] = x109
+        jacobian[0, 3] = -x101*x24 - x110*x44 + x111*x114 + x111*x116 + x111*x118 + x111*x119
+        jacobian[0, 4] = x107*x41 + x107*x42 + x114*x124 + x116*x124 + x118*x124 + x119*x124 - x120*x121 + x120*x123 - x121*x122 + x122*x123
+        jacobian[0, 5] = 0
+        jacobian[1, 0] = x100
+        jacobian[1, 1] = -x1*x13 + x125
+        jacobian[1, 2] = x125
+        jacobian[1, 3] = x110*x51 + x114*x126 + x116*x126 + x118*x126 + x119*x126 + 0.2413*x17*x39*x4*x66
+        jacobian[1, 4] = -x106*x43 - x107*x49 + x114*x129 + x116*x129 + x118*x129 + x119*x129 + x120*x127 - x120*x128 + x122*x127 - x122*x128
+        jacobian[1, 5] = 0
+        jacobian[2, 0] = 0
+        jacobian[2, 1] = x130*x131 + x131*x132 + x141
+        jacobian[2, 2] = x141
+        jacobian[2, 3] = x142*x59 - x142*x60 + x143*x59 - x143*x60
+        jacobian[2, 4] = -x120*x146 - x120*x147 - x120*x148 - x120*x149 - x122*x146 - x122*x147 - x122*x148 - x122*x149 + x144*x90 - x144*x91 + x145*x90 - x145*x91
+        jacobian[2, 5] = 0
+        jacobian[3, 0] = 0
+        jacobian[3, 1] = x1
+        jacobian[3, 2] = x1
+        jacobian[3, 3] = x21
+        jacobian[3, 4] = x47
+        jacobian[3, 5] = x76
+        jacobian[4, 0] = 0
+        jacobian[4, 1] = x0
+        jacobian[4, 2] = x0
+        jacobian[4, 3] = x29
+        jacobian[4, 4] = x53
+        jacobian[4, 5] = x88
+        jacobian[5, 0] = 1
+        jacobian[5, 1] = 0
+        jacobian[5, 2] = 0
+        jacobian[5, 3] = x35
+        jacobian[5, 4] = x61
+        jacobian[5, 5] = x95
+    #
+        return poses, jacobian
+
+
+
+    def joint_fk00_batch_into(q, pose, scratch):
+    #
+        q0, q1, q2, q3, q4, q5, = q.T
+        s0, s1, s2, = scratch[:3]
+    #
+        np.sin(q0, s0)
+        np.cos(q0, s1)
+        np.negative(s0, pose[:, 0, 0])
+        np.copyto(pose[:, 0, 1], 0.0)
+        np.copyto(pose[:, 0, 2], s1)
+        np.multiply(-0.10795, s0, pose[:, 0, 3])
+        np.copyto(pose[:, 1, 0], s1)
+        np.copyto(pose[:, 1, 1], 0.0)
+        np.copyto(pose[:, 1, 2], s0)
+        np.multiply(0.10795, s1, pose[:, 1, 3])
+        np.copyto(pose[:, 2, 0], 0.0)
+        np.copyto(pose[:, 2, 1], 1.0)
+        np.copyto(pose[:, 2, 2], 0.0)
+        np.copyto(pose[:, 2, 3], 0.0889)
+        np.copyto(pose[:, 3, 0], 0.0)
+        np.copyto(pose[:, 3, 1], 0.0)
+        np.copyto(pose[:, 3, 2], 0.0)
+        np.copyto(pose[:, 3, 3], 1.0)
+    #
+        return pose
+
+
+
+    def joint_fk01_batch_into(q, pose, scratch):
+    #
+        q0, q1, q2, q3, q4, q5, = q.T
+        s0, s1, s2, s3, s4, s5, s6, s7, s8, = scratch[:9]
+    #
+        np.sin(q0, s0)
+        np.cos(q1, s1)
+        np.multiply(s0, s1, s2)
+        np.sin(q1, s3)
+        np.cos(q0, s4)
+        np.multiply(s1, s4, s5)
+        np.negative(s2, pose[:, 0, 0])
+        np.multiply(s0, s3, pose[:, 0, 1])
+        np.copyto(pose[:, 0, 2], s4)
+        np.multiply(-0.381, s2, s7)
+        np.multiply(-0.10795, s0, s8)
+        np.add(s7, s8, pose[:, 0, 3])
+        np.copyto(pose[:, 1, 0], s5)
+        np.multiply(s3, s4, s2)
+        np.negative(s2, pose[:, 1, 1])
+        np.copyto(pose[:, 1, 2], s0)
+        np.multiply(0.381, s5, s2)
+        np.multiply(0.10795, s4, s6)
+        np.add(s2, s6, pose[:, 1, 3])
+        np.copyto(pose[:, 2, 0], s3)
+        np.copyto(pose[:, 2, 1], s1)
+        np.copyto(pose[:, 2, 2], 0.0)
+        np.multiply(0.381, s3, s5)
+        np.add(0.0889, s5, pose[:, 2, 3])
+        np.copyto(pose[:, 3, 0], 0.0)
+        np.copyto(pose[:, 3, 1], 0.0)
+        np.copyto(pose[:, 3, 2], 0.0)
+        np.copyto(pose[:, 3, 3], 1.0)
+    #
+        return pose
+
+
+
+    def joint_fk02_batch_into(q, pose, scratch):
+    #
+        q0, q1, q2, q3, q4, q5, = q.T
+        s0, s1, s2, s3, s4, s5, s6, s7, s8, s9, s10, s11, s12, s13, s14, = scratch[:15]
+    #
+        np.sin(q0, s0)
+        np.sin(q1, s1)
+        np.cos(q2, s2)
+        np.multiply(s1, s2, s3)
+        np.multiply(s0, s3, s4)
+        np.sin(q2, s5)
+        np.cos(q1, s6)
+        np.multiply(s5, s6, s7)
+        np.multiply(s0, s7, s8)
+        np.cos(q0, s9)
+        np.multiply(s1, s5, s10)
+        np.multiply(s2, s6, s5)
+        np.multiply(0.381, s6, s2)
+        np.multiply(s3, s9, s6)
+        np.multiply(s7, s9, s11)
+        np.add(s4, s8, pose[:, 0, 0])
+        np.copyto(pose[:, 0, 1], s9)
+        np.multiply(s0, s10, s13)
+        np.multiply(s0, s5, s14)
+        np.negative(s14, s14)
+        np.add(s13, s14, pose[:, 0, 2])
+        np.multiply(0.06985, s4, s14)
+        np.multiply(0.06985, s8, s13)
+        np.add(s14, s13, s12)
+        np.multiply(-0.10795, s0, s13)
+        np.add(s12, s13, s12)
+        np.multiply(s0, s2, s13)
+        np.negative(s13, s13)
+        np.add(s12, s13, pose[:, 0, 3])
+        np.negative(s6, s4)
+        np.negative(s11, s12)
+        np.add(s4, s12, pose[:, 1, 0])
+        np.copyto(pose[:, 1, 1], s0)
+        np.multiply(s5, s9, s8)
+        np.multiply(s10, s9, s12)
+        np.negative(s12, s12)
+        np.add(s8, s12, pose[:, 1, 2])
+        np.multiply(0.10795, s9, s12)
+        np.multiply(-0.06985, s6, s8)
+        np.add(s12, s8, s0)
+        np.multiply(-0.06985, s11, s8)
+        np.add(s0, s8, s0)
+        np.multiply(s2, s9, s8)
+        np.add(s0, s8, pose[:, 1, 3])
+        np.negative(s10, s6)
+        np.add(s5, s6, pose[:, 2, 0])
+        np.copyto(pose[:, 2, 1], 0.0)
+        np.add(s3, s7, pose[:, 2, 2])
+        np.multiply(0.381, s1, s3)
+        np.add(0.0889, s3, s7)
+        np.multiply(0.06985, s5, s3)
+        np.add(s7, s3, s7)
+        np.multiply(-0.06985, s10, s3)
+        np.add(s7, s3, pose[:, 2, 3])
+        np.copyto(pose[:, 3, 0], 0.0)
+        np.copyto(pose[:, 3, 1], 0.0)
+        np.copyto(pose[:, 3, 2], 0.0)
+        np.copyto(pose[:, 3, 3], 1.0)
+    #
+        return pose
+
+
+
+    def joint_fk03_batch_into(q, pose, scratch):
+    #
+        q0, q1, q2, q3, q4, q5, = q.T
+        s0, s1, s2, s3, s4, s5, s6, s7, s8, s9, s10, s11, s12, s13, s14, s15, s16, s17, s18, s19, s20, s21, s22, = scratch[:23]
+    #
+        np.sin(q3, s0)
+        np.cos(q0, s1)
+        np.multiply(s0, s1, s2)
+        np.sin(q0, s3)
+        np.cos(q3, s4)
+        np.multiply(s3, s4, s5)
+        np.sin(q1, s6)
+        np.cos(q2, s7)
+        np.multiply(s6, s7, s8)
+        np.sin(q2, s9)
+        np.cos(q1, s10)
+        np.multiply(s10, s9, s11)
+        np.multiply(s10, s7, s12)
+        np.multiply(s12, s3, s7)
+        np.multiply(s6, s9, s13)
+        np.multiply(s13, s3, s9)
+        np.multiply(s1, s4, s14)
+        np.multiply(s0, s3, s15)
+        np.multiply(0.381, s10, s16)
+        np.multiply(0.06985, s3, s10)
+        np.multiply(s1, s13, s17)
+        np.multiply(s1, s12, s18)
+        np.multiply(0.06985, s1, s19)
+        np.multiply(s11, s5, s21)
+        np.add(s2, s21, s20)
+        np.multiply(s5, s8, s21)
+        np.add(s20, s21, pose[:, 0, 0])
+        np.negative(s9, s21)
+        np.add(s7, s21, pose[:, 0, 1])
+        np.multiply(s11, s15, s21)
+        np.negative(s21, s21)
+        np.add(s14, s21, s20)
+        np.multiply(s15, s8, s21)
+        np.negative(s21, s21)
+        np.add(s20, s21, pose[:, 0, 2])
+        np.multiply(0.3556, s9, s21)
+        np.multiply(-0.3556, s7, s22)
+        np.add(s21, s22, s20)
+        np.multiply(-0.10795, s3, s22)
+        np.add(s20, s22, s20)
+        np.multiply(s11, s10, s22)
+        np.add(s20, s22, s20)
+        np.multiply(s10, s8, s22)
+        np.add(s20, s22, s20)
+        np.multiply(s16, s3, s22)
+        np.negative(s22, s22)
+        np.add(s20, s22, pose[:, 0, 3])
+        np.multiply(s11, s14, s9)
+        np.negative(s9, s9)
+        np.add(s15, s9, s10)
+        np.multiply(s14, s8, s9)
+        np.negative(s9, s9)
+        np.add(s10, s9, pose[:, 1, 0])
+        np.negative(s18, s14)
+        np.add(s17, s14, pose[:, 1, 1])
+        np.multiply(s11, s2, s14)
+        np.add(s5, s14, s15)
+        np.multiply(s2, s8, s14)
+        np.add(s15, s14, pose[:, 1, 2])
+        np.multiply(0.3556, s18, s2)
+        np.multiply(0.10795, s1, s15)
+        np.add(s2, s15, s5)
+        np.multiply(-0.3556, s17, s15)
+        np.add(s5, s15, s5)
+        np.multiply(s1, s16, s15)
+        np.add(s5, s15, s5)
+        np.multiply(s11, s19, s15)
+        np.negative(s15, s15)
+        np.add(s5, s15, s5)
+        np.multiply(s19, s8, s15)
+        np.negative(s15, s15)
+        np.add(s5, s15, pose[:, 1, 3])
+        np.multiply(s12, s4, s18)
+        np.multiply(s13, s4, s17)
+        np.negative(s17, s17)
+        np.add(s18, s17, pose[:, 2, 0])
+        np.negative(s11, s19)
+        np.negative(s8, s17)
+        np.add(s19, s17, pose[:, 2, 1])
+        np.multiply(s0, s13, s17)
+        np.multiply(s0, s12, s19)
+        np.negative(s19, s19)
+        np.add(s17, s19, pose[:, 2, 2])
+        np.multiply(0.381, s6, s4)
+        np.add(0.0889, s4, s0)
+        np.multiply(0.06985, s12, s4)
+        np.add(s0, s4, s0)
+        np.multiply(0.3556, s11, s4)
+        np.add(s0, s4, s0)
+        np.multiply(0.3556, s8, s4)
+        np.add(s0, s4, s0)
+        np.multiply(-0.06985, s13, s4)
+        np.add(s0, s4, pose[:, 2, 3])
+        np.copyto(pose[:, 3, 0], 0.0)
+        np.copyto(pose[:, 3, 1], 0.0)
+        np.copyto(pose[:, 3, 2], 0.0)
+        np.copyto(pose[:, 3, 3], 1.0)
+    #
+        return pose
+
+
+
+    def joint_fk04_batch_into(q, pose, scratch):
+    #
+        q0, q1, q2, q3, q4, q5, = q.T
+        s0, s1, s2, s3, s4, s5, s6, s7, s8, s9, s10, s11, s12, s13, s14, s15, s16, s17, s18, s19, s20, s21, s22, s23, s24, s25, s26, s27, s28, s29, s30, s31, s32, = scratch[:33]
+    #
+        np.cos(q4, s0)
+        np.sin(q3, s1)
+        np.cos(q0, s2)
+        np.multiply(s1, s2, s3)
+        np.sin(q4, s4)
+        np.sin(q0, s5)
+        np.cos(q1, s6)
+        np.cos(q2, s7)
+        np.multiply(s5, s6, s8)
+        np.multiply(s8, s7, s8)
+        np.sin(q1, s9)
+        np.sin(q2, s10)
+        np.multiply(s10, s5, s11)
+        np.multiply(s11, s9, s11)
+        np.cos(q3, s12)
+        np.multiply(s12, s5, s13)
+        np.multiply(s7, s9, s14)
+        np.multiply(s0, s14, s15)
+        np.multiply(s10, s6, s16)
+        np.multiply(s0, s16, s17)
+        np.multiply(s12, s2, s18)
+        np.multiply(s1, s5, s19)
+        np.multiply(s14, s4, s20)
+        np.multiply(s16, s4, s21)
+        np.multiply(0.381, s6, s22)
+        np.multiply(0.3556, s5, s23)
+        np.multiply(s10, s9, s24)
+        np.multiply(0.06985, s5, s25)
+        np.multiply(s6, s7, s26)
+        np.multiply(s10, s4, s27)
+        np.multiply(s27, s9, s27)
+        np.multiply(s4, s6, s28)
+        np.multiply(s28, s7, s28)
+        np.multiply(s0, s6, s29)
+        np.multiply(s29, s7, s29)
+        np.multiply(s0, s10, s7)
+        np.multiply(s7, s9, s7)
+        np.multiply(0.3556, s2, s10)
+        np.multiply(0.06985, s2, s6)
+        np.multiply(s0, s3, s31)
+        np.multiply(s13, s15, s32)
+        np.add(s31, s32, s30)
+        np.multiply(s13, s17, s32)
+        np.add(s30, s32, s30)
+        np.multiply(s4, s8, s32)
+        np.add(s30, s32, s30)
+        np.multiply(s11, s4, s32)
+        np.negative(s32, s32)
+        np.add(s30, s32, pose[:, 0, 0])
+        np.multiply(s14, s19, s32)
+        np.negative(s32, s32)
+        np.add(s18, s32, s30)
+        np.multiply(s16, s19, s32)
+        np.negative(s32, s32)
+        np.add(s30, s32, pose[:, 0, 1])
+        np.multiply(s0, s11, s32)
+        np.multiply(s13, s20, s31)
+        np.add(s32, s31, s30)
+        np.multiply(s13, s21, s31)
+        np.add(s30, s31, s30)
+        np.multiply(s3, s4, s31)
+        np.add(s30, s31, s30)
+        np.multiply(s0, s8, s31)
+        np.negative(s31, s31)
+        np.add(s30, s31, pose[:, 0, 2])
+        np.multiply(-0.10795, s5, s8)
+        np.multiply(s14, s25, s30)
+        np.add(s8, s30, s11)
+        np.multiply(s16, s25, s30)
+        np.add(s11, s30, s11)
+        np.multiply(s23, s24, s30)
+        np.add(s11, s30, s11)
+        np.multiply(s22, s5, s30)
+        np.negative(s30, s30)
+        np.add(s11, s30, s11)
+        np.multiply(s23, s26, s30)
+        np.negative(s30, s30)
+        np.add(s11, s30, pose[:, 0, 3])
+        np.multiply(s0, s19, s23)
+        np.multiply(s2, s27, s5)
+        np.add(s23, s5, s25)
+        np.multiply(s15, s18, s5)
+        np.negative(s5, s5)
+        np.add(s25, s5, s25)
+        np.multiply(s17, s18, s5)
+        np.negative(s5, s5)
+        np.add(s25, s5, s25)
+        np.multiply(s2, s28, s5)
+        np.negative(s5, s5)
+        np.add(s25, s5, pose[:, 1, 0])
+        np.multiply(s14, s3, s25)
+        np.add(s13, s25, s0)
+        np.multiply(s16, s3, s25)
+        np.add(s0, s25, pose[:, 1, 1])
+        np.multiply(s19, s4, s3)
+        np.multiply(s2, s29, s0)
+        np.add(s3, s0, s13)
+        np.multiply(s18, s20, s0)
+        np.negative(s0, s0)
+        np.add(s13, s0, s13)
+        np.multiply(s18, s21, s0)
+        np.negative(s0, s0)
+        np.add(s13, s0, s13)
+        np.multiply(s2, s7, s0)
+        np.negative(s0, s0)
+        np.add(s13, s0, pose[:, 1, 2])
+        np.multiply(0.10795, s2, s18)
+        np.multiply(s2, s22, s4)
+        np.add(s18, s4, s19)
+        np.multiply(s26, s10, s4)
+        np.add(s19, s4, s19)
+        np.multiply(s14, s6, s4)
+        np.negative(s4, s4)
+        np.add(s19, s4, s19)
+        np.multiply(s16, s6, s4)
+        np.negative(s4, s4)
+        np.add(s19, s4, s19)
+        np.multiply(s24, s10, s4)
+        np.negative(s4, s4)
+        np.add(s19, s4, pose[:, 1, 3])
+        np.negative(s20, s10)
+        np.negative(s21, s22)
+        np.add(s10, s22, s6)
+        np.multiply(s12, s29, s22)
+        np.add(s6, s22, s6)
+        np.multiply(s12, s7, s22)
+        np.negative(s22, s22)
+        np.add(s6, s22, pose[:, 2, 0])
+        np.multiply(s1, s24, s29)
+        np.multiply(s1, s26, s21)
+        np.negative(s21, s21)
+        np.add(s29, s21, pose[:, 2, 1])
+        np.add(s15, s17, s1)
+        np.multiply(s12, s28, s7)
+        np.add(s1, s7, s1)
+        np.multiply(s12, s27, s7)
+        np.negative(s7, s7)
+        np.add(s1, s7, pose[:, 2, 2])
+        np.multiply(0.381, s9, s27)
+        np.add(0.0889, s27, s28)
+        np.multiply(0.06985, s26, s27)
+        np.add(s28, s27, s28)
+        np.multiply(0.3556, s14, s27)
+        np.add(s28, s27, s28)
+        np.multiply(0.3556, s16, s27)
+        np.add(s28, s27, s28)
+        np.multiply(-0.06985, s24, s27)
+        np.add(s28, s27, pose[:, 2, 3])
+        np.copyto(pose[:, 3, 0], 0.0)
+        np.copyto(pose[:, 3, 1], 0.0)
+        np.copyto(pose[:, 3, 2], 0.0)
+        np.copyto(pose[:, 3, 3], 1.0)
+    #
+        return pose
+
+
+
+    def joint_fk05_batch_into(q, pose, scratch):
+    #
+        q0, q1, q2, q3, q4, q5, = q.T
+        s0, s1, s2, s3, s4, s5, s6, s7, s8, s9, s10, s11, s12, s13, s14, s15, s16, s17, s18, s19, s20, s21, s22, s23, s24, s25, s26, s27, s28, s29, s30, s31, s32, s33, s34, s35, s36, s37, s38, s39, s40, s41, s42, s43, s44, s45, s46, s47, s48, s49, s50, s51, = scratch[:52]
+    #
+        np.sin(q5, s0)
+        np.cos(q0, s1)
+        np.cos(q3, s2)
+        np.multiply(s1, s2, s3)
+        np.multiply(s0, s3, s4)
+        np.sin(q3, s5)
+        np.cos(q5, s6)
+        np.multiply(s5, s6, s7)
+        np.cos(q4, s8)
+        np.multiply(s1, s8, s9)
+        np.sin(q0, s10)
+        np.sin(q4, s11)
+        np.cos(q1, s12)
+        np.cos(q2, s13)
+        np.multiply(s10, s11, s14)
+        np.multiply(s14, s12, s14)
+        np.multiply(s14, s13, s14)
+        np.sin(q1, s15)
+        np.sin(q2, s16)
+        np.multiply(s10, s11, s17)
+        np.multiply(s17, s15, s17)
+        np.multiply(s17, s16, s17)
+        np.multiply(s0, s5, s18)
+        np.multiply(s10, s13, s19)
+        np.multiply(s19, s15, s19)
+        np.multiply(s10, s12, s20)
+        np.multiply(s20, s16, s20)
+        np.multiply(s10, s2, s21)
+        np.multiply(s21, s6, s22)
+        np.multiply(s13, s15, s23)
+        np.multiply(s23, s8, s24)
+        np.multiply(s12, s16, s25)
+        np.multiply(s25, s8, s26)
+        np.multiply(s3, s6, s27)
+        np.multiply(s0, s21, s28)
+        np.multiply(s11, s5, s29)
+        np.multiply(s1, s29, s30)
+        np.multiply(s10, s8, s31)
+        np.multiply(s15, s16, s32)
+        np.multiply(s31, s32, s33)
+        np.multiply(s12, s13, s34)
+        np.multiply(s31, s34, s35)
+        np.multiply(s11, s13, s31)
+        np.multiply(s31, s15, s31)
+        np.multiply(s21, s31, s36)
+        np.multiply(s11, s12, s37)
+        np.multiply(s37, s16, s37)
+        np.multiply(s21, s37, s38)
+        np.multiply(0.381, s12, s21)
+        np.multiply(0.3556, s10, s39)
+        np.multiply(0.06985, s10, s40)
+        np.multiply(s10, s5, s41)
+        np.multiply(s41, s8, s41)
+        np.multiply(s1, s11, s42)
+        np.multiply(s42, s15, s42)
+        np.multiply(s42, s16, s42)
+        np.multiply(s1, s13, s43)
+        np.multiply(s43, s15, s43)
+        np.multiply(s1, s12, s44)
+        np.multiply(s44, s16, s44)
+        np.multiply(s1, s11, s45)
+        np.multiply(s45, s12, s45)
+        np.multiply(s45, s13, s45)
+        np.multiply(s10, s29, s46)
+        np.multiply(s34, s9, s29)
+        np.multiply(s32, s9, s47)
+        np.multiply(s3, s31, s48)
+        np.multiply(s3, s37, s49)
+        np.multiply(0.3556, s1, s3)
+        np.multiply(0.06985, s1, s50)
+        np.multiply(s15, s16, s51)
+        np.multiply(s51, s5, s51)
+        np.multiply(s12, s13, s5)
+        np.multiply(s5, s2, s5)
+        np.multiply(s5, s8, s5)
+        np.multiply(s15, s16, s13)
+        np.multiply(s13, s2, s13)
+        np.multiply(s13, s8, s13)
+        np.multiply(s11, s2, s16)
+        np.multiply(s34, s16, s11)
+        np.multiply(s32, s16, s2)
+        np.multiply(s14, s6, s8)
+        np.add(s4, s8, s16)
+        np.multiply(s22, s24, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s22, s26, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s7, s9, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s17, s6, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s18, s19, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s18, s20, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, pose[:, 0, 0])
+        np.multiply(s0, s17, s8)
+        np.add(s27, s8, s16)
+        np.multiply(s0, s14, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s18, s9, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s19, s7, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s20, s7, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s24, s28, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, s16)
+        np.multiply(s26, s28, s8)
+        np.negative(s8, s8)
+        np.add(s16, s8, pose[:, 0, 1])
+        np.add(s30, s33, s20)
+        np.add(s20, s36, s20)
+        np.add(s20, s38, s20)
+        np.negative(s35, s19)
+        np.add(s20, s19, pose[:, 0, 2])
+        np.multiply(0.2413, s30, s19)
+        np.multiply(0.2413, s33, s17)
+        np.add(s19, s17, s20)
+        np.multiply(0.2413, s36, s17)
+        np.add(s20, s17, s20)
+        np.multiply(0.2413, s38, s17)
+        np.add(s20, s17, s20)
+        np.multiply(-0.10795, s10, s17)
+        np.add(s20, s17, s20)
+        np.multiply(-0.2413, s35, s17)
+        np.add(s20, s17, s20)
+        np.multiply(s23, s40, s17)
+        np.add(s20, s17, s20)
+        np.multiply(s25, s40, s17)
+        np.add(s20, s17, s20)
+        np.multiply(s32, s39, s17)
+        np.add(s20, s17, s20)
+        np.multiply(s10, s21, s17)
+        np.negative(s17, s17)
+        np.add(s20, s17, s20)
+        np.multiply(s34, s39, s17)
+        np.negative(s17, s17)
+        np.add(s20, s17, pose[:, 0, 3])
+        np.multiply(s18, s43, s39)
+        np.add(s28, s39, s40)
+        np.multiply(s18, s44, s39)
+        np.add(s40, s39, s40)
+        np.multiply(s41, s6, s39)
+        np.add(s40, s39, s40)
+        np.multiply(s42, s6, s39)
+        np.add(s40, s39, s40)
+        np.multiply(s24, s27, s39)
+        np.negative(s39, s39)
+        np.add(s40, s39, s40)
+        np.multiply(s26, s27, s39)
+        np.negative(s39, s39)
+        np.add(s40, s39, s40)
+        np.multiply(s45, s6, s39)
+        np.negative(s39, s39)
+        np.add(s40, s39, pose[:, 1, 0])
+        np.multiply(s0, s45, s27)
+        np.add(s22, s27, s28)
+        np.multiply(s24, s4, s27)
+        np.add(s28, s27, s28)
+        np.multiply(s26, s4, s27)
+        np.add(s28, s27, s28)
+        np.multiply(s43, s7, s27)
+        np.add(s28, s27, s28)
+        np.multiply(s44, s7, s27)
+        np.add(s28, s27, s28)
+        np.multiply(s0, s41, s27)
+        np.negative(s27, s27)
+        np.add(s28, s27, s28)
+        np.multiply(s0, s42, s27)
+        np.negative(s27, s27)
+        np.add(s28, s27, pose[:, 1, 1])
+        np.add(s46, s29, s45)
+        np.negative(s47, s44)
+        np.add(s45, s44, s45)
+        np.negative(s48, s44)
+        np.add(s45, s44, s45)
+        np.negative(s49, s44)
+        np.add(s45, s44, pose[:, 1, 2])
+        np.multiply(0.10795, s1, s44)
+        np.multiply(0.2413, s46, s43)
+        np.add(s44, s43, s45)
+        np.multiply(0.2413, s29, s43)
+        np.add(s45, s43, s45)
+        np.multiply(-0.2413, s47, s43)
+        np.add(s45, s43, s45)
+        np.multiply(-0.2413, s48, s43)
+        np.add(s45, s43, s45)
+        np.multiply(-0.2413, s49, s43)
+        np.add(s45, s43, s45)
+        np.multiply(s1, s21, s43)
+        np.add(s45, s43, s45)
+        np.multiply(s34, s3, s43)
+        np.add(s45, s43, s45)
+        np.multiply(s23, s50, s43)
+        np.negative(s43, s43)
+        np.add(s45, s43, s45)
+        np.multiply(s25, s50, s43)
+        np.negative(s43, s43)
+        np.add(s45, s43, s45)
+        np.multiply(s32, s3, s43)
+        np.negative(s43, s43)
+        np.add(s45, s43, pose[:, 1, 3])
+        np.multiply(s0, s51, s3)
+        np.multiply(s5, s6, s49)
+        np.add(s3, s49, s50)
+        np.multiply(s18, s34, s49)
+        np.negative(s49, s49)
+        np.add(s50, s49, s50)
+        np.multiply(s31, s6, s49)
+        np.negative(s49, s49)
+        np.add(s50, s49, s50)
+        np.multiply(s37, s6, s49)
+        np.negative(s49, s49)
+        np.add(s50, s49, s50)
+        np.multiply(s13, s6, s49)
+        np.negative(s49, s49)
+        np.add(s50, s49, pose[:, 2, 0])
+        np.multiply(s0, s31, s50)
+        np.multiply(s0, s37, s49)
+        np.add(s50, s49, s18)
+        np.multiply(s0, s13, s49)
+        np.add(s18, s49, s18)
+        np.multiply(s51, s6, s49)
+        np.add(s18, s49, s18)
+        np.multiply(s0, s5, s49)
+        np.negative(s49, s49)
+        np.add(s18, s49, s18)
+        np.multiply(s34, s7, s49)
+        np.negative(s49, s49)
+        np.add(s18, s49, pose[:, 2, 1])
+        np.add(s24, s26, s13)
+        np.add(s13, s11, s13)
+        np.negative(s2, s5)
+        np.add(s13, s5, pose[:, 2, 2])
+        np.multiply(0.381, s15, s5)
+        np.add(0.0889, s5, s13)
+        np.multiply(0.06985, s34, s5)
+        np.add(s13, s5, s13)
+        np.multiply(0.3556, s23, s5)
+        np.add(s13, s5, s13)
+        np.multiply(0.3556, s25, s5)
+        np.add(s13, s5, s13)
+        np.multiply(0.2413, s24, s5)
+        np.add(s13, s5, s13)
+        np.multiply(0.2413, s26, s5)
+        np.add(s13, s5, s13)
+        np.multiply(0.2413, s11, s5)
+        np.add(s13, s5, s13)
+        np.multiply(-0.06985, s32, s5)
+        np.add(s13, s5, s13)
+        np.multiply(-0.2413, s2, s5)
+        np.add(s13, s5, pose[:, 2, 3])
+        np.copyto(pose[:, 3, 0], 0.0)
+        np.copyto(pose[:, 3, 1], 0.0)
+        np.copyto(pose[:, 3, 2], 0.0)
+        np.copyto(pose[:, 3, 3], 1.0)
+    #
+        return pose
+
+
+
+    FK_batch_into = {0:joint_fk00_batch_into, 1:joint_fk01_batch_into, 2:joint_fk02_batch_into, 3:joint_fk03_batch_into, 4:joint_fk04_batch_into, 5:joint_fk05_batch_into, }
+    FK_batch_scratch = {0:3, 1:9, 2:15, 3:23, 4:33, 5:52, }
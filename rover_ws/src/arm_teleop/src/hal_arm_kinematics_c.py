@@ -0,0 +1,92 @@
+# Generated by hal_gen_eqns.py: the kinematics of hal_arm_kinematics.py, evaluated
+# by the compiled kernels of hal_arm_kinematics.c.  Build libhal_arm_kinematics.so
+# with catkin_make, or next to this file with
+#     gcc -O2 -shared -fPIC -o libhal_arm_kinematics.so hal_arm_kinematics.c -lm
+import os
+import ctypes
+import numpy as np
+pi = np.pi
+
+_lib = None
+for _path in [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libhal_arm_kinematics.so'),
+              'libhal_arm_kinematics.so']:  # catkin's devel/lib is on LD_LIBRARY_PATH
+    try:
+        _lib = ctypes.CDLL(_path)
+        break
+    except OSError:
+        pass
+if _lib is None:
+    raise ImportError('hal_arm_kinematics_c: libhal_arm_kinematics.so not found')
+
+# Arrays are passed as pointers to their first element.  This is several times
+# cheaper per call than numpy.ctypeslib.ndpointer, which matters next to kernels
+# that take well under a microsecond, so the outputs are checked here instead.
+_joints = ctypes.c_double * 6
+_ref = ctypes.byref
+_double = ctypes.c_double.from_buffer
+
+
+def _check(name, outs, shapes):
+    for out, shape in zip(outs, shapes):
+        if out.dtype.char != 'd' or out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError('hal_arm_kinematics_c: %s needs C-contiguous float64 outputs of shapes %s'
+                             % (name, shapes))
+
+
+def _kernel(name, shapes):
+    ''' The C kernel name as f(q, *outs): outs are filled in place, or allocated
+        and returned if omitted.
+    '''
+    c_func = getattr(_lib, name)
+    c_func.restype = None
+    def kernel(q, *outs):
+        q = _joints.from_buffer_copy(np.ascontiguousarray(q, dtype=float))
+        if outs:
+            _check(name, outs, shapes)
+        else:
+            outs = [np.empty(shape) for shape in shapes]
+        c_func(q, *[_ref(_double(out)) for out in outs])
+        return outs[0] if len(outs) == 1 else tuple(outs)
+    kernel.__name__ = name
+    return kernel
+
+
+def _batch_kernel(name, shapes):
+    ''' The C kernel name_batch as f(q, *outs) for an (N, 6) array q, with outs
+        of shape (N,) + shape.  Arguments after the outputs (the scratch array the
+        NumPy kernels take) are ignored.
+    '''
+    c_func = getattr(_lib, name + '_batch')
+    c_func.restype = None
+    def kernel(q, *outs):
+        q = np.ascontiguousarray(q, dtype=float).reshape(-1, 6)
+        n = q.shape[0]
+        if outs:
+            outs = outs[:len(shapes)]
+            _check(name + '_batch', outs, [(n,) + shape for shape in shapes])
+        else:
+            outs = [np.empty((n,) + shape) for shape in shapes]
+        c_func(*([ctypes.c_void_p(a.ctypes.data) for a in [q] + list(outs)] + [ctypes.c_long(n)]))
+        return outs[0] if len(outs) == 1 else tuple(outs)
+    kernel.__name__ = name + '_batch'
+    return kernel
+
+
+class hal_arm_kinematics():
+    def __init__(self):
+        pass
+
+    FK = {0:_kernel('joint_fk00', [(4, 4)]), 1:_kernel('joint_fk01', [(4, 4)]), 2:_kernel('joint_fk02', [(4, 4)]), 3:_kernel('joint_fk03', [(4, 4)]), 4:_kernel('joint_fk04', [(4, 4)]), 5:_kernel('joint_fk05', [(4, 4)]), }
+    J = {0:_kernel('jacobian00', [(6, 6)]), 1:_kernel('jacobian01', [(6, 6)]), 2:_kernel('jacobian02', [(6, 6)]), 3:_kernel('jacobian03', [(6, 6)]), 4:_kernel('jacobian04', [(6, 6)]), 5:_kernel('jacobian05', [(6, 6)]), }
+    FK_batch = {0:_batch_kernel('joint_fk00', [(4, 4)]), 1:_batch_kernel('joint_fk01', [(4, 4)]), 2:_batch_kernel('joint_fk02', [(4, 4)]), 3:_batch_kernel('joint_fk03', [(4, 4)]), 4:_batch_kernel('joint_fk04', [(4, 4)]), 5:_batch_kernel('joint_fk05', [(4, 4)]), }
+    J_batch = {0:_batch_kernel('jacobian00', [(6, 6)]), 1:_batch_kernel('jacobian01', [(6, 6)]), 2:_batch_kernel('jacobian02', [(6, 6)]), 3:_batch_kernel('jacobian03', [(6, 6)]), 4:_batch_kernel('jacobian04', [(6, 6)]), 5:_batch_kernel('jacobian05', [(6, 6)]), }
+    fk_and_jacobian = staticmethod(_kernel('fk_and_jacobian', [(6, 4, 4), (6, 6)]))
+    fk_and_jacobian_batch = staticmethod(_batch_kernel('fk_and_jacobian', [(6, 4, 4), (6, 6)]))
+
+    # The kernels write into their outputs when given them, so the in-place
+    # interface of hal_arm_kinematics.py is the same functions
+    FK_into = FK
+    J_into = J
+    FK_batch_into = FK_batch
+    FK_batch_scratch = {0:0, 1:0, 2:0, 3:0, 4:0, 5:0, }
+    fk_and_jacobian_into = fk_and_jacobian
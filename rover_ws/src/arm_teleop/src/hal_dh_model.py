@@ -0,0 +1,195 @@
+# Plain sympy model of a serial arm from its Denavit-Hartenberg parameters,
+# providing the parts of sympybotics that hal_gen_eqns.py uses: RobotDef,
+# RobotDynCode (link transforms geo.T, Jacobians kin.J and cse code for the
+# dynamics) and robot_code_to_func for python.  hal_gen_eqns.py falls back to it
+# when sympybotics is not installed, and the checked-in hal_arm_* files were
+# generated with it:
+#     cd rover_ws/src/arm_teleop/src && python hal_gen_eqns.py
+# Only the standard DH convention and the viscous friction model are supported.
+
+import sympy
+
+q = sympy.Symbol('q')  # Stands for the joint angle in the DH parameters
+
+
+class RobotDef():
+
+    ''' A robot given by its standard DH parameters [(alpha, a, d, theta) ...],
+        with q in theta (or d) standing for that link's joint variable.
+    '''
+
+    def __init__(self, name, dh_params, convention='standard'):
+        if convention != 'standard':
+            raise RuntimeError('hal_dh_model: Only standard DH parameters are supported')
+        self.name = name
+        self.dof = len(dh_params)
+        self.q = [sympy.Symbol('q%d' % (i + 1)) for i in range(self.dof)]
+        self.dq = [sympy.Symbol('dq%d' % (i + 1)) for i in range(self.dof)]
+        self.ddq = [sympy.Symbol('ddq%d' % (i + 1)) for i in range(self.dof)]
+        self.links = [tuple(sympy.sympify(v).subs(q, self.q[i]) for v in p)
+                      for i, p in enumerate(dh_params)]
+        self.frictionmodel = None  # or set(['viscous'])
+        self.gravityacc = sympy.Matrix([0, 0, -9.81])
+
+    def dynparms(self):
+        ''' The dynamic parameters of each link, as in sympybotics: inertia tensor
+            L and first moment of mass l about the link frame, mass m, and the
+            viscous friction coefficient fv if that friction model is used.
+        '''
+        parms = []
+        for i in range(1, self.dof + 1):
+            parms += [sympy.Symbol(n % i) for n in ['L_%dxx', 'L_%dxy', 'L_%dxz', 'L_%dyy', 'L_%dyz', 'L_%dzz',
+                                                    'l_%dx', 'l_%dy', 'l_%dz', 'm_%d']]
+            if self.frictionmodel and 'viscous' in self.frictionmodel:
+                parms.append(sympy.Symbol('fv_%d' % i))
+        return parms
+
+
+class _Terms():
+    pass
+
+
+def _rotation(alpha, theta):
+    return sympy.Matrix([[sympy.cos(theta), -sympy.sin(theta) * sympy.cos(alpha), sympy.sin(theta) * sympy.sin(alpha)],
+                         [sympy.sin(theta), sympy.cos(theta) * sympy.cos(alpha), -sympy.cos(theta) * sympy.sin(alpha)],
+                         [0, sympy.sin(alpha), sympy.cos(alpha)]])
+
+
+class RobotDynCode():
+
+    ''' Kinematics and dynamics of a RobotDef:
+            geo.T[i] - pose of link i in the base frame (4x4)
+            kin.J[i] - geometric Jacobian of the origin of link i (6 x dof)
+            invdyn_code, g_code, c_code, M_code, f_code - sympy.cse code for the
+                inverse dynamics and its gravity, Coriolis, mass matrix and
+                friction terms, from recursive Newton-Euler
+    '''
+
+    def __init__(self, rbtdef):
+        self.rbtdef = rbtdef
+        self.dof = rbtdef.dof
+        T = []
+        A = sympy.eye(4)
+        for alpha, a, d, theta in rbtdef.links:
+            R = _rotation(alpha, theta)
+            Ai = R.row_join(sympy.Matrix([a * sympy.cos(theta), a * sympy.sin(theta), d]))
+            Ai = Ai.col_join(sympy.Matrix([[0, 0, 0, 1]]))
+            A = (A * Ai).applyfunc(sympy.expand)
+            T.append(A)
+        self.geo = _Terms()
+        self.geo.T = T
+        self.kin = _Terms()
+        self.kin.J = [self._jacobian(T, i) for i in range(self.dof)]
+        self._dynamics()
+
+    def _jacobian(self, T, i):
+        # Revolute joints: column j is z_j x (p_i - p_j) over z_j, zero past link i
+        p = T[i][:3, 3]
+        cols = []
+        for j in range(self.dof):
+            if j > i:
+                cols.append(sympy.zeros(6, 1))
+                continue
+            if j == 0:
+                z, pj = sympy.Matrix([0, 0, 1]), sympy.zeros(3, 1)
+            else:
+                z, pj = T[j - 1][:3, 2], T[j - 1][:3, 3]
+            cols.append(z.cross(p - pj).col_join(z))
+        return sympy.Matrix.hstack(*cols).applyfunc(sympy.expand)
+
+    def _rne(self, dq, ddq, gravity, friction):
+        ''' Joint torques for dq, ddq by recursive Newton-Euler in the link frames,
+            with or without gravity and friction.
+        '''
+        rbt = self.rbtdef
+        n = self.dof
+        z = sympy.Matrix([0, 0, 1])
+        P = rbt.dynparms()
+        k = 11 if rbt.frictionmodel and 'viscous' in rbt.frictionmodel else 10
+        R, pstar = [], []
+        for alpha, a, d, theta in rbt.links:
+            Ri = _rotation(alpha, theta)
+            R.append(Ri)
+            pstar.append(Ri.T * sympy.Matrix([a * sympy.cos(theta), a * sympy.sin(theta), d]))
+        w = sympy.zeros(3, 1)
+        dw = sympy.zeros(3, 1)
+        dv = -rbt.gravityacc if gravity else sympy.zeros(3, 1)
+        W, DW, DV = [], [], []
+        for i in range(n):
+            dw = R[i].T * (dw + z * ddq[i] + w.cross(z * dq[i]))
+            w = R[i].T * (w + z * dq[i])
+            dv = R[i].T * dv + dw.cross(pstar[i]) + w.cross(w.cross(pstar[i]))
+            W.append(w)
+            DW.append(dw)
+            DV.append(dv)
+        f = sympy.zeros(3, 1)
+        nn = sympy.zeros(3, 1)
+        tau = [0] * n
+        for i in reversed(range(n)):
+            Lxx, Lxy, Lxz, Lyy, Lyz, Lzz, lx, ly, lz, m = P[k * i:k * i + 10]
+            L = sympy.Matrix([[Lxx, Lxy, Lxz], [Lxy, Lyy, Lyz], [Lxz, Lyz, Lzz]])
+            l = sympy.Matrix([lx, ly, lz])
+            F = m * DV[i] + DW[i].cross(l) + W[i].cross(W[i].cross(l))
+            N = L * DW[i] + W[i].cross(L * W[i]) + l.cross(DV[i])
+            if i + 1 < n:
+                f = R[i + 1] * f
+                nn = R[i + 1] * nn
+            f = F + f
+            nn = N + nn + pstar[i].cross(f)
+            tau[i] = (nn.T * (R[i].T * z))[0]
+            if friction and k == 11:
+                tau[i] += P[k * i + 10] * dq[i]
+        return sympy.Matrix(tau)
+
+    def _dynamics(self):
+        rbt = self.rbtdef
+        n = self.dof
+        zero = [0] * n
+        self.invdyn_code = sympy.cse([self._rne(rbt.dq, rbt.ddq, True, True)])
+        self.g_code = sympy.cse([self._rne(zero, zero, True, False)])
+        self.c_code = sympy.cse([self._rne(rbt.dq, zero, False, False)])
+        M = sympy.zeros(n, n)
+        for j in range(n):
+            M[:, j] = self._rne(zero, [1 if i == j else 0 for i in range(n)], False, False)
+        for i in range(n):
+            for j in range(i):
+                M[i, j] = M[j, i]
+        self.M_code = sympy.cse([M])
+        P = rbt.dynparms()
+        if rbt.frictionmodel and 'viscous' in rbt.frictionmodel:
+            self.f_code = ([], [sympy.Matrix([P[11 * i + 10] * rbt.dq[i] for i in range(n)])])
+        else:
+            self.f_code = ([], [sympy.zeros(n, 1)])
+
+
+def robot_code_to_func(lang, code, outputname, funcname, rbtdef):
+    ''' Python function funcname(parms, q, dq, ddq) (only the arguments the code
+        uses) returning the list outputname, from cse code as made by RobotDynCode.
+    '''
+    if lang != 'python':
+        raise RuntimeError('hal_dh_model: Only python code is supported')
+    ivars, exprs = code
+    if len(exprs) == 1 and hasattr(exprs[0], 'shape'):
+        exprs = list(exprs[0])
+    groups = [('parms', rbtdef.dynparms()), ('q', rbtdef.q), ('dq', rbtdef.dq), ('ddq', rbtdef.ddq)]
+    used = set()
+    for s, e in ivars:
+        used |= sympy.sympify(e).free_symbols
+    for e in exprs:
+        used |= sympy.sympify(e).free_symbols
+    subs = {}
+    args = []
+    for name, symbols in groups:
+        if used & set(symbols):
+            args.append(name)
+        for i, s in enumerate(symbols):
+            subs[s] = sympy.Symbol('%s[%d]' % (name, i))
+    lines = ['def %s(%s):' % (funcname, ', '.join(args)), '#', '    %s = [0]*%d' % (outputname, len(exprs)), '#']
+    for s, e in ivars:
+        lines.append('    %s = %s' % (s, sympy.sstr(e.xreplace(subs))))
+    lines.append('#')
+    for k, e in enumerate(exprs):
+        lines.append('    %s[%d] = %s' % (outputname, k, sympy.sstr(sympy.sympify(e).xreplace(subs))))
+    lines.append('#')
+    lines.append('    return %s' % outputname)
+    return '\n'.join(lines)
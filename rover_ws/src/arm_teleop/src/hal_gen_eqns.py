@@ -31,11 +31,285 @@
 
 
 import sympy
-import sympybotics
 import math
+from sympy.printing.str import StrPrinter
+from sympy.printing.ccode import CCodePrinter
+try:
+    import sympybotics
+    from sympybotics import RobotDef, RobotDynCode
+    from sympybotics.robotcodegen import robot_code_to_func
+    q = sympybotics.robotdef.q
+except ImportError:
+    # The checked-in hal_arm_* files are generated with this plain sympy model
+    from hal_dh_model import RobotDef, RobotDynCode, robot_code_to_func, q
 
 pi = sympy.pi
-q = sympybotics.robotdef.q
+
+
+def indent(code, n=4):
+    ''' Indent generated code to sit inside the kinematics class. '''
+    return '\n'.join([' ' * n + line if line else line for line in code.split('\n')])
+
+
+def flatten(exprs):
+    ''' The expressions of a cse result, with matrices in row-major order. '''
+    flat = []
+    for e in exprs:
+        if hasattr(e, 'shape'):
+            flat.extend(list(e))
+        else:
+            flat.append(e)
+    return flat
+
+
+class NumPyPrinter(StrPrinter):
+    ''' Prints expressions as NumPy code: functions become ufuncs (np.sin, ...)
+        and rationals floats, so they apply elementwise to arrays of angles.
+    '''
+    def _print_Function(self, expr):
+        return 'np.' + StrPrinter._print_Function(self, expr)
+
+    def _print_Rational(self, expr):
+        return repr(float(expr))
+
+
+def batch_code_to_func(code, outputname, funcname, shape, rbtdef):
+    ''' Like robot_code_to_func for python, but for an (N, dof) array of joint
+        configurations q.  Each joint angle becomes a column q[:, i], so every
+        operation is one NumPy call over the whole batch; returns (N,) + shape.
+    '''
+    ivars, exprs = code
+    exprs = flatten(exprs)
+    columns = dict((qi, sympy.Symbol('q[:, %d]' % i)) for i, qi in enumerate(rbtdef.q))
+    printer = NumPyPrinter()
+    lines = ['def %s(q):' % funcname,
+             '#',
+             '    q = np.asarray(q, dtype=float).reshape(-1, %d)' % rbtdef.dof,
+             '    %s = np.empty((q.shape[0], %d))' % (outputname, len(exprs)),
+             '#']
+    for var, e in ivars:
+        lines.append('    %s = %s' % (var, printer.doprint(e.subs(columns))))
+    lines.append('#')
+    for k, e in enumerate(exprs):
+        lines.append('    %s[:, %d] = %s' % (outputname, k, printer.doprint(sympy.sympify(e).subs(columns))))
+    lines.append('#')
+    lines.append('    return %s.reshape(-1, %s)' % (outputname, ', '.join(str(n) for n in shape)))
+    return '\n'.join(lines)
+
+
+def output_elements(outputs, prefix=''):
+    ''' Index expressions for the elements of the outputs [(name, shape) ...],
+        in order, each output row-major.  prefix is prepended to each index.
+    '''
+    elements = []
+    for name, shape in outputs:
+        index = [0] * len(shape)
+        for k in range(reduce(lambda a, b: a * b, shape)):
+            elements.append('%s[%s%s]' % (name, prefix, ', '.join(str(i) for i in index)))
+            for d in reversed(range(len(shape))):
+                index[d] += 1
+                if index[d] < shape[d]:
+                    break
+                index[d] = 0
+    return elements
+
+
+def into_code_to_func(code, outputs, funcname, rbtdef):
+    ''' Like robot_code_to_func for python, but writes into caller supplied arrays
+        of the given [(name, shape) ...], so a call builds no lists or arrays.
+        The cse temporaries stay in local variables, the cheapest storage in Python.
+    '''
+    ivars, exprs = code
+    exprs = flatten(exprs)
+    joints = dict((qi, sympy.Symbol('q[%d]' % i)) for i, qi in enumerate(rbtdef.q))
+    printer = StrPrinter()
+    names = [name for name, shape in outputs]
+    lines = ['def %s(q, %s):' % (funcname, ', '.join(names)), '#']
+    for var, e in ivars:
+        lines.append('    %s = %s' % (var, printer.doprint(e.subs(joints))))
+    lines.append('#')
+    for element, e in zip(output_elements(outputs), exprs):
+        lines.append('    %s = %s' % (element, printer.doprint(sympy.sympify(e).subs(joints))))
+    lines.append('#')
+    lines.append('    return %s' % ', '.join(names))
+    return '\n'.join(lines)
+
+
+class UfuncEmitter():
+    ''' Emits expressions over a batch as a sequence of NumPy ufunc calls, each
+        writing its result into a row of a caller supplied scratch array or
+        straight into an output, so an evaluation allocates no arrays.  Rows are
+        reused once their value is dead, which keeps the scratch array small
+        enough to stay in cache.
+    '''
+    UFUNCS = {'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan', 'atan2': 'arctan2'}
+
+    def __init__(self, names):
+        self.names = dict(names)  # symbol -> operand, for joint angles and cse temporaries
+        self.lines = []
+        self.rows = 0
+        self.free = []
+
+    def new_row(self):
+        if self.free:
+            return self.free.pop()
+        self.rows += 1
+        return self.rows - 1
+
+    def operand(self, e):
+        ''' (operand, row) for e.  Expressions are computed into a temporary row,
+            which the caller hands back with release(row) once it is used.
+        '''
+        if e.is_Number:
+            return repr(float(e)), None
+        if e in self.names:
+            return self.names[e], None
+        row = self.new_row()
+        self.assign(e, 's%d' % row)
+        return 's%d' % row, row
+
+    def release(self, *rows):
+        self.free.extend([row for row in rows if row is not None])
+
+    def define(self, var, e):
+        ''' Compute cse temporary var = e into a row of its own; returns the row. '''
+        row = self.new_row()
+        self.assign(e, 's%d' % row)
+        self.names[var] = 's%d' % row
+        return row
+
+    def assign(self, e, target):
+        ''' Compute e into target.  An output is a strided view into the result, so
+            an expression needing several ufunc calls is accumulated in a row and
+            only the last call writes to the output.
+        '''
+        row = None
+        into = target
+        if not target.startswith('s'):
+            row = self.new_row()
+            into = 's%d' % row
+        if e.is_Number or e in self.names:
+            self.lines.append('np.copyto(%s, %s)' % (target, self.operand(e)[0]))
+        elif e.is_Mul and e.args[0] == -1:
+            rest = sympy.Mul(*e.args[1:])
+            if rest in self.names:
+                self.lines.append('np.negative(%s, %s)' % (self.names[rest], target))
+            else:
+                self.assign(rest, into)
+                self.lines.append('np.negative(%s, %s)' % (into, target))
+        elif e.is_Add or e.is_Mul:
+            ufunc = 'np.add' if e.is_Add else 'np.multiply'
+            operands = [self.operand(arg) for arg in e.args[:2]]
+            for k, arg in enumerate(e.args[1:]):
+                if k:
+                    operands = [(into, None), self.operand(arg)]
+                out = target if k == len(e.args) - 2 else into
+                self.lines.append('%s(%s, %s, %s)' % (ufunc, operands[0][0], operands[1][0], out))
+                self.release(*[r for a, r in operands])
+        elif e.is_Pow:
+            b, row_b = self.operand(e.base)
+            if e.exp == 2:
+                self.lines.append('np.multiply(%s, %s, %s)' % (b, b, target))
+            elif e.exp == -1:
+                self.lines.append('np.divide(1.0, %s, %s)' % (b, target))
+            elif e.exp == sympy.S.Half:
+                self.lines.append('np.sqrt(%s, %s)' % (b, target))
+            else:
+                self.lines.append('np.power(%s, %r, %s)' % (b, float(e.exp), target))
+            self.release(row_b)
+        else:
+            name = e.func.__name__
+            args = [self.operand(arg) for arg in e.args]
+            self.lines.append('np.%s(%s, %s)' % (self.UFUNCS.get(name, name),
+                                                 ', '.join(a for a, r in args), target))
+            self.release(*[r for a, r in args])
+        self.release(row)
+
+
+def batch_into_code_to_func(code, outputs, funcname, rbtdef):
+    ''' The batched counterpart of into_code_to_func: q is an (N, dof) array, each
+        output has shape (N,) + shape, and scratch is a caller supplied (rows, N)
+        array for the cse temporaries.  returns the code and the rows it needs.
+    '''
+    ivars, exprs = code
+    statements = list(ivars) + zip(output_elements(outputs, ':, '), flatten(exprs))
+    last_use = {}
+    for k, (target, e) in enumerate(statements):
+        for symbol in sympy.sympify(e).free_symbols:
+            last_use[symbol] = k
+    joints = ['q%d' % i for i in range(rbtdef.dof)]
+    emitter = UfuncEmitter(zip(rbtdef.q, joints))
+    rows = {}
+    for k, (target, e) in enumerate(statements):
+        if k < len(ivars):
+            rows[target] = emitter.define(target, e)
+        else:
+            emitter.assign(sympy.sympify(e), target)
+        emitter.release(*[rows[var] for var, e in ivars if last_use.get(var) == k])
+    names = [name for name, shape in outputs]
+    scratch = ['s%d' % row for row in range(emitter.rows)]
+    lines = ['def %s(q, %s, scratch):' % (funcname, ', '.join(names)),
+             '#',
+             '    %s, = q.T' % ', '.join(joints)]
+    if scratch:
+        lines.append('    %s, = scratch[:%d]' % (', '.join(scratch), len(scratch)))
+    lines.append('#')
+    lines.extend(['    ' + line for line in emitter.lines])
+    lines.append('#')
+    lines.append('    return %s' % ', '.join(names))
+    return '\n'.join(lines), emitter.rows
+
+
+class CPrinter(CCodePrinter):
+    ''' Prints expressions as C on doubles: rationals become double constants
+        rather than long double ones, and squares multiplications.
+    '''
+    def _print_Rational(self, expr):
+        return repr(float(expr))
+
+    def _print_Pow(self, expr):
+        if expr.exp == 2:
+            base = self._print(expr.base)
+            return '(%s*%s)' % (base, base)
+        return CCodePrinter._print_Pow(self, expr)
+
+
+def c_code_to_func(code, outputs, funcname, rbtdef):
+    ''' A C function void funcname(const double *q, double *name, ...) writing
+        the outputs [(name, shape) ...] as row-major arrays.
+    '''
+    ivars, exprs = code
+    exprs = flatten(exprs)
+    joints = dict((qi, sympy.Symbol('q[%d]' % i)) for i, qi in enumerate(rbtdef.q))
+    printer = CPrinter()
+    names = [name for name, shape in outputs]
+    lines = ['void %s(const double *q, %s)' % (funcname, ', '.join('double *' + name for name in names)),
+             '{']
+    for var, e in ivars:
+        lines.append('    const double %s = %s;' % (var, printer.doprint(e.subs(joints))))
+    elements = []
+    for name, shape in outputs:
+        elements.extend(['%s[%d]' % (name, k) for k in range(reduce(lambda a, b: a * b, shape))])
+    for element, e in zip(elements, exprs):
+        lines.append('    %s = %s;' % (element, printer.doprint(sympy.sympify(e).subs(joints))))
+    lines.append('}')
+    return '\n'.join(lines)
+
+
+def c_batch_func(funcname, outputs, rbtdef):
+    ''' A C function funcname_batch(q, name, ..., n) applying funcname to each of
+        n configurations, for q (n, dof) and each output (n,) + shape.
+    '''
+    names = [name for name, shape in outputs]
+    sizes = [reduce(lambda a, b: a * b, shape) for name, shape in outputs]
+    args = ', '.join('%s + %d*i' % (name, size) for name, size in zip(names, sizes))
+    return '\n'.join(['void %s_batch(const double *q, %s, long n)' %
+                      (funcname, ', '.join('double *' + name for name in names)),
+                      '{',
+                      '    long i;',
+                      '    for (i = 0; i < n; i++)',
+                      '        %s(q + %d*i, %s);' % (funcname, rbtdef.dof, args),
+                      '}'])
 
 
 # defining constants for the offset dh params from the body to the first joint
@@ -55,7 +329,7 @@ dh_params = [(pi/2,   0.10795,                     0.0889,    q+pi/2),
              (pi/2,   0.0,                         0.0,       q),
              (0,      0.0,                         0.2413,     q)]
 
-rbtdef = sympybotics.RobotDef('Hal', dh_params , 'standard')
+rbtdef = RobotDef('Hal', dh_params , 'standard')
 
 
 # defining which friction model to use
@@ -63,7 +337,7 @@ rbtdef.frictionmodel = {'viscous'} #'simple' # options are 'simple' and None, de
 
 # printing the definition of which variables are used as dynamic parameters (i.e. mass, center of mass, etc.)
 print(rbtdef.dynparms())
-rbt = sympybotics.RobotDynCode(rbtdef)
+rbt = RobotDynCode(rbtdef)
 
 arm = 'hal_arm'
 
@@ -72,33 +346,251 @@ f_kin = open('./'+arm+'_kinematics.py', 'w+')
 print >> f_kin, "from math import sin, cos"
 #print >> f_kin, "from offset_util import offset_and_reshape"
 print >> f_kin, "import numpy as np"
-print >> f_kin, "pi = np.pi\n\n\n"
+print >> f_kin, "pi = np.pi\n"
+print >> f_kin, "class "+arm+"_kinematics(): "
+print >> f_kin, "    def __init__(self):"
+print >> f_kin, "        pass\n"
 fk_dict = "FK = {"
 for i in range(len(rbt.geo.T)):
     joint_fk_code = sympy.cse(rbt.geo.T[i])
-    fk_string = sympybotics.robotcodegen.robot_code_to_func('python', joint_fk_code, 'pose', 'joint_fk' + str(i).zfill(2), rbtdef)
+    fk_string = robot_code_to_func('python', joint_fk_code, 'pose', 'joint_fk' + str(i).zfill(2), rbtdef)
     fk_list_string = fk_string.split('\n')
 #    fk_list_string.insert(-1, '    pose = offset_and_reshape(pose,'+str(x_offset)+','
 #                           +str(y_offset)+','
 #                           +str(z_offset)+')')
+    fk_list_string.insert(-1, '    pose = np.array(pose).reshape(4,4)')
     fk_final = "\n".join(fk_list_string)
-    print >> f_kin, fk_final + '\n\n\n'
+    print >> f_kin, indent(fk_final) + '\n\n\n'
     fk_dict = fk_dict+str(i)+":joint_fk"+str(i).zfill(2)+", "
 
-print >> f_kin, fk_dict+"}\n\n\n"
+print >> f_kin, indent(fk_dict+"}\n\n\n")
 
 jac_dict = "J = {"
 for i in xrange(len(rbt.kin.J)):
     joint_jac_code = sympy.cse(rbt.kin.J[i])
-    jac_string = sympybotics.robotcodegen.robot_code_to_func('python', joint_jac_code, 'jacobian', 'jacobian' + str(i).zfill(2), rbtdef)
+    jac_string = robot_code_to_func('python', joint_jac_code, 'jacobian', 'jacobian' + str(i).zfill(2), rbtdef)
 
     jac_list_string = jac_string.split('\n')
     jac_list_string.insert(-1, '    jacobian = np.array(jacobian).reshape(6,'+str(rbt.dof)+')')
     jac_final = "\n".join(jac_list_string)
-    print >> f_kin, jac_final + '\n\n\n'
+    print >> f_kin, indent(jac_final) + '\n\n\n'
     jac_dict = jac_dict + str(i)+":jacobian"+str(i).zfill(2)+", "
 
-print >> f_kin, jac_dict+"}"
+print >> f_kin, indent(jac_dict+"}\n\n\n")
+
+# Batched forward kinematics: (N, dof) joint angles -> (N, 4, 4) poses
+fk_batch_dict = "FK_batch = {"
+for i in range(len(rbt.geo.T)):
+    joint_fk_code = sympy.cse(rbt.geo.T[i])
+    fk_string = batch_code_to_func(joint_fk_code, 'pose', 'joint_fk' + str(i).zfill(2) + '_batch', (4, 4), rbtdef)
+    print >> f_kin, indent(fk_string) + '\n\n\n'
+    fk_batch_dict = fk_batch_dict+str(i)+":joint_fk"+str(i).zfill(2)+"_batch, "
+
+print >> f_kin, indent(fk_batch_dict+"}\n\n\n")
+
+# Fused kinematics: every link pose and the end effector Jacobian from one cse
+# pass, so the trig terms and partial products they share are computed once
+n_fk = 16*len(rbt.geo.T)
+fused_exprs = flatten(rbt.geo.T) + flatten([rbt.kin.J[-1]])
+fused_code = sympy.cse(fused_exprs)
+fused_string = robot_code_to_func('python', fused_code, 'out', 'fk_and_jacobian', rbtdef)
+fused_list_string = fused_string.split('\n')
+fused_list_string[-1:] = ['    poses = np.array(out[:'+str(n_fk)+']).reshape('+str(len(rbt.geo.T))+',4,4)',
+                          '    jacobian = np.array(out['+str(n_fk)+':]).reshape(6,'+str(rbt.dof)+')',
+                          '    return poses, jacobian']
+fused_list_string.insert(0, '@staticmethod')
+print >> f_kin, indent("\n".join(fused_list_string)) + '\n\n\n'
+
+# In-place kernels: results are written into caller supplied arrays, so the
+# IK loop can reuse the same buffers on every iteration
+fk_into_dict = "FK_into = {"
+jac_into_dict = "J_into = {"
+for i in range(len(rbt.geo.T)):
+    fk_string = into_code_to_func(sympy.cse(rbt.geo.T[i]), [('pose', (4, 4))],
+                                  'joint_fk' + str(i).zfill(2) + '_into', rbtdef)
+    print >> f_kin, indent(fk_string) + '\n\n\n'
+    fk_into_dict = fk_into_dict+str(i)+":joint_fk"+str(i).zfill(2)+"_into, "
+    jac_string = into_code_to_func(sympy.cse(rbt.kin.J[i]), [('jacobian', (6, rbt.dof))],
+                                   'jacobian' + str(i).zfill(2) + '_into', rbtdef)
+    print >> f_kin, indent(jac_string) + '\n\n\n'
+    jac_into_dict = jac_into_dict+str(i)+":jacobian"+str(i).zfill(2)+"_into, "
+
+print >> f_kin, indent(fk_into_dict+"}")
+print >> f_kin, indent(jac_into_dict+"}\n\n\n")
+
+fused_string = into_code_to_func(fused_code, [('poses', (len(rbt.geo.T), 4, 4)), ('jacobian', (6, rbt.dof))],
+                                 'fk_and_jacobian_into', rbtdef)
+print >> f_kin, indent('@staticmethod\n' + fused_string) + '\n\n\n'
+
+# Batched in-place kernels: q is (N, dof), pose (N, 4, 4) and scratch at least
+# (FK_batch_scratch[i], N); evaluating them allocates no arrays
+fk_batch_into_dict = "FK_batch_into = {"
+fk_batch_scratch_dict = "FK_batch_scratch = {"
+for i in range(len(rbt.geo.T)):
+    fk_string, rows = batch_into_code_to_func(sympy.cse(rbt.geo.T[i]), [('pose', (4, 4))],
+                                              'joint_fk' + str(i).zfill(2) + '_batch_into', rbtdef)
+    print >> f_kin, indent(fk_string) + '\n\n\n'
+    fk_batch_into_dict = fk_batch_into_dict+str(i)+":joint_fk"+str(i).zfill(2)+"_batch_into, "
+    fk_batch_scratch_dict = fk_batch_scratch_dict+str(i)+":"+str(rows)+", "
+
+print >> f_kin, indent(fk_batch_into_dict+"}")
+print >> f_kin, indent(fk_batch_scratch_dict+"}")
 
 f_kin.close()
 
+
+
+# Dynamics: RobotDynCode has already built cse code for the inverse dynamics
+# and its terms, so the teleop nodes can predict joint torques (gravity
+# compensation, torque limits) rather than wait for read_load.  Each function
+# takes parms, the dynamic parameters in the order of rbtdef.dynparms().
+f_dyn = open('./'+arm+'_dynamics.py', 'w+')
+print >> f_dyn, "from math import sin, cos"
+print >> f_dyn, "import numpy as np"
+print >> f_dyn, "pi = np.pi\n"
+print >> f_dyn, "class "+arm+"_dynamics(): "
+print >> f_dyn, "    def __init__(self):"
+print >> f_dyn, "        pass\n"
+dynparms = [str(p) for p in rbtdef.dynparms()]
+per_link = len(dynparms) // rbt.dof
+print >> f_dyn, indent("# The parms argument, per link: inertia tensor L and first moment of mass l")
+print >> f_dyn, indent("# (mass times centre of mass) about the link frame, mass m, then the")
+print >> f_dyn, indent("# coefficients of the friction model")
+print >> f_dyn, indent("dynparms = [" + (",\n" + " " * 12).join(
+    ", ".join(repr(p) for p in dynparms[i:i + per_link]) for i in range(0, len(dynparms), per_link)) + "]\n\n\n")
+dyn_terms = [(rbt.invdyn_code, 'tau', 'invdyn', (rbt.dof,)),          # tau for q, dq, ddq
+             (rbt.g_code, 'tau', 'gravity', (rbt.dof,)),              # gravity torques
+             (rbt.M_code, 'M', 'mass_matrix', (rbt.dof, rbt.dof)),    # tau = M ddq + ...
+             (rbt.c_code, 'tau', 'coriolis', (rbt.dof,)),             # Coriolis and centripetal torques
+             (rbt.f_code, 'tau', 'friction', (rbt.dof,))]             # friction torques
+for code, outputname, funcname, shape in dyn_terms:
+    dyn_string = robot_code_to_func('python', code, outputname, funcname, rbtdef)
+    dyn_list_string = dyn_string.split('\n')
+    dyn_list_string.insert(-1, '    '+outputname+' = np.array('+outputname+').reshape('+', '.join(str(n) for n in shape)+')')
+    dyn_list_string.insert(0, '@staticmethod')
+    print >> f_dyn, indent("\n".join(dyn_list_string)) + '\n\n\n'
+
+f_dyn.close()
+
+# Native kernels: the same cse code as C, with a ctypes wrapper module that has
+# the interface of the Python one.  catkin_make builds the library (see
+# CMakeLists.txt); to build it by hand, next to the wrapper:
+#     gcc -O2 -shared -fPIC -o libhal_arm_kinematics.so hal_arm_kinematics.c -lm
+f_c = open('./'+arm+'_kinematics.c', 'w+')
+print >> f_c, "/* Generated by hal_gen_eqns.py; loaded by "+arm+"_kinematics_c.py */"
+print >> f_c, "#include <math.h>\n"
+fk_c_dict = "FK = {"
+jac_c_dict = "J = {"
+fk_batch_c_dict = "FK_batch = {"
+jac_batch_c_dict = "J_batch = {"
+for i in range(len(rbt.geo.T)):
+    name = 'joint_fk' + str(i).zfill(2)
+    print >> f_c, c_code_to_func(sympy.cse(rbt.geo.T[i]), [('pose', (4, 4))], name, rbtdef) + '\n'
+    print >> f_c, c_batch_func(name, [('pose', (4, 4))], rbtdef) + '\n'
+    fk_c_dict = fk_c_dict+str(i)+":_kernel('"+name+"', [(4, 4)]), "
+    fk_batch_c_dict = fk_batch_c_dict+str(i)+":_batch_kernel('"+name+"', [(4, 4)]), "
+    name = 'jacobian' + str(i).zfill(2)
+    print >> f_c, c_code_to_func(sympy.cse(rbt.kin.J[i]), [('jacobian', (6, rbt.dof))], name, rbtdef) + '\n'
+    print >> f_c, c_batch_func(name, [('jacobian', (6, rbt.dof))], rbtdef) + '\n'
+    jac_c_dict = jac_c_dict+str(i)+":_kernel('"+name+"', [(6, "+str(rbt.dof)+")]), "
+    jac_batch_c_dict = jac_batch_c_dict+str(i)+":_batch_kernel('"+name+"', [(6, "+str(rbt.dof)+")]), "
+
+fused_outputs = [('poses', (len(rbt.geo.T), 4, 4)), ('jacobian', (6, rbt.dof))]
+print >> f_c, c_code_to_func(fused_code, fused_outputs, 'fk_and_jacobian', rbtdef) + '\n'
+print >> f_c, c_batch_func('fk_and_jacobian', fused_outputs, rbtdef)
+f_c.close()
+
+fused_shapes = str([shape for name, shape in fused_outputs])
+f_wrap = open('./'+arm+'_kinematics_c.py', 'w+')
+print >> f_wrap, '''# Generated by hal_gen_eqns.py: the kinematics of %(arm)s_kinematics.py, evaluated
+# by the compiled kernels of %(arm)s_kinematics.c.  Build lib%(arm)s_kinematics.so
+# with catkin_make, or next to this file with
+#     gcc -O2 -shared -fPIC -o lib%(arm)s_kinematics.so %(arm)s_kinematics.c -lm
+import os
+import ctypes
+import numpy as np
+pi = np.pi
+
+_lib = None
+for _path in [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lib%(arm)s_kinematics.so'),
+              'lib%(arm)s_kinematics.so']:  # catkin's devel/lib is on LD_LIBRARY_PATH
+    try:
+        _lib = ctypes.CDLL(_path)
+        break
+    except OSError:
+        pass
+if _lib is None:
+    raise ImportError('%(arm)s_kinematics_c: lib%(arm)s_kinematics.so not found')
+
+# Arrays are passed as pointers to their first element.  This is several times
+# cheaper per call than numpy.ctypeslib.ndpointer, which matters next to kernels
+# that take well under a microsecond, so the outputs are checked here instead.
+_joints = ctypes.c_double * %(dof)d
+_ref = ctypes.byref
+_double = ctypes.c_double.from_buffer
+
+
+def _check(name, outs, shapes):
+    for out, shape in zip(outs, shapes):
+        if out.dtype.char != 'd' or out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError('%(arm)s_kinematics_c: %%s needs C-contiguous float64 outputs of shapes %%s'
+                             %% (name, shapes))
+
+
+def _kernel(name, shapes):
+    \'\'\' The C kernel name as f(q, *outs): outs are filled in place, or allocated
+        and returned if omitted.
+    \'\'\'
+    c_func = getattr(_lib, name)
+    c_func.restype = None
+    def kernel(q, *outs):
+        q = _joints.from_buffer_copy(np.ascontiguousarray(q, dtype=float))
+        if outs:
+            _check(name, outs, shapes)
+        else:
+            outs = [np.empty(shape) for shape in shapes]
+        c_func(q, *[_ref(_double(out)) for out in outs])
+        return outs[0] if len(outs) == 1 else tuple(outs)
+    kernel.__name__ = name
+    return kernel
+
+
+def _batch_kernel(name, shapes):
+    \'\'\' The C kernel name_batch as f(q, *outs) for an (N, %(dof)d) array q, with outs
+        of shape (N,) + shape.  Arguments after the outputs (the scratch array the
+        NumPy kernels take) are ignored.
+    \'\'\'
+    c_func = getattr(_lib, name + '_batch')
+    c_func.restype = None
+    def kernel(q, *outs):
+        q = np.ascontiguousarray(q, dtype=float).reshape(-1, %(dof)d)
+        n = q.shape[0]
+        if outs:
+            outs = outs[:len(shapes)]
+            _check(name + '_batch', outs, [(n,) + shape for shape in shapes])
+        else:
+            outs = [np.empty((n,) + shape) for shape in shapes]
+        c_func(*([ctypes.c_void_p(a.ctypes.data) for a in [q] + list(outs)] + [ctypes.c_long(n)]))
+        return outs[0] if len(outs) == 1 else tuple(outs)
+    kernel.__name__ = name + '_batch'
+    return kernel
+
+
+class %(arm)s_kinematics():
+    def __init__(self):
+        pass
+''' % {'arm': arm, 'dof': rbt.dof}
+print >> f_wrap, indent(fk_c_dict+"}")
+print >> f_wrap, indent(jac_c_dict+"}")
+print >> f_wrap, indent(fk_batch_c_dict+"}")
+print >> f_wrap, indent(jac_batch_c_dict+"}")
+print >> f_wrap, indent("fk_and_jacobian = staticmethod(_kernel('fk_and_jacobian', "+fused_shapes+"))")
+print >> f_wrap, indent("fk_and_jacobian_batch = staticmethod(_batch_kernel('fk_and_jacobian', "+fused_shapes+"))\n")
+print >> f_wrap, indent("# The kernels write into their outputs when given them, so the in-place")
+print >> f_wrap, indent("# interface of "+arm+"_kinematics.py is the same functions")
+print >> f_wrap, indent("FK_into = FK")
+print >> f_wrap, indent("J_into = J")
+print >> f_wrap, indent("FK_batch_into = FK_batch")
+print >> f_wrap, indent("FK_batch_scratch = {"+"".join(str(i)+":0, " for i in range(len(rbt.geo.T)))+"}")
+print >> f_wrap, indent("fk_and_jacobian_into = fk_and_jacobian")
+f_wrap.close()
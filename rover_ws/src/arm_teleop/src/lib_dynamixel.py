@@ -34,18 +34,335 @@
 
 import serial
 import struct
+import contextlib
 import sys
+import os
+import json
+import mmap
 import optparse
 import math
+import time
+import threading
+import Queue
+import collections
+import bisect
 import numpy as np
 
 
+class Dynamixel_Packet_Parser():
+
+    ''' Incremental decoder for Dynamixel status packets.
+        Raw bytes from the serial port are appended with feed(), and complete
+        packets are returned by next_packet() as (id, err, params) tuples.
+        A single bytearray is reused for the receive buffer.
+        Bytes that cannot start a packet (line noise, the tail of a corrupt
+        packet) are skipped up to the next 0xFF 0xFF header, and counted.
+    '''
+
+    def __init__(self):
+        self.buf = bytearray()
+        self.length = None  # Length field of the packet being decoded, once known
+        self.discarded_bytes = 0
+        self.checksum_errors = 0
+
+    def reset(self):
+        ''' Discard any buffered bytes and partially decoded packet.
+        '''
+        del self.buf[:]
+        self.length = None
+
+    def feed(self, data):
+        ''' Append raw bytes read from the serial port.
+        '''
+        self.buf.extend(data)
+
+    def bytes_needed(self):
+        ''' Minimum number of additional bytes required to complete the next packet.
+            Never more than will actually arrive, so it is safe to block reading it.
+        '''
+        if self.length is None:
+            # Smallest status packet: 0xFF 0xFF id len err chksum
+            return max(6 - len(self.buf), 1)
+        return max(self.length + 4 - len(self.buf), 1)
+
+    def next_packet(self):
+        ''' Decode the next complete packet in the buffer.
+            Returns (id, err, params), or None if more bytes are needed.
+        '''
+        buf = self.buf
+        while self.length is None:
+            start = buf.find('\xff\xff')
+            if start < 0:
+                start = len(buf) - 1 if buf[-1:] == '\xff' else len(buf)
+            if start > 0:
+                del buf[:start]
+                self.discarded_bytes += start
+            if len(buf) < 4:
+                return None
+            if buf[2] == 0xFF or buf[3] < 2:
+                # Not a real header (ids stop at 0xFE, length is at least 2); look further on
+                del buf[:1]
+                self.discarded_bytes += 1
+                continue
+            self.length = buf[3]
+        end = self.length + 4
+        if len(buf) < end:
+            return None
+        chksum = (~sum(buf[2:end - 1])) % 256
+        if chksum != buf[end - 1]:
+            # Drop only the header, in case a corrupt length swallowed the next packet
+            del buf[:2]
+            self.length = None
+            self.discarded_bytes += 2
+            self.checksum_errors += 1
+            raise RuntimeError('lib_dynamixel: Error in Received Checksum')
+        packet = (buf[2], buf[4], list(buf[5:end - 1]))
+        del buf[:end]
+        self.length = None
+        return packet
+
+
+class Control_Table_Mirror():
+
+    ''' In-memory copy of the control table of one servo, indexed by address.
+        EEPROM values (below address 0x18) never change at runtime, so they are
+        served from memory until a write invalidates them.  RAM values are
+        only served to reads that explicitly accept data up to max_age seconds old.
+    '''
+
+    EEPROM_END = 0x18
+
+    def __init__(self, size):
+        self.data = bytearray(size)
+        self.stamps = [None] * size  # Time each address was last read; None if dirty.
+        self.populated = False
+
+    def update(self, address, data, stamp=None):
+        ''' Store data read from the servo starting at address.
+        '''
+        if stamp is None:
+            stamp = time.time()
+        end = min(address + len(data), len(self.data))
+        for addr in range(address, end):
+            self.data[addr] = data[addr - address]
+            self.stamps[addr] = stamp
+
+    def invalidate(self, address=0, nBytes=None):
+        ''' Mark nBytes from address as dirty (the whole table by default).
+        '''
+        if nBytes is None:
+            nBytes = len(self.data)
+        for addr in range(address, min(address + nBytes, len(self.data))):
+            self.stamps[addr] = None
+
+    def get(self, address, nBytes=1, max_age=None):
+        ''' Returns [n1,n2 ...] if every byte is cached and fresh enough, otherwise None.
+        '''
+        end = address + nBytes
+        if end > len(self.data):
+            return None
+        if end <= self.EEPROM_END:
+            oldest = 0.
+        elif max_age is None:
+            return None
+        else:
+            oldest = time.time() - max_age
+        for stamp in self.stamps[address:end]:
+            if stamp is None or stamp < oldest:
+                return None
+        return list(self.data[address:end])
+
+
+def _usb_latency(dev):
+    ''' FTDI latency timer of a Linux USB serial device (seconds), or None if unknown.
+        Short packets can sit in the adaptor for this long before reaching the host.
+    '''
+    try:
+        name = os.path.basename(os.path.realpath(dev))
+        with open('/sys/bus/usb-serial/devices/%s/latency_timer' % name) as f:
+            return int(f.read()) / 1000.
+    except (IOError, OSError, ValueError, AttributeError, TypeError):
+        return None
+
+
+INSTRUCTION_NAMES = {0x01: 'PING', 0x02: 'READ', 0x03: 'WRITE', 0x06: 'RESET',
+                     0x83: 'SYNC_WRITE', 0x92: 'BULK_READ'}
+
+# One instruction and its status packet(s).  Times in seconds; wire_time is the
+# time the bytes take at the port baudrate, wait_time from the end of the write
+# until the last status packet was received.  err is the servo error byte, or -1
+# if a status packet was missing or garbled.
+Bus_Transaction = collections.namedtuple(
+    'Bus_Transaction', 'stamp instruction id tx_bytes rx_bytes wire_time wait_time retries err')
+
+
+class Bus_Statistics():
+
+    ''' Ring buffer of recent Bus_Transactions and running totals per instruction
+        and per servo id, including a histogram of transaction times
+        (wait_time, plus the time to write).  Enable with
+        USB2Dynamixel_Device.enable_statistics().
+    '''
+
+    # Upper edges of the latency histogram bins (seconds); the last bin is open
+    LATENCY_BINS = [0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1]
+
+    def __init__(self, size=1000):
+        self.transactions = collections.deque(maxlen=size)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.transactions.clear()
+            self.by_instruction = {}
+            self.by_id = {}
+
+    def _totals(self):
+        return {'count': 0, 'errors': 0, 'retries': 0, 'tx_bytes': 0, 'rx_bytes': 0,
+                'wire_time': 0., 'wait_time': 0., 'total_time': 0.,
+                'histogram': [0] * (len(self.LATENCY_BINS) + 1)}
+
+    def record(self, transaction, elapsed):
+        ''' Add a Bus_Transaction that took elapsed seconds in total.
+        '''
+        name = INSTRUCTION_NAMES.get(transaction.instruction, hex(transaction.instruction))
+        with self.lock:
+            self.transactions.append(transaction)
+            for key, table in [(name, self.by_instruction), (transaction.id, self.by_id)]:
+                totals = table.get(key)
+                if totals is None:
+                    totals = table[key] = self._totals()
+                totals['count'] += 1
+                totals['errors'] += int(transaction.err != 0)
+                totals['retries'] += transaction.retries
+                totals['tx_bytes'] += transaction.tx_bytes
+                totals['rx_bytes'] += transaction.rx_bytes
+                totals['wire_time'] += transaction.wire_time
+                totals['wait_time'] += transaction.wait_time
+                totals['total_time'] += elapsed
+                totals['histogram'][bisect.bisect_left(self.LATENCY_BINS, elapsed)] += 1
+
+    def recent(self, n=None):
+        ''' The last n transactions (all that are buffered by default), oldest first.
+        '''
+        with self.lock:
+            transactions = list(self.transactions)
+        return transactions if n is None else transactions[-n:]
+
+    def summary(self, key='instruction'):
+        ''' Totals keyed by instruction name (key='instruction') or servo id (key='id').
+        '''
+        table = self.by_instruction if key == 'instruction' else self.by_id
+        with self.lock:
+            return dict((k, dict(v, histogram=list(v['histogram']))) for k, v in table.items())
+
+
+class Bus_Arbiter():
+
+    ''' Grants the bus to one thread at a time, for one transaction at a time.
+        Waiting threads are served by priority (COMMAND before NORMAL before
+        TELEMETRY), then earliest deadline, then first come first served.  A
+        waiter moves up one priority level for every aging seconds it has waited,
+        so a steady stream of commands cannot starve telemetry reads.  A request
+        still waiting at its deadline (a time.time() value) is dropped, with a
+        RuntimeError, rather than sent late.  Reentrant: a thread holding the bus
+        may acquire it again.
+            with dyn.arbiter.claim(Bus_Arbiter.COMMAND, deadline=time.time() + 0.01):
+                ...
+        The plain context manager (with dyn.arbiter:) claims at NORMAL priority.
+    '''
+
+    COMMAND = 0
+    NORMAL = 1
+    TELEMETRY = 2
+
+    def __init__(self, aging=0.1):
+        self.aging = aging
+        self._cond = threading.Condition(threading.Lock())
+        self._owner = None
+        self._depth = 0
+        self._waiters = []  # [priority, deadline, ticket, thread, since] for each waiting thread
+        self._tickets = 0
+        self.counts = {'grants': 0, 'contended': 0, 'missed_deadlines': 0}
+
+    def _next_waiter(self, now):
+        def key(waiter):
+            priority, deadline, ticket, thread, since = waiter
+            if self.aging:
+                priority -= int((now - since) / self.aging)
+            return (priority, deadline if deadline is not None else float('inf'), ticket)
+        return min(self._waiters, key=key)
+
+    def acquire(self, priority=NORMAL, deadline=None):
+        me = threading.current_thread()
+        with self._cond:
+            if self._owner is me:
+                self._depth += 1
+                return True
+            self.counts['grants'] += 1
+            if self._owner is None and not self._waiters:
+                self._owner = me
+                self._depth = 1
+                return True
+            self.counts['contended'] += 1
+            self._tickets += 1
+            waiter = [priority, deadline, self._tickets, me, time.time()]
+            self._waiters.append(waiter)
+            while self._owner is not me:
+                if deadline is None:
+                    self._cond.wait()
+                    continue
+                remaining = deadline - time.time()
+                if remaining <= 0.:
+                    self._waiters.remove(waiter)
+                    self.counts['grants'] -= 1
+                    self.counts['missed_deadlines'] += 1
+                    raise RuntimeError('lib_dynamixel: Bus request missed its deadline')
+                self._cond.wait(remaining)
+            self._depth = 1
+            return True
+
+    def release(self):
+        with self._cond:
+            if self._owner is not threading.current_thread():
+                raise RuntimeError('lib_dynamixel: Bus released by a thread not holding it')
+            self._depth -= 1
+            if self._depth > 0:
+                return
+            if self._waiters:
+                # Hand the bus straight to the next waiter, so no other thread can barge in
+                waiter = self._next_waiter(time.time())
+                self._waiters.remove(waiter)
+                self._owner = waiter[3]
+                self._cond.notify_all()
+            else:
+                self._owner = None
+
+    @contextlib.contextmanager
+    def claim(self, priority=NORMAL, deadline=None):
+        self.acquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
 class USB2Dynamixel_Device():
 
     ''' Class that manages serial port contention between servos on same bus
     '''
 
-    def __init__(self, dev_name='/dev/ttyUSB0', baudrate=57600):
+    def __init__(self, dev_name='/dev/ttyUSB0', baudrate=57600, serial_dev=None):
+        ''' serial_dev: an already open serial-port-like object to use instead of
+            opening dev_name (e.g. a dynamixel_sim.Simulated_Bus).
+        '''
         try:
             # stores the serial port as 0-based integer for Windows
             self.dev_name = string.atoi(dev_name)
@@ -53,7 +370,71 @@ class USB2Dynamixel_Device():
             # stores it as a /dev-mapped string for Linux / Mac
             self.dev_name = dev_name
 
-        self.servo_dev = self._open_serial(baudrate)
+        if serial_dev is None:
+            serial_dev = self._open_serial(baudrate)
+        self.servo_dev = serial_dev
+        self._parser = Dynamixel_Packet_Parser()
+        # Held for the whole of each transaction (instruction + status packets)
+        self.arbiter = Bus_Arbiter()
+        self.stats = None
+        self._hooks = []
+        # Attempts after the first for instructions that are safe to repeat (PING, READ)
+        self.max_retries = 2
+        self.recovery = {'retries': 0, 'failures': 0, 'timeouts': 0, 'stale_packets': 0}
+        # Reply deadlines: the expected reply time from the wire time and the servo's
+        # return delay, plus a margin learned from measured replies (SRTT + 4 RTTVAR,
+        # as for TCP retransmission timers) for USB latency and scheduling.
+        self.return_delays = {}  # id -> seconds, where known
+        self.max_timeout = 1.0
+        self.min_margin = 0.001
+        usb_latency = _usb_latency(self.dev_name)
+        self.initial_margin = 0.05 if usb_latency is None else usb_latency + 0.002
+        self._srtt = None
+        self._rttvar = None
+        self._timeout = None  # Last timeout set on the port
+        self._tx_idle_at = 0.  # When everything written so far will have been sent
+        self._unanswered = None  # (id, when its status packet is due) for a reply nobody waits for
+        # Servos not at the default status return level of 2.  Instructions they will
+        # not answer are sent without waiting, and, since that hides their error flags,
+        # a servo not heard from for error_check_period seconds is pinged after a write.
+        self.status_return_levels = {}
+        self.error_check_period = 1.0
+        self._last_status = {}  # id -> time of the last status packet from it
+
+    def _expected_reply_time(self, id, tx_bytes, rx_bytes):
+        ''' Time for tx_bytes out and rx_bytes back at the port baudrate, plus
+            the return delay of servo id (the 508 us maximum if it is unknown),
+            plus whatever earlier unacknowledged writes still have to send.
+        '''
+        wire_time = (tx_bytes + rx_bytes) * 10. / self.servo_dev.baudrate
+        backlog = max(0., self._tx_idle_at - time.time())
+        return wire_time + self.return_delays.get(id, 0.000508) + backlog
+
+    def reply_margin(self):
+        ''' Time allowed beyond the expected reply time before giving up on a reply.
+        '''
+        if self._srtt is None:
+            return self.initial_margin
+        return max(self.min_margin, self._srtt + 4 * self._rttvar)
+
+    def _set_reply_timeout(self, expected):
+        timeout = min(self.max_timeout, expected + self.reply_margin())
+        # Setting the timeout reconfigures the port, so only change it in 0.5 ms steps
+        timeout = math.ceil(timeout / 0.0005) * 0.0005
+        if timeout != self._timeout:
+            self.servo_dev.setTimeout(timeout)
+            self._timeout = timeout
+
+    def _learn_reply_time(self, expected, measured):
+        ''' Update the margin estimate from a reply that took measured seconds.
+        '''
+        overhead = max(measured - expected, 0.)
+        if self._srtt is None:
+            self._srtt = overhead
+            self._rttvar = overhead / 2
+        else:
+            self._rttvar += (abs(overhead - self._srtt) - self._rttvar) / 4
+            self._srtt += (overhead - self._srtt) / 8
 
     def _open_serial(self, baudrate):
         servo_dev = None
@@ -77,14 +458,33 @@ class USB2Dynamixel_Device():
         return servo_dev
 
     def _write_serial(self, msg):
+        ''' Writes msg to the port; returns the time it started going out.
+        '''
+        if self._unanswered is not None:
+            id, due = self._unanswered
+            self._unanswered = None
+            if time.time() < due + self.reply_margin():
+                # A servo is still answering an instruction sent without waiting; let it
+                # finish rather than talk over it, and drop its status packet
+                self._set_reply_timeout(max(0., due - time.time()))
+                try:
+                    self._receive_any([id])
+                except RuntimeError:
+                    pass
         self.servo_dev.flushInput()
+        self._parser.reset()
+        start = time.time()
         self.servo_dev.write(msg)
+        # write() returns once the bytes are buffered; track when they will be on the wire
+        now = time.time()
+        self._tx_idle_at = max(now, self._tx_idle_at) + len(msg) * 10. / self.servo_dev.baudrate
+        return start
 
     def _send_serial(self, msg):
-        """ sends the command to the servo
+        """ sends the command to the servo; returns the time it started going out
         """
         out = struct.pack('%dB' % len(msg), *msg)
-        self._write_serial(out)
+        return self._write_serial(out)
 
     def _read_serial(self, nBytes=1):
         ''' Reads data from the servo
@@ -93,49 +493,188 @@ class USB2Dynamixel_Device():
         return self.servo_dev.read(nBytes)
 
     def _receive_reply(self, id):
-        ''' Reads the status packet returned by the servo
-        '''
-        start = self._read_serial(2)
-        if start != '\xff\xff':
-            raise RuntimeError('lib_dynamixel: Failed to receive start bytes\n')
-        servo_id = ord(self._read_serial(1))
-        if servo_id != id:
-            raise RuntimeError('lib_dynamixel: Incorrect servo ID received: %d\n' %servo_id)
-        data_len = ord(self._read_serial(1))
-        err = ord(self._read_serial(1))
-        raw_data = self._read_serial(data_len - 2)
-        data = [ord(d) for d in raw_data]
-        chksum = servo_id + data_len + err + sum(data)
-        chksum = (~chksum) % 256
-        checksum = ord(self._read_serial(1))
-        if checksum != chksum:
-            raise RuntimeError('lib_dynamixel: Error in Received Checksum')
-        return id, data, err
+        ''' Reads the status packet returned by the servo.
+            Pulls everything already waiting on the port in one read, so a
+            status packet normally costs one or two reads rather than one per field.
+            Packets from other servos (late replies to earlier instructions) are skipped.
+        '''
+        return self._receive_any([id])
+
+    def _receive_any(self, ids):
+        ''' Reads the next status packet from any of the servos in ids, skipping others.
+            returns id, data, err
+        '''
+        parser = self._parser
+        while True:
+            packet = parser.next_packet()
+            while packet is None:
+                nBytes = max(parser.bytes_needed(), self.servo_dev.inWaiting())
+                data = self.servo_dev.read(nBytes)
+                parser.feed(data)
+                packet = parser.next_packet()
+                if packet is None and len(data) < nBytes:  # serial read timed out
+                    self.recovery['timeouts'] += 1
+                    if len(parser.buf) == 0:
+                        raise RuntimeError('lib_dynamixel: Failed to receive start bytes\n')
+                    parser.reset()
+                    raise RuntimeError('lib_dynamixel: Timed out receiving status packet\n')
+            servo_id, err, data = packet
+            if servo_id in ids:
+                self._last_status[servo_id] = time.time()
+                return servo_id, data, err
+            self.recovery['stale_packets'] += 1
+            if self._rttvar is not None:
+                # A reply that missed its deadline; allow more time from now on
+                self._rttvar = min(2 * self._rttvar + self.min_margin, self.max_timeout)
+
+    def recovery_counts(self):
+        ''' Counts of recovered and unrecovered communication faults since the port was opened:
+            retries - instructions re-sent after a failed reply
+            failures - instructions that failed after all retries
+            timeouts - status packets that did not arrive in time
+            stale_packets - status packets from the wrong servo, skipped
+            checksum_errors - status packets with a bad checksum
+            discarded_bytes - bytes skipped to find the next packet header
+        '''
+        counts = dict(self.recovery)
+        counts['checksum_errors'] = self._parser.checksum_errors
+        counts['discarded_bytes'] = self._parser.discarded_bytes
+        return counts
 
     def __calc_checksum(self, msg):
         chksum = sum(msg)
         return (~chksum) % 256
 
-    def _send_instruction(self, instruction, id, status_return=True):
-        ''' Fills out packet metadata, manages mutex, sends packet, and handles response.
+    def _make_packet(self, instruction, id):
+        ''' Fills out packet metadata (header, id, length and checksum) for an instruction.
         '''
         # instruction includes the command (1 byte + parameters. length = parameters+2)
         msg = [id, len(instruction) + 1] + instruction
         chksum = self.__calc_checksum( msg )
-        msg = [0xff, 0xff] + msg + [chksum]
-        try:
-            self._send_serial(msg)
+        return [0xff, 0xff] + msg + [chksum]
+
+    def enable_statistics(self, size=1000):
+        ''' Start recording every transaction into a Bus_Statistics with a ring buffer
+            of size entries, and return it (also available as self.stats).
+        '''
+        self.stats = Bus_Statistics(size)
+        return self.stats
+
+    def disable_statistics(self):
+        self.stats = None
+
+    def add_transaction_hook(self, hook):
+        ''' Call hook(transaction) with a Bus_Transaction after each instruction.
+            Hooks run on the thread using the bus, with the bus locked; keep them short.
+        '''
+        self._hooks.append(hook)
+
+    def remove_transaction_hook(self, hook):
+        self._hooks.remove(hook)
+
+    def _record(self, instruction, id, tx_bytes, rx_bytes, start, sent, retries=0, err=0):
+        ''' Report a finished transaction to the statistics and hooks, if any.
+        '''
+        if self.stats is None and not self._hooks:
+            return
+        done = time.time()
+        baudrate = getattr(self.servo_dev, 'baudrate', None)
+        wire_time = (tx_bytes + rx_bytes) * 10. / baudrate if baudrate else 0.
+        transaction = Bus_Transaction(start, instruction, id, tx_bytes, rx_bytes,
+                                      wire_time, done - sent, retries, err)
+        if self.stats is not None:
+            self.stats.record(transaction, done - start)
+        for hook in self._hooks:
+            hook(transaction)
+
+    def _expects_status(self, instruction, id):
+        ''' True if servo id returns a status packet for instruction at its status return level.
+        '''
+        if id == 0xFE:
+            return False
+        level = self.status_return_levels.get(id, 2)
+        if instruction == 0x01:
+            return True
+        if instruction == 0x02:
+            return level >= 1
+        return level >= 2
+
+    def _check_readable(self, instruction, id):
+        ''' Raise if instruction is a READ_DATA that servo id will not answer.
+        '''
+        if instruction[0] == 0x02 and id != 0xFE and self.status_return_levels.get(id, 2) < 1:
+            raise RuntimeError('lib_dynamixel: Servo %d is at status return level 0, so it only '
+                               'answers PING; set_status_return_level(%d, 1) to read it\n' % (id, id))
+
+    def check_errors(self, id):
+        ''' Ping servo id, raising if it reports any error flags.
+        '''
+        return self._send_instruction([0x01], id)
+
+    def _priority(self, instruction):
+        ''' Bus_Arbiter priority for instruction: writes are commands, reads telemetry.
+        '''
+        if instruction in (0x03, 0x83):
+            return Bus_Arbiter.COMMAND
+        if instruction in (0x02, 0x92):
+            return Bus_Arbiter.TELEMETRY
+        return Bus_Arbiter.NORMAL
+
+    def _send_instruction(self, instruction, id, status_return=None, priority=None, deadline=None):
+        ''' Fills out packet metadata, claims the bus, sends packet, and handles response.
+            Waits for a status packet if status_return, or by default if the servo's
+            status return level says one will come.  priority and deadline are passed
+            to the Bus_Arbiter; by default writes take priority over reads.
+        '''
+        id, data, err = self._transact(instruction, id, status_return, priority, deadline)
+        if err != 0:
+            self._process_err(err, id)
+        return data
+
+    def _transact(self, instruction, id, status_return=None, priority=None, deadline=None):
+        ''' _send_instruction, but returns the error byte instead of raising on it.
+            returns id, data, err
+        '''
+        self._check_readable(instruction, id)
+        if status_return is None:
+            status_return = self._expects_status(instruction[0], id)
+        if priority is None:
+            priority = self._priority(instruction[0])
+        msg = self._make_packet(instruction, id)
+        retries = 0
+        with self.arbiter.claim(priority, deadline):
             if status_return:
-                id, data, err = self._receive_reply(id)
+                rx_bytes = 6 + (instruction[2] if instruction[0] == 0x02 else 0)
+                expected = self._expected_reply_time(id, len(msg), rx_bytes)
+                self._set_reply_timeout(expected)
+            start = self._send_serial(msg)
+            sent = time.time()
+            if status_return:
+                while True:
+                    try:
+                        id, data, err = self._receive_reply(id)
+                        break
+                    except RuntimeError:
+                        self._record(instruction[0], id, len(msg), 0, start, sent, retries, -1)
+                        if instruction[0] not in (0x01, 0x02) or retries >= self.max_retries:
+                            self.recovery['failures'] += 1
+                            raise
+                    retries += 1
+                    self.recovery['retries'] += 1
+                    start = self._send_serial(msg)  # Also flushes whatever is left of the bad reply
+                    sent = time.time()
+                self._learn_reply_time(expected, time.time() - start)
+                self._record(instruction[0], id, len(msg), len(data) + 6, start, sent, retries, err)
             else:
+                self._record(instruction[0], id, len(msg), 0, start, sent)
+                if self._expects_status(instruction[0], id):
+                    self._unanswered = (id, sent + self._expected_reply_time(id, 0, 6))
+                if id != 0xFE and time.time() - self._last_status.get(id, 0.) > self.error_check_period:
+                    self.check_errors(id)
                 id = 0xFE
                 data = []
                 err = 0  # No Error Received
-        except:
-            raise
-        if err != 0:
-            self._process_err(err, id)
-        return data
+        return id, data, err
 
     def _process_err(self, err, id):
         ''' Process and raise errors received from the robotis servo.
@@ -195,6 +734,20 @@ class USB2Dynamixel_Device():
             print "Aborting..."
             return None
 
+    def send_packet(self, packet, priority=Bus_Arbiter.COMMAND, deadline=None):
+        ''' sends a complete, prebuilt instruction packet (str or bytearray)
+            that returns no status packet, e.g. a Sync_Write_Packet buffer.
+        '''
+        with self.arbiter.claim(priority, deadline):
+            start = self._write_serial(packet)
+            sent = time.time()
+            if self.stats is not None or self._hooks:
+                packet = bytearray(packet)
+                i = 0
+                while i + 4 < len(packet):  # One record per packet in the buffer
+                    self._record(packet[i + 4], packet[i + 2], packet[i + 3] + 4, 0, start, sent)
+                    i += packet[i + 3] + 4
+
     def sync_write(self, data):
         '''writes data to address 0xFE (254), the broadcast address.
            sends data to all servos on a bus
@@ -202,26 +755,334 @@ class USB2Dynamixel_Device():
         msg = [0x83] + data
         return self._send_instruction(msg, id=0xFE, status_return=False)
 
+    def bulk_read(self, reads):
+        ''' reads several blocks with a single BULK_READ instruction (MX-series only).
+            reads = [(id, address, nBytes) ...], at most one entry per id.
+            Each servo answers with its own status packet, in the order given.
+            returns [[n1,n2 ...] ...] (one list of parameters per read)
+        '''
+        for id, address, nBytes in reads:
+            self._check_readable([0x02, address, nBytes], id)
+        replies = self._bulk_read(reads)
+        for reply in replies:
+            if isinstance(reply, Exception):
+                raise reply
+        for id, data, err in replies:
+            if err != 0:
+                self._process_err(err, id)
+        return [data for id, data, err in replies]
+
+    def _bulk_read(self, reads, priority=Bus_Arbiter.TELEMETRY, deadline=None):
+        ''' Sends a BULK_READ and collects the status packets.
+            returns a list with (id, data, err), or the exception raised
+            receiving it, for each read.
+        '''
+        replies = [None] * len(reads)
+        pending = range(len(reads))
+        retries = 0
+        with self.arbiter.claim(priority, deadline):
+            while True:
+                msg = [0x92, 0x00]
+                for i in pending:
+                    id, address, nBytes = reads[i]
+                    msg.extend([nBytes, id, address])
+                msg = self._make_packet(msg, 0xFE)
+                # Replies come back one after another, so the deadline covers them all
+                expected = self._expected_reply_time(0xFE, len(msg), 0)
+                for i in pending:
+                    expected += self._expected_reply_time(reads[i][0], 0, reads[i][2] + 6)
+                self._set_reply_timeout(expected)
+                rx_bytes = 0
+                err = 0
+                start = self._send_serial(msg)
+                sent = time.time()
+                waiting = dict((reads[i][0], i) for i in pending)
+                while waiting:
+                    try:
+                        reply = self._receive_any(waiting.keys())
+                    except RuntimeError as e:
+                        # Later servos may answer anyway, but the rest are retried together
+                        for i in waiting.values():
+                            replies[i] = e
+                        err = -1
+                        break
+                    replies[waiting.pop(reply[0])] = reply
+                    rx_bytes += len(reply[1]) + 6
+                    err = err or reply[2]
+                if err != -1:
+                    self._learn_reply_time(expected, time.time() - start)
+                self._record(0x92, 0xFE, len(msg), rx_bytes, start, sent, retries, err)
+                # Read again only the blocks that failed
+                pending = [i for i in pending if isinstance(replies[i], Exception)]
+                if not pending:
+                    break
+                if retries >= self.max_retries:
+                    self.recovery['failures'] += len(pending)
+                    break
+                retries += 1
+                self.recovery['retries'] += 1
+        return replies
+
+
+# Servos found on each port/baudrate, so restarts only need to ping them
+TOPOLOGY_CACHE = os.path.expanduser('~/.ros/dynamixel_topology.json')
+
 
 class Dynamixel_Chain(USB2Dynamixel_Device):
 
     ''' Class that manages multiple servos on a single Dynamixel Device
     '''
 
-    def __init__(self, dev='/dev/ttyUSB0', baudrate='57600', ids=None):
+    def __init__(self, dev='/dev/ttyUSB0', baudrate='57600', ids=None, cache_file=TOPOLOGY_CACHE,
+                 serial_dev=None):
         ''' Accepts device file, baudrate, and a list of id numbers for servos (if known).
-        '''
-        USB2Dynamixel_Device.__init__(self, dev, baudrate)
-
-        valid_servo_ids = self._find_servos(ids)
-        if len(valid_servo_ids) == 0:
-            raise RuntimeError("No valid servo IDs Found")
-
-        series = [self._determine_series(self.read_model_number(id)) for id in valid_servo_ids]
+            The ids, model numbers and firmware versions found are stored in
+            cache_file; on the next start each cached id is pinged once and the
+            full scan is skipped if they all answer.  cache_file=None disables this.
+            serial_dev is passed to USB2Dynamixel_Device.
+        '''
+        USB2Dynamixel_Device.__init__(self, dev, baudrate, serial_dev)
+        self.baudrate = int(baudrate)
+        self.cache_file = cache_file
+        self.mirrors = {}
+        self._batch = threading.local()  # each thread's batch_writes depth and pending writes
+        self._groups = {}  # tuple of ids -> Servo_Group
+        self._sync_packets = {}  # tuple of ids -> Sync_Write_Packet
+
+        cached = self._cached_topology(ids)
+        if cached is not None:
+            valid_servo_ids = sorted(cached.keys())
+            models = [cached[id]['model'] for id in valid_servo_ids]
+            firmware = [cached[id]['firmware'] for id in valid_servo_ids]
+        else:
+            valid_servo_ids = self._find_servos(ids)
+            if len(valid_servo_ids) == 0:
+                raise RuntimeError("No valid servo IDs Found")
+            models = [self.read_model_number(id) for id in valid_servo_ids]
+            firmware = [self.read_firmware_version(id) for id in valid_servo_ids]
+        series = [self._determine_series(code) for code in models]
 
         self.servos = {}
         for id, series in zip(valid_servo_ids, series):
             self.servos[id] = Robotis_Servo(id, series)
+        # BULK_READ is only implemented by the MX-28, MX-64, and MX-106
+        self._bulk_read_ids = set([id for id, code in zip(valid_servo_ids, models)
+                                   if code in [29, 310, 320]])
+        # Control table ends at 0x49 on MX-series, 0x31 on others.
+        for id, code, version in zip(valid_servo_ids, models, firmware):
+            size = 0x4A if id in self._bulk_read_ids else 0x32
+            self.mirrors[id] = Control_Table_Mirror(size)
+            self.mirrors[id].update(0x00, [code % 256, code / 256, version])
+        self._read_status_return_levels(valid_servo_ids)
+        if cached is None:
+            self._save_topology()
+
+    def _read_status_return_levels(self, ids):
+        ''' Learn which servos will not acknowledge writes (status return level below 2).
+        '''
+        try:
+            levels = self._read_blocks(ids, 0x10, 1)
+        except RuntimeError:
+            levels = []
+            for id in ids:
+                try:
+                    levels.append(self.read_address(id, 0x10))
+                except RuntimeError as e:
+                    # A servo at level 0 cannot say so, but neither can one that missed
+                    # a reply; assuming 2 at worst makes writes to it wait for nothing
+                    print "Could not read status return level of servo %d, assuming 2: %s" % (id, e)
+                    levels.append([2])
+        for id, level in zip(ids, levels):
+            if level[0] < 2:
+                self.status_return_levels[id] = level[0]
+            else:
+                self.status_return_levels.pop(id, None)
+
+    def _topology_key(self):
+        return '%s@%d' % (self.dev_name, self.baudrate)
+
+    def _cached_topology(self, ids=None):
+        ''' Servos cached for this port and baudrate, {id: {'model': m, 'firmware': f}},
+            if there are any, they match the requested ids, and each answers a ping.
+            Otherwise None.
+        '''
+        if self.cache_file is None:
+            return None
+        try:
+            with open(self.cache_file) as f:
+                entry = json.load(f)[self._topology_key()]
+            servos = dict((int(id), info) for id, info in entry['servos'].items())
+        except (IOError, ValueError, KeyError, AttributeError):
+            return None
+        if not servos or (ids is not None and sorted(ids) != sorted(servos.keys())):
+            return None
+        # A missing servo means a full scan anyway, so don't spend retries finding out
+        max_retries, self.max_retries = self.max_retries, 0
+        try:
+            for id in servos.keys():
+                try:
+                    self.ping(id)
+                except RuntimeError:
+                    print "Cached servo ID %d did not answer on %s, rescanning" % (id, self.dev_name)
+                    return None
+        finally:
+            self.max_retries = max_retries
+        return servos
+
+    def _save_topology(self):
+        ''' Record the servos on this port and baudrate in the topology cache file.
+        '''
+        if self.cache_file is None:
+            return
+        try:
+            with open(self.cache_file) as f:
+                topology = json.load(f)
+        except (IOError, ValueError):
+            topology = {}
+        servos = {}
+        for id in self.servos.keys():
+            servos[str(id)] = {'model': self.read_model_number(id),
+                               'firmware': self.read_firmware_version(id)}
+        topology[self._topology_key()] = {'port': self.dev_name, 'baudrate': self.baudrate,
+                                          'servos': servos}
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            tmp_file = '%s.%d' % (self.cache_file, os.getpid())
+            with open(tmp_file, 'w') as f:
+                json.dump(topology, f, indent=2, sort_keys=True)
+            os.rename(tmp_file, self.cache_file)  # Atomic, so readers never see a partial file
+        except (IOError, OSError) as e:
+            print "Could not write servo topology cache %s: %s" % (self.cache_file, e)
+
+    def read_address(self, id, address, nBytes=1, max_age=None):
+        ''' reads nBytes from address on the servo at id.
+            EEPROM values are served from the control table mirror, which is
+            filled by a single block read the first time one is requested.
+            RAM values are re-read unless max_age (seconds) is given and the
+            mirror holds a copy at least that recent.
+            returns [n1,n2 ...] (list of parameters)
+        '''
+        mirror = self.mirrors.get(id)
+        if mirror is None:
+            return USB2Dynamixel_Device.read_address(self, id, address, nBytes)
+        data = mirror.get(address, nBytes, max_age)
+        if data is not None:
+            return data
+        if id in self._thread_batch().pending:
+            self.flush_writes()
+        if not mirror.populated and address < mirror.EEPROM_END:
+            self.refresh_mirror(id)
+            data = mirror.get(address, nBytes, max_age)
+            if data is not None:
+                return data
+        data = USB2Dynamixel_Device.read_address(self, id, address, nBytes)
+        mirror.update(address, data)
+        return data
+
+    def write_address(self, id, address, data):
+        ''' writes data at the address on the servo of id, and marks it dirty in the mirror.
+            data = [n1,n2 ...] list of numbers.
+            return [n1,n2 ...] (list of return parameters)
+        '''
+        self._invalidate_mirror(id, address, len(data))
+        batch = self._thread_batch()
+        if batch.depth > 0:
+            registers = batch.pending.setdefault(id, {})
+            for i, byte in enumerate(data):
+                registers[address + i] = byte
+            return []
+        return USB2Dynamixel_Device.write_address(self, id, address, data)
+
+    def sync_write(self, data):
+        '''writes data to address 0xFE (254), the broadcast address.
+           sends data to all servos on a bus, and marks it dirty in the mirrors.
+           data = [address, nBytes, id1, n1, n2 ..., id2, n1, n2 ...]
+        '''
+        address, nBytes = data[0], data[1]
+        for id in data[2::nBytes + 1]:
+            self._invalidate_mirror(id, address, nBytes)
+        if self._thread_batch().pending:
+            self.flush_writes()
+        return USB2Dynamixel_Device.sync_write(self, data)
+
+    @contextlib.contextmanager
+    def batch_writes(self):
+        ''' Defer register writes made inside the block and send them together on exit:
+                with dyn.batch_writes():
+                    dyn.set_compliance_margins(id)
+                    dyn.set_compliance_slopes(id)
+            Writes to contiguous addresses on a servo are merged into one WRITE_DATA.
+            Servos with identical pending ranges share a single SYNC_WRITE, which
+            returns no status packets.  Reading a servo with pending writes flushes
+            them first.  Pending writes are discarded if the block raises.
+            Batches are per thread: writes from other threads go out as usual.
+        '''
+        batch = self._thread_batch()
+        batch.depth += 1
+        try:
+            yield
+        except:
+            batch.depth -= 1
+            batch.pending = {}
+            raise
+        batch.depth -= 1
+        if batch.depth == 0:
+            self.flush_writes()
+
+    def _thread_batch(self):
+        ''' The calling thread's batch_writes state: depth, the nesting level, and
+            pending, {id: {address: byte}} of deferred writes.
+        '''
+        batch = self._batch
+        if not hasattr(batch, 'pending'):
+            batch.depth = 0
+            batch.pending = {}
+        return batch
+
+    def flush_writes(self):
+        ''' Send the register writes this thread deferred with batch_writes.
+        '''
+        batch = self._thread_batch()
+        pending, batch.pending = batch.pending, {}
+        ranges = {}  # id -> [(address, [n1,n2 ...]) ...], contiguous runs
+        for id, registers in pending.items():
+            ranges[id] = []
+            for address in sorted(registers.keys()):
+                if ranges[id] and address == ranges[id][-1][0] + len(ranges[id][-1][1]):
+                    ranges[id][-1][1].append(registers[address])
+                else:
+                    ranges[id].append((address, [registers[address]]))
+        shared = {}  # (address, nBytes) -> [ids whose only pending write is that range]
+        for id, runs in ranges.items():
+            if len(runs) == 1 and id != 0xFE:
+                shared.setdefault((runs[0][0], len(runs[0][1])), []).append(id)
+        for (address, nBytes), ids in shared.items():
+            if len(ids) > 1:
+                data = [address, nBytes]
+                for id in sorted(ids):
+                    data.extend([id] + ranges.pop(id)[0][1])
+                USB2Dynamixel_Device.sync_write(self, data)
+        for id in sorted(ranges.keys()):
+            for address, data in ranges[id]:
+                USB2Dynamixel_Device.write_address(self, id, address, data)
+
+    def _invalidate_mirror(self, id, address, nBytes):
+        if id == 0xFE:
+            for mirror in self.mirrors.values():
+                mirror.invalidate(address, nBytes)
+        elif id in self.mirrors:
+            self.mirrors[id].invalidate(address, nBytes)
+
+    def refresh_mirror(self, id):
+        ''' Re-read the whole control table of servo id into its mirror with one READ_DATA.
+        '''
+        mirror = self.mirrors[id]
+        data = USB2Dynamixel_Device.read_address(self, id, 0, len(mirror.data))
+        mirror.update(0, data)
+        mirror.populated = True
+        self.return_delays[id] = data[0x05] * 2e-6
 
     def _find_servos(self, ids=None):
         ''' Finds all servo IDs on the USB2Dynamixel, or check given ids
@@ -233,17 +1094,19 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         else:
             print 'Scanning for servos with ID(\'s): %s' % ids
             suggested_ids = True
-        self.servo_dev.setTimeout(0.05)  # To make the scan faster
+        # Reply deadlines adapt once the first servo answers; absent ids are not retried
+        max_retries, self.max_retries = self.max_retries, 0
         servos = []
-        for i in ids:
-            if self._id_on_device(i):
-                print '\n FOUND A SERVO @ ID %d\n' % i
-                servos.append(i)
-            else:
-                if suggested_ids:
-                    print "Cannot find ID %s on %s" % (i, self.dev_name)
-
-        self.servo_dev.setTimeout(1.0)  # Restore to original
+        try:
+            for i in ids:
+                if self._id_on_device(i):
+                    print '\n FOUND A SERVO @ ID %d\n' % i
+                    servos.append(i)
+                else:
+                    if suggested_ids:
+                        print "Cannot find ID %s on %s" % (i, self.dev_name)
+        finally:
+            self.max_retries = max_retries
         return servos
 
     def _id_on_device(self, id):
@@ -295,6 +1158,13 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         valid_servo_ids = self._find_servos([new_id])
         self.servos[new_id] = Robotis_Servo(new_id, series=self.servos[current_id].series)
         self.servos.pop(current_id)
+        self.mirrors[new_id] = self.mirrors.pop(current_id)
+        self._groups = {}
+        self._sync_packets = {}
+        if current_id in self._bulk_read_ids:
+            self._bulk_read_ids.remove(current_id)
+            self._bulk_read_ids.add(new_id)
+        self._save_topology()
         return resp
 
     def set_baudrate(self, id, baudrate=0x22):
@@ -329,11 +1199,13 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         elif (delay % 2 != 0):
             delay = 2 * int(delay / 2)
             print("Return Delay Time must be specified by 2 microsecond increments. Rounding to %dus" %delay)
+        self.return_delays[id] = int(delay / 2) * 2e-6
         return self.write_address(id, 0x05, [int(delay / 2)])
 
     def read_return_delay(self, id):
         '''Read the currently set Return Delay Time (in microseconds)'''
         ret_dly = self.read_address(id, 0x05)
+        self.return_delays[id] = ret_dly[0] * 2e-6
         return 2 * ret_dly[0]
 
     def set_angle_limits(self, id, cw_limit=0., ccw_limit=2 * math.pi):
@@ -378,10 +1250,10 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         '''
         return self.read_address(id, 0x0B, 1)[0]
 
-    def read_temperature(self, id):
+    def read_temperature(self, id, max_age=None):
         ''' returns the temperature (Celcius) of servo (id).
         '''
-        data = self.read_address(id, 0x2B, 1)
+        data = self.read_address(id, 0x2B, 1, max_age)
         return data[0]
 
     def read_voltage_limits(self, id):
@@ -397,10 +1269,10 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         high_limit = int(10. * upper)
         return self.write_address(id, 0x0C, [low_limit, high_limit])
 
-    def read_voltage(self, id):
+    def read_voltage(self, id, max_age=None):
         ''' returns voltage (Volts) seen by servo (id).
         '''
-        data = self.read_address(id, 0x2A, 1)
+        data = self.read_address(id, 0x2A, 1, max_age)
         return data[0] / 10.
 
     def read_max_torque(self, id):
@@ -416,15 +1288,7 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         data = 10.23 * percent
         hi = int(data / 256)
         lo = int(data % 256)
-        return self.write_adress(id, 0x0E, [lo, hi])
-
-    def set_torque_limit(self, id, torque)
-	lo = int(torque % 256);
-	hi = int(torque >> 8);
-	response = self.write(servo_id, DXL_TORQUE_LIMIT_L, (loVal, hiVal))
-	if response:
-		self.exception_on_error(response[4], servo_id, 'setting torque limit to %d' % torque)
-	return response
+        return self.write_address(id, 0x0E, [lo, hi])
 
     def read_status_return_level(self, id):
         ''' Read the current status return label of servo at id.
@@ -445,7 +1309,41 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
                                '\t0 - No return except ping \n'
                                '\t1 - return only for read commands \n'
                                '\t2 - return for all commands')
-        return self.write_address(id, 0x10, [level])
+        if self._thread_batch().pending:
+            self.flush_writes()
+        self._invalidate_mirror(id, 0x10, 1)
+        msg = self._make_packet([0x03, 0x10, level], id)
+        with self.arbiter:
+            # Whether this write is acknowledged at the old or the new level varies,
+            # so wait out any reply rather than let it be mistaken for the next one.
+            self._set_reply_timeout(self._expected_reply_time(id, len(msg), 6))
+            self._send_serial(msg)
+            try:
+                id, data, err = self._receive_reply(id)
+            except RuntimeError:
+                err = 0
+        if level < 2:
+            self.status_return_levels[id] = level
+        else:
+            self.status_return_levels.pop(id, None)
+        if err != 0:
+            self._process_err(err, id)
+        return []
+
+    def set_write_acknowledgement(self, enabled=True, ids=None):
+        ''' With enabled=False, set servos with ids (all, by default) to status return
+            level 1, so they only answer reads and pings.  Writes then go out without
+            waiting for a status packet, halving the bus turnarounds of each command;
+            error flags are still checked by a ping at most every error_check_period
+            seconds, and on every read.  enabled=True restores level 2.
+            The level is kept in EEPROM, so it survives power cycles.
+        '''
+        if ids is None:
+            ids = self.servos.keys()
+        level = 2 if enabled else 1
+        for id in ids:
+            if self.status_return_levels.get(id, 2) != level:
+                self.set_status_return_level(id, level)
 
     def is_torque_enabled(self, id):
         ''' Return True if sending power to motor, False otherwise.
@@ -474,13 +1372,7 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
             Should be used for direction of torque only.
         '''
         data = self.read_address(id, 0x28, 2)
-        hi = data[1] & 3  # grab left two bits
-        val = data[0] + hi * 256
-        load = val / 10.24  # percent of 0-1024 range
-        # Check direction bit and servo flipped. If only one =True, then flip.
-        if (data[1] & 4) != self.servos[id].settings['flipped']:
-            load *= -1.
-        return load
+        return self.servos[id].bytes_to_load(data[1], data[0])
 
     def is_led_on(self, id):
         ''' Return True if LED is ON, False if LED is off.
@@ -493,11 +1385,11 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         '''
         return self.write_address(id, 0x19, [on])
 
-    def read_compliance_margins(self, id):
+    def read_compliance_margins(self, id, max_age=None):
         ''' Read the compliance margin (deadband around goal position) of servo with id.
             Returns [CW, CCW] angular deadband in radians (always positive).
         '''
-        cw, ccw = self.read_address(id, 0x1A, 2)
+        cw, ccw = self.read_address(id, 0x1A, 2, max_age)
         cw_rad = cw * self.servos[id].settings['rad_per_enc']
         ccw_rad = ccw * self.servos[id].settings['rad_per_enc']
         return [cw_rad, ccw_rad]
@@ -554,10 +1446,10 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
             print "Compliance slope must be in range(7)"
             raise
 
-    def read_compliance_slopes(self, id):
+    def read_compliance_slopes(self, id, max_age=None):
         ''' Read the CW and CCW compliance slopes as steps from 1-7 (1=stiffer, 7=more flexible').
         '''
-        data = self.read_address(id, 0x1C, 2)
+        data = self.read_address(id, 0x1C, 2, max_age)
         return [self._compliance_slope_to_step(v) for v in data]
 
     def set_compliance_slopes(self, id, cw=None, ccw=None):
@@ -573,11 +1465,11 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
             data = [cw_step, ccw_step]
         return self.write_address(id, 0x1C, data)
 
-    def read_pid_gains(self, id):
+    def read_pid_gains(self, id, max_age=None):
         ''' Read the PID gains currently set on the servo.
             Returns: [kp, ki, kd] (gain coefficients)
         '''
-        data = self.read_address(id, 0x1A, 3)
+        data = self.read_address(id, 0x1A, 3, max_age)
         kd = data[0] * 4. / 1000.
         ki = data[1] * 1000. / 2048.
         kp = data[2] / 8.
@@ -621,11 +1513,11 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         data = self.read_address(id, 0x20, 2)
         return self.servos[id].bytes_to_angvel(data[1], data[0])
 
-    def read_torque_limit(self, id):
+    def read_torque_limit(self, id, max_age=None):
         ''' Read the currently set torque limit as a percentage of acheivable torque.
             Torque produced by the motor will be capped to this value.
         '''
-        data = self.read_address(id, 0x22, 2)
+        data = self.read_address(id, 0x22, 2, max_age)
         return (data[0] + data[1] * 256) / 10.23
 
     def set_torque_limit(self, id, percent=None):
@@ -653,12 +1545,28 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         '''
         return self.servos[id].encoder_to_angle(self.read_encoder(id))
 
+    def _read_blocks(self, ids, address, nBytes):
+        ''' Read the same block of the control table from each servo in ids.
+            Uses a single BULK_READ when every servo supports it,
+            otherwise one READ_DATA per servo.
+        '''
+        if self._thread_batch().pending:
+            self.flush_writes()
+        if len(ids) > 1 and all(id in self._bulk_read_ids for id in ids):
+            blocks = self.bulk_read([(id, address, nBytes) for id in ids])
+            for id, data in zip(ids, blocks):
+                self.mirrors[id].update(address, data)
+            return blocks
+        return [self.read_address(id, address, nBytes) for id in ids]
+
     def read_angles(self, ids=None):
         ''' return a list of current joint angles for servos with given ids
         '''
         if ids is None:
             ids = self.servos.keys()
-        angles = [self.read_angle(id) for id in ids]
+        blocks = self._read_blocks(ids, 36, 2)
+        angles = [self.servos[id].encoder_to_angle(data[0] + data[1] * 256)
+                  for id, data in zip(ids, blocks)]
         return angles, ids
 
     def read_angvel(self, id):
@@ -673,7 +1581,9 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         '''
         if ids is None:
             ids = self.servos.keys()
-        angvels = [self.read_angvel(id) for id in ids]
+        blocks = self._read_blocks(ids, 38, 2)
+        angvels = [self.servos[id].bytes_to_angvel(data[1], data[0])
+                   for id, data in zip(ids, blocks)]
         return angvels, ids
 
     def read_ang_angvel(self, id):
@@ -692,14 +1602,30 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
             ids = self.servos.keys()
         angles = []
         angvels = []
-        for id in ids:
-            ang, angvel = self.read_ang_angvel(id)
-            angles.append(ang)
-            angvels.append(angvel)
+        for id, data in zip(ids, self._read_blocks(ids, 36, 4)):
+            servo = self.servos[id]
+            angles.append(servo.encoder_to_angle(data[0] + data[1] * 256))
+            angvels.append(servo.bytes_to_angvel(data[3], data[2]))
         return angles, angvels, ids
 
-    def move_angle(self, id, ang, angvel=None, blocking=False):
-        ''' move servo with id to angle (radians) with velocity (rad/s)
+    def read_states(self, ids=None):
+        '''return lists of current angular positions, velocities, and loads for given ids.
+           All servos are read in one transaction when the chain supports BULK_READ.
+        '''
+        if ids is None:
+            ids = self.servos.keys()
+        angles = []
+        angvels = []
+        loads = []
+        for id, data in zip(ids, self._read_blocks(ids, 36, 6)):
+            servo = self.servos[id]
+            angles.append(servo.encoder_to_angle(data[0] + data[1] * 256))
+            angvels.append(servo.bytes_to_angvel(data[3], data[2]))
+            loads.append(servo.bytes_to_load(data[5], data[4]))
+        return angles, angvels, loads, ids
+
+    def _move_angle_data(self, id, ang, angvel=None):
+        ''' Goal position and moving speed bytes (from address 30) for move_angle.
         '''
         if angvel is None:
             angvel = self.servos[id].settings['max_speed']
@@ -709,7 +1635,12 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         ang = self.servos[id].clip_angle(ang)
         enc_val = self.servos[id].angle_to_encoder(ang)
         ang_hi, ang_lo = self.__encoder_to_bytes(id, enc_val)
-        self.write_address(id, 30, [ang_lo, ang_hi, av_lo, av_hi])
+        return [ang_lo, ang_hi, av_lo, av_hi]
+
+    def move_angle(self, id, ang, angvel=None, blocking=False):
+        ''' move servo with id to angle (radians) with velocity (rad/s)
+        '''
+        self.write_address(id, 30, self._move_angle_data(id, ang, angvel))
 
         if blocking == True:
             while(self.is_moving(id)):
@@ -719,27 +1650,36 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         ''' move servos with id's to angles with angvels using a single sync_write.
             clips angles to allowed range, and limits angvel to max allowed.
         '''
-        if angvels is None:
-            angvels = [self.servos[id_].settings['max_speed'] for id_ in ids]
-        else:
-            if len(angvels) != len(ids):
-                raise RuntimeError("Number of ids and anvels do not match.")
-            else:
-                angvels = [self.servos[id_].clip_angvel(angvel) for id_, angvel in zip(ids, angvels) ]
-        #Check that there is an angle, angvel for each id
-        assert len(ids) == len(angvels),  "Number of ids and angvels do not match"
+        if (angvels is not None) and (len(angvels) != len(ids)):
+            raise RuntimeError("Number of ids and anvels do not match.")
+        #Check that there is an angle for each id
         assert len(ids) == len(angs), "Number of ids and angles do not match"
-
-        msg = [0x1E, 0x04]  # Start address, length of data per servo (4 bytes)
-        for id, ang, vel in zip(ids, angs, angvels):
-            servo = self.servos[id]
-            ang = servo.clip_angle(ang)
-            enc_tics = servo.angle_to_encoder(ang)
-            ang_hi, ang_lo = self.__encoder_to_bytes(id, enc_tics)
-            new_vel = servo.clip_angvel(vel)
-            vel_hi, vel_lo = self.servos[id].angvel_to_bytes(vel)
-            msg.extend([id, ang_lo, ang_hi, vel_lo, vel_hi])
-        self.sync_write(msg)
+        packet = self.sync_packet(ids)
+        for id in ids:
+            self._invalidate_mirror(id, 0x1E, 4)
+        if self._thread_batch().pending:
+            self.flush_writes()
+        # Every caller moving these servos shares the packet and its running
+        # checksum, so patch and send it under one claim of the bus
+        with self.arbiter.claim(Bus_Arbiter.COMMAND):
+            packet.set_goals(angs, angvels)
+            self.send_packet(packet.buf)
+
+    def servo_group(self, ids):
+        ''' Return the (cached) Servo_Group for servos with the given ids, in that order.
+        '''
+        key = tuple(ids)
+        if key not in self._groups:
+            self._groups[key] = Servo_Group([self.servos[id] for id in ids])
+        return self._groups[key]
+
+    def sync_packet(self, ids):
+        ''' Return the (cached) Sync_Write_Packet used by move_angles_sync for ids.
+        '''
+        key = tuple(ids)
+        if key not in self._sync_packets:
+            self._sync_packets[key] = Sync_Write_Packet(self.servo_group(ids))
+        return self._sync_packets[key]
 
     def move_to_encoder(self, id, n):
         ''' move to encoder position n
@@ -779,11 +1719,11 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         '''
         return self.write_address(id, 0x2F, [0x01])
 
-    def read_punch(self, id):
+    def read_punch(self, id, max_age=None):
         ''' Read the currently set minimum motor current.
             UNITS UNKNOWN.  Values in range 0 - 1023. Default: 0.
         '''
-        data = self.read_address(id, 0x30, 2)
+        data = self.read_address(id, 0x30, 2, max_age)
         return data[0] + data[1] * 256
 
     def set_punch(self, id, value=0):
@@ -841,8 +1781,8 @@ class Dynamixel_Chain(USB2Dynamixel_Device):
         lo = val & 255  # grab only lower byte
         return self.write_address(id, 0x47, [lo, hi])
 
-    def read_goal_acceleration(self, id):
-        data = self.read_address(id, 0x49)
+    def read_goal_acceleration(self, id, max_age=None):
+        data = self.read_address(id, 0x49, 1, max_age)
         return data[0] * 8.583  # 8.583 rad/sec^2 per unit
 
     def set_goal_acceleration(self, id, ang_acc=0):
@@ -975,6 +1915,17 @@ class Robotis_Servo():
             mag *= -1
         return mag
 
+    def bytes_to_load(self, hi, lo):
+        '''returns the present load as a percentage of maximum torque from hi, lo bytes.
+           CW -> load < 0.  CCW -> load > 0.
+        '''
+        val = lo + (hi & 3) * 256
+        load = val / 10.24  # percent of 0-1024 range
+        # Check direction bit and servo flipped. If only one =True, then flip.
+        if bool(hi & 4) != self.settings['flipped']:
+            load *= -1.
+        return load
+
     def clip_angvel(self, angvel):
         '''Clip commanded velocity to below the allowed maximum.
            negative angvels will be set to maximum.
@@ -999,28 +1950,911 @@ class Robotis_Servo():
             return angvel
 
 
+def _round_half_away(x, out=None):
+    ''' Elementwise round-half-away-from-zero, matching the builtin round().
+        With out (a float array other than x), the result is written there.
+    '''
+    if out is None:
+        return np.sign(x) * np.floor(np.abs(x) + 0.5)
+    np.absolute(x, out=out)
+    out += 0.5
+    np.floor(out, out=out)
+    return np.copysign(out, x, out=out)
+
+
+class Servo_Group():
+
+    ''' Settings of several Robotis_Servos held as arrays, so that whole command
+        and feedback vectors are converted in one call rather than per servo.
+        Conversions match the scalar Robotis_Servo methods.  Get one from
+        Dynamixel_Chain.servo_group(ids); it is not updated if settings change.
+    '''
+
+    def __init__(self, servos):
+        self.ids = np.array([s.servo_id for s in servos])
+        settings = [s.settings for s in servos]
+        self.home_encoder = np.array([st['home_encoder'] for st in settings], dtype=float)
+        self.max_encoder = np.array([st['max_encoder'] for st in settings], dtype=float)
+        self.rad_per_enc = np.array([st['rad_per_enc'] for st in settings], dtype=float)
+        self.sign = np.array([-1. if st['flipped'] else 1. for st in settings])
+        self.min_ang = np.array([st['min_ang'] for st in settings], dtype=float)
+        self.max_ang = np.array([st['max_ang'] for st in settings], dtype=float)
+        # Speed used when none is commanded (0 -> servo maximum), and the clipping limit
+        self.default_angvel = np.array([st['max_speed'] for st in settings], dtype=float)
+        self.max_angvel = np.where(self.default_angvel == 0., 12.2595, self.default_angvel)
+
+    def clip_angles(self, angs):
+        ''' Clip commanded joint angles to within the allowed range.
+        '''
+        angs = np.asarray(angs, dtype=float)
+        clipped = np.clip(angs, self.min_ang, self.max_ang)
+        for i in np.flatnonzero(clipped != angs):
+            print "Servo %d: Commanded angle (%f) outside range [%f, %f], commanding to limit."\
+                % (self.ids[i], angs[i], self.min_ang[i], self.max_ang[i])
+        return clipped
+
+    def clip_angvels(self, angvels):
+        ''' Clip commanded velocities to below the allowed maximum.
+        '''
+        angvels = np.asarray(angvels, dtype=float)
+        clipped = np.clip(angvels, -self.max_angvel, self.max_angvel)
+        for i in np.flatnonzero(clipped != angvels):
+            print "Servo %d: Tried to set ang vel to %f, setting to maximum (%f)."\
+                % (self.ids[i], angvels[i], self.max_angvel[i])
+        return clipped
+
+    def angles_to_encoders(self, angs):
+        ''' return encoder positions for given angles (radians), limited to the encoder range
+        '''
+        enc = _round_half_away(self.sign * np.asarray(angs, dtype=float) / self.rad_per_enc)
+        return np.clip(enc + self.home_encoder, 0, self.max_encoder).astype(int)
+
+    def encoders_to_angles(self, encs):
+        ''' return angular positions (rad) from given encoder positions
+        '''
+        return self.sign * (np.asarray(encs, dtype=float) - self.home_encoder) * self.rad_per_enc
+
+    def angvels_to_words(self, angvels):
+        ''' Convert angular velocities, in rad/sec, to moving speed register values.
+        '''
+        rpm = self.sign * np.asarray(angvels, dtype=float) / (2 * math.pi) * 60.0
+        enc = _round_half_away(rpm / 0.11443).astype(int)
+        return np.abs(enc) + 1024 * (enc < 0)  # bit 10 is the direction bit
+
+    def words_to_angvels(self, words):
+        ''' returns angular velocities (rad/sec) from present speed register values
+        '''
+        words = np.asarray(words, dtype=int)
+        mag = (words % 1024) * 0.11443 / 60. * 2 * math.pi
+        return np.where(words & 1024, -mag, mag) * self.sign
+
+    def goal_words(self, angs, angvels=None):
+        ''' Goal position and moving speed register values that move the group to
+            angs (radians) at angvels (rad/s), clipped to the allowed ranges.
+            returns encoders, speeds
+        '''
+        if angvels is None:
+            speeds = self.angvels_to_words(self.default_angvel)
+        else:
+            speeds = self.angvels_to_words(self.clip_angvels(angvels))
+        return self.angles_to_encoders(self.clip_angles(angs)), speeds
+
+
+class Sync_Write_Packet():
+
+    ''' Preallocated SYNC_WRITE packet setting goal position and moving speed
+        (addresses 0x1E-0x21) of a fixed Servo_Group.  Each command converts the
+        goals with the same arithmetic as Servo_Group.goal_words, but into arrays
+        allocated here, writes them into the buffer through numpy views of its
+        fields and recomputes the checksum in place, so buf can be written to the
+        port as-is.  Only copying angs and angvels given as lists allocates.
+    '''
+
+    FIELDS = np.dtype([('id', 'u1'), ('pos', '<u2'), ('speed', '<u2')])
+    HEADER = 7  # 0xFF 0xFF 0xFE length 0x83 0x1E 0x04
+
+    def __init__(self, group):
+        self.group = group
+        n = len(group.ids)
+        self.buf = bytearray(self.HEADER + n * self.FIELDS.itemsize + 1)
+        self.buf[:self.HEADER] = bytearray([0xFF, 0xFF, 0xFE, n * self.FIELDS.itemsize + 4,
+                                            0x83, 0x1E, 0x04])
+        self.fields = np.frombuffer(self.buf, dtype=self.FIELDS, count=n, offset=self.HEADER)
+        self.fields['id'] = group.ids
+        self._pos = self.fields['pos']
+        self._speed = self.fields['speed']
+        data = np.frombuffer(self.buf, dtype=np.uint8)
+        self._summed = data[2:-1]  # Bytes covered by the checksum
+        self._checksum = data[-1:]
+        self._angs = np.empty(n)
+        self._angvels = np.empty(n)
+        self._x = np.empty(n)
+        self._y = np.empty(n)
+        self._clipped = np.empty(n, dtype=bool)
+        self._min_angvel = -group.max_angvel
+        self._default_speeds = group.angvels_to_words(group.default_angvel)
+        self._speed[:] = self._default_speeds
+        self._update_checksum()
+
+    def _update_checksum(self):
+        # uint8 arithmetic wraps, so this is the sum mod 256 the checksum needs
+        np.add.reduce(self._summed, dtype=np.uint8, keepdims=True, out=self._checksum)
+        np.invert(self._checksum, out=self._checksum)
+
+    def _set_positions(self, angs):
+        g, x, y = self.group, self._x, self._y
+        self._angs[:] = angs
+        np.clip(self._angs, g.min_ang, g.max_ang, out=x)
+        if np.not_equal(x, self._angs, out=self._clipped).any():
+            g.clip_angles(self._angs)  # Prints the warnings
+        # As Servo_Group.angles_to_encoders
+        np.multiply(g.sign, x, out=x)
+        np.divide(x, g.rad_per_enc, out=x)
+        _round_half_away(x, out=y)
+        y += g.home_encoder
+        np.clip(y, 0, g.max_encoder, out=y)
+        np.copyto(self._pos, y, casting='unsafe')
+
+    def _set_speeds(self, angvels):
+        g, x, y = self.group, self._x, self._y
+        self._angvels[:] = angvels
+        np.clip(self._angvels, self._min_angvel, g.max_angvel, out=x)
+        if np.not_equal(x, self._angvels, out=self._clipped).any():
+            g.clip_angvels(self._angvels)  # Prints the warnings
+        # As Servo_Group.angvels_to_words
+        np.multiply(g.sign, x, out=x)
+        x /= 2 * math.pi
+        x *= 60.0
+        x /= 0.11443
+        _round_half_away(x, out=y)
+        np.less(y, 0, out=self._clipped)
+        np.absolute(y, out=y)
+        np.multiply(self._clipped, 1024., out=x)  # bit 10 is the direction bit
+        y += x
+        np.copyto(self._speed, y, casting='unsafe')
+
+    def set_goals(self, angs, angvels=None):
+        ''' Patch in goal angles (radians) and angvels (rad/s), clipped to the allowed ranges.
+        '''
+        self._set_positions(angs)
+        if angvels is None:
+            self._speed[:] = self._default_speeds
+        else:
+            self._set_speeds(angvels)
+        self._update_checksum()
+
+
+class Dynamixel_Request():
+
+    ''' An instruction queued on a Dynamixel_IO_Thread.  Call result() to wait
+        for the status packet, or add_done_callback() to be notified instead.
+    '''
+
+    def __init__(self, instruction, id, status_return=True, convert=None,
+                 priority=Bus_Arbiter.NORMAL, deadline=None):
+        self.instruction = instruction
+        self.id = id
+        self.status_return = status_return
+        self.convert = convert  # Applied to the returned parameters, if given
+        self.priority = priority
+        self.deadline = deadline
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._data = None
+        self._exc = None
+
+    def done(self):
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        ''' Block until the request has been handled and return its data.
+            Errors from the bus or the servo are re-raised in the caller's thread.
+        '''
+        if not self._done.wait(timeout):
+            raise RuntimeError('lib_dynamixel: Timed out waiting for request to servo %d' % self.id)
+        if self._exc is not None:
+            raise self._exc
+        return self._data
+
+    def add_done_callback(self, fn):
+        ''' Call fn(request) from the I/O thread once the request completes
+            (immediately, if it already has).
+        '''
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _set_result(self, data):
+        try:
+            if self.convert is not None:
+                data = self.convert(data)
+        except Exception as e:
+            return self._set_exception(e)
+        self._data = data
+        self._finish()
+
+    def _set_exception(self, exc):
+        self._exc = exc
+        self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception as e:
+                # Runs on the I/O thread, which must carry on with the other requests
+                print "lib_dynamixel: Callback for request to servo %d raised: %s" % (self.id, e)
+
+
+class Dynamixel_IO_Thread(threading.Thread):
+
+    ''' Thread that owns the bus of a Dynamixel_Chain and services a queue of
+        instructions, so callers can have moves and reads in flight at once:
+            io = Dynamixel_IO_Thread(dyn)
+            ang = io.read_angle(1)
+            io.move_angle(2, 0.5)
+            print ang.result()
+        Everything queued while the bus is busy goes out as one burst:
+        instructions that return no status packet are written back to back,
+        with consecutive WRITE_DATAs of the same block on different servos merged
+        into one SYNC_WRITE, and READ_DATA requests for MX-series servos are merged
+        into one BULK_READ whose status packets are matched back to the requests by id.
+    '''
+
+    def __init__(self, chain):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.chain = chain
+        self.queue = Queue.Queue()
+        self.should_run = True
+        self.start()
+
+    def submit(self, instruction, id, status_return=None, convert=None, priority=None, deadline=None):
+        ''' Queue an instruction for servo id.  Returns a Dynamixel_Request.
+            By default, waits for a status packet if the servo's status return level gives one.
+            priority and deadline are used when claiming the bus (see Bus_Arbiter).
+        '''
+        if status_return is None:
+            status_return = self.chain._expects_status(instruction[0], id)
+        if priority is None:
+            priority = self.chain._priority(instruction[0])
+        request = Dynamixel_Request(instruction, id, status_return, convert, priority, deadline)
+        if not self.should_run:
+            request._set_exception(RuntimeError('lib_dynamixel: I/O thread is stopped'))
+            return request
+        try:
+            self.chain._check_readable(instruction, id)
+        except RuntimeError as e:
+            request._set_exception(e)
+        else:
+            self.queue.put(request)
+        return request
+
+    def ping(self, id):
+        return self.submit([0x01], id)
+
+    def read_address(self, id, address, nBytes=1):
+        return self.submit([0x02, address, nBytes], id)
+
+    def write_address(self, id, address, data):
+        return self.submit([0x03, address] + data, id)
+
+    def read_angle(self, id):
+        servo = self.chain.servos[id]
+        return self.submit([0x02, 36, 2], id,
+                           convert=lambda data: servo.encoder_to_angle(data[0] + data[1] * 256))
+
+    def read_angvel(self, id):
+        servo = self.chain.servos[id]
+        return self.submit([0x02, 38, 2], id,
+                           convert=lambda data: servo.bytes_to_angvel(data[1], data[0]))
+
+    def read_ang_angvel(self, id):
+        servo = self.chain.servos[id]
+        return self.submit([0x02, 36, 4], id,
+                           convert=lambda data: (servo.encoder_to_angle(data[0] + data[1] * 256),
+                                                 servo.bytes_to_angvel(data[3], data[2])))
+
+    def move_angle(self, id, ang, angvel=None):
+        return self.write_address(id, 30, self.chain._move_angle_data(id, ang, angvel))
+
+    def run(self):
+        while self.should_run:
+            try:
+                requests = [self.queue.get(timeout=0.1)]
+            except Queue.Empty:
+                continue
+            while True:
+                try:
+                    requests.append(self.queue.get_nowait())
+                except Queue.Empty:
+                    break
+            # Each burst claims the bus separately, so other threads' commands can go between
+            try:
+                self._process(list(requests))
+            except Exception as e:
+                # Nobody else will complete these, so fail them rather than leave callers waiting
+                print "lib_dynamixel: I/O thread failed to process requests: %s" % e
+                for request in requests:
+                    if not request.done():
+                        request._set_exception(e)
+
+        while True:
+            try:
+                self.queue.get_nowait()._set_exception(RuntimeError('lib_dynamixel: I/O thread is stopped'))
+            except Queue.Empty:
+                break
+
+    def stop(self):
+        self.should_run = False
+        self.join(3)
+        if (self.isAlive()):
+            raise RuntimeError("lib_dynamixel: unable to stop I/O thread")
+
+    def _process(self, requests):
+        bulk_ids = self.chain._bulk_read_ids
+        while requests:
+            request = requests.pop(0)
+            if not request.status_return:
+                burst = [request]
+                while requests and not requests[0].status_return:
+                    burst.append(requests.pop(0))
+                self._send_burst(burst)
+            elif request.instruction[0] == 0x02 and request.id in bulk_ids:
+                reads = [request]
+                ids = set([request.id])
+                while (requests and requests[0].instruction[0] == 0x02 and
+                       requests[0].id in bulk_ids and requests[0].id not in ids):
+                    ids.add(requests[0].id)
+                    reads.append(requests.pop(0))
+                if len(reads) > 1:
+                    self._send_bulk_read(reads)
+                else:
+                    self._send_single(request)
+            else:
+                self._send_single(request)
+
+    def _send_single(self, request):
+        try:
+            data = self.chain._send_instruction(request.instruction, request.id,
+                                                request.status_return, request.priority,
+                                                request.deadline)
+        except Exception as e:
+            self._complete(request, exc=e)
+        else:
+            self._complete(request, data)
+
+    def _burst_instructions(self, requests):
+        ''' (instruction, id) for each packet of a burst, in order.  Runs of WRITE_DATA
+            to the same address and length on different servos become one SYNC_WRITE.
+        '''
+        packets = []
+        run = []
+        for request in requests + [None]:
+            instruction = request.instruction if request is not None else None
+            if (run and instruction is not None and instruction[0] == 0x03 and
+                    instruction[1] == run[0].instruction[1] and
+                    len(instruction) == len(run[0].instruction) and
+                    request.id not in [r.id for r in run]):
+                run.append(request)
+                continue
+            if len(run) > 1:
+                sync = [0x83, run[0].instruction[1], len(run[0].instruction) - 2]
+                for r in run:
+                    sync.extend([r.id] + r.instruction[2:])
+                packets.append((sync, 0xFE))
+            elif run:
+                packets.append((run[0].instruction, run[0].id))
+            run = []
+            if instruction is None:
+                break
+            if instruction[0] == 0x03:
+                run = [request]
+            else:
+                packets.append((instruction, request.id))
+        return packets
+
+    def _send_burst(self, requests):
+        msg = []
+        for instruction, id in self._burst_instructions(requests):
+            msg.extend(self.chain._make_packet(instruction, id))
+        priority, deadline = self._claim(requests)
+        try:
+            self.chain.send_packet(struct.pack('%dB' % len(msg), *msg), priority, deadline)
+        except Exception as e:
+            for request in requests:
+                self._complete(request, exc=e)
+        else:
+            # Writes to servos that do not acknowledge them hide their error flags
+            chain = self.chain
+            errors = {}
+            for id in set(request.id for request in requests):
+                if id != 0xFE and time.time() - chain._last_status.get(id, 0.) > chain.error_check_period:
+                    try:
+                        chain.check_errors(id)
+                    except Exception as e:
+                        errors[id] = e
+            for request in requests:
+                if request.id in errors:
+                    self._complete(request, exc=errors[request.id])
+                else:
+                    self._complete(request, [])
+
+    def _send_bulk_read(self, requests):
+        reads = [(request.id, request.instruction[1], request.instruction[2]) for request in requests]
+        priority, deadline = self._claim(requests)
+        try:
+            replies = self.chain._bulk_read(reads, priority, deadline)
+        except Exception as e:
+            for request in requests:
+                self._complete(request, exc=e)
+            return
+        for request, reply in zip(requests, replies):
+            try:
+                if isinstance(reply, Exception):
+                    raise reply
+                id, data, err = reply
+                if err != 0:
+                    self.chain._process_err(err, id)
+            except Exception as e:
+                self._complete(request, exc=e)
+            else:
+                self._complete(request, data)
+
+    def _claim(self, requests):
+        ''' Priority and deadline for sending requests together: the most urgent of theirs.
+        '''
+        deadlines = [request.deadline for request in requests if request.deadline is not None]
+        return min(request.priority for request in requests), min(deadlines) if deadlines else None
+
+    def _complete(self, request, data=None, exc=None):
+        ''' Keep the chain's control table mirror coherent, then resolve the request.
+        '''
+        instruction = request.instruction
+        if instruction[0] == 0x03:
+            self.chain._invalidate_mirror(request.id, instruction[1], len(instruction) - 2)
+        elif instruction[0] == 0x83:
+            for id in instruction[3::instruction[2] + 1]:
+                self.chain._invalidate_mirror(id, instruction[1], instruction[2])
+        elif instruction[0] == 0x02 and exc is None and request.id in self.chain.mirrors:
+            self.chain.mirrors[request.id].update(instruction[1], data)
+        if exc is not None:
+            request._set_exception(exc)
+        else:
+            request._set_result(data)
+
+
+class Dynamixel_State_Streamer(threading.Thread):
+
+    ''' Samples the state of every servo on a Dynamixel_Chain at a fixed rate, using
+        one BULK_READ per sample on MX-series chains, and keeps the latest sample
+        in a double buffer.  Readers never touch the bus, so they do not contend
+        with each other or with move commands:
+            streamer = Dynamixel_State_Streamer(dyn, rate=100.)
+            angles, ids = streamer.read_angles()
+        callback, if given, is called from the streamer thread after each sample.
+        With state_file, each sample is also published to a Servo_State_Table
+        there, for other processes on the host.
+    '''
+
+    # Rows of each buffer, one column per servo
+    ANGLE, ANGVEL, LOAD, VOLTAGE, TEMPERATURE, MOVING = range(6)
+
+    def __init__(self, chain, rate=50., ids=None, callback=None, state_file=None):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.chain = chain
+        self.period = 1. / rate
+        if ids is None:
+            ids = chain.servos.keys()
+        self.ids = list(ids)
+        self.callback = callback
+        self.errors = 0
+        self._index = dict((id, i) for i, id in enumerate(self.ids))
+        self._buffers = [np.zeros((6, len(self.ids))), np.zeros((6, len(self.ids)))]
+        self._stamps = [0., 0.]
+        self._seq = 0  # Number of samples published.  Front buffer is _seq % 2.
+        self.table = Servo_State_Table(state_file, self.ids) if state_file else None
+        self._sample()  # Readers always have a sample available.
+        self.should_run = True
+        self.start()
+
+    def _sample(self):
+        ''' Read present position through moving flag (addresses 36 - 46) of all
+            servos into the back buffer, then make it the front buffer.
+        '''
+        stamp = time.time()
+        blocks = self.chain._read_blocks(self.ids, 36, 11)
+        back = (self._seq + 1) % 2
+        buf = self._buffers[back]
+        for i, (id, data) in enumerate(zip(self.ids, blocks)):
+            servo = self.chain.servos[id]
+            buf[self.ANGLE, i] = servo.encoder_to_angle(data[0] + data[1] * 256)
+            buf[self.ANGVEL, i] = servo.bytes_to_angvel(data[3], data[2])
+            buf[self.LOAD, i] = servo.bytes_to_load(data[5], data[4])
+            buf[self.VOLTAGE, i] = data[6] / 10.
+            buf[self.TEMPERATURE, i] = data[7]
+            buf[self.MOVING, i] = data[10] != 0
+        self._stamps[back] = stamp
+        self._seq += 1
+        if self.table is not None:
+            self.table.publish(stamp, buf[self.ANGLE], buf[self.ANGVEL], buf[self.LOAD],
+                               buf[self.TEMPERATURE])
+
+    def run(self):
+        next_time = time.time()
+        while self.should_run:
+            try:
+                self._sample()
+            except RuntimeError as rte:
+                self.errors += 1
+                print rte
+            else:
+                if self.callback is not None:
+                    self.callback()
+            next_time += self.period
+            delay = next_time - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            else:  # Overran the period; skip the missed samples rather than bursting.
+                next_time = time.time()
+
+    def stop(self):
+        self.should_run = False
+        self.join(3)
+        if (self.isAlive()):
+            raise RuntimeError("lib_dynamixel: unable to stop streamer thread")
+        if self.table is not None:
+            self.table.close()
+
+    def read(self):
+        ''' Returns (timestamp, states), a copy of the latest sample.
+            states[row, i] is the value of row (ANGLE, ANGVEL, ...) for servo self.ids[i].
+        '''
+        while True:
+            seq = self._seq
+            front = seq % 2
+            stamp = self._stamps[front]
+            states = self._buffers[front].copy()
+            if self._seq == seq:  # Writer did not start reusing this buffer meanwhile
+                return stamp, states
+
+    def _read_row(self, row, ids):
+        if ids is None:
+            ids = self.ids
+        stamp, states = self.read()
+        return [states[row, self._index[id]] for id in ids], ids
+
+    def read_angle(self, id):
+        return self._read_row(self.ANGLE, [id])[0][0]
+
+    def read_angles(self, ids=None):
+        return self._read_row(self.ANGLE, ids)
+
+    def read_angvel(self, id):
+        return self._read_row(self.ANGVEL, [id])[0][0]
+
+    def read_angvels(self, ids=None):
+        return self._read_row(self.ANGVEL, ids)
+
+    def read_angs_angvels(self, ids=None):
+        if ids is None:
+            ids = self.ids
+        stamp, states = self.read()
+        cols = [self._index[id] for id in ids]
+        return list(states[self.ANGLE, cols]), list(states[self.ANGVEL, cols]), ids
+
+    def read_load(self, id):
+        return self._read_row(self.LOAD, [id])[0][0]
+
+    def read_voltage(self, id):
+        return self._read_row(self.VOLTAGE, [id])[0][0]
+
+    def read_temperature(self, id):
+        return self._read_row(self.TEMPERATURE, [id])[0][0]
+
+    def is_moving(self, id):
+        return bool(self._read_row(self.MOVING, [id])[0][0])
+
+
+def state_table_path(dev):
+    ''' The default Servo_State_Table file for the servos on dev.
+    '''
+    return '/dev/shm/dynamixel_%s.state' % os.path.basename(str(dev))
+
+
+class Servo_State_Table():
+
+    ''' The latest state of each servo in a memory-mapped file, which processes on
+        the same host can poll without a ROS topic.  One writer (a
+        Dynamixel_State_Streamer given a state_file) and any number of readers:
+            table = Servo_State_Table(state_table_path('/dev/ttyUSB0'))
+            stamp, position, velocity, load, temperature = table.read_servo(1)
+        The file is a 16 byte header ('DXS1', then the number of servos, a
+        sequence number and a reserved word, as little-endian uint32s) followed
+        by one RECORD per servo.  The writer makes the sequence number odd while
+        it updates the records and even again afterwards (a seqlock); readers
+        retry any copy that overlapped an update, so they never block the writer,
+        and give up if an update never finishes because the writer died in it.
+        CPython issues no memory barriers, so this relies on stores being seen in
+        program order, as they are on a single-core board such as the BeagleBone.
+    '''
+
+    MAGIC = 'DXS1'
+    HEADER_SIZE = 16
+    RECORD = np.dtype([('id', '<i4'), ('stamp', '<f8'), ('position', '<f8'), ('velocity', '<f8'),
+                       ('load', '<f8'), ('temperature', '<f8')], align=True)
+
+    def __init__(self, path, ids=None):
+        ''' With ids, open the table for those servos for writing, reusing the
+            file at path if it is one (so its readers carry on) and replacing it
+            otherwise.  Without, open an existing table read-only.
+        '''
+        self.path = path
+        if ids is not None:
+            size = self.HEADER_SIZE + len(ids) * self.RECORD.itemsize
+            if not self._reopen(size, ids):
+                self._create(size, ids)
+        else:
+            try:
+                with open(path, 'rb') as f:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (IOError, ValueError):
+                raise RuntimeError('lib_dynamixel: No servo state table at %s' % path)
+            if self._map[:4] != self.MAGIC:
+                raise RuntimeError('lib_dynamixel: %s is not a servo state table' % path)
+            self._map_arrays()
+        self.ids = [int(id) for id in self.records['id']]
+        self._index = dict((id, i) for i, id in enumerate(self.ids))
+
+    def _create(self, size, ids):
+        # Build the table beside path and rename it into place, so readers
+        # never map a partly initialized file.
+        tmp = '%s.%d' % (self.path, os.getpid())
+        with open(tmp, 'w+b') as f:
+            f.write('\0' * size)
+            f.flush()
+            self._map = mmap.mmap(f.fileno(), size)
+        self._map[4:8] = struct.pack('<I', len(ids))
+        self._map_arrays()
+        self.records['id'] = ids
+        self._map[:4] = self.MAGIC
+        os.rename(tmp, self.path)
+
+    def _reopen(self, size, ids):
+        ''' Map an existing table for the same ids for writing.  returns False if there is none.
+        '''
+        try:
+            with open(self.path, 'r+b') as f:
+                self._map = mmap.mmap(f.fileno(), 0)
+        except (IOError, OSError, ValueError):
+            return False
+        if (len(self._map) != size or self._map[:4] != self.MAGIC or
+                struct.unpack('<I', self._map[4:8])[0] != len(ids)):
+            self._map.close()
+            return False
+        self._map_arrays()
+        if [int(id) for id in self.records['id']] != list(ids):
+            self.close()
+            return False
+        if self._seq[0] & 1:
+            # The last writer died mid-update, so the records may be torn; mark
+            # them as never written and let readers in again
+            self.records['stamp'] = 0.
+            self._seq[0] += 1
+        return True
+
+    def _map_arrays(self):
+        self._header = np.ndarray(3, '<u4', self._map, 4)
+        self._seq = self._header[1:2]
+        self.records = np.ndarray(self._header[0], self.RECORD, self._map, self.HEADER_SIZE)
+
+    def close(self):
+        self._header = self._seq = self.records = None  # No views may outlive the map
+        self._map.close()
+
+    def publish(self, stamp, positions, velocities, loads, temperatures):
+        ''' Write one sample; each argument but stamp has a value per servo, in self.ids order.
+        '''
+        records = self.records
+        self._seq[0] += 1
+        records['stamp'] = stamp
+        records['position'] = positions
+        records['velocity'] = velocities
+        records['load'] = loads
+        records['temperature'] = temperatures
+        self._seq[0] += 1
+
+    def read(self, timeout=0.5):
+        ''' A consistent copy of all the records (a numpy array of RECORD).
+            Raises if none can be had within timeout seconds.
+        '''
+        give_up = None
+        while True:
+            seq = int(self._seq[0])
+            if not seq & 1:
+                records = self.records.copy()
+                if int(self._seq[0]) == seq:
+                    return records
+            if give_up is None:
+                give_up = time.time() + timeout
+            elif time.time() > give_up:
+                raise RuntimeError('lib_dynamixel: Servo state table %s is stuck mid-update; '
+                                   'has its writer died?' % self.path)
+            time.sleep(0)  # Let the writer finish
+
+    def read_servo(self, id):
+        ''' returns stamp, position, velocity, load, temperature of servo id
+        '''
+        record = self.read()[self._index[id]]
+        return (record['stamp'], record['position'], record['velocity'], record['load'],
+                record['temperature'])
+
+    def read_angles(self, ids=None):
+        if ids is None:
+            ids = self.ids
+        records = self.read()
+        return [records['position'][self._index[id]] for id in ids], ids
+
+
+BAUDRATES = [9600, 19200, 57600, 115200, 200000, 250000,
+             400000, 500000, 1000000, 2250000, 2500000, 3000000]
+
+# dev -> {baudrate: [ids]} found by the most recent discover_servos on each port
+_last_topology = {}
+
+
+class Servo_Scanner():
+
+    ''' Pings for servos on one USB2Dynamixel across baudrates.
+        The ping timeout is the time on the wire at the current baudrate plus
+        twice the worst round-trip overhead (USB latency, return delay) measured
+        so far on this port.  Until a servo has answered, the adaptor's latency
+        timer is used as the overhead if it can be read, otherwise max_timeout.
+    '''
+
+    def __init__(self, dev='/dev/ttyUSB0', max_timeout=0.05, min_timeout=0.002):
+        self.device = USB2Dynamixel_Device(dev, BAUDRATES[2])
+        self.max_timeout = max_timeout
+        self.min_timeout = min_timeout
+        self.latency = None  # Worst measured reply overhead beyond the wire time (s)
+        self.usb_latency = _usb_latency(dev)
+        self.baudrate = None
+
+    def set_baudrate(self, baudrate):
+        self.device.servo_dev.setBaudrate(baudrate)
+        self.baudrate = baudrate
+
+    def _wire_time(self):
+        # 6 byte PING out, 6 byte status back, 10 bits per byte
+        return 12 * 10. / self.baudrate
+
+    def timeout(self):
+        if self.latency is not None:
+            overhead = 2 * self.latency
+        elif self.usb_latency is not None:
+            overhead = self.usb_latency + 0.001  # Return delay is at most 0.508 ms
+        else:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, self._wire_time() + overhead))
+
+    def ping(self, id):
+        ''' Returns True if servo id answers a PING at the current baudrate.
+            Replies carrying error flags still count as found.
+        '''
+        dev = self.device
+        with dev.arbiter:
+            dev.servo_dev.setTimeout(self.timeout())
+            start = dev._send_serial(dev._make_packet([0x01], id))
+            try:
+                dev._receive_reply(id)
+            except RuntimeError:
+                return False
+        overhead = max(time.time() - start - self._wire_time(), 0.)
+        self.latency = overhead if self.latency is None else max(self.latency, overhead)
+        return True
+
+    def broadcast_ping(self):
+        ''' PING the broadcast id and return the ids of any servos that answer.
+            Protocol 1.0 firmware stays silent, in which case this returns [].
+        '''
+        dev = self.device
+        ids = []
+        with dev.arbiter:
+            dev._send_serial(dev._make_packet([0x01], 0xFE))
+            time.sleep(self.timeout())
+            dev._parser.feed(dev.servo_dev.read(dev.servo_dev.inWaiting()))
+            try:
+                packet = dev._parser.next_packet()
+                while packet is not None:
+                    ids.append(packet[0])
+                    packet = dev._parser.next_packet()
+            except RuntimeError:
+                pass  # Overlapping replies; the unicast scan will sort them out.
+        return ids
+
+    def scan(self, baudrates=None, ids=None, number=255, known=None):
+        ''' Ping ids at each baudrate, stopping once number servos are found.
+            known = {baudrate: [ids]} is checked first; if every servo in it
+            answers (or number are found), nothing else is scanned.
+            returns {baudrate: [ids]}
+        '''
+        if baudrates is None:
+            baudrates = BAUDRATES
+        if ids is None:
+            ids = range(254)
+        found = {}
+        if known:
+            for baudrate, known_ids in known.items():
+                self.set_baudrate(baudrate)
+                found[baudrate] = [id for id in known_ids if self.ping(id)]
+            count = sum(map(len, found.values()))
+            if count >= min(number, sum(map(len, known.values()))):
+                return dict((b, i) for b, i in found.items() if i)
+        # Baudrates that had servos last time go first, then the factory default and 1 Mbps
+        order = sorted(baudrates, key=lambda b: (not (known and b in known),
+                                                 b not in [57600, 1000000]))
+        for baudrate in order:
+            self.set_baudrate(baudrate)
+            hits = found.get(baudrate, [])
+            others = sum(len(i) for b, i in found.items() if b != baudrate)
+            # Confirm broadcast replies, which may be garbled by collisions, then scan the rest
+            for id in sorted(set(self.broadcast_ping())):
+                if id in ids and id not in hits and self.ping(id):
+                    hits.append(id)
+            for id in ids:
+                if others + len(hits) >= number:
+                    break
+                if id not in hits and self.ping(id):
+                    hits.append(id)
+            if hits:
+                found[baudrate] = sorted(hits)
+                print "%s @ %d: found ID('s) %s" % (self.device.dev_name, baudrate, found[baudrate])
+            if others + len(hits) >= number:
+                break
+        return dict((b, i) for b, i in found.items() if i)
+
+    def close(self):
+        self.device.servo_dev.close()
+
+
 def discover_servos(dev='/dev/ttyUSB0', ids=None, baudrates=None, number=255):
-    '''Discover all servos on a USB2Dynamixel_Device using PING command.
-       Checks all servo IDs at all Baudrates, stopping after 'number' of servos are found.
+    '''Discover all servos on one or more USB2Dynamixel_Devices using PING command.
+       dev may be a single device name or a list of them; each is scanned in its own thread.
+       Checks all servo IDs at all Baudrates, stopping after 'number' of servos are found on a port.
+       The topology found last time on each port is checked first.
        Can specify smaller ranges to check instead.
+       returns {dev: {baudrate: [ids]}}
     '''
-    if baudrates is None:
-        baudrates = [9600, 19200, 57600, 115200, 200000, 250000,
-                     400000, 500000, 1000000, 2250000, 2500000, 3000000]
-    print "Searching for ID's on %s" % dev
-    num = 0
-    for baudrate in baudrates:
-        print "\nBaudrate %d:" % baudrate
+    devs = [dev] if isinstance(dev, basestring) else list(dev)
+    topology = {}
+
+    def scan_port(name):
+        print "Searching for ID's on %s" % name
         try:
-            dyn = Dynamixel_Chain(dev, baudrate=baudrate, ids=ids)
-            num += len(dyn.servos.keys())
-            dyn.servo_dev.close()
-            del(dyn)
-            if num >= number:
-                print "Found %d servos. Stopping." % num
-                break
+            scanner = Servo_Scanner(name)
         except RuntimeError as rte:
-            print rte
+            print "%s: %s" % (name, rte)
+            return
+        try:
+            topology[name] = scanner.scan(baudrates, ids, number, _last_topology.get(name))
+        finally:
+            scanner.close()
+        _last_topology[name] = topology[name]
+        print "%s: found %d servos" % (name, sum(map(len, topology[name].values())))
+
+    workers = [threading.Thread(target=scan_port, args=(name,)) for name in devs]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return topology
 
 
 def recover_servo(dyn):
@@ -1055,7 +2889,7 @@ def recover_servo(dyn):
     print 'GO!'
 
     while True:
-        s.write('#')
+        dyn.servo_dev.write('#')
         time.sleep(0.0001)
 
 
@@ -1371,10 +3205,11 @@ if __name__ == '__main__':
         p.print_help()
         sys.exit(0)
 
-    dyn = Dynamixel_Chain(opt.dev_name, opt.baud)
-
     if opt.scan:
-        discover_servos(dyn)
+        discover_servos(opt.dev_name)
+
+    if opt.recover or opt.ang != None:
+        dyn = Dynamixel_Chain(opt.dev_name, opt.baud)
 
     if opt.recover:
         recover_servo(dyn)
@@ -31,33 +31,26 @@
 
 ## Authors: Travis Deyle, Advait Jain & Marc Killpack (Healthcare Robotics Lab, Georgia Tech.)
 
-import serial
+## The bus transport (packets, checksums, replies, retries, timeouts and
+## instrumentation) lives in lib_dynamixel; this module keeps the lib_robotis API.
+
 import time
-import thread
 import sys, optparse
 import math
+import lib_dynamixel as ld
+from lib_dynamixel import recover_servo
 
-class USB2Dynamixel_Device():
+class USB2Dynamixel_Device(ld.USB2Dynamixel_Device):
     ''' Class that manages serial port contention between servos on same bus
     '''
-    def __init__( self, dev_name = '/dev/ttyUSB0', baudrate = 57600 ):
-        try:
-            self.dev_name = string.atoi( dev_name ) # stores the serial port as 0-based integer for Windows
-        except:
-            self.dev_name = dev_name # stores it as a /dev-mapped string for Linux / Mac
-
-        self.mutex = thread.allocate_lock()
-        self.servo_dev = None
-
-        self.acq_mutex()
-        self._open_serial( baudrate )
-        self.rel_mutex()
-
     def acq_mutex(self):
-        self.mutex.acquire()
+        ''' Holds the bus across several transactions.  Robotis_Servo does not need
+            this: each of its transactions claims the bus from self.arbiter itself.
+        '''
+        self.arbiter.acquire()
 
     def rel_mutex(self):
-        self.mutex.release()
+        self.arbiter.release()
 
     def send_serial(self, msg):
         # It is up to the caller to acquire / release mutex
@@ -68,24 +61,6 @@ class USB2Dynamixel_Device():
         rep = self.servo_dev.read( nBytes )
         return rep
 
-    def _open_serial(self, baudrate):
-        try:
-            self.servo_dev = serial.Serial(self.dev_name, baudrate, timeout=1.0)
-            # Closing the device first seems to prevent "Access Denied" errors on WinXP
-            # (Conversations with Brian Wu @ MIT on 6/23/2010)
-            self.servo_dev.close()  
-            self.servo_dev.setParity('N')
-            self.servo_dev.setStopbits(1)
-            self.servo_dev.open()
-
-            self.servo_dev.flushOutput()
-            self.servo_dev.flushInput()
-
-        except (serial.serialutil.SerialException), e:
-            raise RuntimeError('lib_robotis: Serial port not found!\n')
-        if(self.servo_dev == None):
-            raise RuntimeError('lib_robotis: Serial port not found!\n')
-
 
 
 
@@ -143,6 +118,7 @@ class Robotis_Servo():
         # Set Return Delay time - Used to determine when next status can be requested
         data = self.read_address( 0x05, 1)
         self.return_delay = data[0] * 2e-6
+        self.dyn.return_delays[ self.servo_id ] = self.return_delay
 
         # Set various parameters.  Load from servo_config.
         self.settings = {}
@@ -281,74 +257,33 @@ class Robotis_Servo():
         '''
         return self.write_address( 0x03, [id] )
 
-    def __calc_checksum(self, msg):
-        chksum = 0
-        for m in msg:
-            chksum += m
-        chksum = ( ~chksum ) % 256
-        return chksum
-
     def read_address(self, address, nBytes=1):
         ''' reads nBytes from address on the servo.
             returns [n1,n2 ...] (list of parameters)
         '''
-        msg = [ 0x02, address, nBytes ]
-        return self.send_instruction( msg, self.servo_id )
+        return self.dyn.read_address( self.servo_id, address, nBytes )
 
     def write_address(self, address, data):
         ''' writes data at the address.
             data = [n1,n2 ...] list of numbers.
             return [n1,n2 ...] (list of return parameters)
         '''
-        msg = [ 0x03, address ] + data
-        return self.send_instruction( msg, self.servo_id )
+        return self.dyn.write_address( self.servo_id, address, data )
 
     def send_instruction(self, instruction, id):
-        msg = [ id, len(instruction) + 1 ] + instruction # instruction includes the command (1 byte + parameters. length = parameters+2)
-        chksum = self.__calc_checksum( msg )
-        msg = [ 0xff, 0xff ] + msg + [chksum]
-        
-        self.dyn.acq_mutex()
-        try:
-            self.send_serial( msg )
-            data, err = self.receive_reply()
-        except:
-            self.dyn.rel_mutex()
-            raise
-        self.dyn.rel_mutex()
-        
-        if err != 0:
-            print('THIS IS THE ERR: {}'.format(err))
-            self.process_err( err )
-
-        return data
+        return self.dyn._send_instruction( instruction, id )
 
     def process_err( self, err ):
-        print('the current encoder value is: {}'.format(self.read_encoder()))
-        print('the current angle is: {}'.format(self.read_anlge()))
-        raise RuntimeError('lib_robotis: An error occurred: %d\n' % err)
+        self.dyn._process_err( err, self.servo_id )
 
     def receive_reply(self):
-        start = self.dyn.read_serial( 2 )
-        if start != '\xff\xff':
-            raise RuntimeError('lib_robotis: Failed to receive start bytes\n')
-        servo_id = self.dyn.read_serial( 1 )
-        if ord(servo_id) != self.servo_id:
-            raise RuntimeError('lib_robotis: Incorrect servo ID received: %d\n' % ord(servo_id))
-        data_len = self.dyn.read_serial( 1 )
-        err = self.dyn.read_serial( 1 )
-        data = self.dyn.read_serial( ord(data_len) - 2 )
-        checksum = self.dyn.read_serial( 1 ) # I'm not going to check...
-        return [ord(v) for v in data], ord(err)
-        
+        id, data, err = self.dyn._receive_reply( self.servo_id )
+        return data, err
 
     def send_serial(self, msg):
         """ sends the command to the servo
         """
-        out = ''
-        for m in msg:
-            out += chr(m)
-        self.dyn.send_serial( out )
+        self.dyn._send_serial( msg )
 
 
 
@@ -358,53 +293,20 @@ def find_servos(dyn):
     ''' Finds all servo IDs on the USB2Dynamixel '''
     print 'Scanning for Servos.'
     servos = []
-    dyn.servo_dev.setTimeout( 0.03 ) # To make the scan faster
-    for i in xrange(254):
-        try:
-            s = Robotis_Servo( dyn, i )
-            print '\n FOUND A SERVO @ ID %d\n' % i
-            servos.append( i )
-        except:
-            pass
-    dyn.servo_dev.setTimeout( 1.0 ) # Restore to original
+    max_retries, dyn.max_retries = dyn.max_retries, 0 # Absent ids are not retried
+    try:
+        for i in xrange(254):
+            try:
+                s = Robotis_Servo( dyn, i )
+                print '\n FOUND A SERVO @ ID %d\n' % i
+                servos.append( i )
+            except:
+                pass
+    finally:
+        dyn.max_retries = max_retries
     return servos
 
 
-def recover_servo(dyn):
-    ''' Recovers a bricked servo by booting into diagnostic bootloader and resetting '''
-    raw_input('Make sure only one servo connected to USB2Dynamixel Device [ENTER]')
-    raw_input('Disconnect power from the servo, but leave USB2Dynamixel connected to USB. [ENTER]')
-
-    dyn.servo_dev.setBaudrate( 57600 )
-    
-    print 'Get Ready.  Be ready to reconnect servo power when I say \'GO!\''
-    print 'After a second, the red LED should become permanently lit.'
-    print 'After that happens, Ctrl + C to kill this program.'
-    print
-    print 'Then, you will need to use a serial terminal to issue additional commands.',
-    print 'Here is an example using screen as serial terminal:'
-    print
-    print 'Command Line:  screen /dev/robot/servo_left 57600'
-    print 'Type: \'h\''
-    print 'Response: Command : L(oad),G(o),S(ystem),A(pplication),R(eset),D(ump),C(lear)'
-    print 'Type: \'C\''
-    print 'Response:  * Clear EEPROM '
-    print 'Type: \'A\''
-    print 'Response: * Application Mode'
-    print 'Type: \'G\''
-    print 'Response:  * Go'
-    print
-    print 'Should now be able to reconnect to the servo using ID 1'
-    print
-    print
-    raw_input('Ready to reconnect power? [ENTER]')
-    print 'GO!'
-
-    while True:
-        s.write('#')
-        time.sleep(0.0001)
-
-
 if __name__ == '__main__':
     p = optparse.OptionParser()
     p.add_option('-d', action='store', type='string', dest='dev_name',
@@ -31,11 +31,19 @@
 
 
 
-import serial
 import time
 import sys, optparse
 import servo_config as sc
 import math
+import lib_dynamixel as ld
+
+# One USB2Dynamixel_Device per port, shared by every servo on that bus
+_devices = {}
+
+def _open_device(dev_name, baudrate):
+    if not _devices.has_key(dev_name):
+        _devices[dev_name] = ld.USB2Dynamixel_Device(dev_name, baudrate)
+    return _devices[dev_name]
 
 class robotis_servo():
     ''' class to use a robotis servo.
@@ -48,8 +56,8 @@ class robotis_servo():
             max_speed - max allowable speed for the servo (radians/sec)
         '''
         self.dev_name = dev_name
-        self.servo_dev = None
-        self.__open_serial(baudrate)
+        self.dyn = _open_device(dev_name, baudrate)
+        self.servo_dev = self.dyn.servo_dev
 
         print 'WARNING: robotis_servo.py is being deprecated.'
 
@@ -152,7 +160,6 @@ class robotis_servo():
             print 'robotis_servo.move_angle: angle out of range- ', math.degrees(ang)
             return
         self.set_angvel(angvel)
-        time.sleep(0.05)
 
         deg = math.degrees(ang)
         if self.flipped:
@@ -162,11 +169,8 @@ class robotis_servo():
         self.__move_to_encoder(enc_ticks)
 
         if blocking == True:
-            time.sleep(0.05)
             while(self.is_moving()):
                 continue
-        else:
-            time.sleep(0.05)
 
 
     def set_angvel(self, angvel):
@@ -187,7 +191,10 @@ class robotis_servo():
             data = [n1,n2 ...] list of numbers.
         '''
         msg = [0x03,address]+data
-        self.send_instruction(msg,self.servo_id)
+        try:
+            self.send_instruction(msg,self.servo_id)
+        except RuntimeError, e:
+            print 'robotis_servo.write_location:', e
 
     def read_location(self, address, nBytes=1):
         ''' reads nBytes from address on the servo.
@@ -195,60 +202,20 @@ class robotis_servo():
             list of parameters, error byte.
         '''
         msg = [0x02,address,nBytes]
-        self.send_instruction(msg,self.servo_id)
-        s = self.read_serial(6+nBytes)
-        if s == '':
+        try:
+            id, data, err = self.dyn._transact(msg,self.servo_id)
+        except RuntimeError:
             print 'robotis_servo.read_location: Could not read from the servo.'
             print 'Ensure that the 3-way switch on the USB2Dynamixel is at RS485.'
             print 'Exiting...'
             sys.exit(0)
-        l = [ord(a) for a in s[4:-1]]
-        if l == []:
-            return None
-        return l[1:], l[0]
-
-    def __calc_checksum(self, msg):
-        chksum = 0
-        for m in msg:
-            chksum += m
-        chksum = (~chksum)%256
-        return chksum
+        return data, err
 
     def send_instruction(self, instruction, id):
-        msg = [id,len(instruction)+1]+instruction # instruction includes the command (1 byte + parameters. length = parameters+2)
-        chksum = self.__calc_checksum(msg)
-        msg = [0xff,0xff]+msg+[chksum]
-        self.__send_serial(msg)
-
-    def __send_serial(self, msg):
-        """ sends the command to the servo
-        """
-        str = ''
-        for m in msg:
-            str += chr(m)
-
-        self.servo_dev.flushInput()
-        self.servo_dev.write(str)
+        self.dyn._send_instruction(instruction, id, status_return=False)
 
     def read_serial(self, nBytes=1):
-        rep = self.servo_dev.read(nBytes)
-        return rep
-
-    def __open_serial(self, baudrate):
-        try:
-            self.servo_dev = serial.Serial(self.dev_name, timeout=1.)
-            self.servo_dev.setBaudrate(baudrate)
-            self.servo_dev.setParity('N')
-            self.servo_dev.setStopbits(1)
-            self.servo_dev.open()
-
-            self.servo_dev.flushOutput()
-            self.servo_dev.flushInput()
-
-        except (serial.serialutil.SerialException), e:
-            raise RuntimeError("robotis_servo: Serial port not found!\n")
-        if(self.servo_dev == None):
-            raise RuntimeError("robotis_servo: Serial port not found!\n")
+        return self.dyn._read_serial(nBytes)
 
 
 
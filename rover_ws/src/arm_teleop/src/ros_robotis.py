@@ -46,6 +46,7 @@ from robotis.srv import None_Int32
 from robotis.srv import None_Int32Response
 
 import robotis.lib_robotis as rs
+import lib_dynamixel as ld
 import time
 import math
 from threading import Thread
@@ -136,6 +137,62 @@ class ROS_Robotis_Poller( Thread ):
             raise RuntimeError("ROS_Robotis_Servo: unable to stop thread")
 
 
+class Streamed_Servo():
+    # Presents one servo of a Dynamixel_Chain to ROS_Robotis_Server, reading
+    # state from a Dynamixel_State_Streamer snapshot instead of the bus
+    def __init__( self, dyn, streamer, id ):
+        self.dyn = dyn
+        self.streamer = streamer
+        self.id = id
+
+    def read_angle( self ):
+        return self.streamer.read_angle( self.id )
+
+    def is_moving( self ):
+        return self.streamer.is_moving( self.id )
+
+    def move_angle( self, ang, angvel = None, blocking = True ):
+        self.dyn.move_angle( self.id, ang, angvel )
+        if blocking:
+            # Wait for the streamer to see the move start, then for it to finish
+            time.sleep( 2 * self.streamer.period )
+            while self.is_moving() and not rospy.is_shutdown():
+                time.sleep( self.streamer.period )
+
+
+class ROS_Dynamixel_Poller():
+    # Like ROS_Robotis_Poller, but for lib_dynamixel: all servos are sampled
+    # together at a fixed rate (one bulk read per sample on MX-series chains),
+    # and every service call and topic is served from the latest sample.
+    # With state_file (e.g. ld.state_table_path( dev_name )), each sample is also
+    # written to a ld.Servo_State_Table that other processes can poll.
+    def __init__( self, dev_name, ids, names, baudrate = 57600, rate = 50., state_file = None ):
+        self.dev_name = dev_name
+        self.ids = ids
+        self.names = names
+
+        for n in self.names:
+            rospy.logout( 'ROS_Robotis_Servo: Starting Up /robotis/servo_' + n + ' on ' + self.dev_name )
+
+        self.dyn = ld.Dynamixel_Chain( self.dev_name, baudrate, self.ids )
+        self.streamer = ld.Dynamixel_State_Streamer( self.dyn, rate, self.ids, state_file = state_file )
+        self.servos = [ Streamed_Servo( self.dyn, self.streamer, i ) for i in self.ids ]
+        self.ros_servers = [ ROS_Robotis_Server( s, n ) for s,n in zip( self.servos, self.names ) ]
+        self.streamer.callback = self.publish
+
+        rospy.logout( 'ROS_Robotis_Servo: Setup Complete on ' + self.dev_name )
+
+    def publish( self ):
+        if rospy.is_shutdown():
+            self.streamer.should_run = False
+            return
+        [ s.update_server() for s in self.ros_servers ]
+
+    def stop(self):
+        self.streamer.stop()
+        for n in self.names:
+            rospy.logout( 'ROS_Robotis_Servo: Shutting Down /robotis/servo_' + n + ' on ' + self.dev_name )
+
 
 class ROS_Robotis_Client():
     # Provides access to the ROS services in the server.
@@ -174,6 +231,8 @@ if __name__ == '__main__':
     # process. The device is only "thread-safe" within the same
     # process (i.e.  between servos (and callbacks) instantiated
     # within that process) 
+    # To share a port between processes, run dynamixel_daemon.py on it
+    # and use a dynamixel_daemon.Dynamixel_Client in each process.
     
     # NOTE: If you are going to be polling the servers as in the snippet
     #       below, I recommen using a poller!  See "SAMPLE POLLER" below.
@@ -206,6 +265,11 @@ if __name__ == '__main__':
 
 # ROS_Robotis_Poller( '/dev/robot/servo_left', [11,12], ['pan', 'tilt'] )
 
+# With lib_dynamixel servos, ROS_Dynamixel_Poller samples the whole chain at a
+# fixed rate and answers the services without going back to the bus:
+
+# ROS_Dynamixel_Poller( '/dev/ttyUSB0', [1,2], ['wrist_pitch', 'wrist_roll'], rate = 100. )
+
     
 ## SAMPLE CLIENTS:
         